@@ -0,0 +1,268 @@
+from __future__ import annotations
+import csv
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Optional
+
+from combat.batch_sim import POLICIES, simulate_fight
+from combat.engine import CombatStance
+
+
+DEFAULT_OUT_DIR = os.path.join("logs", "balance")
+LATEST_NAME = "matrix_latest.csv"
+PREV_NAME = "matrix_prev.csv"
+DIFF_NAME = "matrix_diff.csv"
+
+COLUMNS = [
+    "ship", "enemy", "stance", "policy", "n",
+    "win", "win_lo", "win_hi", "lose", "flee", "timeout",
+    "rounds_mean", "rounds_sd", "player_hp_mean",
+]
+
+
+@dataclass
+class CellStats:
+    """Aufsummierte Ergebnisse einer Zelle (Ship × Enemy × Stance × Policy), mergebar über Chunks."""
+    n: int = 0
+    win: int = 0
+    lose: int = 0
+    flee: int = 0
+    timeout: int = 0
+    rounds_sum: float = 0.0
+    rounds_sq: float = 0.0
+    player_hp_sum: float = 0.0
+
+    def merge(self, other: "CellStats") -> None:
+        self.n += other.n
+        self.win += other.win
+        self.lose += other.lose
+        self.flee += other.flee
+        self.timeout += other.timeout
+        self.rounds_sum += other.rounds_sum
+        self.rounds_sq += other.rounds_sq
+        self.player_hp_sum += other.player_hp_sum
+
+    def row(self) -> dict:
+        n = max(1, self.n)
+        mean = self.rounds_sum / n
+        var = max(0.0, self.rounds_sq / n - mean * mean)
+        lo, hi = wilson_interval(self.win, self.n)
+        return {
+            "n": self.n,
+            "win": self.win / n,
+            "win_lo": lo,
+            "win_hi": hi,
+            "lose": self.lose / n,
+            "flee": self.flee / n,
+            "timeout": self.timeout / n,
+            "rounds_mean": mean,
+            "rounds_sd": math.sqrt(var),
+            "player_hp_mean": self.player_hp_sum / n,
+        }
+
+
+def wilson_interval(k: int, n: int, z: float = 1.96) -> tuple[float, float]:
+    """95%-Konfidenzintervall für eine Rate k/n (Wilson, stabil auch bei 0% / 100%)."""
+    if n <= 0:
+        return 0.0, 1.0
+    p = k / n
+    denom = 1.0 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1.0 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+# -----------------------------
+# Worker (eigener Prozess)
+# -----------------------------
+_WORKER_CONTENT = None
+
+
+def _init_worker(content_dir: str) -> None:
+    global _WORKER_CONTENT
+    from data.loader import load_content
+    _WORKER_CONTENT = load_content(content_dir)
+
+
+def _run_chunk(key: tuple[str, str, str, str], chunk: int, n: int, seed: int, max_rounds: int) -> tuple[tuple, CellStats]:
+    ship_id, enemy_id, stance_name, policy_name = key
+    content = _WORKER_CONTENT
+    shipdef = content.ships[ship_id]
+    enemydef = content.enemies[enemy_id]
+    policy = POLICIES[policy_name]
+    stance = CombatStance[stance_name]
+
+    # eigener, reproduzierbarer RNG-Stream pro (Seed, Zelle, Chunk) – unabhängig von der Worker-Verteilung
+    stream = random.Random(f"{seed}:{ship_id}:{enemy_id}:{stance_name}:{policy_name}:{chunk}")
+
+    st = CellStats()
+    for _ in range(n):
+        rng = random.Random(stream.getrandbits(64))
+        r = simulate_fight(shipdef, enemydef, policy, rng, None, max_rounds, stance)
+        st.n += 1
+        if r.outcome == "win":
+            st.win += 1
+        elif r.outcome == "lose":
+            st.lose += 1
+        elif r.outcome == "flee":
+            st.flee += 1
+        else:
+            st.timeout += 1
+        st.rounds_sum += r.rounds
+        st.rounds_sq += r.rounds * r.rounds
+        st.player_hp_sum += r.player_hp / max(1, r.player_hp_max)
+    return key, st
+
+
+# -----------------------------
+# Matrix
+# -----------------------------
+def run_matrix(
+    ships: list[str],
+    enemies: list[str],
+    stances: list[str],
+    policies: list[str],
+    n: int = 10000,
+    seed: int = 1,
+    workers: Optional[int] = None,
+    chunk_size: int = 2500,
+    max_rounds: int = 200,
+    content_dir: str = "content",
+    progress=None,
+) -> dict[tuple, CellStats]:
+    """
+    Verteilt alle Zellen in Chunks auf einen Prozess-Pool.
+    Ergebnis: {(ship, enemy, stance, policy): CellStats}
+    """
+    cells = [(s, e, st, p) for s in ships for e in enemies for st in stances for p in policies]
+    jobs = []
+    for key in cells:
+        left = int(n)
+        chunk = 0
+        while left > 0:
+            k = min(chunk_size, left)
+            jobs.append((key, chunk, k))
+            left -= k
+            chunk += 1
+
+    results = {key: CellStats() for key in cells}
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(content_dir,)) as pool:
+        futures = [pool.submit(_run_chunk, key, chunk, k, seed, max_rounds) for key, chunk, k in jobs]
+        for fut in as_completed(futures):
+            key, st = fut.result()
+            results[key].merge(st)
+            done += 1
+            if progress is not None:
+                progress(done, len(jobs))
+    return results
+
+
+def write_table(path: str, results: dict[tuple, CellStats]) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(COLUMNS)
+        for key in sorted(results):
+            row = results[key].row()
+            w.writerow([*key, row["n"], *[f"{row[c]:.4f}" for c in COLUMNS[5:]]])
+
+
+def read_table(path: str) -> dict[tuple, dict]:
+    if not os.path.exists(path):
+        return {}
+    out = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for r in csv.DictReader(f):
+            key = (r["ship"], r["enemy"], r["stance"], r["policy"])
+            out[key] = {c: float(r[c]) for c in COLUMNS[4:]}
+    return out
+
+
+def diff_tables(prev: dict[tuple, dict], cur: dict[tuple, dict]) -> list[dict]:
+    """
+    Änderung der Winrate je Zelle. significant = Konfidenzintervalle überlappen nicht.
+    """
+    rows = []
+    for key in sorted(set(prev) | set(cur)):
+        a = prev.get(key)
+        b = cur.get(key)
+        if a is None or b is None:
+            rows.append({"key": key, "prev": a and a["win"], "cur": b and b["win"], "delta": None, "significant": True})
+            continue
+        delta = b["win"] - a["win"]
+        significant = b["win_lo"] > a["win_hi"] or b["win_hi"] < a["win_lo"]
+        rows.append({"key": key, "prev": a["win"], "cur": b["win"], "delta": delta, "significant": significant})
+    return rows
+
+
+def write_diff(path: str, rows: list[dict]) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["ship", "enemy", "stance", "policy", "win_prev", "win_cur", "delta", "significant"])
+        for r in rows:
+            fmt = lambda v: "" if v is None else f"{v:.4f}"
+            w.writerow([*r["key"], fmt(r["prev"]), fmt(r["cur"]), fmt(r["delta"]), int(bool(r["significant"]))])
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    import argparse
+    from data.loader import load_content
+
+    ap = argparse.ArgumentParser(description="Balance-Matrix: Schiffe × Gegner × Haltung × Policy")
+    ap.add_argument("-n", type=int, default=10000, help="Kämpfe pro Zelle")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--ships", nargs="*", default=None)
+    ap.add_argument("--enemies", nargs="*", default=None)
+    ap.add_argument("--stances", nargs="*", default=[s.name for s in CombatStance])
+    ap.add_argument("--policies", nargs="*", default=sorted(POLICIES))
+    ap.add_argument("--out", default=DEFAULT_OUT_DIR)
+    args = ap.parse_args(argv)
+
+    content = load_content("content")
+    ships = args.ships or list(content.ships)
+    enemies = args.enemies or list(content.enemies)
+
+    t0 = time.perf_counter()
+
+    def progress(done: int, total: int) -> None:
+        print(f"\r  {done}/{total} chunks  {time.perf_counter() - t0:6.1f}s", end="", flush=True)
+
+    results = run_matrix(
+        ships, enemies, args.stances, args.policies,
+        n=args.n, seed=args.seed, workers=args.workers, progress=progress,
+    )
+    print()
+
+    os.makedirs(args.out, exist_ok=True)
+    latest = os.path.join(args.out, LATEST_NAME)
+    prev_path = os.path.join(args.out, PREV_NAME)
+    if os.path.exists(latest):
+        os.replace(latest, prev_path)
+    write_table(latest, results)
+
+    prev = read_table(prev_path)
+    rows = diff_tables(prev, read_table(latest)) if prev else []
+    if rows:
+        write_diff(os.path.join(args.out, DIFF_NAME), rows)
+
+    cells = len(results)
+    fights = sum(st.n for st in results.values())
+    print(f"{cells} cells, {fights} fights in {time.perf_counter() - t0:.1f}s -> {latest}")
+    changed = [r for r in rows if r["significant"]]
+    if prev:
+        print(f"diff vs previous run: {len(changed)} significant change(s)")
+        for r in changed[:40]:
+            ship, enemy, stance, policy = r["key"]
+            if r["delta"] is None:
+                print(f"  {ship:8} {enemy:15} {stance:9} {policy:6}  (neu/entfernt)")
+            else:
+                print(f"  {ship:8} {enemy:15} {stance:9} {policy:6}  win {r['prev']:.1%} -> {r['cur']:.1%} ({r['delta']:+.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+from __future__ import annotations
+import random
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from combat.engine import CombatEngine, CombatStance, PlayerStats, combatant_from_stats, roll_start_morale
+
+
+# Policy: entscheidet im Spielerzug eine Aktion ("fire" | "repair" | "quick_repair" | "flee")
+Policy = Callable[[CombatEngine], str]
+
+_PLAYER_ACTIONS = {
+    "fire": CombatEngine.player_fire,
+    "repair": CombatEngine.player_repair,
+    "quick_repair": CombatEngine.player_quick_repair,
+    "flee": CombatEngine.player_flee,
+}
+
+
+# -----------------------------
+# Policies
+# -----------------------------
+def always_fire(engine: CombatEngine) -> str:
+    return "fire"
+
+
+def repair_below(threshold: float = 0.35) -> Policy:
+    """Feuern, unter threshold * hp_max reparieren (Quick Repair bevorzugt, wenn bereit)."""
+    def policy(engine: CombatEngine) -> str:
+        p = engine.p
+        if p.hp < p.hp_max * threshold:
+            if engine.can_use_ability("quick_repair", "player")[0]:
+                return "quick_repair"
+            if engine.can_use_ability("repair", "player")[0]:
+                return "repair"
+        return "fire"
+    return policy
+
+
+def flee_below(threshold: float = 0.25) -> Policy:
+    """Feuern, unter threshold * hp_max fliehen."""
+    def policy(engine: CombatEngine) -> str:
+        p = engine.p
+        if p.hp < p.hp_max * threshold and engine.can_use_ability("flee", "player")[0]:
+            return "flee"
+        return "fire"
+    return policy
+
+
+POLICIES: dict[str, Policy] = {
+    "fire": always_fire,
+    "repair": repair_below(),
+    "flee": flee_below(),
+}
+
+
+# -----------------------------
+# Ergebnisse
+# -----------------------------
+@dataclass
+class FightResult:
+    outcome: str            # "win" | "lose" | "flee" | "enemy_fled" | "timeout"
+    rounds: int
+    player_hp: int
+    player_hp_max: int
+    enemy_hp: int
+    enemy_hp_max: int
+
+
+@dataclass
+class BatchResult:
+    ship_id: str
+    enemy_id: str
+    fights: list[FightResult] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.fights)
+
+    def rate(self, outcome: str) -> float:
+        if not self.fights:
+            return 0.0
+        return sum(1 for f in self.fights if f.outcome == outcome) / len(self.fights)
+
+    @property
+    def win_rate(self) -> float:
+        return self.rate("win")
+
+    @property
+    def lose_rate(self) -> float:
+        return self.rate("lose")
+
+    @property
+    def flee_rate(self) -> float:
+        return self.rate("flee")
+
+    def rounds(self) -> list[int]:
+        return [f.rounds for f in self.fights]
+
+    def player_hp_fractions(self) -> list[float]:
+        return [f.player_hp / max(1, f.player_hp_max) for f in self.fights]
+
+    def enemy_hp_fractions(self) -> list[float]:
+        return [f.enemy_hp / max(1, f.enemy_hp_max) for f in self.fights]
+
+    def summary(self) -> dict:
+        rounds = sorted(self.rounds())
+        p_hp = sorted(self.player_hp_fractions())
+        return {
+            "ship": self.ship_id,
+            "enemy": self.enemy_id,
+            "n": len(self.fights),
+            "win": self.win_rate,
+            "lose": self.lose_rate,
+            "flee": self.flee_rate,
+            "timeout": self.rate("timeout"),
+            "rounds_mean": sum(rounds) / len(rounds) if rounds else 0.0,
+            "rounds_p50": _quantile(rounds, 0.50),
+            "rounds_p95": _quantile(rounds, 0.95),
+            "player_hp_p10": _quantile(p_hp, 0.10),
+            "player_hp_p50": _quantile(p_hp, 0.50),
+            "player_hp_hist": histogram(p_hp),
+        }
+
+
+def _quantile(sorted_values: list, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return float(sorted_values[min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))])
+
+
+def histogram(values: list[float], bins: int = 10) -> list[int]:
+    """Verteilung von Werten in [0..1] auf gleich breite Bins (1.0 landet im letzten Bin)."""
+    out = [0] * bins
+    for v in values:
+        out[min(bins - 1, max(0, int(v * bins)))] += 1
+    return out
+
+
+# -----------------------------
+# Simulation
+# -----------------------------
+def simulate_fight(
+    shipdef,
+    enemydef,
+    policy: Policy = always_fire,
+    rng: Optional[random.Random] = None,
+    pstats: Optional[PlayerStats] = None,
+    max_rounds: int = 200,
+    stance: Optional[CombatStance] = None,
+    player_hp: Optional[int] = None,
+    ai: Optional[str] = None,
+    ai_nodes: Optional[int] = None,
+    ai_tt: Optional[dict] = None,
+) -> FightResult:
+    """
+    Ein Kampf ohne UI: gleiche Engine und gleicher Zugablauf wie CombatState
+    (Spieleraktion -> Engine tickt bis der Spieler wieder dran ist).
+    player_hp = Start-HP des Spielers (None -> volle HP).
+    ai = Schwierigkeit der Gegner-KI (z.B. "schwer"); None -> Gegner feuert immer.
+    ai_nodes = Suchknoten pro KI-Entscheidung (None -> node_budget des Presets).
+    ai_tt = geteilte Transpositionstabelle über mehrere Kämpfe desselben Matchups (optional).
+    """
+    engine = new_fight(shipdef, enemydef, rng, pstats, stance, player_hp, ai, ai_nodes, ai_tt)
+    play_out(engine, policy, max_rounds)
+    return fight_result(engine)
+
+
+def new_fight(
+    shipdef,
+    enemydef,
+    rng: Optional[random.Random] = None,
+    pstats: Optional[PlayerStats] = None,
+    stance: Optional[CombatStance] = None,
+    player_hp: Optional[int] = None,
+    ai: Optional[str] = None,
+    ai_nodes: Optional[int] = None,
+    ai_tt: Optional[dict] = None,
+) -> CombatEngine:
+    """Headless-Kampf aufsetzen wie simulate_fight, ohne ihn zu spielen (zum schrittweisen Rechnen mit play_step)."""
+    rng = rng if rng is not None else random.Random()
+
+    player = combatant_from_stats("You", shipdef.combat, hp=player_hp)
+    enemy = combatant_from_stats(enemydef.name, enemydef.combat)
+    player.morale = roll_start_morale(rng, "player")
+    enemy.morale = roll_start_morale(rng, "enemy")
+
+    engine = CombatEngine(player, enemy, pstats or PlayerStats(), rng=rng)
+    if stance is not None:
+        engine.stance = stance  # feste Haltung für den ganzen Kampf
+    if ai is not None:
+        from combat.enemy_ai import EnemyAI
+        engine.enemy_ai = EnemyAI.for_difficulty(ai, headless=True, node_budget=ai_nodes, tt=ai_tt)
+    return engine
+
+
+def fight_result(engine: CombatEngine) -> FightResult:
+    p, e = engine.p, engine.e
+    return FightResult(
+        outcome=engine.outcome or "timeout",
+        rounds=engine.round_index,
+        player_hp=int(p.hp),
+        player_hp_max=int(p.hp_max),
+        enemy_hp=int(e.hp),
+        enemy_hp_max=int(e.hp_max),
+    )
+
+
+def play_out(engine: CombatEngine, policy: Policy = always_fire, max_rounds: int = 200) -> None:
+    """
+    Spielt einen (auch schon laufenden) Kampf ohne UI zu Ende: Spieleraktion per policy,
+    Engine tickt bis der Spieler wieder dran ist. Events werden verworfen.
+    Nach max_rounds wird abgebrochen (engine.finished bleibt dann False).
+    """
+    while not engine.finished and engine.round_index <= max_rounds:
+        play_step(engine, policy)
+
+
+def play_step(engine: CombatEngine, policy: Policy = always_fire) -> None:
+    """Ein Schritt von play_out (Engine-Tick, ggf. eine Spieleraktion) - zum Verteilen über mehrere Frames."""
+    engine.update(0.0)
+    engine._events.clear()  # Headless: VFX-Events verwerfen
+    if engine.finished or engine.turn_owner != "player":
+        return
+
+    action = policy(engine)
+    act = _PLAYER_ACTIONS.get(action, CombatEngine.player_fire)
+    if not act(engine):
+        # Aktion nicht verfügbar (Cooldown, volle HP, ...) -> feuern
+        CombatEngine.player_fire(engine)
+    engine._events.clear()
+
+
+def simulate_batch(
+    shipdef,
+    enemydef,
+    n: int = 1000,
+    policy: Policy = always_fire,
+    seed: Optional[int] = None,
+    pstats: Optional[PlayerStats] = None,
+    max_rounds: int = 200,
+    stance: Optional[CombatStance] = None,
+    ai: Optional[str] = None,
+    ai_nodes: Optional[int] = None,
+) -> BatchResult:
+    """
+    n unabhängige Kämpfe. Jeder Kampf bekommt einen eigenen Seed aus dem Master-Seed,
+    damit Ergebnisse reproduzierbar sind (und sich später beliebig aufteilen lassen).
+    """
+    master = random.Random(seed)
+    out = BatchResult(ship_id=shipdef.id, enemy_id=enemydef.id)
+    for _ in range(int(n)):
+        rng = random.Random(master.getrandbits(64))
+        out.fights.append(simulate_fight(shipdef, enemydef, policy, rng, pstats, max_rounds, stance, ai=ai, ai_nodes=ai_nodes))
+    return out
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    import argparse
+    from data.loader import load_content
+
+    ap = argparse.ArgumentParser(description="Headless Kampf-Simulation (Schiff vs. Gegner)")
+    ap.add_argument("--ship", required=True)
+    ap.add_argument("--enemy", required=True)
+    ap.add_argument("-n", type=int, default=1000)
+    ap.add_argument("--policy", choices=sorted(POLICIES), default="fire")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--ai", default=None, help="Gegner-KI-Schwierigkeit (leicht/normal/schwer/legendär)")
+    ap.add_argument("--ai-nodes", type=int, default=None, help="Suchknoten pro KI-Entscheidung (Default: Preset)")
+    args = ap.parse_args(argv)
+
+    content = load_content("content")
+    res = simulate_batch(
+        content.ships[args.ship], content.enemies[args.enemy],
+        n=args.n, policy=POLICIES[args.policy], seed=args.seed, ai=args.ai, ai_nodes=args.ai_nodes,
+    )
+    s = res.summary()
+    print(f"{s['ship']} vs {s['enemy']} (n={s['n']}, policy={args.policy})")
+    print(f"  win {s['win']:.1%}  lose {s['lose']:.1%}  flee {s['flee']:.1%}  enemy fled {res.rate('enemy_fled'):.1%}  timeout {s['timeout']:.1%}")
+    print(f"  rounds mean {s['rounds_mean']:.1f}  p50 {s['rounds_p50']:.0f}  p95 {s['rounds_p95']:.0f}")
+    print(f"  player hp p10 {s['player_hp_p10']:.0%}  p50 {s['player_hp_p50']:.0%}  hist {s['player_hp_hist']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Optional
+
+from combat.engine import CombatStance, _LIVE_CACHE, _compute_live_modifiers
+
+# Gegner-KI: Expectimax über ein kompaktes Kampfmodell (HP, Moral, Cooldowns, Verwundbarkeit, Haltungen).
+# - Max-Knoten: Gegnerzug (Feuern / Reparieren / Quick Repair / Flucht, Haltung nur an der Wurzel)
+# - Zufallsknoten: Treffer/Krit/Fehlschuss bzw. Reparatur-Erfolg; der Spieler wird als "feuert" modelliert
+# - Transpositionstabelle über (Zustand, Resttiefe), bleibt über Züge eines Kampfes erhalten
+# - Zeitgeschnitten: think() rechnet pro Frame höchstens budget_ms (während des Turn-Delays),
+#   decide() nimmt das Ergebnis der tiefsten fertigen Iteration
+# - Headless (Batch-Sim, Odds, Auto-Resolve): feste Knotenzahl pro Entscheidung statt Zeit,
+#   damit Ergebnisse reproduzierbar bleiben und ein Zug nicht beliebig lange rechnet
+
+
+@dataclass(frozen=True)
+class AiPreset:
+    depth: int                  # Gegnerzüge voraus
+    budget_ms: float            # Rechenzeit pro Frame
+    flee_value: float           # Bewertung "entkommen" (-1 = versenkt, +1 = Sieg)
+    abilities: tuple = ("fire", "flee")
+    stances: bool = False       # darf die Haltung wechseln
+    quick_repairs: int = 0      # Quick Repairs pro Kampf (ohne Limit ist der Gegner kaum zu versenken)
+    node_budget: int = 0        # Headless: max. Suchknoten pro Entscheidung (Tiefe 1 wird immer fertig)
+
+
+AI_PRESETS = {
+    "leicht": AiPreset(depth=1, budget_ms=1.0, flee_value=-0.45),
+    "normal": AiPreset(depth=2, budget_ms=2.0, flee_value=-0.40, abilities=("fire", "repair", "flee"), stances=True, node_budget=64),
+    "schwer": AiPreset(depth=3, budget_ms=3.0, flee_value=-0.35, abilities=("fire", "repair", "quick_repair", "flee"), stances=True, quick_repairs=1, node_budget=128),
+    "legendär": AiPreset(depth=4, budget_ms=4.0, flee_value=-0.30, abilities=("fire", "repair", "quick_repair", "flee"), stances=True, quick_repairs=2, node_budget=192),
+}
+DEFAULT_AI_PRESET = "normal"
+
+STANCES = (CombatStance.OFFENSIVE, CombatStance.BALANCED, CombatStance.DEFENSIVE)
+
+# Cooldowns wie in CombatEngine._register_base_abilities
+_CD_REPAIR = 1
+_CD_QUICK = 3
+_CD_FLEE = 2
+# Gegenschuss des Spielers (CombatEngine._chip_shot) bei Reparatur bzw. gescheiterter Flucht
+_CHIP_REPAIR = 0.35
+_CHIP_FLEE = 0.60
+
+_TT_MAX = 250_000
+
+# Zustand (nur ints): Index-Konstanten
+E_HP, P_HP, E_MOR, P_MOR, CD_REP, CD_QR, CD_FLEE, E_VULN, P_VULN, E_ST, P_ST, QR_LEFT = range(12)
+
+
+def _mods(stance: CombatStance, morale: int):
+    m = _LIVE_CACHE.get((stance, morale))
+    if m is None:
+        m = _compute_live_modifiers(stance, morale)
+        _LIVE_CACHE[(stance, morale)] = m
+    return m
+
+
+class _Side:
+    """Konstante Kampfwerte einer Seite für das Modell."""
+    __slots__ = ("hp_max", "dmg_avg", "crit_chance", "crit_mult", "armor_mult")
+
+    def __init__(self, unit, target):
+        self.hp_max = max(1, int(unit.hp_max))
+        self.dmg_avg = (int(unit.damage_min) + max(int(unit.damage_min), int(unit.damage_max))) * 0.5
+        self.crit_chance = float(unit.crit_chance)
+        self.crit_mult = max(1.0, float(unit.crit_multiplier))
+        armor = float(target.armor_physical) if str(unit.damage_type) == "physical" else float(target.armor_abyssal)
+        self.armor_mult = max(0.1, 1.0 - ((armor - float(unit.penetration)) / 100.0))
+
+
+class EnemyAI:
+    def __init__(self, preset: AiPreset, headless: bool = False, node_budget: Optional[int] = None,
+                 tt: Optional[dict] = None):
+        self.preset = preset
+        self.depth = max(1, int(preset.depth))
+        self.budget_ms = None if headless else preset.budget_ms  # None = synchron (Headless)
+        # Headless: Knoten pro Entscheidung (None = Preset); im Spiel begrenzt budget_ms pro Frame
+        self.node_budget = max(0, int(preset.node_budget if node_budget is None else node_budget))
+        self.flee_value = float(preset.flee_value)
+        self._abilities = frozenset(preset.abilities) | {"fire"}
+        self._quick_repairs_used = 0
+
+        # tt kann zwischen KIs desselben Matchups geteilt werden (Werte hängen nur von Seiten + Preset ab)
+        self._tt: dict[tuple, float] = {} if tt is None else tt
+        self._sides = None
+        self._hp_quant = (1, 1)
+        self._job = None
+        self._job_key = None
+        self._best = None          # (stance, action)
+        self._best_depth = 0
+        self._deadline = 0.0
+        self._node_cap = float("inf")
+        self._job_nodes0 = 0
+        self.nodes = 0
+
+    @classmethod
+    def for_difficulty(cls, difficulty_id: Optional[str], headless: bool = False,
+                       node_budget: Optional[int] = None, tt: Optional[dict] = None) -> "EnemyAI":
+        preset = AI_PRESETS.get(difficulty_id or "", AI_PRESETS[DEFAULT_AI_PRESET])
+        return cls(preset, headless=headless, node_budget=node_budget, tt=tt)
+
+    # --- Schnittstelle zur Engine ------------------------------------------------
+
+    def think(self, engine, budget_ms: Optional[float] = None) -> bool:
+        """Rechnet höchstens budget_ms an der Entscheidung für den aktuellen Gegnerzug. True = fertig."""
+        if engine.finished or engine.turn_owner != "enemy":
+            return True
+        self._ensure_job(engine)
+        if self._job is None:
+            return True
+        budget = self.budget_ms if budget_ms is None else budget_ms
+        self._deadline = float("inf") if budget is None else perf_counter() + budget / 1000.0
+        if self.budget_ms is None:
+            # Headless, aber zeitgeschnitten: gleicher Knoten-Stopp wie decide() -> gleiche Entscheidung
+            self._node_cap = self._job_nodes0 + self.node_budget
+        self._step_job(until_depth=None)
+        capped = self.nodes >= self._node_cap and self._best_depth >= 1
+        self._node_cap = float("inf")
+        return self._job is None or capped
+
+    def decide(self, engine) -> tuple[Optional[CombatStance], str]:
+        """Haltung + Aktion für den aktuellen Gegnerzug (nutzt, was think() schon gerechnet hat)."""
+        self._ensure_job(engine)
+        if self._job is not None and self.budget_ms is None:
+            # Headless: bis node_budget Knoten (deterministisch), tiefste fertige Iteration zählt
+            self._deadline = float("inf")
+            self._node_cap = self._job_nodes0 + self.node_budget
+            self._step_job(until_depth=None)
+            self._node_cap = float("inf")
+        if self._job is not None and self._best_depth < 1:
+            # im Spiel reicht die tiefste fertige Iteration (min. Tiefe 1, die ist billig)
+            self._deadline = float("inf")
+            self._step_job(until_depth=1)
+        stance, action = self._best or (None, "fire")
+        self._job = None
+        self._job_key = None
+        if action == "quick_repair":
+            self._quick_repairs_used += 1
+        if not self.preset.stances:
+            stance = None
+        return stance, action
+
+    # --- Job-Steuerung -----------------------------------------------------------
+
+    def _ensure_job(self, engine) -> None:
+        key = self._root_key(engine)
+        if key == self._job_key:
+            return
+        if self._sides is None:
+            self._sides = (_Side(engine.e, engine.p), _Side(engine.p, engine.e))
+            self._hp_quant = (max(1, self._sides[0].hp_max // 50), max(1, self._sides[1].hp_max // 50))
+        if len(self._tt) > _TT_MAX:
+            self._tt.clear()
+        self._job_key = key
+        self._job_nodes0 = self.nodes
+        self._best = None
+        self._best_depth = 0
+        self._job = self._root(engine, key)
+
+    def _step_job(self, until_depth: Optional[int]) -> None:
+        job = self._job
+        while job is not None:
+            try:
+                next(job)
+            except StopIteration:
+                self._job = None
+                return
+            if until_depth is not None and self._best_depth >= until_depth:
+                return
+            if perf_counter() >= self._deadline:
+                return
+            if self.nodes >= self._node_cap and self._best_depth >= 1:
+                return
+
+    def _root_key(self, engine) -> tuple:
+        e, p = engine.e, engine.p
+        cd = engine._cd["enemy"]
+        e_st = engine.enemy_stance if engine.enemy_stance is not None else engine.stance
+        state = (
+            int(e.hp), int(p.hp), int(e.morale), int(p.morale),
+            int(cd.get("repair", 0)), int(cd.get("quick_repair", 0)), int(cd.get("flee", 0)),
+            1 if e.quick_repair_vuln_rounds > 0 else 0, 1 if p.quick_repair_vuln_rounds > 0 else 0,
+            STANCES.index(e_st), STANCES.index(engine.stance),
+            max(0, self.preset.quick_repairs - self._quick_repairs_used),
+        )
+        can_switch = self.preset.stances and engine._enemy_stance_changed_round != engine.round_index
+        return state, can_switch
+
+    def _root(self, engine, key):
+        state, can_switch = key
+        stances = range(3) if can_switch else (state[E_ST],)
+        for depth in range(1, self.depth + 1):
+            best = None
+            best_val = float("-inf")
+            for si in stances:
+                st = state[:E_ST] + (si,) + state[E_ST + 1:]
+                for action in self._legal(st):
+                    val = yield from self._action_value(st, action, depth)
+                    if val > best_val + 1e-9:
+                        best_val = val
+                        best = (STANCES[si], action)
+            self._best = best
+            self._best_depth = depth
+            yield  # Iteration fertig -> decide() darf sie nehmen
+
+    # --- Suche ---------------------------------------------------------------------
+
+    def _legal(self, st: tuple) -> list:
+        acts = ["fire"]
+        kit = self._abilities
+        hurt = st[E_HP] < self._sides[0].hp_max
+        if hurt and st[CD_REP] <= 0 and "repair" in kit:
+            acts.append("repair")
+        if hurt and st[CD_QR] <= 0 and st[QR_LEFT] > 0 and "quick_repair" in kit:
+            acts.append("quick_repair")
+        if st[CD_FLEE] <= 0 and "flee" in kit:
+            acts.append("flee")
+        return acts
+
+    def _tt_key(self, st: tuple, depth: int) -> tuple:
+        # kompakter Schlüssel: HP in 2%-Schritten, Moral in 5er-Schritten -> ähnliche Zustände teilen sich Werte
+        e_q, p_q = self._hp_quant
+        return (
+            st[E_HP] // e_q, st[P_HP] // p_q, st[E_MOR] // 5, st[P_MOR] // 5,
+            st[CD_REP], st[CD_QR], st[CD_FLEE], st[E_VULN], st[P_VULN], st[E_ST], st[P_ST], st[QR_LEFT], depth,
+        )
+
+    def _max_node(self, st: tuple, depth: int):
+        key = self._tt_key(st, depth)
+        v = self._tt.get(key)
+        if v is not None:
+            return v
+        self.nodes += 1
+        if self.nodes >= self._node_cap or perf_counter() >= self._deadline:
+            yield
+
+        best = float("-inf")
+        for action in self._legal(st):
+            val = yield from self._action_value(st, action, depth)
+            if val > best:
+                best = val
+        self._tt[key] = best
+        return best
+
+    def _action_value(self, st: tuple, action: str, depth: int):
+        total = 0.0
+        for prob, nxt, terminal in self._enemy_outcomes(st, action):
+            if prob <= 0.0:
+                continue
+            if terminal is not None:
+                total += prob * terminal
+            else:
+                total += prob * (yield from self._player_node(nxt, depth))
+        return total
+
+    def _player_node(self, st: tuple, depth: int):
+        # Spieler feuert; danach Rundenende (Cooldowns, Verwundbarkeit)
+        total = 0.0
+        for prob, nxt in self._fire_outcomes(st, attacker_is_enemy=False):
+            if prob <= 0.0:
+                continue
+            if nxt[E_HP] <= 0:
+                total += prob * -1.0
+                continue
+            nxt = self._end_round(nxt)
+            if depth <= 1:
+                total += prob * self._evaluate(nxt)
+            else:
+                total += prob * (yield from self._max_node(nxt, depth - 1))
+        return total
+
+    def _end_round(self, st: tuple) -> tuple:
+        s = list(st)
+        s[CD_REP] = max(0, s[CD_REP] - 1)
+        s[CD_QR] = max(0, s[CD_QR] - 1)
+        s[CD_FLEE] = max(0, s[CD_FLEE] - 1)
+        s[E_VULN] = 0
+        s[P_VULN] = 0
+        return tuple(s)
+
+    def _evaluate(self, st: tuple) -> float:
+        e_side, p_side = self._sides
+        hp = st[E_HP] / e_side.hp_max - st[P_HP] / p_side.hp_max
+        mor = (st[E_MOR] - st[P_MOR]) / 100.0
+        return 0.5 * hp + 0.1 * mor
+
+    def _enemy_outcomes(self, st: tuple, action: str):
+        """[(p, state, terminal_value|None)] für eine Gegneraktion."""
+        if action == "fire":
+            out = []
+            for prob, nxt in self._fire_outcomes(st, attacker_is_enemy=True):
+                out.append((prob, nxt, 1.0 if nxt[P_HP] <= 0 else None))
+            return out
+
+        e_side = self._sides[0]
+        stance = STANCES[st[E_ST]]
+        mods = _mods(stance, st[E_MOR])
+        s = list(st)
+
+        if action == "quick_repair":
+            heal = int(round(max(8, int(round(e_side.hp_max * 0.30))) * mods.repair))
+            s[E_HP] = min(e_side.hp_max, s[E_HP] + heal)
+            s[E_MOR] = max(0, s[E_MOR] - 18)
+            s[E_VULN] = 1
+            s[CD_QR] = _CD_QUICK
+            s[QR_LEFT] -= 1
+            return [(1.0, tuple(s), None)]
+
+        if action == "repair":
+            s[CD_REP] = _CD_REPAIR
+            stress = 5 + (3 if stance is CombatStance.OFFENSIVE else -1 if stance is CombatStance.DEFENSIVE else 0)
+            stress = max(2, stress)
+            panic = float(mods.panic_fail)
+            m = max(0, min(100, st[E_MOR])) / 100.0
+            success = max(0.10, min(0.95, 0.35 + 0.55 * m))
+            heal = int(round(max(3, int(round(e_side.hp_max * 0.10))) * mods.repair))
+
+            s_panic = list(s)
+            s_panic[E_MOR] = max(0, s[E_MOR] - 4)
+            s_ok = list(s)
+            s_ok[E_HP] = min(e_side.hp_max, s[E_HP] + heal)
+            s_ok[E_MOR] = max(0, min(100, s[E_MOR] + 1) - stress)
+            s_fail = list(s)
+            s_fail[E_MOR] = max(0, s[E_MOR] - 4 - stress)
+            out = [(panic, tuple(s_panic), None)]
+            # Panik bricht vor dem Gegenschuss ab, sonst schießt der Spieler zurück
+            out += self._chip_outcomes((1.0 - panic) * success, tuple(s_ok), _CHIP_REPAIR)
+            out += self._chip_outcomes((1.0 - panic) * (1.0 - success), tuple(s_fail), _CHIP_REPAIR)
+            return out
+
+        if action == "flee":
+            s[CD_FLEE] = _CD_FLEE
+            chance = self._flee_chance(st)
+            s[E_MOR] = max(0, s[E_MOR] - 8)
+            return [(chance, tuple(s), self.flee_value)] + self._chip_outcomes(1.0 - chance, tuple(s), _CHIP_FLEE)
+
+        return [(1.0, st, None)]
+
+    def _chip_outcomes(self, prob: float, st: tuple, mult: float) -> list:
+        """Gegenschuss des Spielers mit mult auf st (versenkt -> -1)."""
+        return [
+            (prob * p, nxt, -1.0 if nxt[E_HP] <= 0 else None)
+            for p, nxt in self._fire_outcomes(st, attacker_is_enemy=False, mult=mult)
+        ]
+
+    def _flee_chance(self, st: tuple) -> float:
+        # wie CombatEngine._compute_flee_chance("enemy")
+        p_side = self._sides[1]
+        stance = STANCES[st[E_ST]]
+        m = max(0.0, min(1.0, st[E_MOR] / 100.0))
+        morale_term = -0.10 + 0.30 * m
+        stance_term = 0.10 if stance is CombatStance.DEFENSIVE else -0.08 if stance is CombatStance.OFFENSIVE else 0.0
+        pressure = 0.20 * max(0.0, min(1.0, st[P_HP] / p_side.hp_max)) + 0.15 * max(0.0, min(1.0, st[P_MOR] / 100.0))
+        return max(0.05, min(0.85, 0.20 + morale_term + stance_term - pressure))
+
+    def _fire_outcomes(self, st: tuple, attacker_is_enemy: bool, mult: float = 1.0):
+        """Fehlschuss / Treffer / Krit mit Durchschnittsschaden (wie CombatEngine._fire)."""
+        if attacker_is_enemy:
+            side = self._sides[0]
+            a_hp, d_hp, a_mor, d_mor, d_vuln = E_HP, P_HP, E_MOR, P_MOR, P_VULN
+            stance = STANCES[st[E_ST]]
+        else:
+            side = self._sides[1]
+            a_hp, d_hp, a_mor, d_mor, d_vuln = P_HP, E_HP, P_MOR, E_MOR, E_VULN
+            stance = STANCES[st[P_ST]]
+
+        mods = _mods(stance, st[a_mor])
+        hit = max(0.05, min(0.95, 0.75 * mods.hit))
+        crit = max(0.0, min(1.0, side.crit_chance * mods.hit))
+        vuln = 1.35 if st[d_vuln] else 1.0
+
+        miss = list(st)
+        miss[a_mor] = max(0, st[a_mor] - (10 if stance is CombatStance.OFFENSIVE else 6))
+
+        base = mult * side.armor_mult * mods.damage
+        dmg_hit = max(1, int(round(int(round(side.dmg_avg * base)) * vuln)))
+        dmg_crit = max(1, int(round(int(round(round(side.dmg_avg * side.crit_mult) * base)) * vuln)))
+
+        s_hit = list(st)
+        s_hit[d_hp] = max(0, st[d_hp] - dmg_hit)
+        s_hit[d_mor] = max(0, min(100, st[d_mor] - 4))
+        s_hit[a_mor] = max(0, min(100, st[a_mor] + 2))
+
+        s_crit = list(st)
+        s_crit[d_hp] = max(0, st[d_hp] - dmg_crit)
+        s_crit[d_mor] = max(0, min(100, st[d_mor] - 8))
+        s_crit[a_mor] = max(0, min(100, st[a_mor] + 4))
+
+        if attacker_is_enemy:
+            s_hit[P_VULN] = s_crit[P_VULN] = 0
+
+        return (
+            (1.0 - hit, tuple(miss)),
+            (hit * (1.0 - crit), tuple(s_hit)),
+            (hit * crit, tuple(s_crit)),
+        )
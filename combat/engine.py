@@ -0,0 +1,1244 @@
+from __future__ import annotations
+import random
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Optional, Tuple
+
+# Reine Kampflogik ohne pygame: wird von states/combat.py (UI) und von
+# Headless-Tools (combat/batch_sim.py) gemeinsam genutzt.
+
+
+# -----------------------------
+# Data / Definitions (v1)
+# -----------------------------
+class CombatStance(Enum):
+    OFFENSIVE = "offensive"
+    BALANCED = "balanced"
+    DEFENSIVE = "defensive"
+
+@dataclass
+class PlayerStats:
+    cannon_damage_mult: float = 1.0
+    reload_mult: float = 1.0
+    boarding_damage_mult: float = 1.0
+    repair_mult: float = 1.0
+    evade_mult: float = 1.0
+    flee_mult: float = 1.0
+
+
+@dataclass
+class CombatantRuntime:
+    name: str
+
+    # Defensive
+    hp: int
+    hp_max: int
+    armor_physical: float  # percent
+    armor_abyssal: float   # percent
+
+    # Offensive
+    damage_min: int
+    damage_max: int
+    damage_type: str       # "physical" | "abyssal"
+    penetration: float     # percent, can exceed 100
+    crit_chance: float     # 0..1
+    crit_multiplier: float # e.g. 1.5, 2.0
+
+    # Tempo
+    initiative_base: float
+
+    # Meta
+    difficulty_tier: int
+    threat_level: int
+
+    # Status effects
+    status: dict = field(default_factory=dict)
+
+    # Morale
+    morale: int = 100  # 0..100
+
+    #Additional stats for abilities/statuses
+    quick_repair_vuln_rounds: int = 0  # erhöht eingehenden Schaden für N Runden
+
+    # Modifier-Cache (CombatEngine.get_live_combat_multipliers): gültig für (Haltung, Moral)
+    _mods: Optional["LiveModifiers"] = field(default=None, init=False, repr=False, compare=False)
+    _mods_stance: Optional[CombatStance] = field(default=None, init=False, repr=False, compare=False)
+    _mods_morale: int = field(default=-1, init=False, repr=False, compare=False)
+
+@dataclass
+class AbilitySpec:
+    id: str
+    name: str
+    cooldown_rounds: int = 0
+
+    # morale handling
+    morale_cost: int = 0          # subtract on use
+    morale_delta: int = 0         # add (or subtract) on use
+
+    # conditions + execution
+    # can_use returns (ok, reason)
+    can_use: Optional[Callable[["CombatEngine", str], Tuple[bool, str]]] = None
+
+    # execute returns a result dict; ctx can be used for params like {"mult": 0.35}
+    execute: Optional[Callable[["CombatEngine", str, dict], dict]] = None
+
+
+# -----------------------------
+# Modifier-Records (gecacht, unveränderlich)
+# -----------------------------
+@dataclass(frozen=True, slots=True)
+class LiveModifiers:
+    damage: float
+    hit: float
+    repair: float
+    flee: float
+    panic_fail: float
+
+
+@dataclass(frozen=True, slots=True)
+class StanceModifiers:
+    damage: float
+    morale: float
+    flee: float
+
+
+@dataclass(frozen=True, slots=True)
+class MoraleModifiers:
+    hit: float
+    repair: float
+    flee: float
+    panic_fail: float
+
+
+@dataclass(frozen=True, slots=True)
+class DebugModifiers:
+    cannon: float
+    reload: float
+    boarding: float
+    repair: float
+    evade: float
+    flee: float
+
+    def items(self) -> tuple[tuple[str, float], ...]:
+        # Anzeige-Reihenfolge/-Namen fürs Debug-Panel
+        return (
+            ("Cannon Damage", self.cannon),
+            ("Reload Speed", self.reload),
+            ("Boarding Damage", self.boarding),
+            ("Repair Power", self.repair),
+            ("Evade", self.evade),
+            ("Flee", self.flee),
+        )
+
+
+_STANCE_MODIFIERS = {
+    CombatStance.OFFENSIVE: StanceModifiers(damage=1.20, morale=-1.0, flee=0.75),
+    CombatStance.DEFENSIVE: StanceModifiers(damage=0.85, morale=+1.0, flee=1.25),
+    CombatStance.BALANCED: StanceModifiers(damage=1.0, morale=0.0, flee=1.0),
+}
+
+_MORALE_MODIFIERS = {
+    "bonus": MoraleModifiers(hit=1.10, repair=1.15, flee=0.85, panic_fail=0.0),
+    "neutral": MoraleModifiers(hit=1.0, repair=1.0, flee=1.0, panic_fail=0.0),
+    "malus": MoraleModifiers(hit=0.85, repair=0.75, flee=1.15, panic_fail=0.0),
+    "panic": MoraleModifiers(hit=0.65, repair=0.50, flee=1.35, panic_fail=0.25),  # 25% Aktion scheitert
+}
+
+# Live-/Debug-Multiplikatoren hängen nur von (Haltung, Moral) ab -> prozessweit memoisiert
+# (max. 3 × 101 Einträge, geteilt von allen Engines, auch in Batch-Sims)
+_LIVE_CACHE: dict[tuple, LiveModifiers] = {}
+_DEBUG_CACHE: dict[tuple, DebugModifiers] = {}
+
+
+class CombatEngine:
+    """
+    MVP-Engine:
+    - distance in [0..1], 0 = Boarding-Reichweite, 1 = weit weg
+    - Aktionen via trigger_* Methoden
+    - update(sim_dt) tickt cooldowns und simple enemy AI
+    """
+
+    def __init__(self, player: CombatantRuntime, enemy: CombatantRuntime, pstats: PlayerStats, rng=None):
+        self.p = player
+        self.e = enemy
+        self.pstats = pstats
+
+        # Zufallsquelle: im Spiel das globale random-Modul, in Headless-Sims ein eigenes random.Random
+        self.rng = rng if rng is not None else random
+
+        self.log = deque(maxlen=10)
+        self.finished: bool = False
+        self.outcome: Optional[str] = None  # "win" | "lose" | "flee"
+
+        #Reward
+        self.rewards = {"gold": 0, "xp": 0, "cargo": []}  # cargo: list[tuple[good_id, tons]]
+
+        # --- AI state ---
+        self._events = deque()
+
+
+        # Runden-Tracking (future-proof)
+        self.round_index: int = 0
+        self.turn_owner: str = "player"   # "player" | "enemy"
+        self._turn_queue: list[str] = []
+        self.last_initiative: dict = {"player": 0.0, "enemy": 0.0}
+
+        # --- Combat Stance ---
+        self.stance: CombatStance = CombatStance.BALANCED
+        self._stance_changed_this_round: bool = False
+        # eigene Gegner-Haltung (None = folgt der Spieler-Haltung, Verhalten ohne KI)
+        self.enemy_stance: Optional[CombatStance] = None
+        self._enemy_stance_changed_round: int = -1
+
+        # Gegner-KI (combat/enemy_ai.py); None = Gegner feuert immer
+        self.enemy_ai = None
+        # Kampfmitschnitt (combat/replay.py); None = keine Aufzeichnung
+        self.recorder = None
+        # track morale tier changes (for feedback)
+        self._last_morale_tier = {
+            "player": self._morale_tier(self.p.morale),
+            "enemy": self._morale_tier(self.e.morale),
+        }
+
+        # --- Abilities / cooldowns (C1) ---
+        self._abilities: dict[str, AbilitySpec] = {}
+        self._cd: dict[str, dict[str, int]] = {"player": {}, "enemy": {}}
+
+        self._register_base_abilities()
+
+
+
+    def pop_event(self) -> Optional[dict]:
+        if not self._events:
+            return None
+        return self._events.popleft()
+
+    def add_event(self, ev: dict) -> None:
+        if not hasattr(self, "_events") or self._events is None:
+            self._events = deque()
+        self._events.append(ev)
+        if self.recorder is not None:
+            self.recorder.event(ev)
+
+    def _record(self, token: str) -> None:
+        if self.recorder is not None:
+            self.recorder.intent(token)
+
+
+    def _register_base_abilities(self) -> None:
+        self.register_ability(AbilitySpec(
+            id="fire",
+            name="Fire",
+            cooldown_rounds=0,
+            can_use=None,
+            execute=lambda eng, side, ctx: eng._ability_fire(side, ctx),
+        ))
+
+        self.register_ability(AbilitySpec(
+            id="repair",
+            name="Repair",
+            cooldown_rounds=1,
+            can_use=lambda eng, side: (eng._unit(side).hp < eng._unit(side).hp_max, "full_hp"),
+            execute=lambda eng, side, ctx: eng._ability_repair(side, ctx),
+        ))
+
+        self.register_ability(AbilitySpec(
+            id="flee",
+            name="Flee",
+            cooldown_rounds=2,
+            can_use=None,
+            execute=lambda eng, side, ctx: eng._ability_flee(side, ctx),
+        ))
+
+        self.register_ability(AbilitySpec(
+            id="quick_repair",
+            name="Quick Repair",
+            cooldown_rounds=3,
+            can_use=None,
+            execute=lambda eng, side, ctx: eng._ability_quick_repair(side, ctx),
+        ))
+
+
+    def register_ability(self, spec: AbilitySpec) -> None:
+        self._abilities[spec.id] = spec
+        for s in ("player", "enemy"):
+            self._cd[s].setdefault(spec.id, 0)
+
+    def can_use_ability(self, ability_id: str, side: str) -> tuple[bool, str]:
+        if self.finished:
+            return False, "finished"
+        if side not in ("player", "enemy"):
+            return False, "bad_side"
+        if ability_id not in self._abilities:
+            return False, "unknown"
+        if self.turn_owner != side:
+            return False, "not_your_turn"
+
+        spec = self._abilities[ability_id]
+
+        if self._cd[side].get(ability_id, 0) > 0:
+            return False, "cooldown"
+
+        actor = self.p if side == "player" else self.e
+        if spec.morale_cost > 0 and actor.morale < spec.morale_cost:
+            return False, "low_morale"
+
+        if spec.can_use:
+            ok, reason = spec.can_use(self, side)
+            if not ok:
+                return False, reason
+
+        return True, ""
+
+    def use_ability(self, ability_id: str, side: str, ctx: Optional[dict] = None) -> Optional[dict]:
+        ok, reason = self.can_use_ability(ability_id, side)
+        if not ok:
+            if side == "player":
+                self.add_log(f"{ability_id.upper()} not available ({reason}).")
+            return None
+
+        spec = self._abilities.get(ability_id)
+        if not spec:
+            return None
+
+        if ctx is None:
+            ctx = {}
+
+        actor = self.p if side == "player" else self.e
+
+        # morale cost/effect
+        if spec.morale_cost:
+            actor.morale = max(0, actor.morale - int(spec.morale_cost))
+        if spec.morale_delta:
+            actor.morale = max(0, min(100, actor.morale + int(spec.morale_delta)))
+
+        # 🔧 SICHERER EXECUTE
+        if spec.execute:
+            res = spec.execute(self, side, ctx)
+        else:
+            res = {"result": "noop"}
+
+        # cooldown
+        if spec.cooldown_rounds > 0:
+            self._cd[side][ability_id] = int(spec.cooldown_rounds)
+
+        return res
+
+    def _morale_tier(self, morale: int) -> str:
+        if morale >= 80:
+            return "bonus"
+        if morale >= 40:
+            return "neutral"
+        if morale >= 20:
+            return "malus"
+        return "panic"
+
+    def _morale_modifiers(self, morale: int) -> MoraleModifiers:
+        return _MORALE_MODIFIERS[self._morale_tier(morale)]
+
+    def get_live_combat_multipliers(self, unit) -> LiveModifiers:
+        """
+        SINGLE SOURCE OF TRUTH.
+        All combat systems must use this.
+        Pro Einheit versioniert: neu berechnet wird nur, wenn sich Haltung oder Moral geändert haben.
+        """
+        stance = self._stance_for(unit)
+        morale = unit.morale
+        if unit._mods_stance is stance and unit._mods_morale == morale:
+            return unit._mods
+
+        mods = _LIVE_CACHE.get((stance, morale))
+        if mods is None:
+            mods = _compute_live_modifiers(stance, morale)
+            _LIVE_CACHE[(stance, morale)] = mods
+
+        unit._mods = mods
+        unit._mods_stance = stance
+        unit._mods_morale = morale
+        return mods
+
+    def _unit(self, side: str) -> CombatantRuntime:
+        return self.p if side == "player" else self.e
+
+    def _stance_for(self, unit) -> CombatStance:
+        if unit is self.e and self.enemy_stance is not None:
+            return self.enemy_stance
+        return self.stance
+
+    def _compute_enemy_pressure(self, side: str = "player") -> float:
+        """
+        0.00 .. 0.35 typical.
+        Higher = harder to flee. side = wer fliehen will (Druck kommt von der Gegenseite).
+        """
+        other = self.e if side == "player" else self.p
+        hp_frac = 0.0
+        if other.hp_max > 0:
+            hp_frac = max(0.0, min(1.0, other.hp / other.hp_max))
+
+        morale_frac = max(0.0, min(1.0, other.morale / 100.0))
+
+        # weighted pressure
+        return 0.20 * hp_frac + 0.15 * morale_frac
+
+    def _compute_flee_chance(self, side: str = "player") -> float:
+        base = 0.20  # not a panic exit
+        unit = self._unit(side)
+
+        # morale contribution: -0.10 .. +0.20
+        m = max(0.0, min(1.0, unit.morale / 100.0))
+        morale_term = -0.10 + 0.30 * m
+
+        # stance contribution
+        stance = self._stance_for(unit)
+        if stance is CombatStance.DEFENSIVE:
+            stance_term = +0.10
+        elif stance is CombatStance.OFFENSIVE:
+            stance_term = -0.08
+        else:
+            stance_term = 0.0
+
+        pressure = self._compute_enemy_pressure(side)
+
+        chance = base + morale_term + stance_term - pressure
+        return max(0.05, min(0.85, chance))
+
+    def _apply_low_morale_flee_penalty(self) -> dict:
+        """
+        Returns penalty dict (for UI/log). Does not assume economy model.
+        """
+        if self.p.morale >= 20:
+            return {"penalty": None}
+
+        # chance grows as morale drops: 20 -> 0.25, 0 -> 0.60
+        t = (20 - self.p.morale) / 20.0
+        chance = 0.25 + 0.35 * t
+
+        if self.rng.random() >= chance:
+            return {"penalty": None}
+
+        # penalty is abstract (hook)
+        return {"penalty": "crew_scatter", "chance": chance}
+
+    def player_fire(self) -> bool:
+        self._record("fire")
+        res = self.use_ability("fire", "player")
+        if not res:
+            return False
+
+        # if combat ended inside executor, don't advance turn
+        if not self.finished:
+            self._advance_turn()
+        return True
+
+    def player_attack(self) -> bool:
+        # Backward compatibility: route to player_fire()
+        return self.player_fire()
+
+    def player_repair(self) -> bool:
+        self._record("repair")
+        res = self.use_ability("repair", "player")
+        if not res:
+            return False
+
+        # action consumed unless combat ended (repair doesn't end combat)
+        if not self.finished:
+            self._advance_turn()
+        return True
+
+    def player_flee(self) -> bool:
+        self._record("flee")
+        res = self.use_ability("flee", "player")
+        if not res:
+            return False
+
+        # If flee succeeded, combat already ended inside executor.
+        if res.get("result") != "success" and not self.finished:
+            self._advance_turn()
+
+        return True
+    
+    def player_quick_repair(self) -> bool:
+        self._record("quick_repair")
+        res = self.use_ability("quick_repair", "player")
+        if not res:
+            return False
+
+        if not self.finished:
+            self._advance_turn()
+        return True
+
+    def _ability_fire(self, side: str, ctx: dict) -> dict:
+        if self.finished:
+            return {"result": "finished"}
+
+        if side not in ("player", "enemy"):
+            return {"result": "bad_side"}
+
+        # turn ownership check: only enforce for player; enemy auto-actions can bypass if you want
+        if side == "player" and self.turn_owner != "player":
+            return {"result": "no_turn"}
+
+        attacker = self.p if side == "player" else self.e
+        defender = self.e if side == "player" else self.p
+
+        mult = float(ctx.get("mult", 1.0))
+        res = self._fire(attacker=attacker, defender=defender, mult=mult)
+
+        # emit event for both sides
+        self.add_event({
+            "type": "fire",
+            "side": side,
+            "result": res.get("result"),
+            "hull": int(res.get("hull", 0)),
+            "applied": list(res.get("applied", [])),
+        })
+
+        if side == "player":
+            self.add_log(f"You fire: -{int(res.get('hull', 0))} hull.")
+        else:
+            self.add_log(f"Enemy fires: -{int(res.get('hull', 0))} hull.")
+
+        if self._check_finish():
+            self._stop_turns()
+            return {"result": "finished", **res}
+
+        return {"result": "ok", **res}
+
+    def _chip_shot(self, side: str, mult: float) -> dict:
+        """
+        Gegenschuss von side, während die andere Seite am Zug ist (Reparatur, gescheiterte Flucht).
+        Läuft direkt über _fire: kein Zug-Check, kein Cooldown, kein Replay-Eintrag.
+        """
+        attacker = self.p if side == "player" else self.e
+        defender = self.e if side == "player" else self.p
+        res = self._fire(attacker=attacker, defender=defender, mult=mult)
+
+        self.add_event({
+            "type": "fire",
+            "side": side,
+            "result": res.get("result"),
+            "hull": int(res.get("hull", 0)),
+            "applied": list(res.get("applied", [])),
+        })
+        if side == "player":
+            self.add_log(f"You fire back: -{int(res.get('hull', 0))} hull.")
+        else:
+            self.add_log(f"Enemy fires back: -{int(res.get('hull', 0))} hull.")
+
+        self._check_finish()
+        return res
+
+    def _ability_repair(self, side: str, ctx: dict) -> dict:
+        if side not in ("player", "enemy"):
+            return {"result": "blocked"}
+
+        if self.finished or self.turn_owner != side:
+            return {"result": "no_turn"}
+
+        unit = self._unit(side)
+        other = "enemy" if side == "player" else "player"
+        who = "" if side == "player" else "Enemy "
+
+        mods = self.get_live_combat_multipliers(unit)
+
+        # panic check
+        panic = float(mods.panic_fail)
+        if panic > 0.0 and self.rng.random() < panic:
+            self.add_log(f"{who}Repair failed due to panic!")
+            unit.morale = max(0, unit.morale - 4)
+            return {"result": "panic_fail", "heal": 0}
+
+        # success roll
+        success_chance = self._compute_repair_success(unit)
+        roll = self.rng.random()
+        success = roll < success_chance
+
+        base_heal = int(round(unit.hp_max * 0.10))
+        base_heal = max(3, base_heal)
+
+        heal = int(round(base_heal * float(mods.repair)))
+
+        stress_loss = 5
+        stance = self._stance_for(unit)
+        if stance is CombatStance.OFFENSIVE:
+            stress_loss += 3
+        elif stance is CombatStance.DEFENSIVE:
+            stress_loss -= 1
+        stress_loss = max(2, stress_loss)
+
+        applied_heal = 0
+        if success:
+            old_hp = unit.hp
+            unit.hp = min(unit.hp_max, unit.hp + heal)
+            applied_heal = unit.hp - old_hp
+            self.add_log(f"{who}Repair succeeded (+{applied_heal} HP) (p={success_chance:.2f}, r={roll:.2f})")
+            unit.morale = min(100, unit.morale + 1)
+        else:
+            self.add_log(f"{who}Repair failed (p={success_chance:.2f}, r={roll:.2f})")
+            unit.morale = max(0, unit.morale - 4)
+
+        unit.morale = max(0, unit.morale - stress_loss)
+
+        # chip shot
+        chip_res = self._chip_shot(other, 0.35)
+
+        self.add_event({
+            "type": "repair",
+            "side": side,
+            "amount": applied_heal,
+        })
+
+        return {
+            "result": "success" if success else "fail",
+            "heal": applied_heal,
+            "p": success_chance,
+            "r": roll,
+            "chip": {
+                "result": chip_res.get("result") if chip_res else None,
+                "hull": int(chip_res.get("hull", 0)) if chip_res else 0
+            }
+
+        }
+
+    def _ability_flee(self, side: str, ctx: dict) -> dict:
+        if side not in ("player", "enemy"):
+            return {"result": "blocked"}
+
+        if self.finished or self.turn_owner != side:
+            return {"result": "no_turn"}
+
+        unit = self._unit(side)
+        other = "enemy" if side == "player" else "player"
+
+        chance = self._compute_flee_chance(side)
+        roll = self.rng.random()
+        success = roll < chance
+
+        if success and side == "enemy":
+            self.add_event({
+                "type": "flee",
+                "side": "enemy",
+                "success": True
+            })
+            self.add_log(f"The enemy escaped! (p={chance:.2f}, r={roll:.2f})")
+
+            self.finished = True
+            self.outcome = "enemy_fled"
+            self.rewards = {}
+            self._stop_turns()
+
+            return {"result": "success", "p": chance, "r": roll}
+
+        if success:
+            penalty = self._apply_low_morale_flee_penalty()
+
+            self.add_event({
+                "type": "flee",
+                "side": "player",
+                "success": True
+            })
+
+            if penalty.get("penalty"):
+                self.add_log(f"Flee succeeded, but chaos ensued ({penalty['penalty']})!")
+                self.add_event({"type": "flee_penalty", **penalty})
+            else:
+                self.add_log("Flee succeeded!")
+
+            self.add_log(f"(p={chance:.2f}, r={roll:.2f})")
+
+            self.finished = True
+            self.outcome = "flee"
+            self._stop_turns()
+
+            return {"result": "success", "p": chance, "r": roll, "penalty": penalty}
+
+        # failure
+        if side == "player":
+            self.add_log(f"Flee failed! (p={chance:.2f}, r={roll:.2f})")
+        else:
+            self.add_log(f"Enemy tried to flee and failed! (p={chance:.2f}, r={roll:.2f})")
+        unit.morale = max(0, unit.morale - 8)
+
+        chip_res = self._chip_shot(other, 0.60)
+        self.add_event({
+            "type": "flee",
+            "side": side,
+            "success": False
+        })
+
+        return {
+            "result": "fail",
+            "p": chance,
+            "r": roll,
+            "chip": {
+                "result": chip_res.get("result") if chip_res else None,
+                "hull": int(chip_res.get("hull", 0)) if chip_res else 0
+            }
+        }
+
+    def _ability_quick_repair(self, side: str, ctx: dict) -> dict:
+        if side not in ("player", "enemy"):
+            return {"result": "blocked"}
+
+        if self.finished or self.turn_owner != side:
+            return {"result": "no_turn"}
+
+        unit = self._unit(side)
+        mods = self.get_live_combat_multipliers(unit)
+
+        # großer Heal: 30% max HP (mit repair-mult)
+        base_heal = int(round(unit.hp_max * 0.30))
+        base_heal = max(8, base_heal)
+        heal = int(round(base_heal * float(mods.repair)))
+
+        old_hp = unit.hp
+        unit.hp = min(unit.hp_max, unit.hp + heal)
+        applied = unit.hp - old_hp
+
+        # starker Moralverlust
+        morale_loss = 18
+        unit.morale = max(0, unit.morale - morale_loss)
+
+        # Verwundbarkeit nächste Runde
+        unit.quick_repair_vuln_rounds = max(unit.quick_repair_vuln_rounds, 1)
+
+        self.add_event({
+            "type": "quick_repair",
+            "side": side,
+            "heal": int(applied),
+        })
+
+        if side == "player":
+            self.add_log(f"Quick Repair! +{applied} HP, -{morale_loss} morale. Vulnerable next round.")
+        else:
+            self.add_log(f"Enemy Quick Repair! +{applied} HP. Vulnerable next round.")
+
+        return {"result": "ok", "heal": int(applied)}
+
+    def _compute_rewards(self) -> dict:
+        # sauber am neuen Modell orientiert
+        dmg_avg = (self.e.damage_min + self.e.damage_max) * 0.5
+        armor_avg = (self.e.armor_physical + self.e.armor_abyssal) * 0.5
+
+        danger = (
+            self.e.hp_max * 0.35 +
+            dmg_avg * 6.0 +
+            armor_avg * 1.2 +
+            self.e.threat_level * 35.0 +
+            self.e.difficulty_tier * 25.0
+        )
+        gold = int(8 + danger * 0.12)
+        xp = int(4 + danger * 0.09)
+
+        # cargo-drops machen wir später datengetrieben (EnemyDef.loot.cargo)
+        return {"gold": gold, "xp": xp, "cargo": []}
+    
+    def add_log(self, msg: str) -> None:
+        self.log.append(msg)
+
+    def update(self, dt: float) -> None:
+        if self.finished:
+            return
+
+        # check for death after DOT
+        if self._check_finish():
+            self._stop_turns()
+            return
+
+        # nur Ticks mitschreiben, die etwas tun (Rundenstart / Gegnerzug)
+        if self.recorder is not None and (self.round_index == 0 or not self._turn_queue or self.turn_owner == "enemy"):
+            self._record("t")
+
+        # Turn-based round init
+        if self.round_index == 0 or not self._turn_queue:
+            self._start_new_round()
+
+        # enemy auto-turn (max 1 action per frame)
+        if self.turn_owner == "enemy":
+            self._enemy_take_turn()
+            return
+        
+    def set_stance(self, stance: CombatStance) -> bool:
+        """
+        Returns True if stance was changed.
+        Can be called only once per round.
+        """
+        if self.finished:
+            return False
+
+        self._record(f"s:{stance.value}")
+        if self._stance_changed_this_round:
+            return False
+
+        if stance == self.stance:
+            return False
+
+        self.stance = stance
+        self._stance_changed_this_round = True
+        self.add_log(f"Stance set to {stance.name.title()}")
+
+        return True
+
+    def _stance_modifiers(self) -> StanceModifiers:
+        """
+        Central stance balance table.
+        """
+        return _STANCE_MODIFIERS[self.stance]
+
+    def _stop_turns(self) -> None:
+        self._turn_queue = []
+        self.turn_owner = "none"
+
+    def _apply_status(self, target: CombatantRuntime, key: str, payload: dict) -> bool:
+        """
+        Returns True if status was newly applied, False if refreshed/updated.
+        """
+        if key not in target.status:
+            target.status[key] = dict(payload)
+            return True
+
+        # refresh duration (keep strongest values if needed)
+        target.status[key]["dur"] = max(target.status[key].get("dur", 0.0), payload.get("dur", 0.0))
+        # merge known numeric fields (simple: max)
+        for k, v in payload.items():
+            if k == "dur":
+                continue
+            try:
+                target.status[key][k] = max(float(target.status[key].get(k, 0.0)), float(v))
+            except Exception:
+                target.status[key][k] = v
+        return False
+
+
+    def _remove_status(self, target: CombatantRuntime, key: str) -> None:
+        if key in target.status:
+            del target.status[key]
+
+    def _tick_statuses(self, target: CombatantRuntime, sim_dt: float) -> None:
+        if not target.status:
+            return
+
+        to_remove = []
+
+        # Leak: hull DOT
+        leak = target.status.get("leak")
+        if leak:
+            dps = float(leak.get("dps", self.LEAK_DPS))
+            dmg = max(0, int(dps * sim_dt))
+            # ensure DOT does something even on small dt
+            if dmg == 0 and sim_dt > 0:
+                # probabilistic 1 hp tick
+                if self.rng.random() < (dps * sim_dt):
+                    dmg = 1
+            if dmg > 0 and target.hp > 0:
+                target.hp = max(0, target.hp - dmg)
+
+
+            leak["dur"] = float(leak.get("dur", 0.0)) - sim_dt
+            if leak["dur"] <= 0.0:
+                to_remove.append("leak")
+
+        # Shaken: just duration (effect applied via reload multiplier)
+        shaken = target.status.get("shaken")
+        if shaken:
+            shaken["dur"] = float(shaken.get("dur", 0.0)) - sim_dt
+            if shaken["dur"] <= 0.0:
+                to_remove.append("shaken")
+
+        for k in to_remove:
+            self._remove_status(target, k)
+
+
+    def _compute_hit_chance(self, attacker, mods: Optional[LiveModifiers] = None):
+        base = 0.75
+        if mods is None:
+            mods = self.get_live_combat_multipliers(attacker)
+
+        chance = base * mods.hit
+        return max(0.05, min(0.95, chance))
+
+    def _compute_repair_success(self, unit: CombatantRuntime) -> float:
+        """
+        Repair success chance based on morale.
+        0..100 morale -> 0.35..0.90
+        """
+        m = max(0, min(100, int(unit.morale))) / 100.0
+        chance = 0.35 + 0.55 * m
+        return max(0.10, min(0.95, chance))
+
+    def get_debug_combat_modifiers(self, unit) -> DebugModifiers:
+        """
+        Returns live combat multipliers affected by stance & morale.
+        """
+        key = (self.stance, unit.morale)
+        mods = _DEBUG_CACHE.get(key)
+        if mods is None:
+            mods = _compute_debug_modifiers(self.stance, unit.morale)
+            _DEBUG_CACHE[key] = mods
+        return mods
+
+
+    # ---- Player actions ----
+
+    def _roll_initiative(self, base: float) -> float:
+        # kleine, faire Varianz pro Runde (±8%)
+        jitter = self.rng.uniform(-0.08, 0.08)
+        return max(0.05, base * (1.0 + jitter))
+
+    def _start_new_round(self) -> None:
+        self.round_index += 1
+        # decay one-round vulnerability flags
+        if getattr(self.p, "quick_repair_vuln_rounds", 0) > 0:
+            self.p.quick_repair_vuln_rounds -= 1
+        if getattr(self.e, "quick_repair_vuln_rounds", 0) > 0:
+            self.e.quick_repair_vuln_rounds -= 1
+
+        # reset stance-change lock per round
+        self._stance_changed_this_round = False
+
+        ip = self._roll_initiative(self.p.initiative_base)
+        ie = self._roll_initiative(self.e.initiative_base)
+        self.last_initiative = {"player": ip, "enemy": ie}
+
+        if ip >= ie:
+            self._turn_queue = ["player", "enemy"]
+        else:
+            self._turn_queue = ["enemy", "player"]
+
+        self.turn_owner = self._turn_queue[0]
+        self.add_log(f"Round {self.round_index}: init P={ip:.2f} vs E={ie:.2f} → {self.turn_owner} first")
+
+        # --- tick ability cooldowns (C1.1) ---
+        for side in ("player", "enemy"):
+            for aid, cd in list(self._cd[side].items()):
+                if cd > 0:
+                    self._cd[side][aid] = cd - 1
+
+    def _fire(self, attacker: CombatantRuntime, defender: CombatantRuntime, mult: float) -> dict:
+        mods = self.get_live_combat_multipliers(attacker)
+
+        # --- HIT CHECK ---
+        hit_chance = self._compute_hit_chance(attacker, mods)
+        hit_roll = self.rng.random()
+        hit = hit_roll < hit_chance
+
+        if not hit:
+            # morale loss on miss
+            morale_loss = 6
+
+            # offensive stance -> more morale punishment
+            if self._stance_for(attacker) is CombatStance.OFFENSIVE:
+                morale_loss += 4
+
+            attacker.morale = max(0, attacker.morale - morale_loss)
+
+            self.add_log(
+                f"{attacker.name} missed! "
+                f"(hit {hit_chance:.2f}, roll {hit_roll:.2f})"
+            )
+
+            return {
+                "result": "miss",
+                "hull": 0,
+                "applied": [],
+                "hit_chance": hit_chance,
+                "roll": hit_roll,
+            }
+
+
+
+        """
+        Feste Damage-Auflösung (verbindliche Reihenfolge, keine Sonderfälle):
+        1) Damage-Roll [min..max]
+        2) Crit-Check -> damage *= crit_multiplier
+        3) Damage-Typ bestimmen
+        4) Ziel-Armor bestimmen
+        5) Penetration abziehen (Armor kann negativ werden)
+        6) Final Damage = HP-Verlust
+        """
+        # 1) Damage roll
+        dmin = int(attacker.damage_min)
+        dmax = int(attacker.damage_max)
+        if dmax < dmin:
+            dmax = dmin
+        base = self.rng.randint(dmin, dmax)
+
+        # 2) Crit check
+        cc = float(attacker.crit_chance)
+        cc *= mods.hit
+        cc = max(0.0, min(1.0, cc))
+        cm = float(attacker.crit_multiplier)
+        is_crit = (self.rng.random() < max(0.0, min(1.0, cc)))
+        if is_crit:
+            base = int(round(base * max(1.0, cm)))
+
+        # 3) Damage type
+        dtype = str(attacker.damage_type)
+
+        # 4) Target armor by type
+        armor = float(defender.armor_physical) if dtype == "physical" else float(defender.armor_abyssal)
+
+        # 5) Penetration subtract (armor may become negative)
+        pen = float(attacker.penetration)
+        effective_armor = armor - pen
+
+        # 6) Convert armor% into multiplier (positive reduces, negative amplifies)
+        # Beispiel: 30 armor -> 0.70 dmg, -20 armor -> 1.20 dmg
+        dmg_mult_from_armor = max(0.1, 1.0 - (effective_armor / 100.0))
+
+        # final damage (mult bleibt als hook, aber keine Sonderfälle)
+        dmg = int(round(base * float(mult) * dmg_mult_from_armor * mods.damage))
+        # quick repair vulnerability: incoming damage increased for 1 round
+        if getattr(defender, "quick_repair_vuln_rounds", 0) > 0:
+            dmg = int(round(dmg * 1.35))
+
+        if dmg < 1:
+            dmg = 1
+
+        defender.hp = max(0, int(defender.hp) - dmg)
+        # morale impact
+        if is_crit:
+            defender.morale -= 8
+            attacker.morale += 4
+        else:
+            defender.morale -= 4
+            attacker.morale += 2
+
+
+        defender.morale = max(0, min(100, defender.morale))
+        attacker.morale = max(0, min(100, attacker.morale))
+
+
+        # morale tier change feedback
+        for key, unit in (("player", attacker), ("enemy", defender)):
+            old = self._last_morale_tier.get(key)
+            new = self._morale_tier(unit.morale)
+            if old != new:
+                self._last_morale_tier[key] = new
+                self.add_event({
+                    "type": "morale_shift",
+                    "side": key,
+                    "tier": new,
+                })
+
+        return {
+            "result": "crit" if is_crit else "hit",
+            "hull": dmg,  # UI-Key beibehalten
+            "applied": [],
+            "damage_type": dtype,
+            "armor": armor,
+            "penetration": pen,
+            "effective_armor": effective_armor,
+        }
+
+
+    def _repair(self, target: CombatantRuntime, amount_base: int) -> None:
+        if target.hp <= 0:
+            return
+        target.hp = min(target.hp_max, target.hp + max(1, amount_base))
+
+    def _enemy_take_turn(self) -> None:
+        if self.finished:
+            return
+
+        # KI entscheidet (Suche läuft zeitgeschnitten während des Turn-Delays, siehe enemy_ai.py)
+        ai = self.enemy_ai
+        if ai is not None:
+            stance, action = ai.decide(self)
+            self._record(f"ai:{stance.value if stance is not None else '-'}:{action}")
+            self.set_enemy_stance(stance)
+            if action != "fire" and self.use_ability(action, "enemy") is not None:
+                if not self.finished and self.turn_owner == "enemy":
+                    self._advance_turn()
+                return
+
+        res = self._fire(attacker=self.e, defender=self.p, mult=1.0)
+        self.add_event({
+            "type": "fire",
+            "side": "enemy",
+            "result": res.get("result"),
+            "hull": int(res.get("hull", 0)),
+            "applied": list(res.get("applied", [])),
+        })
+
+
+        if self._check_finish():
+            self._stop_turns()
+            return
+
+        self._advance_turn()
+
+    def set_enemy_stance(self, stance: Optional[CombatStance]) -> bool:
+        """Gegner-Haltung (KI). Wie beim Spieler max. ein Wechsel pro Runde."""
+        if stance is None or self.finished or stance == self.enemy_stance:
+            return False
+        if self._enemy_stance_changed_round == self.round_index:
+            return False
+        self.enemy_stance = stance
+        self._enemy_stance_changed_round = self.round_index
+        self.add_log(f"Enemy switches to {stance.name.title()} stance")
+        self.add_event({"type": "stance", "side": "enemy", "stance": stance.value})
+        return True
+
+    def _advance_turn(self) -> None:
+        if not self._turn_queue:
+            self._start_new_round()
+            return
+
+        # entferne aktuellen Spieler aus Queue
+        cur = self._turn_queue.pop(0) if self._turn_queue else None
+
+        if not self._turn_queue:
+            # Runde vorbei → neue Runde
+            self._start_new_round()
+        else:
+            self.turn_owner = self._turn_queue[0]
+
+    def _check_finish(self) -> bool:
+        if self.e.hp <= 0:
+            self.finished = True
+            self.outcome = "win"
+            self.rewards = self._compute_rewards()
+            self.add_log("Enemy defeated!")
+            self._stop_turns()
+            return True
+
+        if self.p.hp <= 0:
+            self.finished = True
+            self.outcome = "lose"
+            self.rewards = {}
+            self.add_log("You were defeated!")
+            self._stop_turns()
+            return True
+
+        return False
+
+
+# -----------------------------
+# Modifier-Berechnung (nur bei Cache-Miss)
+# -----------------------------
+def _compute_live_modifiers(stance: CombatStance, morale_value: int) -> LiveModifiers:
+    # --- STANCE ---
+    stance_damage = 1.0
+    stance_repair = 1.0
+    stance_hit = 1.0
+    stance_flee = 1.0
+
+    if stance is CombatStance.OFFENSIVE:
+        stance_damage = 1.20
+        stance_hit = 1.10
+        stance_repair = 0.85
+        stance_flee = 0.85
+
+    elif stance is CombatStance.DEFENSIVE:
+        stance_damage = 0.90
+        stance_hit = 0.90
+        stance_repair = 1.20
+        stance_flee = 1.25
+
+    # --- MORALE ---
+    morale = morale_value / 100.0
+
+    morale_damage = 0.75 + morale * 0.5
+    morale_hit = 0.5 + morale * 0.75
+    morale_repair = 0.7 + morale * 0.6
+    morale_flee = 1.3 - morale * 0.6
+    # --- PANIC FAIL (used by player_repair) ---
+    panic_fail = 0.0
+    if morale_value < 20:
+        # 20 morale -> 0%, 0 morale -> 50%
+        panic_fail = (20 - morale_value) / 20.0 * 0.50
+
+    return LiveModifiers(
+        damage=stance_damage * morale_damage,
+        hit=stance_hit * morale_hit,
+        repair=stance_repair * morale_repair,
+        flee=stance_flee * morale_flee,
+        panic_fail=panic_fail,
+    )
+
+
+def _compute_debug_modifiers(stance: CombatStance, morale_value: int) -> DebugModifiers:
+    # --- BASE ---
+    cannon = 1.0
+    reload = 1.0
+    boarding = 1.0
+    repair = 1.0
+    evade = 1.0
+    flee = 1.0
+
+    # --- STANCE ---
+    if stance is CombatStance.OFFENSIVE:
+        cannon *= 1.20
+        boarding *= 1.15
+        repair *= 0.85
+        evade *= 0.90
+        flee *= 0.85
+
+    elif stance is CombatStance.DEFENSIVE:
+        cannon *= 0.90
+        boarding *= 0.85
+        repair *= 1.20
+        evade *= 1.15
+        flee *= 1.25
+
+    # BALANCED = no change
+
+    # --- MORALE ---
+    morale = morale_value / 100.0
+
+    cannon *= 0.75 + morale * 0.5
+    reload *= 1.25 - morale * 0.5
+    boarding *= 0.8 + morale * 0.4
+    repair *= 0.7 + morale * 0.6
+    evade *= 0.8 + morale * 0.4
+    flee *= 1.3 - morale * 0.6
+
+    return DebugModifiers(cannon=cannon, reload=reload, boarding=boarding, repair=repair, evade=evade, flee=flee)
+
+
+# -----------------------------
+# Builder (Content -> Runtime)
+# -----------------------------
+PLAYER_START_MORALE = (65, 80)
+ENEMY_START_MORALE = (55, 75)
+
+
+def combatant_from_stats(name: str, c, hp: Optional[int] = None) -> CombatantRuntime:
+    """
+    CombatantRuntime aus CombatStats (ShipDef.combat / EnemyDef.combat).
+    hp = aktuelle HP (z.B. vom Runtime-Schiff); <= 0 oder None -> volle HP.
+    """
+    hp_max = int(getattr(c, "hp_max", 1) or 1)
+    hp_cur = int(hp or 0)
+    if hp_cur <= 0:
+        hp_cur = hp_max
+    hp_max = max(hp_max, hp_cur)
+
+    return CombatantRuntime(
+        name=name,
+
+        hp=hp_cur,
+        hp_max=hp_max,
+
+        armor_physical=float(getattr(c, "armor_physical", 0.0)),
+        armor_abyssal=float(getattr(c, "armor_abyssal", 0.0)),
+
+        damage_min=int(getattr(c, "damage_min", 1)),
+        damage_max=int(getattr(c, "damage_max", 1)),
+        damage_type=str(getattr(c, "damage_type", "physical")),
+        penetration=float(getattr(c, "penetration", 0.0)),
+        crit_chance=float(getattr(c, "crit_chance", 0.0)),
+        crit_multiplier=float(getattr(c, "crit_multiplier", 1.5)),
+
+        initiative_base=float(getattr(c, "initiative_base", 1.0)),
+
+        difficulty_tier=int(getattr(c, "difficulty_tier", 1)),
+        threat_level=int(getattr(c, "threat_level", 1)),
+    )
+
+
+def roll_start_morale(rng, side: str) -> int:
+    lo, hi = PLAYER_START_MORALE if side == "player" else ENEMY_START_MORALE
+    return rng.randint(lo, hi)
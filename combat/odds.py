@@ -0,0 +1,201 @@
+from __future__ import annotations
+import dataclasses
+import random
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Optional
+
+from combat.batch_sim import POLICIES, fight_result, new_fight, play_step
+from combat.engine import CombatStance, PlayerStats
+
+
+# HP wird auf 1/HP_BUCKETS-Stufen gerundet (volle HP = eigene Stufe)
+HP_BUCKETS = 10
+
+# Kämpfe pro Schätzung: ab ODDS_MIN_FIGHTS wird angezeigt, bei ODDS_TARGET_FIGHTS ist sie fertig
+ODDS_MIN_FIGHTS = 40
+ODDS_TARGET_FIGHTS = 600
+
+# Spieler-Modell für die Prognose: feuert, flieht bei niedriger HP
+ODDS_POLICY = "flee"
+ODDS_MAX_ROUNDS = 200  # wie simulate_fight; danach zählt der Kampf als Timeout
+
+# Gegner-KI in der Prognose: gleiches Preset wie im Kampf, aber nur 1 Zug voraus (node_budget 0).
+# Kostet ~5 ms pro Kampf statt ~40 ms mit Tiefe 2+, Ergebnis war in Stichproben gleich.
+# Ein Kampf passt damit nicht in das Budget eines Frames -> _OddsCell rechnet ihn schrittweise.
+ODDS_AI_NODES = 0
+
+
+@dataclass(frozen=True)
+class OddsEstimate:
+    win: float
+    flee: float
+    lose: float
+    n: int
+    final: bool
+    enemy_fled: float = 0.0  # Gegner entkommt (kein Sieg, aber auch keine Niederlage)
+
+    @property
+    def ready(self) -> bool:
+        return self.n >= ODDS_MIN_FIGHTS
+
+
+class _OddsCell:
+    """Laufende Monte-Carlo-Zählung für einen Schlüssel; wird schrittweise verfeinert."""
+    __slots__ = ("shipdef", "enemydef", "hp", "pstats", "stance", "ai", "ai_tt", "rng",
+                 "n", "win", "flee", "enemy_fled", "lose", "_estimate", "_fight")
+
+    def __init__(self, key: tuple, shipdef, enemydef, hp: int, pstats: PlayerStats, stance: CombatStance,
+                 ai: Optional[str] = None):
+        self.shipdef = shipdef
+        self.enemydef = enemydef
+        self.hp = hp
+        self.pstats = pstats
+        self.stance = stance
+        self.ai = ai
+        self.ai_tt: dict = {}  # KI-Werte gelten für das ganze Matchup -> über alle Kämpfe der Zelle teilen
+        # fester Stream pro Schlüssel -> gleiche Anzeige bei gleicher Situation
+        self.rng = random.Random(repr(key))
+        self.n = 0
+        self.win = 0
+        self.flee = 0
+        self.enemy_fled = 0
+        self.lose = 0
+        self._estimate: Optional[OddsEstimate] = None
+        self._fight = None  # angefangener Kampf (Engine), wird beim nächsten run() fortgesetzt
+
+    def run(self, budget_s: float, target: int) -> None:
+        """Rechnet höchstens ~budget_s: Deadline wird pro Engine-Schritt und in der KI-Suche geprüft."""
+        policy = POLICIES[ODDS_POLICY]
+        t_end = perf_counter() + budget_s
+        while self.n < target:
+            engine = self._fight
+            if engine is None:
+                engine = self._fight = new_fight(
+                    self.shipdef, self.enemydef,
+                    random.Random(self.rng.getrandbits(64)), self.pstats,
+                    stance=self.stance, player_hp=self.hp,
+                    ai=self.ai, ai_nodes=ODDS_AI_NODES, ai_tt=self.ai_tt,
+                )
+            ai = engine.enemy_ai
+            while not engine.finished and engine.round_index <= ODDS_MAX_ROUNDS:
+                # Gegnerzug zeitgeschnitten vorrechnen (gleiche Entscheidung wie decide(), siehe EnemyAI.think)
+                if ai is not None and engine.turn_owner == "enemy":
+                    left_ms = (t_end - perf_counter()) * 1000.0
+                    if left_ms <= 0.0 or not ai.think(engine, left_ms):
+                        return
+                play_step(engine, policy)
+                if perf_counter() >= t_end and not engine.finished:
+                    return
+            self._fight = None
+            r = fight_result(engine)
+            self.n += 1
+            if r.outcome == "win":
+                self.win += 1
+            elif r.outcome == "flee":
+                self.flee += 1
+            elif r.outcome == "enemy_fled":
+                self.enemy_fled += 1
+            else:
+                self.lose += 1  # Timeout zählt als verloren (kein Sieg, Schiff nicht heil raus)
+            self._estimate = None
+            if perf_counter() >= t_end:
+                break
+
+    def estimate(self, target: int) -> OddsEstimate:
+        if self._estimate is None:
+            n = max(1, self.n)
+            self._estimate = OddsEstimate(
+                win=self.win / n,
+                flee=self.flee / n,
+                lose=self.lose / n,
+                n=self.n,
+                final=self.n >= target,
+                enemy_fled=self.enemy_fled / n,
+            )
+        return self._estimate
+
+
+class OddsEstimator:
+    """
+    Sieg-/Flucht-/Niederlage-Wahrscheinlichkeit vor einem Kampf.
+    Gebündelter Monte-Carlo-Lauf über die Headless-Engine mit Zeitbudget pro Aufruf:
+    estimate() rechnet höchstens budget_ms und liefert den aktuellen Stand; weitere Aufrufe
+    (z.B. pro Frame im Übergang) verfeinern, bis ODDS_TARGET_FIGHTS erreicht sind.
+    Memoisiert pro (Schiff, Gegner, HP-Stufe, Haltung, Skillwerte, KI-Schwierigkeit) für die ganze Sitzung.
+    """
+
+    def __init__(self, target: int = ODDS_TARGET_FIGHTS):
+        self.target = int(target)
+        self._cells: dict[tuple, _OddsCell] = {}
+
+    @staticmethod
+    def hp_bucket(hp: int, hp_max: int) -> int:
+        if hp_max <= 0 or hp <= 0:
+            return HP_BUCKETS
+        return max(1, min(HP_BUCKETS, int(round(hp / hp_max * HP_BUCKETS))))
+
+    def _cell(self, shipdef, enemydef, hp: Optional[int], pstats: Optional[PlayerStats], stance: CombatStance,
+              ai: Optional[str] = None) -> _OddsCell:
+        pstats = pstats or PlayerStats()
+        hp_max = int(getattr(shipdef.combat, "hp_max", 1) or 1)
+        bucket = self.hp_bucket(int(hp or 0), hp_max)
+        key = (shipdef.id, enemydef.id, bucket, stance.name, dataclasses.astuple(pstats), ai)
+        cell = self._cells.get(key)
+        if cell is None:
+            cell_hp = max(1, int(round(hp_max * bucket / HP_BUCKETS)))
+            cell = _OddsCell(key, shipdef, enemydef, cell_hp, dataclasses.replace(pstats), stance, ai)
+            self._cells[key] = cell
+        return cell
+
+    def estimate(
+        self,
+        shipdef,
+        enemydef,
+        hp: Optional[int] = None,
+        pstats: Optional[PlayerStats] = None,
+        stance: CombatStance = CombatStance.BALANCED,
+        budget_ms: float = 2.0,
+        ai: Optional[str] = None,
+    ) -> OddsEstimate:
+        """ai = Schwierigkeit der Gegner-KI wie im Kampf (None -> Gegner feuert nur)."""
+        cell = self._cell(shipdef, enemydef, hp, pstats, stance, ai)
+        if cell.n < self.target and budget_ms > 0.0:
+            cell.run(budget_ms / 1000.0, self.target)
+        return cell.estimate(self.target)
+
+
+def get_odds_estimator(ctx) -> OddsEstimator:
+    est = getattr(ctx, "combat_odds", None)
+    if est is None:
+        est = OddsEstimator()
+        ctx.combat_odds = est
+    return est
+
+
+def estimate_encounter_odds(ctx, enemy_id: str, stance: CombatStance = CombatStance.BALANCED, budget_ms: float = 2.0) -> Optional[OddsEstimate]:
+    """Prognose für das aktuelle Spielerschiff (aktuelle HP + Skillwerte) gegen enemy_id, mit der KI des Schwierigkeitsgrads."""
+    content = getattr(ctx, "content", None)
+    ship = getattr(getattr(ctx, "player", None), "ship", None)
+    if content is None or ship is None:
+        return None
+    shipdef = content.ships.get(ship.id)
+    enemydef = content.enemies.get(enemy_id)
+    if shipdef is None or enemydef is None or getattr(shipdef, "combat", None) is None:
+        return None
+    hp = int(getattr(ship, "hp", getattr(ship, "hull_hp", 0)) or 0)
+    # gleiche KI-Wahl wie CombatState.on_enter
+    from combat.enemy_ai import DEFAULT_AI_PRESET
+    ai = getattr(getattr(ctx, "run_config", None), "difficulty_id", None) or DEFAULT_AI_PRESET
+    return get_odds_estimator(ctx).estimate(
+        shipdef, enemydef, hp, getattr(ctx, "player_stats", None), stance, budget_ms, ai=ai,
+    )
+
+
+def format_odds(est: Optional[OddsEstimate]) -> str:
+    if est is None or not est.ready:
+        return "Odds: ..."
+    txt = f"Odds: win {est.win:.0%}  flee {est.flee:.0%}  lose {est.lose:.0%}"
+    if est.enemy_fled > 0.0:
+        txt += f"  enemy flees {est.enemy_fled:.0%}"
+    return txt
@@ -0,0 +1,248 @@
+from __future__ import annotations
+import dataclasses
+import gzip
+import json
+import os
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from combat.engine import CombatEngine, CombatStance, PlayerStats, combatant_from_stats, roll_start_morale
+
+
+REPLAY_VERSION = 2  # 2: Gegenschuss bei Reparatur/Flucht trifft (andere Würfelfolge als v1)
+REPLAY_DIR = os.path.join("logs", "replays")
+REPLAY_KEEP = 50  # ältere Aufzeichnungen werden beim Speichern gelöscht
+
+# Intent-Token im Stream (Reihenfolge = Aufrufreihenfolge an der Engine):
+#   "t"                       Engine-Tick, der etwas getan hat (Rundenstart / Gegnerzug)
+#   "fire" | "repair" | ...   Spieleraktion
+#   "s:<stance>"              Haltungswechsel des Spielers
+#   "ai:<stance|->:<action>"  Entscheidung der Gegner-KI (zeitabhängig, daher mitgeschrieben)
+TICK = "t"
+
+
+@dataclass
+class CombatRecord:
+    """Kompakter Kampfmitschnitt: Startzustand + Seed + Intents reichen für eine exakte Wiedergabe."""
+    seed: int
+    ship_id: str
+    enemy_id: str
+    player_hp: int
+    pstats: dict
+    ai: Optional[str] = None
+    intents: list = field(default_factory=list)
+    events: list = field(default_factory=list)  # Engine-Events zur Kontrolle beim Abspielen
+    outcome: Optional[str] = None
+    rounds: int = 0
+    version: int = REPLAY_VERSION
+
+
+class CombatRecorder:
+    """Hängt als engine.recorder an der Engine und schreibt Intents + Events mit."""
+    __slots__ = ("record",)
+
+    def __init__(self, record: CombatRecord):
+        self.record = record
+
+    def intent(self, token: str) -> None:
+        self.record.intents.append(token)
+
+    def event(self, ev: dict) -> None:
+        self.record.events.append(dict(ev))
+
+    def finish(self, engine: CombatEngine) -> CombatRecord:
+        self.record.outcome = engine.outcome
+        self.record.rounds = int(engine.round_index)
+        return self.record
+
+
+# -----------------------------
+# Aufbau
+# -----------------------------
+def new_seed() -> int:
+    return random.getrandbits(63)
+
+
+def start_fight(
+    shipdef,
+    enemydef,
+    player_hp: Optional[int] = None,
+    pstats: Optional[PlayerStats] = None,
+    seed: Optional[int] = None,
+    ai: Optional[str] = None,
+) -> tuple[CombatEngine, CombatRecorder]:
+    """
+    Kampfaufbau wie in CombatState, aber mit eigenem random.Random(seed) für die Engine,
+    damit der Kampf aus dem Mitschnitt exakt wiederholbar ist. ai = Schwierigkeit der Gegner-KI.
+    """
+    seed = new_seed() if seed is None else int(seed)
+    pstats = pstats or PlayerStats()
+    rng = random.Random(seed)
+
+    player = combatant_from_stats("You", shipdef.combat, hp=player_hp)
+    player.morale = roll_start_morale(rng, "player")
+    enemy = combatant_from_stats(enemydef.name, enemydef.combat)
+    enemy.morale = roll_start_morale(rng, "enemy")
+
+    engine = CombatEngine(player, enemy, pstats, rng=rng)
+    if ai is not None:
+        from combat.enemy_ai import EnemyAI
+        engine.enemy_ai = EnemyAI.for_difficulty(ai)
+
+    rec = CombatRecorder(CombatRecord(
+        seed=seed,
+        ship_id=shipdef.id,
+        enemy_id=enemydef.id,
+        player_hp=int(player.hp),
+        pstats=dataclasses.asdict(pstats),
+        ai=ai,
+    ))
+    engine.recorder = rec
+    return engine, rec
+
+
+# -----------------------------
+# Speichern / Laden
+# -----------------------------
+def save_record(record: CombatRecord, out_dir: str = REPLAY_DIR, keep: int = REPLAY_KEEP) -> str:
+    os.makedirs(out_dir, exist_ok=True)
+    name = time.strftime("combat_%Y%m%d_%H%M%S") + f"_{record.enemy_id}_{record.seed & 0xffff:04x}.json.gz"
+    path = os.path.join(out_dir, name)
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(dataclasses.asdict(record), f, separators=(",", ":"))
+    _prune(out_dir, keep)
+    return path
+
+
+def load_record(path: str) -> CombatRecord:
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    if int(data.get("version", 0)) != REPLAY_VERSION:
+        raise ValueError(f"Unsupported replay version {data.get('version')} in {path}")
+    names = {f.name for f in dataclasses.fields(CombatRecord)}
+    return CombatRecord(**{k: v for k, v in data.items() if k in names})
+
+
+def _prune(out_dir: str, keep: int) -> None:
+    try:
+        files = sorted(f for f in os.listdir(out_dir) if f.startswith("combat_") and f.endswith(".json.gz"))
+        for f in files[:max(0, len(files) - int(keep))]:
+            os.remove(os.path.join(out_dir, f))
+    except OSError:
+        pass
+
+
+# -----------------------------
+# Wiedergabe
+# -----------------------------
+class _ReplayAI:
+    """Spielt die mitgeschriebenen KI-Entscheidungen ab (die echte Suche ist zeitabhängig)."""
+
+    def __init__(self, decisions: list[tuple[Optional[CombatStance], str]]):
+        self._decisions = deque(decisions)
+
+    def think(self, engine, budget_ms: Optional[float] = None) -> bool:
+        return True
+
+    def decide(self, engine) -> tuple[Optional[CombatStance], str]:
+        if not self._decisions:
+            return None, "fire"
+        return self._decisions.popleft()
+
+
+def _parse_ai_token(token: str) -> tuple[Optional[CombatStance], str]:
+    _, stance, action = token.split(":", 2)
+    return (None if stance == "-" else CombatStance(stance)), action
+
+
+_ACTIONS = {
+    "fire": CombatEngine.player_fire,
+    "repair": CombatEngine.player_repair,
+    "quick_repair": CombatEngine.player_quick_repair,
+    "flee": CombatEngine.player_flee,
+}
+
+
+@dataclass
+class ReplayResult:
+    engine: CombatEngine
+    ok: bool
+    diverged_at: Optional[int] = None  # Index des ersten abweichenden Events
+    expected: Optional[dict] = None
+    got: Optional[dict] = None
+
+
+def _normalized(events: list) -> list:
+    # Tupel -> Listen etc., damit Mitschnitt aus Datei und Live-Events vergleichbar sind
+    return json.loads(json.dumps(events))
+
+
+def replay(record: CombatRecord, content) -> ReplayResult:
+    """Spielt den Kampf aus dem Mitschnitt nach und vergleicht den Event-Stream."""
+    shipdef = content.ships[record.ship_id]
+    enemydef = content.enemies[record.enemy_id]
+    engine, rec = start_fight(
+        shipdef, enemydef, record.player_hp, PlayerStats(**record.pstats), record.seed, ai=None,
+    )
+    decisions = [_parse_ai_token(t) for t in record.intents if t.startswith("ai:")]
+    if record.ai is not None:
+        engine.enemy_ai = _ReplayAI(decisions)
+    engine.recorder = None  # Intents nicht erneut aufzeichnen, nur Events sammeln
+    events: list = []
+
+    for token in record.intents:
+        if token == TICK:
+            engine.update(0.0)
+        elif token.startswith("s:"):
+            engine.set_stance(CombatStance(token[2:]))
+        elif token in _ACTIONS:
+            _ACTIONS[token](engine)
+        while True:
+            ev = engine.pop_event()
+            if ev is None:
+                break
+            events.append(ev)
+    if not engine.finished:
+        engine._check_finish()
+
+    got = _normalized(events)
+    want = _normalized(record.events)
+    for i, (a, b) in enumerate(zip(want, got)):
+        if a != b:
+            return ReplayResult(engine, False, i, a, b)
+    if len(want) != len(got) or engine.outcome != record.outcome:
+        i = min(len(want), len(got))
+        return ReplayResult(engine, False, i, want[i] if i < len(want) else None, got[i] if i < len(got) else None)
+    return ReplayResult(engine, True)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    import argparse
+    import sys
+    from data.loader import load_content
+
+    ap = argparse.ArgumentParser(description="Kampf-Mitschnitt abspielen und auf Abweichungen prüfen")
+    ap.add_argument("paths", nargs="+", help="Mitschnitte (logs/replays/*.json.gz)")
+    args = ap.parse_args(argv)
+
+    content = load_content("content")
+    failed = 0
+    for path in args.paths:
+        record = load_record(path)
+        res = replay(record, content)
+        status = "OK  " if res.ok else "DIFF"
+        print(f"{status} {os.path.basename(path)}: {record.ship_id} vs {record.enemy_id} -> "
+              f"{res.engine.outcome} in {res.engine.round_index} rounds ({len(record.events)} events)")
+        if not res.ok:
+            failed += 1
+            print(f"     event #{res.diverged_at}: expected {res.expected}")
+            print(f"     event #{res.diverged_at}: got      {res.got}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
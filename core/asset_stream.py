@@ -0,0 +1,69 @@
+from __future__ import annotations
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class AssetStreamer:
+    """
+    Kleiner Thread-Pool für Hintergrund-Ladejobs (PNG dekodieren, skalieren, Grids bauen).
+    Jobs werden über einen Key dedupliziert; das Ergebnis holt der Main-Thread
+    per take() ab, sobald is_ready() True ist.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self._pool = ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="asset")
+        self._jobs: dict[str, Future] = {}
+
+    def submit(self, key: str, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        # gleicher Key -> gleicher Job (kein doppeltes Laden)
+        fut = self._jobs.get(key)
+        if fut is None:
+            fut = self._pool.submit(fn, *args, **kwargs)
+            self._jobs[key] = fut
+        return fut
+
+    def is_pending(self, key: str) -> bool:
+        return key in self._jobs
+
+    def is_ready(self, key: str) -> bool:
+        fut = self._jobs.get(key)
+        return fut is not None and fut.done()
+
+    def take(self, key: str, timeout: float | None = 0.0) -> Any | None:
+        """
+        Holt das Ergebnis ab und entfernt den Job.
+        timeout=0.0 -> nicht blockieren (None, wenn noch nicht fertig), None -> warten.
+        Fehler im Job werden geloggt und als None zurückgegeben.
+        """
+        fut = self._jobs.get(key)
+        if fut is None:
+            return None
+        if timeout is not None and not fut.done():
+            if timeout <= 0.0:
+                return None
+            try:
+                fut.result(timeout=timeout)
+            except Exception:
+                pass
+            if not fut.done():
+                return None
+
+        self._jobs.pop(key, None)
+        try:
+            return fut.result()
+        except Exception as e:
+            print(f"[Assets] background load failed: {key} ({e})")
+            return None
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._jobs.clear()
+
+
+def get_asset_streamer(ctx) -> AssetStreamer:
+    # ein Pool pro Spiel, hängt am ctx (wie map_cache)
+    streamer = getattr(ctx, "asset_stream", None)
+    if streamer is None:
+        streamer = AssetStreamer()
+        ctx.asset_stream = streamer
+    return streamer
@@ -0,0 +1,214 @@
+from __future__ import annotations
+import os
+from collections import OrderedDict
+from time import perf_counter
+from typing import Optional
+import pygame
+
+
+# Skalier-Varianten für AssetManager.image(size=...)
+SMOOTH = "smooth"   # pygame.transform.smoothscale
+NEAREST = "scale"   # pygame.transform.scale (pixel-scharf)
+
+DEFAULT_BUDGET_BYTES = 192 * 1024 * 1024
+
+
+class _Entry:
+    __slots__ = ("surface", "bytes", "refs")
+
+    def __init__(self, surface: Optional[pygame.Surface], nbytes: int):
+        self.surface = surface
+        self.bytes = nbytes
+        self.refs = 0
+
+
+def _surface_bytes(surf: Optional[pygame.Surface]) -> int:
+    if surf is None:
+        return 0
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+class AssetManager:
+    """
+    Prozessweiter Bild-Cache, Key = (path, size, transform, alpha).
+    - Fehlende/kaputte Dateien werden negativ gecacht (kein os.path.exists pro Frame)
+    - owner (z.B. der State) pinnt seine Bilder, release(owner) gibt sie wieder frei;
+      gezählt wird über id(owner), damit auch (nicht hashbare) Dataclass-States gehen
+    - nicht gepinnte Einträge fliegen per LRU raus, sobald budget_bytes überschritten ist
+    Gelieferte Surfaces sind geteilt: nicht verändern (set_alpha, fill, ...), sondern kopieren.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = int(budget_bytes)
+        self._entries: "OrderedDict[tuple, _Entry]" = OrderedDict()
+        self._owners: dict[int, set[tuple]] = {}  # id(owner) -> Keys
+        self._missing: set[str] = set()
+        self._exists: dict[str, bool] = {}
+        self.bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.load_ms = 0.0
+        self.evictions = 0
+
+    # --- Abfragen ------------------------------------------------------------
+
+    def exists(self, path: str) -> bool:
+        """os.path.exists mit Cache (Asset-Ordner ändern sich zur Laufzeit nicht)."""
+        ok = self._exists.get(path)
+        if ok is None:
+            ok = os.path.exists(path)
+            self._exists[path] = ok
+        return ok
+
+    def image(
+        self,
+        path: str,
+        size: Optional[tuple[int, int]] = None,
+        transform: str = SMOOTH,
+        alpha: bool = True,
+        owner: object = None,
+    ) -> Optional[pygame.Surface]:
+        """
+        Bild laden (convert_alpha bzw. convert) und optional auf size skalieren.
+        None, wenn die Datei fehlt oder nicht dekodiert werden kann.
+        """
+        if path in self._missing:
+            self.hits += 1
+            return None
+
+        if size is not None:
+            size = (max(1, int(size[0])), max(1, int(size[1])))
+            key = (path, size, transform, alpha)
+        else:
+            key = (path, None, None, alpha)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        else:
+            self.misses += 1
+            surf = self._build(path, size, transform, alpha)
+            if surf is None:
+                return None
+            entry = _Entry(surf, _surface_bytes(surf))
+            self._entries[key] = entry
+            self.bytes += entry.bytes
+
+        if owner is not None:
+            keys = self._owners.setdefault(id(owner), set())
+            if key not in keys:
+                keys.add(key)
+                entry.refs += 1
+
+        self._evict()
+        return entry.surface
+
+    def add_decoded(self, path: str, img: pygame.Surface, alpha: bool = True) -> Optional[pygame.Surface]:
+        """
+        Im Hintergrund dekodiertes Bild (pygame.image.load ohne convert) übernehmen.
+        convert passiert hier, also nur vom Main-Thread aufrufen. Vorhandene Einträge bleiben.
+        """
+        key = (path, None, None, alpha)
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry.surface
+        t0 = perf_counter()
+        try:
+            surf = img.convert_alpha() if alpha else img.convert()
+        except pygame.error:
+            return None
+        self.loads += 1
+        self.load_ms += (perf_counter() - t0) * 1000.0
+        self._exists[path] = True
+        entry = _Entry(surf, _surface_bytes(surf))
+        self._entries[key] = entry
+        self.bytes += entry.bytes
+        self._evict()
+        return surf
+
+    def _build(self, path: str, size, transform: str, alpha: bool) -> Optional[pygame.Surface]:
+        if size is None:
+            if not self.exists(path):
+                self._missing.add(path)
+                return None
+            t0 = perf_counter()
+            try:
+                img = pygame.image.load(path)
+                img = img.convert_alpha() if alpha else img.convert()
+            except (pygame.error, OSError) as e:
+                print(f"[Assets] failed to load {path}: {e}")
+                self._missing.add(path)
+                return None
+            self.loads += 1
+            self.load_ms += (perf_counter() - t0) * 1000.0
+            return img
+
+        base = self.image(path, None, alpha=alpha)
+        if base is None:
+            return None
+        if base.get_size() == size:
+            return base
+        if transform == NEAREST:
+            return pygame.transform.scale(base, size)
+        return pygame.transform.smoothscale(base, size)
+
+    # --- Lebensdauer ---------------------------------------------------------
+
+    def release(self, owner: object) -> None:
+        """Alle von owner gepinnten Bilder freigeben (bleiben bis zur Verdrängung im Cache)."""
+        keys = self._owners.pop(id(owner), None)
+        if not keys:
+            return
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refs = max(0, entry.refs - 1)
+        self._evict()
+
+    def _evict(self) -> None:
+        if self.bytes <= self.budget_bytes:
+            return
+        for key in list(self._entries):
+            if self.bytes <= self.budget_bytes:
+                break
+            entry = self._entries[key]
+            if entry.refs > 0:
+                continue
+            del self._entries[key]
+            self.bytes -= entry.bytes
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._owners.clear()
+        self._missing.clear()
+        self._exists.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "pinned": sum(1 for e in self._entries.values() if e.refs > 0),
+            "missing": len(self._missing),
+            "bytes": self.bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "load_ms": self.load_ms,
+            "evictions": self.evictions,
+        }
+
+
+# prozessweit geteilt (wie die Rotations-Atlanten in core/sprite_rotation.py)
+_ASSETS: Optional[AssetManager] = None
+
+
+def get_assets() -> AssetManager:
+    global _ASSETS
+    if _ASSETS is None:
+        _ASSETS = AssetManager()
+    return _ASSETS
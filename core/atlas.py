@@ -0,0 +1,241 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Callable, Optional
+import pygame
+
+from core.assets import NEAREST, SMOOTH, get_assets
+
+
+ATLAS_DIR = os.path.join("assets", "atlas")
+ATLAS_VERSION = 1
+SHEET_MAX_W = 1024
+PADDING = 1
+
+GOOD_ICON_SIZE = 32
+
+# Größen wie in CityState.render: Kategorie-Buttons, Lot-Buttons (1t/5t/10t), Kauf/Verkauf pro Zeile
+UI_BUTTON_SIZES = ((120, 28), (36, 26), (60, 20))
+UI_CROSS_SIZES = ((120, 28), (36, 26))
+UI_BUTTON_CROP = (900, 220)  # fester Zuschnitt aus button*.png
+UI_STAR_SIZE = 48
+
+
+@dataclass(frozen=True)
+class AtlasItem:
+    name: str
+    path: str
+    size: tuple[int, int]
+    transform: str = SMOOTH
+    crop: Optional[tuple[int, int]] = None  # zentrierter Ausschnitt vor dem Skalieren
+
+
+def button_item_name(variant: str, size: tuple[int, int]) -> str:
+    return f"button_{variant}_{size[0]}x{size[1]}"
+
+
+def cross_item_name(size: tuple[int, int]) -> str:
+    return f"crossed_{size[0]}x{size[1]}"
+
+
+def good_icon_name(good_id: str, smooth: bool = False) -> str:
+    # Handel/Stadt: NEAREST (Pixel-Look); Kampf-Loot wurde schon immer mit smoothscale skaliert
+    return f"{good_id}_smooth" if smooth else good_id
+
+
+def _goods_items() -> list[AtlasItem]:
+    icons_dir = os.path.join("assets", "icons")
+    try:
+        files = sorted(f for f in os.listdir(icons_dir) if f.lower().endswith(".png"))
+    except OSError:
+        files = []
+    size = (GOOD_ICON_SIZE, GOOD_ICON_SIZE)
+    items = []
+    for f in files:
+        gid, path = os.path.splitext(f)[0], os.path.join(icons_dir, f)
+        items.append(AtlasItem(good_icon_name(gid), path, size, NEAREST))
+        items.append(AtlasItem(good_icon_name(gid, smooth=True), path, size, SMOOTH))
+    return items
+
+
+def _ui_items() -> list[AtlasItem]:
+    ui_dir = os.path.join("assets", "ui")
+    items = []
+    for variant, fn in (("normal", "button.png"), ("hi", "button_high.png"), ("not", "button_not.png")):
+        for size in UI_BUTTON_SIZES:
+            items.append(AtlasItem(button_item_name(variant, size), os.path.join(ui_dir, fn), size, SMOOTH, UI_BUTTON_CROP))
+    for size in UI_CROSS_SIZES:
+        items.append(AtlasItem(cross_item_name(size), os.path.join(ui_dir, "crossed.png"), size, SMOOTH))
+    star = (UI_STAR_SIZE, UI_STAR_SIZE)
+    items.append(AtlasItem("star_empty", os.path.join(ui_dir, "star_empty.png"), star, NEAREST))
+    items.append(AtlasItem("star_filled", os.path.join(ui_dir, "star_filled.png"), star, NEAREST))
+    return items
+
+
+# Atlas-Name -> Item-Liste (wird beim Packen und zur Laufzeit für den Stale-Check gleich gebaut)
+ATLAS_SPECS: dict[str, Callable[[], list[AtlasItem]]] = {
+    "goods": _goods_items,
+    "ui": _ui_items,
+}
+
+
+def spec_hash(items: list[AtlasItem]) -> str:
+    raw = json.dumps([(i.name, i.path.replace(os.sep, "/"), i.size, i.transform, i.crop) for i in items])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def render_item(item: AtlasItem, src: pygame.Surface) -> pygame.Surface:
+    """Quellbild -> fertiges Sprite (Zuschnitt + Skalierung), identisch für Packer und Fallback."""
+    if item.crop is not None:
+        cw, ch = min(item.crop[0], src.get_width()), min(item.crop[1], src.get_height())
+        rect = pygame.Rect((src.get_width() - cw) // 2, (src.get_height() - ch) // 2, cw, ch)
+        src = src.subsurface(rect)
+    if src.get_size() == item.size:
+        return src.copy()
+    if item.transform == NEAREST:
+        return pygame.transform.scale(src, item.size)
+    return pygame.transform.smoothscale(src, item.size)
+
+
+# -----------------------------
+# Packer (offline)
+# -----------------------------
+def _shelf_pack(sizes: list[tuple[int, int]], max_w: int, pad: int) -> tuple[list[tuple[int, int]], int, int]:
+    """Einfaches Shelf-Packing: hohe Sprites zuerst, Reihe für Reihe. Gibt Positionen + Sheet-Größe zurück."""
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    pos: list[tuple[int, int]] = [(0, 0)] * len(sizes)
+    x = y = shelf_h = sheet_w = 0
+    for i in order:
+        w, h = sizes[i]
+        if x > 0 and x + w > max_w:
+            y += shelf_h + pad
+            x = shelf_h = 0
+        pos[i] = (x, y)
+        x += w + pad
+        shelf_h = max(shelf_h, h)
+        sheet_w = max(sheet_w, x - pad)
+    return pos, max(1, sheet_w), max(1, y + shelf_h)
+
+
+def _load_source(path: str) -> pygame.Surface:
+    # ohne Display (kein convert_alpha): auf 32-Bit mit Alpha bringen, damit smoothscale geht
+    img = pygame.image.load(path)
+    out = pygame.Surface(img.get_size(), pygame.SRCALPHA, 32)
+    out.blit(img, (0, 0))
+    return out
+
+
+def pack_atlas(name: str, out_dir: str = ATLAS_DIR) -> tuple[str, int]:
+    """Packt ATLAS_SPECS[name] in <out_dir>/<name>.png + .json. Gibt (Sheet-Pfad, Anzahl Sprites) zurück."""
+    items = ATLAS_SPECS[name]()
+    sources: dict[str, pygame.Surface] = {}
+    sprites: list[tuple[AtlasItem, pygame.Surface]] = []
+    for item in items:
+        if item.path not in sources:
+            if not os.path.exists(item.path):
+                print(f"[Atlas] missing source {item.path} ({item.name})")
+                continue
+            sources[item.path] = _load_source(item.path)
+        sprites.append((item, render_item(item, sources[item.path])))
+
+    pos, w, h = _shelf_pack([s.get_size() for _, s in sprites], SHEET_MAX_W, PADDING)
+    sheet = pygame.Surface((w, h), pygame.SRCALPHA, 32)
+    sheet.fill((0, 0, 0, 0))
+    rects = {}
+    for (item, surf), (x, y) in zip(sprites, pos):
+        sheet.blit(surf, (x, y))
+        rects[item.name] = [x, y, surf.get_width(), surf.get_height()]
+
+    os.makedirs(out_dir, exist_ok=True)
+    sheet_path = os.path.join(out_dir, f"{name}.png")
+    pygame.image.save(sheet, sheet_path)
+    with open(os.path.join(out_dir, f"{name}.json"), "w", encoding="utf-8") as f:
+        json.dump({"version": ATLAS_VERSION, "spec": spec_hash(items), "rects": rects}, f, sort_keys=True)
+    return sheet_path, len(rects)
+
+
+# -----------------------------
+# Laufzeit
+# -----------------------------
+class TextureAtlas:
+    """
+    Sprites eines Atlas als Subsurfaces eines gemeinsamen Sheets (ein PNG statt vieler Einzeldateien).
+    Fehlt das Sheet oder passt es nicht mehr zur Spec, werden einzelne Sprites aus den
+    Quell-PNGs gebaut (gleiches Ergebnis, nur langsamer). Sprites nicht verändern (geteilte Pixel).
+    """
+
+    def __init__(self, name: str, out_dir: str = ATLAS_DIR):
+        self.name = name
+        self.items = {i.name: i for i in ATLAS_SPECS[name]()}
+        self.sheet: Optional[pygame.Surface] = None
+        self._rects: dict[str, pygame.Rect] = {}
+        self._sprites: dict[str, Optional[pygame.Surface]] = {}
+        self._load_sheet(out_dir)
+
+    def _load_sheet(self, out_dir: str) -> None:
+        manifest = os.path.join(out_dir, f"{self.name}.json")
+        try:
+            with open(manifest, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != ATLAS_VERSION or data.get("spec") != spec_hash(list(self.items.values())):
+            print(f"[Atlas] {manifest} is stale, run 'python -m core.atlas'")
+            return
+        # Sheet bleibt dauerhaft gepinnt (owner = dieser Atlas)
+        self.sheet = get_assets().image(os.path.join(out_dir, f"{self.name}.png"), owner=self)
+        if self.sheet is not None:
+            self._rects = {k: pygame.Rect(v) for k, v in data.get("rects", {}).items()}
+
+    def get(self, item_name: str) -> Optional[pygame.Surface]:
+        try:
+            return self._sprites[item_name]
+        except KeyError:
+            pass
+        surf = None
+        rect = self._rects.get(item_name)
+        if rect is not None:
+            surf = self.sheet.subsurface(rect)
+        else:
+            item = self.items.get(item_name)
+            if item is not None:
+                src = get_assets().image(item.path)
+                surf = render_item(item, src) if src is not None else None
+        self._sprites[item_name] = surf
+        return surf
+
+
+# prozessweit geteilt (wie AssetManager)
+_ATLASES: dict[str, TextureAtlas] = {}
+
+
+def get_atlas(name: str) -> TextureAtlas:
+    atlas = _ATLASES.get(name)
+    if atlas is None:
+        atlas = TextureAtlas(name)
+        _ATLASES[name] = atlas
+    return atlas
+
+
+def atlas_image(atlas_name: str, item_name: str) -> Optional[pygame.Surface]:
+    return get_atlas(atlas_name).get(item_name)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Icons und UI-Teile in Atlas-Sheets packen (assets/atlas/)")
+    ap.add_argument("names", nargs="*", default=sorted(ATLAS_SPECS), help="Atlanten (Default: alle)")
+    ap.add_argument("--out", default=ATLAS_DIR)
+    args = ap.parse_args(argv)
+
+    for name in args.names:
+        path, n = pack_atlas(name, args.out)
+        w, h = pygame.image.load(path).get_size()
+        print(f"{name}: {n} sprites -> {path} ({w}x{h})")
+
+
+if __name__ == "__main__":
+    main()
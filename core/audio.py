@@ -1,8 +1,126 @@
 from __future__ import annotations
 import os
 import random
+import threading
+from dataclasses import dataclass
+from typing import Optional
 import pygame
 
+
+NUM_CHANNELS = 32
+
+# Kanal-Gruppen (feste Bereiche, damit z.B. Münz-Spam beim Handeln nie den Encounter-Crash verdrängt).
+# "loop" ist per set_reserved für pygame's automatische Kanalwahl gesperrt.
+SFX_GROUPS: dict[str, range] = {
+    "loop": range(0, 4),
+    "ambience": range(4, 8),
+    "combat": range(8, 20),
+    "ui": range(20, 32),
+}
+LOOP_CHANNELS = len(SFX_GROUPS["loop"])
+
+
+@dataclass(frozen=True)
+class SfxSpec:
+    group: str = "ui"
+    max_voices: int = 4          # gleichzeitige Stimmen dieses Sounds (älteste wird ersetzt)
+    min_interval_ms: int = 30    # Mindestabstand zwischen zwei Starts
+    volume: float = 1.0
+
+
+# Key = Dateiname ohne Endung (Pfad/Extension egal, siehe _resolve_sfx_path in world.py)
+SFX_SPECS: dict[str, SfxSpec] = {
+    "ui_click": SfxSpec("ui", max_voices=2, min_interval_ms=40),
+    "coin": SfxSpec("ui", max_voices=2, min_interval_ms=70),
+    "wave_crash": SfxSpec("combat", max_voices=1, min_interval_ms=0),
+    "waves_level": SfxSpec("loop"),
+    "ship_waves_loop": SfxSpec("loop"),
+}
+DEFAULT_SFX_SPEC = SfxSpec()
+
+# wird beim Start im Hintergrund dekodiert (kein Hänger beim ersten Abspielen)
+PRELOAD_SFX = tuple(
+    os.path.join("assets", "sfx", fn)
+    for fn in ("ui_click.mp3", "coin.mp3", "wave_crash.mp3", "waves_level.mp3", "ship_waves_loop.mp3")
+)
+
+
+def sfx_spec(path: str) -> SfxSpec:
+    return SFX_SPECS.get(os.path.splitext(os.path.basename(path))[0], DEFAULT_SFX_SPEC)
+
+
+def _sound_bytes(snd: pygame.mixer.Sound) -> int:
+    init = pygame.mixer.get_init()
+    if not init:
+        return 0
+    freq, fmt, channels = init
+    return int(snd.get_length() * freq) * channels * (abs(fmt) // 8)
+
+
+class SoundBank:
+    """
+    Prozessweiter Cache dekodierter Sounds (wie AssetManager für Bilder).
+    preload() dekodiert im Hintergrund-Thread; get() lädt fehlende Sounds synchron nach.
+    Fehlende/kaputte Dateien werden negativ gecacht.
+    """
+
+    def __init__(self):
+        self._sounds: dict[str, pygame.mixer.Sound] = {}
+        self._missing: set[str] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.bytes = 0
+        self.loads = 0
+
+    def _load(self, path: str) -> Optional[pygame.mixer.Sound]:
+        if not path or not os.path.exists(path):
+            with self._lock:
+                self._missing.add(path)
+            return None
+        try:
+            snd = pygame.mixer.Sound(path)
+        except (pygame.error, OSError) as e:
+            print(f"[Audio] failed to load {path}: {e}")
+            with self._lock:
+                self._missing.add(path)
+            return None
+        with self._lock:
+            # Preload-Thread und Main-Thread können denselben Sound gleichzeitig laden
+            have = self._sounds.get(path)
+            if have is not None:
+                return have
+            self._sounds[path] = snd
+            self.bytes += _sound_bytes(snd)
+            self.loads += 1
+        return snd
+
+    def get(self, path: str) -> Optional[pygame.mixer.Sound]:
+        snd = self._sounds.get(path)
+        if snd is not None or path in self._missing:
+            return snd
+        return self._load(path)
+
+    def preload(self, paths) -> None:
+        if self._thread is not None:
+            return
+        todo = [p for p in paths if p not in self._sounds]
+        self._thread = threading.Thread(target=lambda: [self._load(p) for p in todo], name="sfx-preload", daemon=True)
+        self._thread.start()
+
+    def stats(self) -> dict:
+        return {"sounds": len(self._sounds), "missing": len(self._missing), "bytes": self.bytes, "loads": self.loads}
+
+
+_SOUNDS: Optional[SoundBank] = None
+
+
+def get_sound_bank() -> SoundBank:
+    global _SOUNDS
+    if _SOUNDS is None:
+        _SOUNDS = SoundBank()
+    return _SOUNDS
+
+
 class AudioManager:
     def __init__(self, music_volume: float = 0.6, sfx_volume: float = 0.8):
         self.music_volume = float(music_volume)
@@ -12,7 +130,13 @@ class AudioManager:
         self._current: str | None = None
         self._shuffle: bool = True
 
-        self._sfx_cache: dict[str, pygame.mixer.Sound] = {}
+        # SFX: Sounds kommen aus der prozessweiten SoundBank (beim Start vorgeladen)
+        self._sounds = get_sound_bank()
+        self._sounds.preload(PRELOAD_SFX)
+        self._last_play: dict[str, int] = {}                      # path -> ticks des letzten Starts
+        self._voices: dict[str, list[int]] = {}                   # path -> Kanal-Indizes, auf denen er läuft
+        self._channel_started: dict[int, int] = {}                 # Kanal-Index -> ticks (für Voice-Stealing)
+        self.dropped = 0
 
         self._music_stack: list[dict] = []
 
@@ -24,9 +148,8 @@ class AudioManager:
 
         # Loop-SFX (z.B. Meeresrauschen/Schiff)
         self._loop_channels: dict[str, pygame.mixer.Channel] = {}
-        self._loop_sounds: dict[str, pygame.mixer.Sound] = {}
+        self._loop_channel_idx: dict[str, int] = {}
 
-        self._reserved_loop_channel = pygame.mixer.Channel(0)
         self._loop_key_to_path: dict[str, str] = {}
 
 
@@ -131,17 +254,62 @@ class AudioManager:
         if event.type == self.MUSIC_END:
             self._start_next(fade_ms=0)
 
-    def play_sfx(self, path: str) -> None:
-        if not path or not os.path.exists(path):
-            return
+    def _group_channels(self, group: str) -> list[int]:
+        n = pygame.mixer.get_num_channels()
+        return [i for i in SFX_GROUPS.get(group, SFX_GROUPS["ui"]) if i < n]
+
+    def _pick_channel(self, group: str) -> Optional[int]:
+        """Freier Kanal der Gruppe, sonst der am längsten laufende (Voice-Stealing innerhalb der Gruppe)."""
+        idxs = self._group_channels(group)
+        if not idxs:
+            return None
+        for i in idxs:
+            if not pygame.mixer.Channel(i).get_busy():
+                return i
+        oldest = min(idxs, key=lambda i: self._channel_started.get(i, 0))
+        pygame.mixer.Channel(oldest).stop()
+        return oldest
+
+    def play_sfx(self, path: str) -> bool:
+        """
+        Spielt einen SFX in seiner Kanal-Gruppe (SFX_SPECS). Zu schnelle Wiederholungen
+        (min_interval_ms) werden verworfen, mehr als max_voices ersetzen die älteste Stimme.
+        """
+        if not path:
+            return False
+        spec = sfx_spec(path)
 
-        s = self._sfx_cache.get(path)
-        if s is None:
-            s = pygame.mixer.Sound(path)
-            self._sfx_cache[path] = s
+        now = pygame.time.get_ticks()
+        last = self._last_play.get(path)
+        if last is not None and now - last < spec.min_interval_ms:
+            self.dropped += 1
+            return False
 
-        s.set_volume(self.sfx_volume)
-        s.play()
+        snd = self._sounds.get(path)
+        if snd is None:
+            return False
+
+        voices = []
+        for i in self._voices.get(path, ()):
+            ch = pygame.mixer.Channel(i)
+            if ch.get_busy() and ch.get_sound() is snd:
+                voices.append(i)
+        if len(voices) >= max(1, spec.max_voices):
+            pygame.mixer.Channel(voices.pop(0)).stop()
+
+        idx = self._pick_channel(spec.group)
+        if idx is None:
+            self.dropped += 1
+            return False
+
+        ch = pygame.mixer.Channel(idx)
+        ch.set_volume(max(0.0, min(1.0, self.sfx_volume * spec.volume)))
+        ch.play(snd)
+        voices.append(idx)
+        self._voices[path] = voices
+        self._last_play[path] = now
+        self._channel_started[idx] = now
+        return True
 
     def play_loop_sfx(self, key: str, path: str, *, volume: float = 1.0) -> None:
         """
@@ -159,23 +327,17 @@ class AudioManager:
             self.set_loop_volume(key, volume)
             return
 
-        # Sound laden/cachen
-        snd = self._loop_sounds.get(path)
+        # Sound aus der SoundBank (vorgeladen)
+        snd = self._sounds.get(path)
         if snd is None:
-            try:
-                snd = pygame.mixer.Sound(path)
-            except Exception as e:
-                print(f"[Audio] failed to load loop sfx {path}: {e}")
-                return
-            self._loop_sounds[path] = snd
-
-        # Channel holen (falls du einen reservierten Channel nutzt, nimm den; sonst find_channel)
-        ch = getattr(self, "_reserved_loop_channel", None)
-        if ch is None:
-            ch = pygame.mixer.find_channel()
-            if ch is None:
-                print("[Audio] no free mixer channel for loop sfx (increase num channels)")
-                return
+            return
+
+        # eigener Kanal pro Loop-Key aus der (reservierten) Loop-Gruppe
+        idx = self._pick_loop_channel(key)
+        if idx is None:
+            print("[Audio] no free mixer channel for loop sfx (increase num channels)")
+            return
+        ch = pygame.mixer.Channel(idx)
 
         # Starten (genau einmal)
         v = max(0.0, min(1.0, self.sfx_volume * float(volume)))
@@ -183,6 +345,15 @@ class AudioManager:
         ch.play(snd, loops=-1)
 
         self._loop_channels[key] = ch
+        self._loop_channel_idx[key] = idx
+
+    def _pick_loop_channel(self, key: str) -> Optional[int]:
+        # Kanäle, die andere Loop-Keys gerade benutzen, bleiben tabu
+        in_use = {i for k, i in self._loop_channel_idx.items() if k != key}
+        for i in self._group_channels("loop"):
+            if i not in in_use and not pygame.mixer.Channel(i).get_busy():
+                return i
+        return None
 
     def set_loop_volume(self, key: str, volume: float) -> None:
         ch = self._loop_channels.get(key)
@@ -203,4 +374,5 @@ class AudioManager:
                 ch.stop()
         finally:
             self._loop_channels.pop(key, None)
+            self._loop_channel_idx.pop(key, None)
             self._loop_key_to_path.pop(key, None)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+from typing import Callable
+import pygame
+
+
+class DirtyRectRenderer:
+    """
+    Compositor für "statischer Hintergrund + wenige dynamische Elemente".
+
+    Pro Frame werden die dynamischen Elemente in Zeichenreihenfolge mit
+    (name, key, rect, draw) angemeldet. Nur Elemente, deren key oder rect sich
+    geändert hat, erzeugen Schaden. Alles, was den Schaden überlappt, wird über
+    dem wiederhergestellten Hintergrund komplett neu gezeichnet.
+    present() liefert die Rects für pygame.display.update (None = ganzer Screen).
+    """
+
+    def __init__(self, full_ratio: float = 0.55):
+        self.full_ratio = float(full_ratio)  # ab diesem Flächenanteil lieber komplett zeichnen
+        self._items: list[tuple[str, object, pygame.Rect, Callable]] = []
+        self._prev: dict[str, tuple[object, pygame.Rect]] = {}
+
+    def reset(self) -> None:
+        # nächstes present() zeichnet alles neu (z.B. nachdem ein Overlay drüber lag)
+        self._prev = {}
+
+    def begin(self) -> None:
+        self._items = []
+
+    def add(self, name: str, key, rect, draw: Callable[[pygame.Surface], None]) -> None:
+        r = pygame.Rect(rect)
+        if r.w <= 0 or r.h <= 0:
+            return
+        self._items.append((name, key, r, draw))
+
+    def present(self, screen: pygame.Surface, background: pygame.Surface, full: bool = False) -> list[pygame.Rect] | None:
+        items = self._items
+        self._items = []
+        cur = {name: (key, rect) for name, key, rect, _draw in items}
+
+        if full or not self._prev:
+            return self._present_full(screen, background, items, cur)
+
+        # Schaden: alte + neue Rects aller geänderten / verschwundenen Elemente
+        damage: list[pygame.Rect] = []
+        for name, (key, rect) in self._prev.items():
+            if cur.get(name) != (key, rect):
+                damage.append(rect)
+        for name, (key, rect) in cur.items():
+            if self._prev.get(name) != (key, rect):
+                damage.append(rect)
+
+        if not damage:
+            self._prev = cur
+            return []
+
+        # Alles, was Schaden überlappt, komplett neu zeichnen
+        # (sonst würde Alpha doppelt auf sich selbst geblendet)
+        redraw = [False] * len(items)
+        grown = True
+        while grown:
+            grown = False
+            for i, (_name, _key, rect, _draw) in enumerate(items):
+                if not redraw[i] and rect.collidelist(damage) != -1:
+                    redraw[i] = True
+                    damage.append(rect)
+                    grown = True
+
+        bounds = screen.get_rect()
+        damage = [r.clip(bounds) for r in damage]
+        damage = [r for r in damage if r.w > 0 and r.h > 0]
+
+        area = sum(r.w * r.h for r in damage)
+        if area > bounds.w * bounds.h * self.full_ratio:
+            return self._present_full(screen, background, items, cur)
+
+        for r in damage:
+            screen.blit(background, r, r)
+        for i, (_name, _key, _rect, draw) in enumerate(items):
+            if redraw[i]:
+                draw(screen)
+
+        self._prev = cur
+        return damage
+
+    def _present_full(self, screen, background, items, cur) -> None:
+        screen.blit(background, (0, 0))
+        for _name, _key, _rect, draw in items:
+            draw(screen)
+        self._prev = cur
+        return None
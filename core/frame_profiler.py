@@ -0,0 +1,256 @@
+from __future__ import annotations
+import csv
+import os
+import time
+from collections import deque
+from time import perf_counter
+from typing import Optional
+import pygame
+
+from core.assets import get_assets
+from core.ui_text import get_text_cache
+
+
+# feste Frame-Phasen (Reihenfolge = Zeichenreihenfolge im Graph)
+PHASES = ("events", "clock", "update", "render", "flip")
+PHASE_COLORS = {
+    "events": (120, 170, 255),
+    "clock": (190, 120, 255),
+    "update": (110, 220, 140),
+    "render": (255, 190, 90),
+    "flip": (240, 100, 100),
+}
+
+
+class _Section:
+    """Wiederverwendbarer Timer-Context für benannte Sub-Phasen (kein Objekt pro Aufruf)."""
+    __slots__ = ("_prof", "_name", "_t0")
+
+    def __init__(self, prof: "FrameProfiler", name: str):
+        self._prof = prof
+        self._name = name
+        self._t0 = 0.0
+
+    def __enter__(self):
+        self._t0 = perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._prof.add_section(self._name, perf_counter() - self._t0)
+
+
+class FrameProfiler:
+    """
+    Misst pro Frame die Phasen aus PHASES (ms) in einem Ringpuffer.
+    - phase(name) schließt die laufende Phase ab und startet die nächste
+    - section(name) für Sub-Timer in States (z.B. "combat.vfx"), summiert pro Frame
+    - Spikes (Frame > spike_ms) werden mit State + teuerster Phase gemerkt
+    Ein Frame wird beim nächsten begin_frame() abgeschlossen, damit flip() aus main.py mitzählt.
+    """
+
+    def __init__(self, capacity: int = 600, spike_ms: float = 25.0):
+        self.capacity = max(16, int(capacity))
+        self.spike_ms = float(spike_ms)
+
+        self._frames: list[Optional[tuple]] = [None] * self.capacity  # (frame, state, total, phases, sections)
+        self._head = 0
+        self._count = 0
+        self.spikes: deque = deque(maxlen=32)
+
+        self._sections: dict[str, _Section] = {}
+        self._cur_frame = None
+        self._cur_state = ""
+        self._cur_phase = None
+        self._t_phase = 0.0
+        self._phase_ms = dict.fromkeys(PHASES, 0.0)
+        self._section_ms: dict[str, float] = {}
+
+        # Overlay
+        self.visible = False
+        self._font = None
+
+    # --- Messung -------------------------------------------------------------
+
+    def begin_frame(self, frame_index: int) -> None:
+        self._commit()
+        self._cur_frame = int(frame_index)
+        self._cur_state = ""
+        self._phase_ms = dict.fromkeys(PHASES, 0.0)
+        self._section_ms = {}
+        self._cur_phase = None
+
+    def phase(self, name: str) -> None:
+        now = perf_counter()
+        if self._cur_phase is not None:
+            self._phase_ms[self._cur_phase] += (now - self._t_phase) * 1000.0
+        self._cur_phase = name
+        self._t_phase = now
+
+    def end_phase(self) -> None:
+        if self._cur_phase is not None:
+            self._phase_ms[self._cur_phase] += (perf_counter() - self._t_phase) * 1000.0
+            self._cur_phase = None
+
+    def set_state(self, state) -> None:
+        self._cur_state = type(state).__name__
+
+    def section(self, name: str) -> _Section:
+        sec = self._sections.get(name)
+        if sec is None:
+            sec = _Section(self, name)
+            self._sections[name] = sec
+        return sec
+
+    def add_section(self, name: str, seconds: float) -> None:
+        self._section_ms[name] = self._section_ms.get(name, 0.0) + seconds * 1000.0
+
+    def _commit(self) -> None:
+        if self._cur_frame is None:
+            return
+        self.end_phase()
+        phases = tuple(self._phase_ms[p] for p in PHASES)
+        total = sum(phases)
+        rec = (self._cur_frame, self._cur_state, total, phases, dict(self._section_ms))
+        self._frames[self._head] = rec
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self.capacity, self._count + 1)
+
+        if total > self.spike_ms:
+            worst = max(range(len(PHASES)), key=lambda i: phases[i])
+            worst_sec = max(self._section_ms.items(), key=lambda kv: kv[1])[0] if self._section_ms else ""
+            self.spikes.append({
+                "frame": self._cur_frame,
+                "state": self._cur_state,
+                "total_ms": total,
+                "phase": PHASES[worst],
+                "phase_ms": phases[worst],
+                "section": worst_sec,
+            })
+        self._cur_frame = None
+
+    # --- Auswertung ----------------------------------------------------------
+
+    def records(self) -> list[tuple]:
+        """Frames in zeitlicher Reihenfolge (ältester zuerst)."""
+        if self._count < self.capacity:
+            return [r for r in self._frames[:self._count]]
+        return self._frames[self._head:] + self._frames[:self._head]
+
+    def percentiles(self, qs=(50, 95, 99)) -> dict[int, float]:
+        totals = sorted(r[2] for r in self.records())
+        if not totals:
+            return {q: 0.0 for q in qs}
+        n = len(totals)
+        return {q: totals[min(n - 1, int(round(q / 100.0 * (n - 1))))] for q in qs}
+
+    def phase_means(self) -> dict[str, float]:
+        recs = self.records()
+        if not recs:
+            return dict.fromkeys(PHASES, 0.0)
+        return {p: sum(r[3][i] for r in recs) / len(recs) for i, p in enumerate(PHASES)}
+
+    def dump_csv(self, path: Optional[str] = None) -> str:
+        if path is None:
+            os.makedirs("logs", exist_ok=True)
+            path = os.path.join("logs", time.strftime("frames_%Y%m%d_%H%M%S.csv"))
+        recs = self.records()
+        section_names = sorted({k for r in recs for k in r[4]})
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["frame", "state", "total_ms", *[f"{p}_ms" for p in PHASES], *section_names])
+            for frame, state, total, phases, sections in recs:
+                w.writerow([
+                    frame, state, f"{total:.3f}",
+                    *[f"{v:.3f}" for v in phases],
+                    *[f"{sections.get(s, 0.0):.3f}" for s in section_names],
+                ])
+        return path
+
+    # --- Overlay -------------------------------------------------------------
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+
+    def render_overlay(self, screen: pygame.Surface, budget_ms: float = 1000.0 / 60.0) -> pygame.Rect:
+        """Graph (gestapelte Phasen je Frame) + Perzentile + letzter Spike. Gibt das Panel-Rect zurück."""
+        if self._font is None:
+            self._font = pygame.font.SysFont("consolas", 14)
+        font = self._font
+
+        recs = self.records()[-240:]
+        w, h = 252, 150
+        sw, _sh = screen.get_size()
+        panel = pygame.Rect(sw - w - 10, 10, w, h + 106)
+
+        pygame.draw.rect(screen, (10, 12, 16), panel)
+        pygame.draw.rect(screen, (80, 90, 110), panel, 1)
+
+        graph = pygame.Rect(panel.x + 6, panel.y + 6, 240, h - 12)
+        scale_ms = max(budget_ms * 2.0, 1.0)
+        px_per_ms = graph.h / scale_ms
+
+        x = graph.right - len(recs)
+        for _frame, _state, _total, phases, _sections in recs:
+            y = graph.bottom
+            for name, ms in zip(PHASES, phases):
+                bh = int(ms * px_per_ms + 0.5)
+                if bh <= 0:
+                    continue
+                top = max(graph.top, y - bh)
+                pygame.draw.line(screen, PHASE_COLORS[name], (x, y - 1), (x, top))
+                y = top
+            x += 1
+
+        # Budget-Linie (z.B. 16.7 ms)
+        by = graph.bottom - int(budget_ms * px_per_ms)
+        pygame.draw.line(screen, (200, 200, 200), (graph.x, by), (graph.right, by))
+
+        pct = self.percentiles()
+        means = self.phase_means()
+        lines = [
+            f"p50 {pct[50]:5.1f}  p95 {pct[95]:5.1f}  p99 {pct[99]:5.1f} ms",
+            "  ".join(f"{p[:3]} {means[p]:.1f}" for p in PHASES),
+        ]
+        if self.spikes:
+            s = self.spikes[-1]
+            extra = f"/{s['section']}" if s["section"] else ""
+            lines.append(f"spike {s['total_ms']:.0f}ms {s['state']}.{s['phase']}{extra}")
+        a = get_assets().stats()
+        lines.append(
+            f"img {a['entries']} {a['bytes'] / 1048576.0:.0f}MB "
+            f"hit {a['hits']}/{a['hits'] + a['misses']} load {a['load_ms']:.0f}ms"
+        )
+        t = get_text_cache().stats()
+        lines.append(f"text {t['entries']} {t['bytes'] / 1048576.0:.1f}MB hit {t['hits']}/{t['hits'] + t['misses']}")
+        lines.append("F3: aus  F4: CSV")
+
+        ty = graph.bottom + 6
+        for line in lines:
+            surf = font.render(line, True, (225, 225, 225))
+            screen.blit(surf, (panel.x + 6, ty))
+            ty += 16
+        return panel
+
+
+def profile_section(game, name: str):
+    """
+    Sub-Phasen-Timer für States: `with profile_section(self.game, "combat.vfx"): ...`
+    Ohne Profiler (z.B. Headless-Sims) ein No-op.
+    """
+    prof = getattr(game, "profiler", None)
+    if prof is None:
+        return _NULL_SECTION
+    return prof.section(name)
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL_SECTION = _NullSection()
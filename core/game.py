@@ -2,10 +2,12 @@ from __future__ import annotations
 import pygame
 from dataclasses import dataclass
 from typing import List, Optional
-from core.audio import AudioManager 
+from core.audio import AudioManager, LOOP_CHANNELS, NUM_CHANNELS
 from core.clock import GameClock
 from core.state import State
 from core.run_config import RunConfig
+from core.frame_profiler import FrameProfiler
+from settings import WIN_GOLD_TARGET
 from dataclasses import dataclass, field
 
 
@@ -25,6 +27,25 @@ class Game:
         self.screen = screen
         self.ctx = GameContext(clock=GameClock())
         self.state_stack: List[State] = [initial_state]
+
+        # Frame-Zähler + Dirty-Rects des letzten Frames (None = ganzen Screen flippen)
+        self.frame_index = 0
+        self.dirty_rects = None
+
+        # Leerlauf: kein Input, kein State-Wechsel, nichts Neues gezeichnet -> Main-Loop darf schlafen
+        self.idle = False
+        self._stack_serial = 0
+        # Event, mit dem wait_for_activity aufgewacht ist (kommt im nächsten run_frame zuerst)
+        self._woken_event = None
+        self._rendered_serial = -1
+
+        # Frame-Profiler (F3 Overlay, F4 CSV-Dump); Dirty-Rect-States zeichnen nach
+        # dem Ausblenden einmal komplett neu
+        self.profiler = FrameProfiler()
+        self.force_full_redraw = False
+
+        # läuft der Menü-Warmup (core/warmup.py), wird er pro Frame gepumpt
+        self._warmup = None
         pygame.mouse.set_visible(True)
         self.ctx.run_config = RunConfig()
 
@@ -34,8 +55,8 @@ class Game:
         if not pygame.mixer.get_init():
             pygame.mixer.init()
         
-        pygame.mixer.set_num_channels(32)
-        pygame.mixer.set_reserved(1)  # Channel 0 wird exklusiv reserviert
+        pygame.mixer.set_num_channels(NUM_CHANNELS)
+        pygame.mixer.set_reserved(LOOP_CHANNELS)  # Loop-Kanäle werden exklusiv reserviert (siehe SFX_GROUPS)
 
         # AudioManager am Context
         self.ctx.audio = AudioManager(music_volume=0.55, sfx_volume=0.8)
@@ -48,6 +69,7 @@ class Game:
         state.ctx = self.ctx
 
     def push(self, new_state) -> None:
+        self._stack_serial += 1
         new_state.game = self
         new_state.ctx = self.ctx
         self.state_stack.append(new_state)
@@ -57,12 +79,14 @@ class Game:
     def pop(self) -> None:
         if not self.state_stack:
             return
+        self._stack_serial += 1
         old = self.state_stack.pop()
         if hasattr(old, "on_exit"):
             old.on_exit()
 
 
     def replace(self, new_state) -> None:
+        self._stack_serial += 1
         # Exit old
         if self.state_stack:
             old = self.state_stack[-1]
@@ -89,12 +113,63 @@ class Game:
     def state(self) -> State:
         return self.state_stack[-1]
 
+    def wait_for_activity(self, timeout_ms: int) -> None:
+        """
+        Im Leerlauf bis zum nächsten Event schlafen (höchstens timeout_ms).
+        Das Event wird gemerkt und im nächsten run_frame vor dem Rest der Queue verarbeitet
+        (zurückposten würde es hinter später eingetroffene Events sortieren).
+        """
+        if self._woken_event is not None:
+            return
+        event = pygame.event.wait(max(1, int(timeout_ms)))
+        if event.type != pygame.NOEVENT:
+            self._woken_event = event
+
+    def present(self) -> None:
+        """Präsentiert das Ergebnis von run_frame (flip bzw. Dirty-Rects) und misst die Zeit."""
+        prof = self.profiler
+        prof.phase("flip")
+        rects = self.dirty_rects
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+        prof.end_phase()
+
+    def _handle_profiler_key(self, event) -> bool:
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == pygame.K_F3:
+            self.profiler.toggle()
+            if not self.profiler.visible:
+                self.force_full_redraw = True
+            return True
+        if event.key == pygame.K_F4:
+            path = self.profiler.dump_csv()
+            print(f"[Profiler] frame times -> {path}")
+            return True
+        return False
+
     def run_frame(self, real_dt: float) -> None:
+        self.frame_index += 1
+        prof = self.profiler
+        prof.begin_frame(self.frame_index)
+        prof.phase("events")
+
         # Event handling
-        for event in pygame.event.get():
+        had_events = False
+        events = pygame.event.get()
+        if self._woken_event is not None:
+            events.insert(0, self._woken_event)
+            self._woken_event = None
+        for event in events:
+            had_events = True
             if event.type == pygame.QUIT:
                 raise SystemExit
 
+            if self._handle_profiler_key(event):
+                continue
+
             # Audio zuerst (damit Trackwechsel zuverlässig passiert)
             if getattr(self.ctx, "audio", None) is not None:
                 self.ctx.audio.handle_event(event)
@@ -103,18 +178,19 @@ class Game:
             self.state.handle_event(event)
 
         # Update clock (state can adjust time_scale)
+        prof.phase("clock")
         days = self.ctx.clock.update(real_dt)
         if days:
-            from core.day_update import on_new_day
             for _ in range(int(days)):
-                on_new_day(self.ctx)
+                _on_new_day(self.ctx)
 
 
         # State update
+        prof.phase("update")
+        prof.set_state(self.state)
         self.state.update(real_dt)
 
         # --- Win Condition: Gold Ziel erreicht ---
-        from settings import WIN_GOLD_TARGET
         if getattr(self.ctx, "player", None) is not None:
             money = int(getattr(self.ctx.player, "money", 0))
 
@@ -124,8 +200,63 @@ class Game:
                 from states.victory import VictoryState
                 self.replace(VictoryState())
 
-        # Render
-        self.screen.fill((12, 14, 18))
-        self.state.render(self.screen)
+        # Hintergrund-Warmup (Menü): fertig dekodierte Bilder häppchenweise übernehmen (zählt zu "update")
+        warmup = self._warmup
+        if warmup is not None:
+            warmup.pump(self.ctx)
+            if not warmup.busy:
+                self._warmup = None
+
+        # Render (State darf Frames auslassen, z.B. gedrosselt im Schnellvorlauf)
+        prof.phase("render")
+        state = self.state
+        if getattr(state, "skip_render", False):
+            self.idle = False
+            self.dirty_rects = []
+            return
+
+        # Statische Screens melden per is_idle(), dass sich ohne Input nichts ändert:
+        # dann bleibt das zuletzt präsentierte Bild stehen
+        quiet = (
+            not had_events and self._rendered_serial == self._stack_serial
+            and not prof.visible and self._warmup is None
+        )
+        is_idle = getattr(state, "is_idle", None)
+        if quiet and is_idle is not None and is_idle():
+            self.idle = True
+            self.dirty_rects = []
+            return
+
+        # States mit eigenem Hintergrund (Dirty-Rect-Rendering) löschen selbst
+        if not getattr(state, "owns_clear", False):
+            self.screen.fill((12, 14, 18))
+        state.render(self.screen)
+        self._rendered_serial = self._stack_serial
+        self.force_full_redraw = False
+
+        # None = ganzer Screen, [] = nichts geändert, sonst nur diese Bereiche updaten
+        self.dirty_rects = getattr(state, "dirty_rects", None)
+
+        if prof.visible:
+            # Panel ist deckend -> bei Dirty-Rects reicht es, sein Rect mit zu updaten
+            panel = prof.render_overlay(self.screen)
+            if self.dirty_rects is not None:
+                self.dirty_rects = list(self.dirty_rects) + [panel]
+
+        # Dirty-Rect-States ohne Änderung gelten ebenfalls als Leerlauf
+        self.idle = quiet and self.dirty_rects == [] and self._warmup is None
+
+    def start_warmup(self) -> None:
+        """Hintergrund-Warmup (Module, Content, UI-Bilder) anstoßen; einmal pro Prozess."""
+        from core.warmup import start_warmup
+        warmup = start_warmup()
+        if warmup.busy:
+            self._warmup = warmup
 
 
+def _on_new_day(ctx) -> None:
+    # day_update zieht Ökonomie/Events nach -> erst beim ersten Tageswechsel importieren (danach gecacht)
+    global _on_new_day
+    from core.day_update import on_new_day
+    _on_new_day = on_new_day
+    on_new_day(ctx)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+import builtins
+import os
+import sys
+import threading
+import time
+from time import perf_counter
+from typing import Optional
+
+
+class ImportProfiler:
+    """
+    Misst beim Start, welche Module wie lange zum Importieren brauchen (wie `python -X importtime`,
+    aber im Spiel ein-/ausschaltbar und mit Time-to-first-Frame im Report).
+    Hängt sich in builtins.__import__; bereits geladene Module laufen über einen schnellen Pfad.
+    Gemessen wird nur der Thread, der install() aufruft (Imports im Warmup-Thread blockieren den Start nicht).
+    """
+
+    def __init__(self):
+        self._orig_import = None
+        self._thread_id = None
+        self._stack: list[list] = []  # [name, t0, child_ms]
+        self.records: list[tuple[str, float, float, int]] = []  # (name, self_ms, cum_ms, depth)
+        self.t_start = perf_counter()
+
+    def install(self) -> None:
+        if self._orig_import is not None:
+            return
+        self._orig_import = builtins.__import__
+        self._thread_id = threading.get_ident()
+        builtins.__import__ = self._import
+
+    def uninstall(self) -> None:
+        if self._orig_import is not None:
+            builtins.__import__ = self._orig_import
+            self._orig_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        orig = self._orig_import
+        if (level == 0 and name in sys.modules) or threading.get_ident() != self._thread_id:
+            return orig(name, globals, locals, fromlist, level)
+        if level > 0 and globals:
+            pkg = (globals.get("__package__") or "").rsplit(".", level - 1)[0]
+            full = f"{pkg}.{name}" if name else pkg
+        else:
+            full = name
+        if full in sys.modules:
+            return orig(name, globals, locals, fromlist, level)
+
+        frame = [full, perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            return orig(name, globals, locals, fromlist, level)
+        finally:
+            self._stack.pop()
+            cum = (perf_counter() - frame[1]) * 1000.0
+            self.records.append((full, cum - frame[2], cum, len(self._stack)))
+            if self._stack:
+                self._stack[-1][2] += cum
+
+    # --- Report ------------------------------------------------------------------
+
+    def total_ms(self) -> float:
+        return sum(r[2] for r in self.records if r[3] == 0)
+
+    def report(self, first_frame_ms: Optional[float] = None, top: int = 25) -> str:
+        lines = [f"imports: {len(self.records)} modules, {self.total_ms():.1f} ms (top level)"]
+        if first_frame_ms is not None:
+            lines.append(f"time to first frame: {first_frame_ms:.1f} ms")
+
+        lines.append("")
+        lines.append(f"{'cum ms':>9} {'self ms':>9}  module")
+        for name, self_ms, cum_ms, depth in sorted(self.records, key=lambda r: -r[2])[:top]:
+            lines.append(f"{cum_ms:9.1f} {self_ms:9.1f}  {'  ' * min(depth, 6)}{name}")
+
+        # eigene Pakete getrennt, damit sie neben pygame & Co. nicht untergehen
+        own = ("main", "settings", "core", "states", "combat", "data", "ui", "world", "economy")
+        own_recs = [r for r in self.records if r[0].split(".")[0] in own]
+        if own_recs:
+            lines.append("")
+            lines.append(f"game modules: {len(own_recs)}, {sum(r[1] for r in own_recs):.1f} ms self")
+            for name, self_ms, cum_ms, _depth in sorted(own_recs, key=lambda r: -r[1])[:top]:
+                lines.append(f"{cum_ms:9.1f} {self_ms:9.1f}  {name}")
+        return "\n".join(lines)
+
+    def dump(self, first_frame_ms: Optional[float] = None, path: Optional[str] = None) -> str:
+        if path is None:
+            os.makedirs("logs", exist_ok=True)
+            path = os.path.join("logs", time.strftime("imports_%Y%m%d_%H%M%S.txt"))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.report(first_frame_ms, top=60) + "\n")
+        return path
@@ -0,0 +1,381 @@
+from __future__ import annotations
+import json
+import lzma
+import struct
+import sys
+import zlib
+from array import array
+from typing import Any, BinaryIO, Callable, Dict, Optional
+
+
+# Kompaktes Binärformat für Savegames (ab Version 2).
+#
+# Datei = fester Header + Metadaten + Thumbnail + komprimierter Body:
+#     Header  "<4sHBxIII": MAGIC, Version, Codec, Länge Meta / Thumbnail / Body (komprimiert)
+#     Meta    kleines JSON (Tag, Uhrzeit, Level, ...) fürs Slot-Menü, unkomprimiert
+#     Thumb   JPEG/PNG-Bytes (leer = kein Bild); wird nur bei Bedarf gelesen (read_header -> thumb_offset)
+#     Body    Sektionen in fester Reihenfolge (siehe _encode_body):
+#             Doc-JSON (alles Kleine: clock/world/player/ship/ui/run_config),
+#             Märkte spaltenweise (pro Ware alle Städte, float64, NaN = Key fehlt),
+#             top_needs, Cargo-Lots, NPC-Shipments, Supply-Index,
+#             am Ende die Namenstabelle (alle IDs genau einmal) + ihr Offset.
+# IDs werden über die Namenstabelle als varint referenziert, Ganzzahlen (Alter, ETA, Tag)
+# zigzag-varint, created_day der Shipments als Delta zum Vorgänger.
+#
+# Das logische Save (dict) ist dasselbe wie bei snapshot_game(); ältere Versionen werden
+# über MIGRATIONS Schritt für Schritt hochgezogen (v1 = JSON, ggf. gzip; v2 = Header ohne Meta/Thumb).
+
+
+MAGIC = b"PTSV"
+FORMAT_VERSION = 3
+
+CODEC_ZLIB = 1
+CODEC_LZMA = 2
+CODECS = {"zlib": CODEC_ZLIB, "lzma": CODEC_LZMA}
+
+_HEADER = struct.Struct("<4sHBxIII")
+_HEADER_V2 = struct.Struct("<4sHBxI")
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+# --- varint / Spalten --------------------------------------------------------------
+
+class _Writer:
+    __slots__ = ("buf",)
+
+    def __init__(self):
+        self.buf = bytearray()
+
+    def uvarint(self, n: int) -> None:
+        n = int(n)
+        while n >= 0x80:
+            self.buf.append((n & 0x7F) | 0x80)
+            n >>= 7
+        self.buf.append(n)
+
+    def svarint(self, n: int) -> None:
+        n = int(n)
+        self.uvarint((n << 1) if n >= 0 else ((-n << 1) - 1))
+
+    def blob(self, b: bytes) -> None:
+        self.uvarint(len(b))
+        self.buf += b
+
+    def floats(self, values) -> None:
+        arr = array("d", values)
+        if sys.byteorder == "big":
+            arr.byteswap()
+        self.blob(arr.tobytes())
+
+
+class _Reader:
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, buf: bytes):
+        self.buf = memoryview(buf)
+        self.pos = 0
+
+    def uvarint(self) -> int:
+        buf = self.buf
+        b = buf[self.pos]
+        if b < 0x80:  # häufigster Fall: Index < 128
+            self.pos += 1
+            return b
+        shift = 0
+        out = 0
+        while True:
+            b = buf[self.pos]
+            self.pos += 1
+            out |= (b & 0x7F) << shift
+            if b < 0x80:
+                return out
+            shift += 7
+
+    def svarint(self) -> int:
+        n = self.uvarint()
+        return (n >> 1) if not (n & 1) else -((n + 1) >> 1)
+
+    def blob(self) -> bytes:
+        n = self.uvarint()
+        out = bytes(self.buf[self.pos:self.pos + n])
+        self.pos += n
+        return out
+
+    def floats(self) -> list[float]:
+        arr = array("d")
+        arr.frombytes(self.blob())
+        if sys.byteorder == "big":
+            arr.byteswap()
+        return arr.tolist()
+
+
+class _Names:
+    """Namenstabelle: jede ID (Stadt, Ware, Kategorie) steht genau einmal im File."""
+
+    def __init__(self):
+        self.names: list[str] = []
+        self._idx: dict[str, int] = {}
+
+    def __call__(self, name: Any) -> int:
+        name = str(name)
+        i = self._idx.get(name)
+        if i is None:
+            i = len(self.names)
+            self._idx[name] = i
+            self.names.append(name)
+        return i
+
+
+# --- Body --------------------------------------------------------------------------
+
+_MARKET_FIELDS = ("stock", "price_stock", "pending")
+
+
+def _encode_body(data: Dict[str, Any]) -> bytes:
+    doc = dict(data)
+    markets = doc.pop("markets", None) or {}
+    shipments = doc.pop("npc_shipments", None) or []
+    supply = doc.pop("city_supply_idx", None) or []
+    player = dict(doc.get("player") or {})
+    lots = player.pop("cargo_lots", None) or []
+    doc["player"] = player
+
+    names = _Names()
+    city_ids = [names(c) for c in markets]
+    # feste Warenreihenfolge (sortiert), damit gleiche Welten gleiche Spalten ergeben
+    goods = sorted({str(g) for md in markets.values() for f in _MARKET_FIELDS for g in (md.get(f) or {})})
+    good_ids = [names(g) for g in goods]
+
+    w = _Writer()
+    w.blob(json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    # Märkte: pro Feld eine Matrix goods x cities, spaltenweise (ähnliche Werte liegen nebeneinander)
+    w.uvarint(len(city_ids))
+    for i in city_ids:
+        w.uvarint(i)
+    w.uvarint(len(good_ids))
+    for i in good_ids:
+        w.uvarint(i)
+    nan = float("nan")
+    mds = list(markets.values())
+    for field in _MARKET_FIELDS:
+        cols = [md.get(field) or {} for md in mds]
+        w.floats(float(col.get(g, nan)) for g in goods for col in cols)
+    for md in mds:
+        needs = list(md.get("top_needs") or [])
+        w.uvarint(len(needs))
+        for g in needs:
+            w.uvarint(names(g))
+
+    # Cargo-Lots
+    w.uvarint(len(lots))
+    for lot in lots:
+        w.uvarint(names(lot["good_id"]))
+        w.svarint(lot.get("age_days", 0))
+    w.floats(float(lot["qty_tons"]) for lot in lots)
+
+    # NPC-Shipments (created_day als Delta, meist 0/1)
+    w.uvarint(len(shipments))
+    prev_day = 0
+    for s in shipments:
+        w.uvarint(names(s["src_city_id"]))
+        w.uvarint(names(s["dst_city_id"]))
+        w.uvarint(names(s["good_id"]))
+        w.svarint(s["eta_days"])
+        day = int(s.get("created_day", 0))
+        w.svarint(day - prev_day)
+        prev_day = day
+    w.floats(float(s["qty"]) for s in shipments)
+
+    # Supply-Index: (city, category, value)
+    w.uvarint(len(supply))
+    for city_id, cat, _v in supply:
+        w.uvarint(names(city_id))
+        w.uvarint(names(cat))
+    w.floats(float(row[2]) for row in supply)
+
+    # Namenstabelle ans Ende (erst jetzt vollständig); Offset steht in den letzten 4 Bytes
+    table_at = len(w.buf)
+    w.blob(json.dumps(names.names, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    w.buf += struct.pack("<I", table_at)
+    return bytes(w.buf)
+
+
+def _decode_body(body: bytes) -> Dict[str, Any]:
+    (table_at,) = struct.unpack_from("<I", body, len(body) - 4)
+    r = _Reader(body)
+    r.pos = table_at
+    names = json.loads(r.blob().decode("utf-8"))
+    r.pos = 0
+
+    data = json.loads(r.blob().decode("utf-8"))
+
+    cities = [names[r.uvarint()] for _ in range(r.uvarint())]
+    goods = [names[r.uvarint()] for _ in range(r.uvarint())]
+    n_c = len(cities)
+    markets: Dict[str, Dict[str, Any]] = {c: {} for c in cities}
+    for field in _MARKET_FIELDS:
+        vals = r.floats()
+        for ci, c in enumerate(cities):
+            # Stadt ci = jeder n_c-te Wert; NaN (v != v) = Key war nicht gesetzt
+            markets[c][field] = {g: v for g, v in zip(goods, vals[ci::n_c]) if v == v}
+    for c in cities:
+        markets[c]["top_needs"] = [names[r.uvarint()] for _ in range(r.uvarint())]
+    data["markets"] = markets
+
+    n = r.uvarint()
+    heads = [(names[r.uvarint()], r.svarint()) for _ in range(n)]
+    qtys = r.floats()
+    data.setdefault("player", {})["cargo_lots"] = [
+        {"good_id": g, "qty_tons": q, "age_days": age} for (g, age), q in zip(heads, qtys)
+    ]
+
+    n = r.uvarint()
+    heads = []
+    day = 0
+    for _ in range(n):
+        src, dst, g = names[r.uvarint()], names[r.uvarint()], names[r.uvarint()]
+        eta = r.svarint()
+        day += r.svarint()
+        heads.append((src, dst, g, eta, day))
+    qtys = r.floats()
+    data["npc_shipments"] = [
+        {"src_city_id": src, "dst_city_id": dst, "good_id": g, "qty": q, "eta_days": eta, "created_day": day}
+        for (src, dst, g, eta, day), q in zip(heads, qtys)
+    ]
+
+    n = r.uvarint()
+    keys = [(names[r.uvarint()], names[r.uvarint()]) for _ in range(n)]
+    data["city_supply_idx"] = [[c, cat, v] for (c, cat), v in zip(keys, r.floats())]
+    return data
+
+
+# --- Datei -------------------------------------------------------------------------
+
+def encode_save(
+    data: Dict[str, Any],
+    compression: str = "zlib",
+    meta: Optional[Dict[str, Any]] = None,
+    thumb: bytes = b"",
+) -> bytes:
+    """Logisches Save (Version FORMAT_VERSION) -> Datei-Bytes. meta/thumb landen vorne im File."""
+    codec = CODECS[compression]
+    body = _encode_body(data)
+    if codec == CODEC_LZMA:
+        packed = lzma.compress(body, preset=6)
+    else:
+        packed = zlib.compress(body, 6)
+    meta_b = json.dumps(meta or {}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    head = _HEADER.pack(MAGIC, FORMAT_VERSION, codec, len(meta_b), len(thumb), len(packed))
+    return b"".join((head, meta_b, thumb, packed))
+
+
+def read_header(f: BinaryIO) -> Optional[Dict[str, Any]]:
+    """
+    Nur Header + Metadaten lesen (ein paar hundert Bytes, egal wie groß das Save ist).
+    None bei Dateien ohne Header (JSON-Saves, v2); dann muss der Aufrufer das ganze Save lesen.
+    """
+    raw = f.read(_HEADER.size)
+    if len(raw) < _HEADER.size or raw[:4] != MAGIC:
+        return None
+    _magic, version, codec, meta_len, thumb_len, body_len = _HEADER.unpack(raw)
+    if version < 3:
+        return None
+    meta = json.loads(f.read(meta_len).decode("utf-8")) if meta_len else {}
+    thumb_offset = _HEADER.size + meta_len
+    return {
+        "version": version,
+        "meta": meta,
+        "thumb_offset": thumb_offset,
+        "thumb_len": thumb_len,
+        "body_offset": thumb_offset + thumb_len,
+        "body_len": body_len,
+    }
+
+
+def decode_save(raw: bytes) -> Dict[str, Any]:
+    """
+    Datei-Bytes -> logisches Save in aktueller Version.
+    Versteht das Binärformat und alte JSON-Saves (Klartext oder gzip) und migriert sie.
+    """
+    if raw[:4] == MAGIC:
+        (version,) = struct.unpack_from("<H", raw, 4)
+        if version < 3:
+            _magic, version, codec, size = _HEADER_V2.unpack_from(raw, 0)
+            start = _HEADER_V2.size
+        else:
+            _magic, version, codec, meta_len, thumb_len, size = _HEADER.unpack_from(raw, 0)
+            start = _HEADER.size + meta_len + thumb_len
+        packed = raw[start:start + size]
+        body = lzma.decompress(packed) if codec == CODEC_LZMA else zlib.decompress(packed)
+        data = _decode_body(body)
+        data["version"] = version
+    else:
+        if raw[:2] == _GZIP_MAGIC:
+            import gzip
+            raw = gzip.decompress(raw)
+        data = json.loads(raw.decode("utf-8"))
+    return upgrade(data)
+
+
+# --- Migrationen -------------------------------------------------------------------
+
+def _migrate_v1(data: Dict[str, Any]) -> Dict[str, Any]:
+    # enc_meter lag früher top-level, gehört nach world
+    world = data.setdefault("world", {})
+    if "enc_meter" in data:
+        world.setdefault("enc_meter", data.pop("enc_meter"))
+    # Supply-Index: {"city|category": v} -> [[city, category, v], ...]
+    supply = data.get("city_supply_idx") or {}
+    if isinstance(supply, dict):
+        rows = []
+        for k, v in supply.items():
+            if "|" in k:
+                city_id, cat = k.split("|", 1)
+                rows.append([city_id, cat, float(v)])
+        data["city_supply_idx"] = rows
+    return data
+
+
+def _migrate_v2(data: Dict[str, Any]) -> Dict[str, Any]:
+    # nur der Container hat sich geändert (Header mit Meta + Thumbnail), Inhalt bleibt
+    return data
+
+
+# Version n -> n+1; jede Formatänderung hängt hier einen Schritt an
+MIGRATIONS: Dict[int, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    1: _migrate_v1,
+    2: _migrate_v2,
+}
+
+
+def upgrade(data: Dict[str, Any]) -> Dict[str, Any]:
+    version = int(data.get("version", 1))
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Savegame-Version {version} ist neuer als dieses Spiel ({FORMAT_VERSION})")
+    while version < FORMAT_VERSION:
+        data = MIGRATIONS[version](data)
+        version += 1
+    data["version"] = version
+    return data
+
+
+def export_json(src: str, dst: Optional[str] = None) -> str:
+    """Save (beliebige Version) als lesbares JSON ausgeben (Debugging). Kann wieder geladen werden."""
+    with open(src, "rb") as f:
+        data = decode_save(f.read())
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    if dst:
+        with open(dst, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    return text
+
+
+if __name__ == "__main__":
+    # python -m core.save_format saves/slot_01.sav [out.json]
+    if len(sys.argv) < 2:
+        print("usage: python -m core.save_format <save> [out.json]")
+        sys.exit(2)
+    out = export_json(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    if len(sys.argv) <= 2:
+        print(out)
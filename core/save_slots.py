@@ -0,0 +1,160 @@
+# core/save_slots.py
+"""
+Slot-Übersicht nur über die Save-Header (Meta + Thumbnail-Position).
+Bewusst ohne Spielmodell (data.loader, world.model, economy.market), damit Menüs vor dem
+Warmup prüfen können, ob es Savegames gibt; Laden/Speichern bleibt in core/save_system.py.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from core.progression import xp_to_level, cap_xp
+from core.save_format import decode_save, read_header
+
+
+SAVE_DIR = "saves"
+NUM_SLOTS = 20
+LEGACY_SAVE_PATHS = (
+    os.path.join(SAVE_DIR, "savegame.sav"),   # Version 2 (ein Slot, ohne Header-Meta)
+    os.path.join(SAVE_DIR, "savegame.json"),  # Version 1 (JSON)
+)
+LEGACY_PREVIEW_PATH = os.path.join(SAVE_DIR, "preview.png")
+
+# Thumbnail-Größe (16:9)
+THUMB_SIZE = (420, 236)
+
+
+def slot_path(slot: int) -> str:
+    return os.path.join(SAVE_DIR, f"slot_{int(slot):02d}.sav")
+
+
+DEFAULT_SAVE_PATH = slot_path(1)
+
+
+@dataclass
+class SlotInfo:
+    """Ein Eintrag im Slot-Menü; meta kommt aus dem Datei-Header (None = leerer Slot)."""
+    slot: int            # 1..NUM_SLOTS, 0 = altes Einzel-Savegame
+    path: str
+    meta: Optional[dict] = None
+    mtime: float = 0.0
+    thumb_offset: int = 0
+    thumb_len: int = 0
+
+    @property
+    def empty(self) -> bool:
+        return self.meta is None
+
+
+# (slot, path) -> ((mtime_ns, size), SlotInfo): Header werden nur neu gelesen, wenn sich die Datei ändert
+_SLOT_CACHE: Dict[Tuple[int, str], Tuple[Tuple[int, int], SlotInfo]] = {}
+
+
+def _slot_info(slot: int, path: str) -> SlotInfo:
+    try:
+        st = os.stat(path)
+    except OSError:
+        _SLOT_CACHE.pop((slot, path), None)
+        return SlotInfo(slot=slot, path=path)
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _SLOT_CACHE.get((slot, path))
+    if hit is not None and hit[0] == key:
+        return hit[1]
+
+    info = SlotInfo(slot=slot, path=path, mtime=st.st_mtime)
+    try:
+        with open(path, "rb") as f:
+            head = read_header(f)
+        if head is not None:
+            info.meta = head["meta"]
+            info.thumb_offset = head["thumb_offset"]
+            info.thumb_len = head["thumb_len"]
+        else:
+            # alte Saves ohne Header: einmal komplett lesen (danach im Cache)
+            info.meta = _meta_from_data(_read_save_data(path))
+    except Exception as e:
+        print(f"[Save] cannot read {path}: {e}")
+        info.meta = None
+    _SLOT_CACHE[(slot, path)] = (key, info)
+    return info
+
+
+def list_slots(include_legacy: bool = True) -> list[SlotInfo]:
+    """Alle Slots (auch leere) nur über die Header; altes Einzel-Savegame als Slot 0 hinten dran."""
+    out = [_slot_info(i, slot_path(i)) for i in range(1, NUM_SLOTS + 1)]
+    if include_legacy:
+        for path in LEGACY_SAVE_PATHS:
+            if os.path.exists(path):
+                out.append(_slot_info(0, path))
+                break
+    return out
+
+
+def latest_slot() -> Optional[SlotInfo]:
+    used = [s for s in list_slots() if not s.empty]
+    return max(used, key=lambda s: s.mtime) if used else None
+
+
+def save_exists(path: Optional[str] = None) -> bool:
+    if path is not None:
+        return os.path.exists(path)
+    return latest_slot() is not None
+
+
+def load_slot_thumbnail(info: SlotInfo) -> Optional["pygame.Surface"]:
+    """Thumbnail eines Slots laden (unkonvertiert); liest nur den Thumbnail-Bereich der Datei."""
+    import io
+    try:
+        if info.thumb_len > 0:
+            with open(info.path, "rb") as f:
+                f.seek(info.thumb_offset)
+                raw = f.read(info.thumb_len)
+            hint = "thumb.jpg" if raw[:2] == b"\xff\xd8" else "thumb.png"
+            return pygame.image.load(io.BytesIO(raw), hint)
+        if info.slot == 0 and os.path.exists(LEGACY_PREVIEW_PATH):
+            return pygame.image.load(LEGACY_PREVIEW_PATH)
+    except (pygame.error, OSError) as e:
+        print(f"[Save] thumbnail {info.path}: {e}")
+    return None
+
+
+def _meta_from_data(data: Optional[dict]) -> Optional[dict]:
+    if data is None:
+        return None
+
+    clock = data.get("clock", {}) or {}
+    player = data.get("player", {}) or {}
+
+    # "Spielzeit": In-Game Zeit (Tag + Uhrzeit)
+    day = int(clock.get("day", 1))
+    sec = float(clock.get("seconds_in_day", 0.0))
+    hours = int(sec // 3600)
+    minutes = int((sec % 3600) // 60)
+
+    # XP + Level
+    xp = cap_xp(int(player.get("xp", 0)))
+    lvl, cur, need = xp_to_level(xp)
+    wd = data.get("world", {}) or {}
+
+    return {
+        "day": day,
+        "time_str": f"{hours:02d}:{minutes:02d}",
+        "xp": xp,
+        "level": lvl,
+        "xp_cur": cur,
+        "xp_need": need,
+        "enc_meter": float(wd.get("enc_meter", 0.0)),
+        "money": int(player.get("money", 0)),
+    }
+
+
+def _read_save_data(path: str) -> Optional[dict]:
+    """Save lesen (Binär oder altes JSON) und auf FORMAT_VERSION migrieren."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return decode_save(f.read())
@@ -1,9 +1,10 @@
 # core/save_system.py
 from __future__ import annotations
 
-import json
+import copy
 import os
-from dataclasses import asdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from typing import Any, Dict, Optional, Tuple
 
 import pygame
@@ -11,65 +12,124 @@ import pygame
 from data.loader import load_content
 from world.model import World, City, Ship, Player, CargoHold, CargoLot
 from economy.market import CityMarketState
-from core.progression import xp_to_level, cap_xp
+from core.progression import cap_xp
+from core.save_format import FORMAT_VERSION, encode_save
+from core.save_slots import (  # Slot-Übersicht (header-only) liegt in core/save_slots.py
+    DEFAULT_SAVE_PATH,
+    LEGACY_PREVIEW_PATH,
+    LEGACY_SAVE_PATHS,
+    NUM_SLOTS,
+    SAVE_DIR,
+    THUMB_SIZE,
+    SlotInfo,
+    _meta_from_data,
+    _read_save_data,
+    _slot_info,
+    latest_slot,
+    list_slots,
+    load_slot_thumbnail,
+    save_exists,
+    slot_path,
+)
+
+
+
+SAVE_VERSION = FORMAT_VERSION
+
+
+def _encode_thumbnail(surface: "pygame.Surface") -> bytes:
+    """
+    Thumbnail als JPEG-Bytes (~40 KB statt ~250 KB PNG, dekodiert ~5x schneller; PNG nur ohne
+    SDL_image). surface wird nur gelesen; läuft im Save-Thread, solange der Main-Thread die
+    Surface danach nicht mehr anfasst.
+    """
+    import io
+    thumb = pygame.transform.smoothscale(surface, THUMB_SIZE)
+    buf = io.BytesIO()
+    pygame.image.save(thumb, buf, "thumb.jpg" if pygame.image.get_extended() else "thumb.png")
+    return buf.getvalue()
+
+
+def load_save_metadata(path: str = DEFAULT_SAVE_PATH) -> Optional[dict]:
+    return _slot_info(0, path).meta
 
 
+def _ensure_save_dir(path: str) -> None:
+    d = os.path.dirname(path)
+    if d:
+        os.makedirs(d, exist_ok=True)
 
-SAVE_VERSION = 1
-DEFAULT_SAVE_PATH = os.path.join("saves", "savegame.json")
-PREVIEW_PATH = os.path.join("saves", "preview.png")
 
-def save_exists(path: str = DEFAULT_SAVE_PATH) -> bool:
-    import os
-    return os.path.exists(path)
 
 
-def save_preview(surface: "pygame.Surface", path: str = PREVIEW_PATH) -> None:
-    import pygame
+def _atomic_write(path: str, payload: bytes) -> None:
+    """Temp-Datei im selben Ordner schreiben, fsync, dann per os.replace umbenennen (nie halbe Saves)."""
     _ensure_save_dir(path)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    # Verzeichniseintrag ebenfalls auf die Platte bringen (nur POSIX)
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
-    # Thumbnail-Größe (16:9)
-    target_w, target_h = 420, 236
 
-    thumb = pygame.transform.smoothscale(surface, (target_w, target_h))
-    pygame.image.save(thumb, path)
+def write_save(data: dict, path: str = DEFAULT_SAVE_PATH, thumb: bytes = b"") -> None:
+    """Snapshot serialisieren, komprimieren und atomar schreiben (läuft im Save-Thread)."""
+    _atomic_write(path, encode_save(data, meta=_meta_from_data(data), thumb=thumb))
 
-def load_save_metadata(path: str = DEFAULT_SAVE_PATH) -> Optional[dict]:
-    if not os.path.exists(path):
-        return None
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    clock = data.get("clock", {}) or {}
-    player = data.get("player", {}) or {}
-
-    # "Spielzeit": In-Game Zeit (Tag + Uhrzeit)
-    day = int(clock.get("day", 1))
-    sec = float(clock.get("seconds_in_day", 0.0))
-    hours = int(sec // 3600)
-    minutes = int((sec % 3600) // 60)
-
-    # XP + Level
-    xp = cap_xp(int(player.get("xp", 0)))
-    lvl, cur, need = xp_to_level(xp)
-    wd = data.get("world", {}) or {}
-
-    return {
-        "day": day,
-        "time_str": f"{hours:02d}:{minutes:02d}",
-        "xp": xp,
-        "level": lvl,
-        "xp_cur": cur,
-        "xp_need": need,
-        "enc_meter": float(wd.get("enc_meter", data.get("enc_meter", 0.0))),
 
-    }
+class SaveWriter:
+    """
+    Ein einzelner Worker-Thread für Saves: Reihenfolge bleibt erhalten, der Render-Thread
+    macht nur den Snapshot. Ergebnis per Future (done()/exception()).
+    """
 
+    def __init__(self):
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        self._pending: list[Future] = []
 
-def _ensure_save_dir(path: str) -> None:
-    d = os.path.dirname(path)
-    if d:
-        os.makedirs(d, exist_ok=True)
+    def submit(self, data: dict, path: str, preview: Optional["pygame.Surface"] = None) -> Future:
+        def job():
+            thumb = _encode_thumbnail(preview) if preview is not None else b""
+            write_save(data, path, thumb)
+            return path
+
+        fut = self._pool.submit(job)
+        self._pending = [f for f in self._pending if not f.done()] + [fut]
+        return fut
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Auf alle laufenden Saves warten (z.B. vor dem Laden)."""
+        for fut in list(self._pending):
+            try:
+                fut.result(timeout=timeout)
+            except Exception:
+                pass
+        self._pending = [f for f in self._pending if not f.done()]
+
+    def busy(self) -> bool:
+        return any(not f.done() for f in self._pending)
+
+
+# prozessweit ein Save-Thread
+_WRITER: Optional[SaveWriter] = None
+
+
+def get_save_writer() -> SaveWriter:
+    global _WRITER
+    if _WRITER is None:
+        _WRITER = SaveWriter()
+    return _WRITER
 
 
 def _tuple2(v):
@@ -80,11 +140,25 @@ def _tuple2(v):
 
 def save_game(ctx: Any, path: str = DEFAULT_SAVE_PATH) -> None:
     """
-    Speichert den minimal nötigen Spielzustand aus ctx in JSON.
+    Speichert den minimal nötigen Spielzustand aus ctx (synchron).
     Content wird NICHT gespeichert (wird beim Laden aus content/ wiederhergestellt).
     """
-    _ensure_save_dir(path)
+    write_save(snapshot_game(ctx), path)
 
+
+def save_game_async(ctx: Any, path: str = DEFAULT_SAVE_PATH, preview: Optional["pygame.Surface"] = None) -> Future:
+    """
+    Snapshot im Main-Thread, Serialisieren/Komprimieren/Schreiben (+ Preview) im Save-Thread.
+    preview darf danach vom Aufrufer nicht mehr verändert werden.
+    """
+    return get_save_writer().submit(snapshot_game(ctx), path, preview)
+
+
+def snapshot_game(ctx: Any) -> Dict[str, Any]:
+    """
+    Spielzustand als reine Daten (dict/list/Primitive), unabhängig von den Live-Objekten:
+    der Save-Thread kann ihn serialisieren, während das Spiel weiterläuft.
+    """
     clock = getattr(ctx, "clock", None)
     player = getattr(ctx, "player", None)
 
@@ -188,19 +262,17 @@ def save_game(ctx: Any, path: str = DEFAULT_SAVE_PATH) -> None:
         "markets": markets_out,
         "npc_shipments": shipments_out,
 
-        "city_supply_idx": {
-            # keys: (city_id, category) -> float
-            f"{k[0]}|{k[1]}": float(v)
+        # [[city_id, category, value], ...]
+        "city_supply_idx": [
+            [str(k[0]), str(k[1]), float(v)]
             for k, v in (getattr(ctx, "city_supply_idx", {}) or {}).items()
-        },
+        ],
 
         "trade_ui_state": _serialize_trade_ui_state(getattr(ctx, "trade_ui_state", None)),
 
         "run_config": _serialize_run_config(getattr(ctx, "run_config", None)),
     }
-
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    return data
 
 
 def load_game(ctx: Any, path: str = DEFAULT_SAVE_PATH) -> bool:
@@ -208,11 +280,13 @@ def load_game(ctx: Any, path: str = DEFAULT_SAVE_PATH) -> bool:
     Lädt Savegame in den bestehenden ctx.
     Gibt False zurück, wenn kein Save existiert.
     """
-    if not os.path.exists(path):
-        return False
+    # ein gerade laufender Save soll fertig sein, bevor gelesen wird
+    if _WRITER is not None:
+        _WRITER.wait()
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _read_save_data(path)
+    if data is None:
+        return False
 
     # --- Content neu laden (Source of Truth) ---
     ctx.content = load_content("content")
@@ -256,8 +330,7 @@ def load_game(ctx: Any, path: str = DEFAULT_SAVE_PATH) -> bool:
     ctx.current_map_id = str(wd.get("current_map_id", "world_01"))
     ctx.last_city_id = wd.get("last_city_id", None)
     ctx.last_world_ship_pos = _tuple2(wd.get("last_world_ship_pos", [0.0, 0.0]))
-    # enc_meter liegt im Save unter world.enc_meter (Legacy-Fallback: top-level enc_meter)
-    ctx.enc_meter = float(wd.get("enc_meter", data.get("enc_meter", 0.0)))
+    ctx.enc_meter = float(wd.get("enc_meter", 0.0))
     ctx.enc_meter = max(0.0, min(1.0, ctx.enc_meter))
 
 
@@ -362,11 +435,8 @@ def load_game(ctx: Any, path: str = DEFAULT_SAVE_PATH) -> bool:
 
     # supply idx
     ctx.city_supply_idx = {}
-    for k, v in (data.get("city_supply_idx", {}) or {}).items():
-        # key format: "city|category"
-        if "|" in k:
-            city_id, cat = k.split("|", 1)
-            ctx.city_supply_idx[(city_id, cat)] = float(v)
+    for city_id, cat, v in (data.get("city_supply_idx", []) or []):
+        ctx.city_supply_idx[(city_id, cat)] = float(v)
 
     # UI state (optional)
     ctx.trade_ui_state = _deserialize_trade_ui_state(data.get("trade_ui_state", None))
@@ -380,7 +450,7 @@ def load_game(ctx: Any, path: str = DEFAULT_SAVE_PATH) -> bool:
 def _serialize_trade_ui_state(st: Any) -> Optional[Dict[str, Any]]:
     if not st:
         return None
-    out = dict(st)
+    out = copy.deepcopy(dict(st))  # innere dicts (avg_cost ...) ändern sich weiter, während der Save-Thread schreibt
     # sets -> lists
     if "favorite_goods" in out and isinstance(out["favorite_goods"], set):
         out["favorite_goods"] = sorted(list(out["favorite_goods"]))
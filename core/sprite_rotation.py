@@ -0,0 +1,62 @@
+from __future__ import annotations
+import math
+import pygame
+
+
+class RotationAtlas:
+    """
+    Vorgerenderte Rotationen eines Sprites in festen Winkelschritten.
+    get(angle) liefert nur noch einen Listen-Lookup statt rotozoom pro Frame.
+    """
+
+    def __init__(self, base: pygame.Surface, step_deg: float):
+        self.step_deg = float(step_deg)
+        self.count = max(1, int(round(360.0 / self.step_deg)))
+        self.step_deg = 360.0 / self.count
+
+        self.frames: list[pygame.Surface] = []
+        self.bytes = 0
+        for i in range(self.count):
+            surf = pygame.transform.rotozoom(base, i * self.step_deg, 1.0)
+            self.frames.append(surf)
+            self.bytes += surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+    def index_for(self, angle_deg: float) -> int:
+        return int(round(angle_deg / self.step_deg)) % self.count
+
+    def get(self, angle_deg: float) -> pygame.Surface:
+        return self.frames[self.index_for(angle_deg)]
+
+
+def pick_step_deg(size: tuple[int, int], min_step: float = 1.0, max_step: float = 2.0) -> float:
+    """
+    Winkelauflösung je Sprite-Größe: so fein, dass die äußersten Pixel pro Schritt
+    höchstens ~1 px wandern (kleine Schiffe 2°, große Schiffe bis 1°).
+    """
+    radius = 0.5 * math.hypot(size[0], size[1])
+    if radius <= 1.0:
+        return max_step
+    step = math.degrees(1.0 / radius)
+    return max(min_step, min(max_step, step))
+
+
+# prozessweit geteilt: Weltkarte, NPC-Schiffe, ... (key z.B. (ship_name, size))
+_ATLASES: dict[object, RotationAtlas] = {}
+
+
+def get_rotation_atlas(key, base: pygame.Surface, step_deg: float | None = None) -> RotationAtlas:
+    atlas = _ATLASES.get(key)
+    if atlas is None:
+        if step_deg is None:
+            step_deg = pick_step_deg(base.get_size())
+        atlas = RotationAtlas(base, step_deg)
+        _ATLASES[key] = atlas
+    return atlas
+
+
+def atlas_stats() -> dict:
+    return {
+        "atlases": len(_ATLASES),
+        "frames": sum(a.count for a in _ATLASES.values()),
+        "bytes": sum(a.bytes for a in _ATLASES.values()),
+    }
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Dict, Optional, Tuple
 
@@ -9,6 +10,9 @@ import pygame
 
 Color = Tuple[int, int, int]
 
+TEXT_CACHE_BUDGET_BYTES = 16 * 1024 * 1024
+TEXT_CACHE_MAX_ENTRIES = 2048
+
 
 @dataclass(frozen=True)
 class TextStyle:
@@ -60,6 +64,18 @@ class FontBank:
         return font
 
 
+# prozessweit eine FontBank (Fonts werden geteilt: nicht per set_bold & Co. umstellen, sondern get(bold=True))
+_FONTS: Optional[FontBank] = None
+
+
+def get_fonts() -> FontBank:
+    global _FONTS
+    if _FONTS is None:
+        from settings import UI_FONT_PATH, UI_FONT_FALLBACK
+        _FONTS = FontBank(UI_FONT_PATH, UI_FONT_FALLBACK)
+    return _FONTS
+
+
 def _lerp(a: int, b: int, t: float) -> int:
     return int(a + (b - a) * t)
 
@@ -78,61 +94,253 @@ def _make_vertical_gradient(size: Tuple[int, int], top: Color, bottom: Color) ->
     return surf
 
 
+class _TextEntry:
+    __slots__ = ("surface", "font", "bytes")
+
+    def __init__(self, surface: pygame.Surface, font: pygame.font.Font):
+        self.surface = surface
+        self.font = font  # Referenz halten: solange der Eintrag lebt, kann id(font) nicht neu vergeben werden
+        self.bytes = surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class TextCache:
+    """
+    LRU-Cache für fertig gerenderte Texte, Key = (text, id(font), style/Farbe, antialias).
+    Statische Labels kosten so nur noch einen Blit pro Frame; wechselnde Texte (Zähler etc.)
+    verdrängen sich gegenseitig, sobald budget_bytes bzw. max_entries überschritten sind.
+    Gelieferte Surfaces sind geteilt: nicht verändern, sondern kopieren.
+    """
+
+    def __init__(self, budget_bytes: int = TEXT_CACHE_BUDGET_BYTES, max_entries: int = TEXT_CACHE_MAX_ENTRIES):
+        self.budget_bytes = int(budget_bytes)
+        self.max_entries = int(max_entries)
+        self._entries: "OrderedDict[tuple, _TextEntry]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple) -> Optional[pygame.Surface]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry.surface
+
+    def put(self, key: tuple, font: pygame.font.Font, surface: pygame.Surface) -> pygame.Surface:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old.bytes
+        entry = _TextEntry(surface, font)
+        self._entries[key] = entry
+        self.bytes += entry.bytes
+        while self._entries and (self.bytes > self.budget_bytes or len(self._entries) > self.max_entries):
+            _k, dropped = self._entries.popitem(last=False)
+            self.bytes -= dropped.bytes
+            self.evictions += 1
+        return surface
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# prozessweit geteilt (wie AssetManager)
+_TEXT_CACHE: Optional[TextCache] = None
+
+
+def get_text_cache() -> TextCache:
+    global _TEXT_CACHE
+    if _TEXT_CACHE is None:
+        _TEXT_CACHE = TextCache()
+    return _TEXT_CACHE
+
+
+def text_surface(font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+    """font.render mit Cache (für schlichte Labels ohne TextStyle)."""
+    cache = get_text_cache()
+    key = (text, id(font), tuple(color), antialias)
+    surf = cache.get(key)
+    if surf is None:
+        surf = cache.put(key, font, font.render(text, antialias, color))
+    return surf
+
+
+# Zeichen für Zahlen-Anzeigen (Geld, Bestand, Tonnen, HP, Schaden)
+NUMERIC_CHARS = "0123456789 +-.,:/%()xt"
+
+
+class GlyphAtlas:
+    """
+    Vorgerenderte Glyphen (NUMERIC_CHARS) für eine (Font, Farbe) auf einem Sheet.
+    Wechselnde Zahlen werden aus Glyph-Blits zusammengesetzt statt jedes Frame font.render zu rufen.
+    Abstände = font.size(ch) pro Zeichen (kein Kerning; bei Ziffern praktisch identisch).
+    """
+
+    def __init__(self, font: pygame.font.Font, color, antialias: bool = True, chars: str = NUMERIC_CHARS):
+        self.font = font  # Referenz halten (Key nutzt id(font))
+        self.height = font.get_height()
+        self.rects: Dict[str, pygame.Rect] = {}
+
+        glyphs = [(ch, font.render(ch, antialias, color)) for ch in dict.fromkeys(chars)]
+        w = sum(g.get_width() + 1 for _ch, g in glyphs)
+        h = max([self.height] + [g.get_height() for _ch, g in glyphs])
+        sheet = pygame.Surface((max(1, w), max(1, h)), pygame.SRCALPHA)
+        x = 0
+        for ch, g in glyphs:
+            # BLEND_RGBA_ADD auf leeres Sheet = exakte Kopie (auch der Alpha-Kanten)
+            sheet.blit(g, (x, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            self.rects[ch] = pygame.Rect(x, 0, g.get_width(), g.get_height())
+            x += g.get_width() + 1
+        self.sheet = sheet.convert_alpha()
+        self._space = self.rects.get(" ")
+
+    def supports(self, text: str) -> bool:
+        rects = self.rects
+        return all(ch in rects for ch in text)
+
+    def width(self, text: str) -> int:
+        rects = self.rects
+        return sum(rects[ch].w for ch in text)
+
+    def blits(self, text: str, pos: Tuple[int, int]) -> list:
+        """(sheet, Position, Ausschnitt) pro Zeichen für Surface.blits."""
+        return self._blits([self.rects[ch] for ch in text], pos[0], pos[1])
+
+    def _blits(self, rects: list, x: int, y: int) -> list:
+        sheet = self.sheet
+        space = self._space
+        out = []
+        for r in rects:
+            if r is not space:
+                out.append((sheet, (x, y), r))
+            x += r.w
+        return out
+
+
+_GLYPHS: Dict[tuple, GlyphAtlas] = {}
+
+# anchor -> (x, y) in halben Breiten/Höhen (wie die gleichnamigen pygame.Rect-Attribute)
+_ANCHORS: Dict[str, Tuple[int, int]] = {
+    "topleft": (0, 0), "midtop": (1, 0), "topright": (2, 0),
+    "midleft": (0, 1), "center": (1, 1), "midright": (2, 1),
+    "bottomleft": (0, 2), "midbottom": (1, 2), "bottomright": (2, 2),
+}
+
+
+def glyph_atlas(font: pygame.font.Font, color, antialias: bool = True) -> GlyphAtlas:
+    key = (id(font), tuple(color), antialias)
+    atlas = _GLYPHS.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font, color, antialias)
+        _GLYPHS[key] = atlas
+    return atlas
+
+
+def number_blits(font: pygame.font.Font, text: str, color, pos: Tuple[int, int], anchor: str = "topleft") -> list:
+    """
+    Blit-Liste (für Surface.blits) für eine Zahl/Anzeige; pos bezieht sich auf anchor
+    ("topleft", "midleft", "center", "midright", ...).
+    Reine Zahlen kommen aus dem Glyph-Atlas, alles andere als gecachter Text.
+    """
+    ax, ay = _ANCHORS[anchor]
+    atlas = _GLYPHS.get((id(font), color, True)) or glyph_atlas(font, color)
+    rects = atlas.rects
+    try:
+        glyphs = [rects[ch] for ch in text]
+    except KeyError:
+        surf = text_surface(font, text, color)
+        w, h = surf.get_size()
+        return [(surf, (pos[0] - w * ax // 2, pos[1] - h * ay // 2))]
+
+    w = 0
+    for r in glyphs:
+        w += r.w
+    return atlas._blits(glyphs, pos[0] - w * ax // 2, pos[1] - atlas.height * ay // 2)
+
+
+# Kreis-/Rauten-Kernel für Mask-Dilatation, pro (Form, Radius) einmal gebaut
+_KERNELS: Dict[Tuple[str, int], pygame.mask.Mask] = {}
+
+
+def _kernel(shape: str, r: int) -> pygame.mask.Mask:
+    k = _KERNELS.get((shape, r))
+    if k is None:
+        k = pygame.mask.Mask((2 * r + 1, 2 * r + 1))
+        for dx in range(-r, r + 1):
+            for dy in range(-r, r + 1):
+                inside = (abs(dx) + abs(dy) <= r) if shape == "diamond" else (dx * dx + dy * dy <= r * r)
+                if inside:
+                    k.set_at((r + dx, r + dy))
+        _KERNELS[(shape, r)] = k
+    return k
+
+
+def _dilate(mask: pygame.mask.Mask, shape: str, r: int) -> pygame.mask.Mask:
+    # convolve mit symmetrischem Kernel = Dilatation; Ergebnis ist um r pro Seite größer (Original bei (r, r))
+    if r <= 0:
+        return mask
+    return mask.convolve(_kernel(shape, r))
+
+
 def render_text(text: str, font: pygame.font.Font, style: Optional[TextStyle] = None, antialias: bool = True) -> pygame.Surface:
     """
     EIN Einstiegspunkt für alle Texte.
     Unterstützt: thickness, shadow, outline, gradient.
-    Rückgabe ist eine convert_alpha()-Surface.
+    Rückgabe ist eine (geteilte, gecachte) convert_alpha()-Surface.
     """
     if style is None:
         style = TextStyle()
 
+    cache = get_text_cache()
+    key = (text, id(font), style, antialias)
+    surf = cache.get(key)
+    if surf is None:
+        surf = cache.put(key, font, _render_text(text, font, style, antialias))
+    return surf
+
+
+def _render_text(text: str, font: pygame.font.Font, style: TextStyle, antialias: bool) -> pygame.Surface:
     # 1) Basis-Maske (Alpha) erzeugen
     base_mask = font.render(text, antialias, (255, 255, 255)).convert_alpha()
+    mask = pygame.mask.from_surface(base_mask)
+
+    # 2) Dicke: Maske rautenförmig dilatieren (entspricht dem früheren Overdraw mit |dx|+|dy| <= thick-1)
+    thick = max(1, int(style.thickness))
+    body = _dilate(mask, "diamond", thick - 1)
 
-    # 2) Füllung (solid oder gradient) erzeugen
+    # 3) Füllung (solid oder gradient) über die dilatierte Maske legen
     if style.gradient_top and style.gradient_bottom:
-        fill = _make_vertical_gradient(base_mask.get_size(), style.gradient_top, style.gradient_bottom).convert_alpha()
+        fill = _make_vertical_gradient(body.get_size(), style.gradient_top, style.gradient_bottom)
+        main = body.to_surface(setsurface=fill, unsetcolor=(0, 0, 0, 0))
     else:
-        fill = pygame.Surface(base_mask.get_size(), pygame.SRCALPHA)
-        fill.fill((*style.color, 255))
-
-    # Alpha der Maske auf Füllung übertragen
-    # --- Alpha der Maske auf Füllung übertragen (ohne surfarray / numpy) ---
-    mask = pygame.mask.from_surface(base_mask)
-    alpha_surf = mask.to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0))
-    fill.blit(alpha_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        main = body.to_surface(setcolor=(*style.color, 255), unsetcolor=(0, 0, 0, 0))
 
-
-    # 3) Dicke simulieren (Overdraw)
-    thick = max(1, int(style.thickness))
-    main = pygame.Surface((fill.get_width() + (thick - 1) * 2, fill.get_height() + (thick - 1) * 2), pygame.SRCALPHA)
-    ox = (thick - 1)
-    oy = (thick - 1)
-    for dx in range(-ox, ox + 1):
-        for dy in range(-oy, oy + 1):
-            # kleiner Radius, damit es nicht "matschig" wird
-            if abs(dx) + abs(dy) <= ox:
-                main.blit(fill, (ox + dx, oy + dy))
-
-    # 4) Outline (unter main)
+    # 4) Outline (unter main): Basis-Maske kreisförmig dilatieren statt (2r+1)^2 Kopien zu blitten
     if style.outline_color and style.outline_px > 0:
         outline_px = int(style.outline_px)
-        outline = font.render(text, antialias, style.outline_color).convert_alpha()
-
-        out = pygame.Surface((outline.get_width() + outline_px * 2, outline.get_height() + outline_px * 2), pygame.SRCALPHA)
-        # ringförmig blitten
-        for dx in range(-outline_px, outline_px + 1):
-            for dy in range(-outline_px, outline_px + 1):
-                if dx * dx + dy * dy <= outline_px * outline_px:
-                    out.blit(outline, (outline_px + dx, outline_px + dy))
+        out = _dilate(mask, "disc", outline_px).to_surface(
+            setcolor=(*style.outline_color, 255), unsetcolor=(0, 0, 0, 0)
+        )
 
         # main in die Mitte auf out
         combo = pygame.Surface(
             (max(out.get_width(), main.get_width()), max(out.get_height(), main.get_height())),
             pygame.SRCALPHA
         )
-        combo.blit(out, (0, 0))
+        combo.blit(out, ((combo.get_width() - out.get_width()) // 2, (combo.get_height() - out.get_height()) // 2))
         combo.blit(main, ((combo.get_width() - main.get_width()) // 2, (combo.get_height() - main.get_height()) // 2))
         main = combo
 
@@ -143,7 +351,7 @@ def render_text(text: str, font: pygame.font.Font, style: Optional[TextStyle] =
         sh_shape = mask.to_surface(
             setcolor=(*style.shadow_color, int(style.shadow_alpha)),
             unsetcolor=(0, 0, 0, 0)
-        ).convert_alpha()
+        )
 
         out = pygame.Surface(
             (main.get_width() + abs(style.shadow_offset[0]) + 4,
@@ -154,5 +362,4 @@ def render_text(text: str, font: pygame.font.Font, style: Optional[TextStyle] =
         out.blit(main, (2, 2))
         main = out
 
-
     return main.convert_alpha()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+import importlib
+import os
+import sys
+import threading
+from collections import deque
+from time import perf_counter
+from typing import Optional
+import pygame
+
+from core.assets import get_assets
+
+
+# Module, die das Hauptmenü selbst nicht braucht (werden erst beim Klick auf "Spiel starten"/"Laden" benutzt)
+WARM_MODULES = (
+    "states.character_select",
+    "states.setup",
+    "states.world",
+    "states.city",
+    "states.combat",
+    "core.save_system",
+    "states.save_slots",
+    "core.day_update",
+    "combat.enemy_ai",
+    "combat.odds",
+    "combat.replay",
+)
+
+_UI = os.path.join("assets", "ui")
+
+# Rohbilder (unskaliert) für World/City/Kampf: (Pfad, alpha) wie in den States geladen
+WARM_IMAGES = (
+    (os.path.join("assets", "atlas", "goods.png"), True),
+    (os.path.join("assets", "atlas", "ui.png"), True),
+    (os.path.join(_UI, "stats.png"), True),
+    (os.path.join(_UI, "stats_klick.png"), True),
+    (os.path.join(_UI, "barometer.png"), True),
+    (os.path.join(_UI, "level.png"), True),
+    (os.path.join(_UI, "xp.png"), True),
+    (os.path.join(_UI, "xp_fill.png"), True),
+    (os.path.join(_UI, "master_life.png"), True),
+    (os.path.join(_UI, "gold.png"), True),
+    (os.path.join(_UI, "trade_menu.png"), True),
+    (os.path.join(_UI, "city.png"), False),
+    (os.path.join(_UI, "sign_empty.png"), True),
+    (os.path.join(_UI, "moral", "moral.png"), True),
+    (os.path.join(_UI, "moral", "moral_fill.png"), True),
+    (os.path.join(_UI, "moral", "moral_bg.png"), True),
+)
+
+START_MAP_ID = "world_01"
+
+
+class Warmup:
+    """
+    Lädt während das Hauptmenü läuft im Hintergrund vor, was nach "Spiel starten" gebraucht wird:
+    Module importieren, Content laden, UI-Bilder dekodieren.
+    Dekodierte Bilder übernimmt der Main-Thread per pump() (convert geht nur dort) in den AssetManager.
+    """
+
+    def __init__(self, modules=WARM_MODULES, images=WARM_IMAGES):
+        self.modules = tuple(modules)
+        self.images = tuple(images)
+        self._ready: deque = deque()  # (path, alpha, Surface) aus dem Thread
+        self._thread: Optional[threading.Thread] = None
+        self._map_submitted = False
+        self.done = False
+        self.thread_ms = 0.0
+        self.failed: list[str] = []
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        t0 = perf_counter()
+        for name in self.modules:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                self.failed.append(name)
+                print(f"[Warmup] import {name} failed: {e}")
+
+        try:
+            from data.loader import load_content
+            load_content("content")
+        except Exception as e:
+            print(f"[Warmup] content failed: {e}")
+
+        assets = get_assets()
+        for path, alpha in self.images:
+            if not assets.exists(path):
+                continue
+            try:
+                img = pygame.image.load(path)
+            except (pygame.error, OSError):
+                continue
+            self._ready.append((path, alpha, img))
+
+        self.thread_ms = (perf_counter() - t0) * 1000.0
+        self.done = True
+
+    @property
+    def busy(self) -> bool:
+        return not self.done or bool(self._ready)
+
+    def pump(self, ctx, budget_ms: float = 2.0) -> None:
+        """Main-Thread: fertige Bilder konvertieren (höchstens budget_ms pro Frame) + Start-Map anstoßen."""
+        if not self._map_submitted and "states.world" in self.modules and _module_ready("states.world"):
+            self._map_submitted = True
+            _prefetch_start_map(ctx)
+
+        if not self._ready:
+            return
+        assets = get_assets()
+        t_end = perf_counter() + budget_ms / 1000.0
+        while self._ready:
+            path, alpha, img = self._ready.popleft()
+            assets.add_decoded(path, img, alpha=alpha)
+            if perf_counter() >= t_end:
+                break
+
+
+def _module_ready(name: str) -> bool:
+    # erst wenn der Import komplett durch ist (sys.modules enthält halbfertige Module schon früher)
+    mod = sys.modules.get(name)
+    spec = getattr(mod, "__spec__", None)
+    return mod is not None and not getattr(spec, "_initializing", False)
+
+
+def _prefetch_start_map(ctx) -> None:
+    # Start-Map über den Asset-Streamer vordekodieren; WorldMapState übernimmt den laufenden Job
+    from states.world import WorldMapState, _load_map_bundle
+    from core.asset_stream import get_asset_streamer
+
+    cache = getattr(ctx, "map_cache", None) or {}
+    cfg = WorldMapState.MAPS.get(START_MAP_ID)
+    if cfg is None or START_MAP_ID in cache:
+        return
+    get_asset_streamer(ctx).submit(START_MAP_ID, _load_map_bundle, cfg)
+
+
+# einmal pro Prozess (zurück ins Menü startet nichts neu)
+_WARMUP: Optional[Warmup] = None
+
+
+def start_warmup() -> Warmup:
+    global _WARMUP
+    if _WARMUP is None:
+        _WARMUP = Warmup()
+        _WARMUP.start()
+    return _WARMUP
@@ -1,33 +1,46 @@
 import math
 import random
-from dataclasses import dataclass
 import pygame
 
-@dataclass
-class WakeParticle:
-    x: float
-    y: float
-    vx: float
-    vy: float
-    radius: float
-    age: float
-    life: float
+try:
+    import numpy as np
+except ImportError:  # optional: ohne NumPy läuft die (langsamere) Listen-Variante
+    np = None
+
+
+# Partikel-Arten
+KIND_DOT = 0
+KIND_STRIPE = 1
+KIND_BOW = 2
+
+# Sprite-Tabellen: Lebensalter und Richtung werden in Buckets vorgerendert
+AGE_BUCKETS = 16
+ANGLE_BUCKETS = 36          # 10°-Schritte für Stripes
+DOT_RADIUS_MIN = 2.0        # Dot/Bow-Radius 2.0..5.0 in 0.5er Schritten
+DOT_RADIUS_STEP = 0.5
+DOT_RADIUS_BUCKETS = 7
+STRIPE_LEN_MIN = 8.0        # Stripe-Länge 8..16 in 2er Schritten
+STRIPE_LEN_STEP = 2.0
+STRIPE_LEN_BUCKETS = 5
+
+FOAM_COLOR = (235, 235, 235)
+
+# Structure-of-Arrays: eine Spalte pro Feld (kind als float gespeichert)
+_FIELDS = ("x", "y", "vx", "vy", "radius", "age", "life", "kind", "angle_deg", "length")
 
-    kind: str = "dot"       # "dot" | "stripe" | "bow"
-    angle_deg: float = 0.0  # für "stripe"
-    length: float = 0.0     # für "stripe"
 
 class WakeSystem:
     def __init__(self) -> None:
-        self._parts: list[WakeParticle] = []
-        self._spawn_acc = 0.0
-        self._bow_spawn_acc = 0.0
+        self._cols = self._empty_columns()
+        self._spawn_buf: list[tuple] = []
+        self._spawn_acc: dict[object, float] = {}
+        self._bow_spawn_acc: dict[object, float] = {}
 
 
         # Tuning
         self.base_rate = 2.0          # Partikel/s (bei sehr wenig Speed)
         self.speed_rate = 0.10        # zusätzl. Partikel/s pro px/s Speed
-        self.max_parts = 260
+        self.max_parts = 4096         # reicht auch für NPC-Wakes / Combat-FX
 
         self.behind_dist = 18.0       # hinter dem Schiff
         self.side_spread = 7.0        # seitliche Streuung
@@ -49,17 +62,91 @@ class WakeSystem:
         self.bow_rate = 0.55            # Partikel/s Basis (zusätzlich zu speed)
         self.bow_speed_rate = 0.015     # Partikel/s pro px/s Speed
 
+        # Vorgerenderte Sprites: Dots/Bows komplett, Stripes lazy pro (Länge, Winkel, Alter)
+        self._dot_sprites = self._bake_dot_sprites()
+        self._stripe_sprites: dict[tuple[int, int, int], tuple] = {}
 
-    def update(self, dt: float, ship_pos: tuple[float, float], ship_vel: tuple[float, float]) -> None:
-        # Partikel updaten
-        for p in self._parts:
-            p.age += dt
-            p.x += p.vx * dt
-            p.y += p.vy * dt
+        # wiederverwendetes Overlay (wächst nur, wenn die Bounding-Box größer wird)
+        self._overlay: pygame.Surface | None = None
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _empty_columns() -> dict:
+        if np is not None:
+            return {k: np.zeros(0, dtype=np.float32) for k in _FIELDS}
+        return {k: [] for k in _FIELDS}
+
+    def __len__(self) -> int:
+        return len(self._cols["x"]) + len(self._spawn_buf)
+
+    def clear(self) -> None:
+        self._cols = self._empty_columns()
+        self._spawn_buf = []
+
+    def _flush_spawns(self) -> None:
+        buf = self._spawn_buf
+        if not buf:
+            return
+        self._spawn_buf = []
+        cols = self._cols
+
+        if np is not None:
+            block = np.asarray(buf, dtype=np.float32)
+            for j, k in enumerate(_FIELDS):
+                cols[k] = np.concatenate((cols[k], block[:, j]))
+        else:
+            for j, k in enumerate(_FIELDS):
+                cols[k].extend(row[j] for row in buf)
+
+    def _spawn(self, x, y, vx, vy, radius, life, kind, angle_deg=0.0, length=0.0) -> None:
+        self._spawn_buf.append((x, y, vx, vy, radius, 0.0, life, float(kind), angle_deg, length))
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+    def step(self, dt: float) -> None:
+        """Alle Partikel in einem Rutsch integrieren und tote entfernen."""
+        self._flush_spawns()
+        cols = self._cols
+        if len(cols["x"]) == 0:
+            return
 
-        # Tote entfernen
-        self._parts = [p for p in self._parts if p.age < p.life]
+        if np is not None:
+            cols["age"] += dt
+            cols["x"] += cols["vx"] * dt
+            cols["y"] += cols["vy"] * dt
 
+            alive = cols["age"] < cols["life"]
+            if not alive.all():
+                for k in _FIELDS:
+                    cols[k] = cols[k][alive]
+            return
+
+        xs, ys, vxs, vys = cols["x"], cols["y"], cols["vx"], cols["vy"]
+        ages, lifes = cols["age"], cols["life"]
+        for i in range(len(xs)):
+            ages[i] += dt
+            xs[i] += vxs[i] * dt
+            ys[i] += vys[i] * dt
+
+        keep = [i for i in range(len(xs)) if ages[i] < lifes[i]]
+        if len(keep) != len(xs):
+            for k in _FIELDS:
+                col = cols[k]
+                cols[k] = [col[i] for i in keep]
+
+    def update(self, dt: float, ship_pos: tuple[float, float], ship_vel: tuple[float, float]) -> None:
+        # Partikel updaten
+        self.step(dt)
+        self.emit_ship(dt, ship_pos, ship_vel)
+
+    def emit_ship(self, dt: float, ship_pos: tuple[float, float], ship_vel: tuple[float, float], emitter="player") -> None:
+        """
+        Heck- und Bugwelle für ein Schiff spawnen. Mehrere Schiffe (z.B. NPCs)
+        teilen sich ein System; Spawn-Akkus laufen pro emitter-Key.
+        """
         vx, vy = ship_vel
         speed = math.hypot(vx, vy)
         if speed < 5.0:
@@ -67,7 +154,7 @@ class WakeSystem:
 
         # Spawnrate abhängig vom Speed
         rate = self.base_rate + speed * self.speed_rate  # particles/sec
-        self._spawn_acc += rate * dt
+        acc = self._spawn_acc.get(emitter, 0.0) + rate * dt
 
         # Richtung (aus Velocity)
         inv = 1.0 / speed
@@ -80,8 +167,8 @@ class WakeSystem:
 
         sx, sy = ship_pos
 
-        while self._spawn_acc >= 1.0 and len(self._parts) < self.max_parts:
-            self._spawn_acc -= 1.0
+        while acc >= 1.0 and len(self) < self.max_parts:
+            acc -= 1.0
 
             side = (random.random() * 2.0 - 1.0) * self.side_spread
             px = sx - dx * self.behind_dist + rx * side
@@ -99,23 +186,21 @@ class WakeSystem:
                 length = random.uniform(self.min_stripe_len, self.max_stripe_len)
                 radius = float(self.stripe_width)  # "radius" als width verwendet
                 angle_deg = math.degrees(math.atan2(dy, dx))  # Richtung der Bewegung
-                self._parts.append(
-                    WakeParticle(px, py, pvx, pvy, radius, 0.0, life, kind="stripe", angle_deg=angle_deg, length=length)
-                )
+                self._spawn(px, py, pvx, pvy, radius, life, KIND_STRIPE, angle_deg, length)
             else:
                 radius = random.uniform(self.min_radius, self.max_radius)
-                self._parts.append(
-                    WakeParticle(px, py, pvx, pvy, radius, 0.0, life, kind="dot")
-                )
+                self._spawn(px, py, pvx, pvy, radius, life, KIND_DOT)
+
+        self._spawn_acc[emitter] = acc
 
         # -------------------------------
         # Bugwelle (links/rechts am Bug)
         # -------------------------------
         bow_rate = self.bow_rate + speed * self.bow_speed_rate
-        self._bow_spawn_acc += bow_rate * dt
+        bow_acc = self._bow_spawn_acc.get(emitter, 0.0) + bow_rate * dt
 
-        while self._bow_spawn_acc >= 1.0 and len(self._parts) < self.max_parts:
-            self._bow_spawn_acc -= 1.0
+        while bow_acc >= 1.0 and len(self) < self.max_parts:
+            bow_acc -= 1.0
 
             # links oder rechts
             sign = -1.0 if random.random() < 0.5 else 1.0
@@ -131,38 +216,130 @@ class WakeSystem:
             life = random.uniform(0.35, 0.75)
             radius = random.uniform(2.0, 4.5)
 
-            self._parts.append(
-                WakeParticle(px, py, pvx, pvy, radius, 0.0, life, kind="bow")
+            self._spawn(px, py, pvx, pvy, radius, life, KIND_BOW)
+
+        self._bow_spawn_acc[emitter] = bow_acc
+
+    def forget_emitter(self, emitter) -> None:
+        self._spawn_acc.pop(emitter, None)
+        self._bow_spawn_acc.pop(emitter, None)
+
+    # ------------------------------------------------------------------
+    # Sprite-Tabellen
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _bucket_t(age_b: int) -> float:
+        return (age_b + 0.5) / AGE_BUCKETS
+
+    def _bake_dot_sprites(self) -> list[list[tuple]]:
+        # [radius_bucket][age_bucket] -> (Surface, ox, oy)
+        table = []
+        for rb in range(DOT_RADIUS_BUCKETS):
+            radius = DOT_RADIUS_MIN + rb * DOT_RADIUS_STEP
+            row = []
+            for ab in range(AGE_BUCKETS):
+                t = self._bucket_t(ab)
+                # Alpha fällt über Lebenszeit ab, leichtes "Auflösen" durch Radius-Wachstum
+                alpha = int(110 * (1.0 - t))
+                r = max(1, int(radius * (1.0 + 0.55 * t)))
+                surf = pygame.Surface((r * 2 + 1, r * 2 + 1), pygame.SRCALPHA)
+                pygame.draw.circle(surf, (*FOAM_COLOR, alpha), (r, r), r)
+                row.append((surf, r, r))
+            table.append(row)
+        return table
+
+    def _stripe_sprite(self, lb: int, angle_b: int, ab: int) -> tuple:
+        key = (lb, angle_b, ab)
+        hit = self._stripe_sprites.get(key)
+        if hit is not None:
+            return hit
+
+        t = self._bucket_t(ab)
+        alpha = int(110 * (1.0 - t))
+        length = STRIPE_LEN_MIN + lb * STRIPE_LEN_STEP
+
+        # stripe: dünner, gedrehter Strich
+        r = self.stripe_width * (1.0 + 0.55 * t)
+        w = max(2, int(r))  # "r" als width
+        h = max(4, int(length * (1.0 + 0.35 * t)))  # wächst leicht
+        tmp = pygame.Surface((h, w), pygame.SRCALPHA)
+        tmp.fill((*FOAM_COLOR, alpha))
+        rot = pygame.transform.rotozoom(tmp, -angle_b * (360.0 / ANGLE_BUCKETS), 1.0)
+
+        hit = (rot, rot.get_width() // 2, rot.get_height() // 2)
+        self._stripe_sprites[key] = hit
+        return hit
+
+    # ------------------------------------------------------------------
+    # Render
+    # ------------------------------------------------------------------
+    def bounds(self, pad: int = 16) -> "pygame.Rect | None":
+        # Bounding-Box aller Partikel (inkl. Radius-Wachstum / Stripe-Länge) für Dirty-Rects
+        self._flush_spawns()
+        xs, ys = self._cols["x"], self._cols["y"]
+        if len(xs) == 0:
+            return None
+        x0, y0 = int(min(xs)) - pad, int(min(ys)) - pad
+        x1, y1 = int(max(xs)) + pad, int(max(ys)) + pad
+        return pygame.Rect(x0, y0, x1 - x0 + 1, y1 - y0 + 1)
+
+    def _sprite_indices(self):
+        # pro Partikel: (kind, age_bucket, radius_bucket, len_bucket, angle_bucket, x, y)
+        cols = self._cols
+        if np is not None:
+            t = np.clip(cols["age"] / cols["life"], 0.0, 0.999)
+            age_b = (t * AGE_BUCKETS).astype(np.int32)
+            rad_b = np.clip(np.rint((cols["radius"] - DOT_RADIUS_MIN) / DOT_RADIUS_STEP), 0, DOT_RADIUS_BUCKETS - 1).astype(np.int32)
+            len_b = np.clip(np.rint((cols["length"] - STRIPE_LEN_MIN) / STRIPE_LEN_STEP), 0, STRIPE_LEN_BUCKETS - 1).astype(np.int32)
+            ang_b = np.rint(cols["angle_deg"] / (360.0 / ANGLE_BUCKETS)).astype(np.int32) % ANGLE_BUCKETS
+            return zip(
+                cols["kind"].astype(np.int32).tolist(), age_b.tolist(), rad_b.tolist(),
+                len_b.tolist(), ang_b.tolist(), cols["x"].astype(np.int32).tolist(), cols["y"].astype(np.int32).tolist(),
             )
 
+        out = []
+        for kind, age, life, radius, length, angle, x, y in zip(
+            cols["kind"], cols["age"], cols["life"], cols["radius"], cols["length"], cols["angle_deg"], cols["x"], cols["y"]
+        ):
+            t = min(0.999, max(0.0, age / life))
+            out.append((
+                int(kind),
+                int(t * AGE_BUCKETS),
+                min(DOT_RADIUS_BUCKETS - 1, max(0, int(round((radius - DOT_RADIUS_MIN) / DOT_RADIUS_STEP)))),
+                min(STRIPE_LEN_BUCKETS - 1, max(0, int(round((length - STRIPE_LEN_MIN) / STRIPE_LEN_STEP)))),
+                int(round(angle / (360.0 / ANGLE_BUCKETS))) % ANGLE_BUCKETS,
+                int(x),
+                int(y),
+            ))
+        return out
+
     def render(self, screen: "pygame.Surface") -> None:
-        if not self._parts:
+        bb = self.bounds()
+        if bb is None:
+            return
+        bb = bb.clip(screen.get_rect())
+        if bb.w <= 0 or bb.h <= 0:
             return
 
-        # Overlay für Alpha (perf. ausreichend für Stufe 1)
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-
-        for p in self._parts:
-            t = p.age / p.life
-            # Alpha fällt über Lebenszeit ab
-            alpha = int(110 * (1.0 - t))
-            if alpha <= 0:
-                continue
-
-            # leichtes “Auflösen” durch Radius-Wachstum
-            r = p.radius * (1.0 + 0.55 * t)
-
-            if p.kind in ("dot", "bow"):
-                pygame.draw.circle(overlay, (235, 235, 235, alpha), (int(p.x), int(p.y)), int(r))
+        # Overlay nur so groß wie die Bounding-Box (wird wiederverwendet)
+        ov = self._overlay
+        if ov is None or ov.get_width() < bb.w or ov.get_height() < bb.h:
+            ow = max(bb.w, ov.get_width() if ov is not None else 0)
+            oh = max(bb.h, ov.get_height() if ov is not None else 0)
+            ov = pygame.Surface((ow, oh), pygame.SRCALPHA)
+            self._overlay = ov
+        area = pygame.Rect(0, 0, bb.w, bb.h)
+        ov.fill((0, 0, 0, 0), area)
+
+        bx, by = bb.topleft
+        dots = self._dot_sprites
+        seq = []
+        for kind, ab, rb, lb, angle_b, x, y in self._sprite_indices():
+            if kind == KIND_STRIPE:
+                surf, ox, oy = self._stripe_sprite(lb, angle_b, ab)
             else:
-                # stripe: dünner, gedrehter Strich
-                w = max(2, int(r))  # "r" als width
-                h = max(4, int(p.length * (1.0 + 0.35 * t)))  # wächst leicht
-                tmp = pygame.Surface((h, w), pygame.SRCALPHA)
-                tmp.fill((235, 235, 235, alpha))
-                rot = pygame.transform.rotozoom(tmp, -p.angle_deg, 1.0)
-                rect = rot.get_rect(center=(int(p.x), int(p.y)))
-                overlay.blit(rot, rect)
-
+                surf, ox, oy = dots[rb][ab]
+            seq.append((surf, (x - ox - bx, y - oy - by)))
 
-        screen.blit(overlay, (0, 0))
+        ov.blits(seq, doreturn=False)
+        screen.blit(ov, bb.topleft, area)
@@ -1,8 +1,13 @@
 from __future__ import annotations
+import hashlib
 import json
+import os
+import pickle
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from dataclasses import fields
 
 @dataclass(frozen=True)
@@ -130,13 +135,46 @@ class CityDef:
     map_id: str = "world_01"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Content:
-    goods: Dict[str, GoodDef]
-    ships: Dict[str, ShipDef]
-    city_types: Dict[str, CityTypeDef]
-    cities: Dict[str, CityDef]
-    enemies: Dict[str, EnemyDef]
+    """
+    Geladener, validierter Content. Eine Instanz pro Prozess (siehe load_content),
+    daher read-only: Tabellen sind MappingProxies, dazu vorberechnete Indizes.
+    """
+    goods: Mapping[str, GoodDef]
+    ships: Mapping[str, ShipDef]
+    city_types: Mapping[str, CityTypeDef]
+    cities: Mapping[str, CityDef]
+    enemies: Mapping[str, EnemyDef]
+
+    # Indizes (in __post_init__ gebaut)
+    categories: Tuple[str, ...] = ()
+    goods_by_category: Mapping[str, Tuple[GoodDef, ...]] = field(default_factory=dict)  # je Kategorie nach base_price
+    cities_by_map: Mapping[str, Tuple[CityDef, ...]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for name in ("goods", "ships", "city_types", "cities", "enemies"):
+            object.__setattr__(self, name, MappingProxyType(dict(getattr(self, name))))
+
+        by_cat: Dict[str, List[GoodDef]] = {}
+        for g in sorted(self.goods.values(), key=lambda g: (g.category, g.base_price)):
+            by_cat.setdefault(g.category, []).append(g)
+        by_map: Dict[str, List[CityDef]] = {}
+        for c in self.cities.values():
+            by_map.setdefault(c.map_id, []).append(c)
+
+        object.__setattr__(self, "categories", tuple(sorted(by_cat)))
+        object.__setattr__(self, "goods_by_category", MappingProxyType({k: tuple(v) for k, v in by_cat.items()}))
+        object.__setattr__(self, "cities_by_map", MappingProxyType({k: tuple(v) for k, v in by_map.items()}))
+        object.__setattr__(self, "_goods_sorted", tuple(g for cat in self.categories for g in by_cat[cat]))
+
+    def goods_sorted(self) -> Tuple[GoodDef, ...]:
+        """Alle Waren nach (category, base_price), wie im Handelsmenü."""
+        return self._goods_sorted
+
+    def __reduce__(self):
+        # MappingProxies sind nicht picklebar -> als dicts speichern, Indizes beim Laden neu bauen
+        return (Content, (dict(self.goods), dict(self.ships), dict(self.city_types), dict(self.cities), dict(self.enemies)))
 
 
 def _read_json(path: Path) -> dict:
@@ -162,8 +200,77 @@ def _parse_loot(ld: dict) -> LootTable:
     )
 
 
+CONTENT_FILES = ("goods.json", "ships.json", "cities.json", "enemies.json")
+CONTENT_CACHE_DIR = "cache"
+# bei Änderungen an der Parse-Logik hochzählen (Feldänderungen der Defs invalidieren automatisch)
+CONTENT_CACHE_VERSION = 1
+
+# content_dir -> Content (einmal pro Prozess)
+_LOADED: Dict[str, Content] = {}
+_LOAD_LOCK = threading.Lock()  # Warmup-Thread und Main-Thread können gleichzeitig laden
+
+
 def load_content(content_dir: str = "content") -> Content:
-    base = Path(content_dir)
+    """
+    Content-Service: liefert pro content_dir immer dieselbe (read-only) Instanz.
+    Beim ersten Aufruf kommt sie aus dem kompilierten Cache (cache/content_<dir>.pkl),
+    solange die Hashes der JSON-Quellen passen, sonst wird neu geparst und der Cache geschrieben.
+    """
+    key = os.path.normpath(content_dir)
+    content = _LOADED.get(key)
+    if content is None:
+        with _LOAD_LOCK:
+            content = _LOADED.get(key)
+            if content is None:
+                content = _load_cached(Path(content_dir))
+                _LOADED[key] = content
+    return content
+
+
+def _schema_signature() -> str:
+    defs = (LootCargoEntry, LootTable, CombatStats, EnemyDef, GoodDef, VisualDef, ShipDef, CityTypeDef, CityDef, Content)
+    return ";".join(f"{d.__name__}:{','.join(f.name for f in fields(d))}" for d in defs)
+
+
+def _sources_hash(base: Path) -> str:
+    h = hashlib.sha1(f"{CONTENT_CACHE_VERSION}|{_schema_signature()}".encode("utf-8"))
+    for name in CONTENT_FILES:
+        h.update(name.encode("utf-8"))
+        h.update((base / name).read_bytes())
+    return h.hexdigest()
+
+
+def _cache_path(base: Path) -> Path:
+    tag = hashlib.sha1(str(base.resolve()).encode("utf-8")).hexdigest()[:10]
+    return Path(CONTENT_CACHE_DIR) / f"content_{base.name}_{tag}.pkl"
+
+
+def _load_cached(base: Path) -> Content:
+    digest = _sources_hash(base)
+    path = _cache_path(base)
+    head = digest.encode("ascii") + b"\n"
+    try:
+        with path.open("rb") as f:
+            # Hash steht als Klartext-Zeile vor dem Pickle -> alter Cache wird gar nicht erst entpickelt
+            if f.readline() == head:
+                return pickle.load(f)
+    except Exception:
+        pass  # kein/kaputter Cache oder Klassen umbenannt/verschoben -> neu kompilieren
+
+    content = _compile_content(base)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("wb") as f:
+            f.write(head)
+            pickle.dump(content, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[Content] could not write cache {path}: {e}")
+    return content
+
+
+def _compile_content(base: Path) -> Content:
 
     goods_raw = _read_json(base / "goods.json")["goods"]
     ships_raw = _read_json(base / "ships.json")["ships"]
@@ -1,9 +1,24 @@
+import os
+import sys
+
+# Import-Profiler muss vor allen anderen Imports hängen (python main.py --profile-imports)
+_import_profiler = None
+if "--profile-imports" in sys.argv or os.environ.get("PTS_PROFILE_IMPORTS"):
+    from core.import_profiler import ImportProfiler
+    _import_profiler = ImportProfiler()
+    _import_profiler.install()
+
 import pygame
-from settings import SCREEN_W, SCREEN_H, FPS
+from settings import SCREEN_W, SCREEN_H, FPS, IDLE_FPS
 from core.game import Game
 from states.menu import MainMenuState
 from core.audio import AudioManager
 
+def _report_startup(first_frame_ms: float) -> None:
+    _import_profiler.uninstall()
+    print(_import_profiler.report(first_frame_ms))
+    print(f"[Startup] import report -> {_import_profiler.dump(first_frame_ms)}")
+
 def main():
     pygame.init()
     pygame.mixer.init()
@@ -15,11 +30,21 @@ def main():
     game = Game(screen=screen, initial_state=MainMenuState())
     pygame.mixer.init()
     game.ctx.audio = AudioManager(music_volume=0.8, sfx_volume=0.8)
-    
+
+    first_frame = True
     while True:
+        # Leerlauf: bis zum nächsten Event schlafen statt mit 60 FPS dasselbe Bild zu zeichnen
+        if game.idle:
+            game.wait_for_activity(1000 // max(1, IDLE_FPS))
         real_dt = clock.tick(FPS) / 1000.0
         game.run_frame(real_dt)
-        pygame.display.flip()
+        game.present()
+
+        if first_frame:
+            first_frame = False
+            if _import_profiler is not None:
+                from time import perf_counter
+                _report_startup((perf_counter() - _import_profiler.t_start) * 1000.0)
 
 if __name__ == "__main__":
     main()
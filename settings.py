@@ -2,12 +2,24 @@ import os
 
 SCREEN_W, SCREEN_H = 1280, 720
 FPS = 60
+IDLE_FPS = 10                    # Obergrenze im Leerlauf (nichts ändert sich, kein Input)
 
 # Zeitsteuerung
 TIME_SCALE_PAUSE  = 0.0
 TIME_SCALE_1X     = 1.0  # oder dein bisheriger TIME_SCALE_NORMAL
 TIME_SCALE_2X     = 2.0
 TIME_SCALE_4X     = 4.0  # oder dein bisheriger TIME_SCALE_FAST
+TIME_SCALE_16X    = 16.0  # Schnellvorlauf (Taste F)
+TIME_SCALE_64X    = 64.0
+
+# Welt-Simulation: fester Zeitschritt, unabhängig von der Render-FPS
+WORLD_SIM_HZ = 120
+WORLD_SIM_MAX_STEPS = 600        # max. Sim-Schritte pro Frame (Rest wird verworfen statt aufgeholt)
+FAST_FORWARD_RENDER_FPS = 15     # im Schnellvorlauf wird nur so oft gerendert
+
+# NPC-Konvois auf der Weltkarte
+CONVOY_SPRITE_SIZE = (30, 30)
+CONVOY_INTERCEPT_RADIUS = 22.0   # px Abstand Spieler <-> Konvoi für ein Abfangen
 
 MASTER_LIFE_ICON = os.path.join("assets", "ui", "master_life.png")
 GOLD_ICON = os.path.join("assets", "ui", "gold.png")  # Dateiname ggf. anpassen
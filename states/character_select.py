@@ -1,16 +1,16 @@
 import os
 import pygame
 from core.run_config import DIFFICULTY_PRESETS, DEFAULT_DIFFICULTY_ID
-import json
+from core.assets import NEAREST, get_assets
+from data.loader import load_content
 from ui.video_background import VideoBackground
 
 
 class CharacterSelectState:
     def on_enter(self):
-        from core.ui_text import FontBank, TextStyle, render_text
-        from settings import UI_FONT_PATH, UI_FONT_FALLBACK
+        from core.ui_text import get_fonts, TextStyle, render_text
 
-        self._fonts = FontBank(UI_FONT_PATH, UI_FONT_FALLBACK)
+        self._fonts = get_fonts()
         self.font = self._fonts.get(22)
         self.small = self._fonts.get(16)
 
@@ -66,12 +66,11 @@ class CharacterSelectState:
 
 
         self.selected = 0
+        assets = get_assets()
         self.portraits = []
         for c in self.chars:
             p = os.path.join("assets", "portraits", c["portrait"])
-            img = pygame.image.load(p).convert_alpha()
-            img = pygame.transform.scale(img, (140, 140))
-            self.portraits.append(img)
+            self.portraits.append(assets.image(p, (140, 140), transform=NEAREST, owner=self))
 
         self.hitboxes = []
 
@@ -103,56 +102,38 @@ class CharacterSelectState:
 
         for type_id, display_name in self.ship_type_to_name.items():
             p = os.path.join("assets", "ships", f"{display_name}.png")
-            img = pygame.image.load(p).convert_alpha()
-            img = pygame.transform.smoothscale(img, ship_preview_size)
-            self.ship_previews[type_id] = img
-
-        # Ship-Stats aus ship.json laden (für Panel-Anzeige)
-        self.ship_defs = {}
-        here = os.path.dirname(os.path.abspath(__file__))
-        ship_json_path = os.path.normpath(os.path.join(here, "..", "content", "ships.json"))
-
-        try:
-            with open(ship_json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Erwartet: {"ships":[{"id":"sloop","name":"Schaluppe","capacity_tons":..,"speed_px_s":..}, ...]}
-            for s in data.get("ships", []):
-                if "id" in s:
-                    self.ship_defs[s["id"]] = s
-        except Exception:
-            # Fallback: leer lassen, UI zeigt dann nur das Bild
-            self.ship_defs = {}
+            self.ship_previews[type_id] = assets.image(p, ship_preview_size, owner=self)
+
+        # Ship-Stats aus dem Content-Service (für Panel-Anzeige, gleiche Instanz wie später im Spiel)
+        self.ship_defs = load_content("content").ships
 
         # Start-Button (Bild unten rechts)
         self.start_img = None
         self.start_rect = None
         start_path = os.path.join("assets", "ui", "start_game.png")  # <-- Dateiname/Ordner ggf. anpassen
 
-        if os.path.exists(start_path):
-            img = pygame.image.load(start_path).convert_alpha()
-
+        img = assets.image(start_path)
+        if img is not None:
             max_w, max_h = 280, 110
             iw, ih = img.get_size()
             scale = min(1 * max_w / iw, 1 * max_h / ih)
             new_size = (max(1, int(iw * scale)), max(1, int(ih * scale)))
 
-            self.start_img = pygame.transform.smoothscale(img, new_size)
+            self.start_img = assets.image(start_path, new_size, owner=self)
 
         # --- Back-Button (unten mittig) ---
         self.back_img = None
         self.back_rect = None
 
         back_path = os.path.join("assets", "ui", "back.png")  # falls vorhanden
-        if os.path.exists(back_path):
-            img = pygame.image.load(back_path).convert_alpha()
-
+        img = assets.image(back_path)
+        if img is not None:
             # etwas kleiner als Startbutton, passt unten mittig
             max_w, max_h = 220, 90
             iw, ih = img.get_size()
             scale = min(max_w / iw, max_h / ih)
             new_size = (max(1, int(iw * scale)), max(1, int(ih * scale)))
-            self.back_img = pygame.transform.smoothscale(img, new_size)
+            self.back_img = assets.image(back_path, new_size, owner=self)
 
         # --- Titel-Schild oben mittig (keine Interaktion) ---
         self.title_img = None
@@ -160,15 +141,14 @@ class CharacterSelectState:
 
         # Passe den Dateinamen an, falls dein Bild anders heißt
         title_path = os.path.join("assets", "ui", "charakterauswahl.png")
-        if os.path.exists(title_path):
-            img = pygame.image.load(title_path).convert_alpha()
-            self.title_img = img
+        self.title_img = assets.image(title_path, owner=self)
 
 
         # --- Shared Menu Video Background (identisch wie im Hauptmenü) ---
         self.bg = getattr(self.ctx, "menu_bg", None)
 
-
+    def on_exit(self):
+        get_assets().release(self)
 
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
@@ -408,27 +388,27 @@ class CharacterSelectState:
             img_rect = ship_img.get_rect(center=(left_rect.centerx, left_rect.centery + 12))
             screen.blit(ship_img, img_rect)
 
-        ship_def = self.ship_defs.get(ship_type_id, {})
+        ship_def = self.ship_defs.get(ship_type_id)
 
         # --- base stats ---
-        cap = ship_def.get("capacity_tons")
-        spd = ship_def.get("speed_px_s")
-        crew_max = ship_def.get("crew_max")
-        crew_req = ship_def.get("crew_required")
-        cannons = ship_def.get("cannon_slots")
+        cap = getattr(ship_def, "capacity_tons", None)
+        spd = getattr(ship_def, "speed_px_s", None)
+        crew_max = getattr(ship_def, "crew_max", None)
+        crew_req = getattr(ship_def, "crew_required", None)
+        cannons = getattr(ship_def, "cannon_slots", None)
 
         # --- combat stats ---
-        combat = ship_def.get("combat", {})
+        combat = getattr(ship_def, "combat", None)
 
-        hp_max = combat.get("hp_max")
-        armor_phys = combat.get("armor_physical")
-        armor_abyss = combat.get("armor_abyssal")
+        hp_max = getattr(combat, "hp_max", None)
+        armor_phys = getattr(combat, "armor_physical", None)
+        armor_abyss = getattr(combat, "armor_abyssal", None)
 
-        dmg_min = combat.get("damage_min")
-        dmg_max = combat.get("damage_max")
+        dmg_min = getattr(combat, "damage_min", None)
+        dmg_max = getattr(combat, "damage_max", None)
 
-        initiative = combat.get("initiative_base")
-        threat = combat.get("threat_level")
+        initiative = getattr(combat, "initiative_base", None)
+        threat = getattr(combat, "threat_level", None)
 
 
         cap_txt = f"{cap:.0f} t" if isinstance(cap, (int, float)) else "-"
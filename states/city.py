@@ -5,6 +5,13 @@ from dataclasses import dataclass
 from typing import Optional
 
 from settings import TIME_SCALE_PAUSE, TIME_SCALE_1X, TIME_SCALE_2X, TIME_SCALE_4X
+from core.frame_profiler import profile_section
+from core.assets import get_assets
+from core.ui_text import number_blits, text_surface
+from core.atlas import (
+    UI_BUTTON_CROP, UI_STAR_SIZE, AtlasItem, atlas_image, button_item_name, cross_item_name,
+    get_atlas, render_item,
+)
 
 @dataclass
 class CityState:
@@ -47,11 +54,10 @@ class CityState:
         self.ctx.clock.time_scale = TIME_SCALE_PAUSE
 
         # kompaktere Schrift
-        from core.ui_text import FontBank
-        from settings import UI_FONT_PATH, UI_FONT_FALLBACK
+        from core.ui_text import get_fonts
 
         if not hasattr(self, "fonts") or self.fonts is None:
-            self.fonts = FontBank(UI_FONT_PATH, UI_FONT_FALLBACK)
+            self.fonts = get_fonts()
 
         # Haupt-UI Schriftgrößen für City
         self.font = self.fonts.get(22)
@@ -74,7 +80,7 @@ class CityState:
 
         # Kategorien übernehmen (oder default setzen)
         if self.ctx.trade_ui_state["enabled_categories"] is None:
-            cats = sorted({g.category for g in self.ctx.content.goods.values()})
+            cats = list(self.ctx.content.categories)
             self.enabled_categories = set(["__fav__"] + cats)  # falls FAV default aktiv sein soll
         else:
             self.enabled_categories = set(self.ctx.trade_ui_state["enabled_categories"])
@@ -85,58 +91,29 @@ class CityState:
 
         # Kategorien initial: alle an
         if self.enabled_categories is None:
-            self.enabled_categories = {g.category for g in self.ctx.content.goods.values()}
+            self.enabled_categories = set(self.ctx.content.categories)
 
-        # Icons laden
+        # Icons + Buttons/Sterne kommen aus den Atlas-Sheets (core/atlas.py, 32px nearest)
+        assets = get_assets()
+        goods_atlas = get_atlas("goods")
         self.icons = {}
-        icons_dir = os.path.join("assets", "icons")
         for gid in self.ctx.content.goods.keys():
-            path = os.path.join(icons_dir, f"{gid}.png")
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                ICON_SIZE = 32  # oder 36, wenn du noch größer willst
-                img = pygame.transform.scale(img, (ICON_SIZE, ICON_SIZE))  # scharf (nearest)
-
+            img = goods_atlas.get(gid)
+            if img is not None:
                 self.icons[gid] = img
 
-        # UI Button-Sprites laden + Ausschnitten
         ui_dir = os.path.join("assets", "ui")
 
-        btn_raw = pygame.image.load(os.path.join(ui_dir, "button.png")).convert_alpha()
-        btn_hi_raw = pygame.image.load(os.path.join(ui_dir, "button_high.png")).convert_alpha()
-        # neu:
-        btn_not_raw = pygame.image.load(os.path.join(ui_dir, "button_not.png")).convert_alpha()
-        cross_raw   = pygame.image.load(os.path.join(ui_dir, "crossed.png")).convert_alpha()
-
         #Handelsmenühintergrund
-        self.trade_bg = pygame.image.load(
-            os.path.join(ui_dir, "trade_menu.png")
-        ).convert_alpha()
-
-        # (dein fester Zuschnitt bleibt wie gehabt)
-        bw, bh = 900, 220
-        x0 = (btn_raw.get_width() - bw) // 2
-        y0 = (btn_raw.get_height() - bh) // 2
-        btn_rect = pygame.Rect(x0, y0, bw, bh)
-
-        self.ui_btn      = btn_raw.subsurface(btn_rect).copy()
-        self.ui_btn_hi   = btn_hi_raw.subsurface(btn_rect).copy()
-        self.ui_btn_not  = btn_not_raw.subsurface(btn_rect).copy()
-
-        # crossed ggf. nicht gleich groß -> wir croppen NICHT, wir skalieren später auf Button-Größe
-        self.ui_cross = cross_raw
+        self.trade_bg = assets.image(os.path.join(ui_dir, "trade_menu.png"), owner=self)
 
         # caches
         self._ui_btn_cache = {}       # (w,h,variant) -> Surface
         self._ui_cross_cache = {}     # (w,h) -> Surface
 
-        self.star_empty = pygame.image.load(os.path.join(ui_dir, "star_empty.png")).convert_alpha()
-        self.star_filled = pygame.image.load(os.path.join(ui_dir, "star_filled.png")).convert_alpha()
-
-        STAR_SIZE = 48  # optional 18, je nach Look
-        self.star_empty = pygame.transform.scale(self.star_empty, (STAR_SIZE, STAR_SIZE))
-        self.star_filled = pygame.transform.scale(self.star_filled, (STAR_SIZE, STAR_SIZE))
-        self._star_size = STAR_SIZE
+        self.star_empty = atlas_image("ui", "star_empty")
+        self.star_filled = atlas_image("ui", "star_filled")
+        self._star_size = UI_STAR_SIZE
 
         # Pressed-State + Cache
         self._pressed_trade_btn = None
@@ -148,18 +125,10 @@ class CityState:
         self.ui_dir = ui_dir
 
         # Fullscreen city background
-        self.city_bg = None
-        try:
-            self.city_bg = pygame.image.load(os.path.join(ui_dir, "city.png")).convert()
-        except Exception:
-            self.city_bg = None
+        self.city_bg = assets.image(os.path.join(ui_dir, "city.png"), alpha=False, owner=self)
 
         # Stats background used for panels
-        self._bg_stats = None
-        try:
-            self._bg_stats = pygame.image.load(os.path.join(ui_dir, "bg_stats.png")).convert_alpha()
-        except Exception:
-            self._bg_stats = None
+        self._bg_stats = assets.image(os.path.join(ui_dir, "bg_stats.png"), owner=self)
 
         # --- City wood sign (per city) ---
         self._city_sign = None
@@ -179,12 +148,7 @@ class CityState:
             pass
 
         # 1) direkter Versuch mit city_id (wie du es erwartest)
-        direct = os.path.join(cities_dir, f"{self.city_id}.png")
-        if os.path.exists(direct):
-            try:
-                self._city_sign = pygame.image.load(direct).convert_alpha()
-            except Exception:
-                self._city_sign = None
+        self._city_sign = assets.image(os.path.join(cities_dir, f"{self.city_id}.png"), owner=self)
 
         # 2) Fallback: case-insensitive/normalisiert im Ordner finden
         if self._city_sign is None and os.path.isdir(cities_dir):
@@ -194,17 +158,15 @@ class CityState:
                         continue
                     stem = os.path.splitext(fn)[0]
                     if _norm(stem) in candidates:
-                        try:
-                            self._city_sign = pygame.image.load(os.path.join(cities_dir, fn)).convert_alpha()
+                        self._city_sign = assets.image(os.path.join(cities_dir, fn), owner=self)
+                        if self._city_sign is not None:
                             break
-                        except Exception:
-                            self._city_sign = None
             except Exception:
                 self._city_sign = None
 
 
     def on_exit(self) -> None:
-        ...
+        get_assets().release(self)
 
     def handle_event(self, event) -> None:
 
@@ -342,7 +304,7 @@ class CityState:
     def _get_goods_sorted(self):
         FAV_CAT = "__fav__"
 
-        goods_all = sorted(self.ctx.content.goods.values(), key=lambda gg: (gg.category, gg.base_price))
+        goods_all = self.ctx.content.goods_sorted()
         if not self.enabled_categories:
             return []
 
@@ -486,9 +448,8 @@ class CityState:
 
     def render(self, screen) -> None:
         if not hasattr(self, "fonts") or self.fonts is None:
-            from core.ui_text import FontBank
-            from settings import UI_FONT_PATH, UI_FONT_FALLBACK
-            self.fonts = FontBank(UI_FONT_PATH, UI_FONT_FALLBACK)
+            from core.ui_text import get_fonts
+            self.fonts = get_fonts()
 
         if not hasattr(self, "font") or self.font is None:
             self.font = self.fonts.get(22)
@@ -501,16 +462,17 @@ class CityState:
         # --- City background ---
         sw, sh = screen.get_size()
 
-        if getattr(self, "city_bg", None) is not None:
-            bg = pygame.transform.smoothscale(self.city_bg, (sw, sh))
-            screen.blit(bg, (0, 0))
-        else:
-            # Fallback, falls Bild fehlt
-            screen.fill((12, 14, 18))
+        with profile_section(self.game, "city.background"):
+            if getattr(self, "city_bg", None) is not None:
+                bg = pygame.transform.smoothscale(self.city_bg, (sw, sh))
+                screen.blit(bg, (0, 0))
+            else:
+                # Fallback, falls Bild fehlt
+                screen.fill((12, 14, 18))
 
-        dim = pygame.Surface((sw, sh), pygame.SRCALPHA)
-        dim.fill((0, 0, 0, 40))  # 30–60 je nach Geschmack
-        screen.blit(dim, (0, 0))
+            dim = pygame.Surface((sw, sh), pygame.SRCALPHA)
+            dim.fill((0, 0, 0, 40))  # 30–60 je nach Geschmack
+            screen.blit(dim, (0, 0))
 
         # --- Layout Konstanten (zentral!) ---
         CAT_W   = 140
@@ -568,34 +530,28 @@ class CityState:
 
         day = getattr(self.ctx.clock, "day", 1)
 
-        hud = self.font.render(
-            f"Tag: {day} | Geld: {player.money}",
-            True,
-            (220, 220, 220)
-        )
+        hud = text_surface(self.font, f"Tag: {day} | Geld: {player.money}", (220, 220, 220))
 
 
         screen.blit(hud, (x0, hud_y))
 
         # Message
         if getattr(self, "message", ""):
-            screen.blit(self.font.render(self.message, True, (240, 210, 140)), (x0, hud_y + 22))
+            screen.blit(text_surface(self.font, self.message, (240, 210, 140)), (x0, hud_y + 22))
 
         # --- Control Bar (Buttons) ---
         total_w = CAT_W + GAP + TABLE_W + GAP + CARGO_W
         bar = pygame.Rect(x0, bar_y, total_w, 42)
 
         # Menge-Label (GANZE ZAHL)
-        qty_label = self.font_small.render(f"{qty_i} t", True, (230, 230, 230))
-        screen.blit(qty_label, (bar.left + 315, bar.top + 11))
+        screen.blits(number_blits(self.font_small, f"{qty_i} t", (230, 230, 230), (bar.left + 315, bar.top + 11)), doreturn=False)
 
         # --- Kategorie-Toggles (On/Off) ---
         if self.enabled_categories is None:
-            self.enabled_categories = {g.category for g in self.ctx.content.goods.values()}
+            self.enabled_categories = set(self.ctx.content.categories)
 
         FAV_CAT = "__fav__"
-        cats = sorted({g.category for g in self.ctx.content.goods.values()})
-        cats = [FAV_CAT] + cats  # Favoriten ganz oben
+        cats = [FAV_CAT] + list(self.ctx.content.categories)  # Favoriten ganz oben
 
         self.cat_buttons = {}
 
@@ -621,14 +577,7 @@ class CityState:
                 self._draw_ui_button(screen, r, label, variant="not")
 
                 # crossed overlay skalieren/cachen
-                ck = (r.w, r.h)
-                if ck in self._ui_cross_cache:
-                    cross_surf = self._ui_cross_cache[ck]
-                else:
-                    cross_surf = pygame.transform.smoothscale(self.ui_cross, (r.w, r.h))
-                    self._ui_cross_cache[ck] = cross_surf
-
-                screen.blit(cross_surf, r.topleft)
+                screen.blit(self._ui_cross_surface(r.w, r.h), r.topleft)
 
             by += step
             if by + btn_h > table_y + TABLE_H - 10:
@@ -660,14 +609,7 @@ class CityState:
                 self._draw_ui_button(screen, r, label, variant="not")
 
                 # crossed overlay (wie bei Kategorien)
-                ck = (r.w, r.h)
-                if ck in self._ui_cross_cache:
-                    cross_surf = self._ui_cross_cache[ck]
-                else:
-                    cross_surf = pygame.transform.smoothscale(self.ui_cross, (r.w, r.h))
-                    self._ui_cross_cache[ck] = cross_surf
-
-                screen.blit(cross_surf, r.topleft)
+                screen.blit(self._ui_cross_surface(r.w, r.h), r.topleft)
 
 
             x += lot_w + gap_x
@@ -798,6 +740,11 @@ class CityState:
         hover_tooltip_text = None
         hover_tooltip_pos = None
 
+        # Zeilen werden gesammelt und am Ende mit zwei Surface.blits gezeichnet:
+        # erst alle Sprites (fast alle aus den Atlas-Sheets), dann alle Texte darüber
+        sprite_blits = []
+        text_blits = []
+
         for i in range(start, end):
             g = goods_filtered[i]
             row_idx = i  # Index innerhalb goods_filtered
@@ -830,7 +777,7 @@ class CityState:
 
             sx = fav_rect.centerx - self._star_size // 2
             sy = fav_rect.centery - self._star_size // 2
-            screen.blit(star_img, (sx, sy))
+            sprite_blits.append((star_img, (sx, sy)))
 
             # GANZE ZAHLEN für Anzeige
             stock_i = int(round(stock))
@@ -855,11 +802,11 @@ class CityState:
             ask_txt = f"{ask_i}"
             bid_txt = f"{bid_i}"
 
-            pressed = (self._pressed_trade_btn == (g.id, "buy"))
-            self._draw_ui_button(screen, buy_rect, ask_txt, variant=("hi" if pressed else "normal"))
-
-            pressed = (self._pressed_trade_btn == (g.id, "sell"))
-            self._draw_ui_button(screen, sell_rect, bid_txt, variant=("hi" if pressed else "normal"))
+            for rect, txt, side in ((buy_rect, ask_txt, "buy"), (sell_rect, bid_txt, "sell")):
+                pressed = (self._pressed_trade_btn == (g.id, side))
+                btn, labels = self._ui_button_blits(rect, txt, variant=("hi" if pressed else "normal"))
+                sprite_blits.append(btn)
+                text_blits.extend(labels)
 
             # Icon
             icon = None
@@ -869,13 +816,13 @@ class CityState:
             # Icon in der Mitte (doppelt so groß)
             if icon:
                 # Pixel-scharf skalieren (kein smoothscale!)
-                screen.blit(icon, (icon_rect.centerx - ICON_SIZE // 2, icon_rect.centery - ICON_SIZE // 2))
+                sprite_blits.append((icon, (icon_rect.centerx - ICON_SIZE // 2, icon_rect.centery - ICON_SIZE // 2)))
 
 
             else:
-                letter = self.font_small.render(g.name[0].upper(), True, (230, 230, 230))
-                screen.blit(letter, (icon_rect.centerx - letter.get_width() // 2,
-                                    icon_rect.centery - letter.get_height() // 2))
+                letter = text_surface(self.font_small, g.name[0].upper(), (230, 230, 230))
+                text_blits.append((letter, (icon_rect.centerx - letter.get_width() // 2,
+                                            icon_rect.centery - letter.get_height() // 2)))
 
             # Tooltip: Warenname nur bei Hover über Icon
             mx, my = pygame.mouse.get_pos()
@@ -885,8 +832,8 @@ class CityState:
 
 
             # --- Markt links neben Kaufen, Du direkt neben Verkaufen ---
-            m_surf = self.font_small.render(f"{stock_i:>5d}", True, (200, 200, 200))
-            screen.blit(m_surf, (content_x0 + X_MARKET, cy - m_surf.get_height() // 2))
+            # Zahlenspalten aus dem Glyph-Atlas (kein font.render pro Zeile und Frame)
+            text_blits.extend(number_blits(self.font_small, f"{stock_i:>5d}", (200, 200, 200), (content_x0 + X_MARKET, cy), "midleft"))
 
             owned = int(round(player.cargo.tons_by_good().get(g.id, 0.0)))
 
@@ -898,19 +845,23 @@ class CityState:
             else:
                 owned_text = f"{owned}"
 
-            owned_surf = self.font_small.render(owned_text, True, (200, 200, 200))
-            screen.blit(owned_surf, (content_x0 + X_OWN, cy - owned_surf.get_height() // 2))
+            text_blits.extend(number_blits(self.font_small, owned_text, (200, 200, 200), (content_x0 + X_OWN, cy), "midleft"))
 
             y += row_h
 
+        screen.blits(sprite_blits, doreturn=False)
+        screen.blits(text_blits, doreturn=False)
+
         # Cargo Header (mit Frei)
         used = float(player.cargo.total_tons())
         cap = float(player.ship.capacity_tons)
         free = max(0.0, cap - used)
 
-        screen.blit(self.font_small.render("Laderaum", True, (220, 220, 220)), (cargo_panel.left + 10, cargo_panel.top + 10))
-        screen.blit(self.font_small.render(f"{int(round(used))}/{int(round(cap))} t", True, (220, 220, 220)), (cargo_panel.left + 10, cargo_panel.top + 30))
-        screen.blit(self.font_small.render(f"Frei: {int(round(free))} t", True, (220, 220, 220)), (cargo_panel.left + 10, cargo_panel.top + 50))
+        cargo_blits = [(text_surface(self.font_small, "Laderaum", (220, 220, 220)), (cargo_panel.left + 10, cargo_panel.top + 10))]
+        cargo_blits += number_blits(self.font_small, f"{int(round(used))}/{int(round(cap))} t", (220, 220, 220), (cargo_panel.left + 10, cargo_panel.top + 30))
+        cargo_blits.append((text_surface(self.font_small, "Frei:", (220, 220, 220)), (cargo_panel.left + 10, cargo_panel.top + 50)))
+        free_x = cargo_panel.left + 10 + self.font_small.size("Frei: ")[0]
+        cargo_blits += number_blits(self.font_small, f"{int(round(free))} t", (220, 220, 220), (free_x, cargo_panel.top + 50))
 
 
         tons_by = player.cargo.tons_by_good()
@@ -927,14 +878,15 @@ class CityState:
                 line = f"{name[:14]:<14} {tons_i:>6d}t"
 
             y2 += 22
-            screen.blit(self.font_small.render(line, True, (220, 220, 220)), (cargo_panel.left + 10, y2))
+            cargo_blits.append((text_surface(self.font_small, line, (220, 220, 220)), (cargo_panel.left + 10, y2)))
             if y2 > cargo_panel.bottom - 20:
                 break
+        screen.blits(cargo_blits, doreturn=False)
 
         # Tooltip IMMER ganz vorne zeichnen
         if hover_tooltip_text and hover_tooltip_pos:
             mx, my = hover_tooltip_pos
-            name_surf = self.font_small.render(hover_tooltip_text, True, (255, 255, 255))
+            name_surf = text_surface(self.font_small, hover_tooltip_text, (255, 255, 255))
             pad = 6
 
             tip_rect = name_surf.get_rect()
@@ -955,31 +907,48 @@ class CityState:
         self._tick_hold_trade()
 
 
-    def _draw_ui_button(self, screen: pygame.Surface, rect: pygame.Rect, text: str, variant: str = "normal") -> None:
+    def _ui_button_surface(self, w: int, h: int, variant: str) -> pygame.Surface:
         """
         variant: "normal" | "hi" | "not"
+        Gängige Größen liegen fertig im UI-Atlas, andere werden aus dem Zuschnitt skaliert.
         """
-        key = (rect.w, rect.h, variant)
-        if key in self._ui_btn_cache:
-            surf = self._ui_btn_cache[key]
-        else:
-            if variant == "hi":
-                base = self.ui_btn_hi
-            elif variant == "not":
-                base = self.ui_btn_not
-            else:
-                base = self.ui_btn
-
-            surf = pygame.transform.smoothscale(base, (rect.w, rect.h))
+        key = (w, h, variant)
+        surf = self._ui_btn_cache.get(key)
+        if surf is None:
+            surf = atlas_image("ui", button_item_name(variant, (w, h)))
+            if surf is None:
+                fn = {"hi": "button_high.png", "not": "button_not.png"}.get(variant, "button.png")
+                item = AtlasItem("", os.path.join(self.ui_dir, fn), (w, h), crop=UI_BUTTON_CROP)
+                surf = render_item(item, get_assets().image(item.path, owner=self))
             self._ui_btn_cache[key] = surf
-
-        screen.blit(surf, rect.topleft)
+        return surf
+
+    def _ui_cross_surface(self, w: int, h: int) -> pygame.Surface:
+        # crossed ggf. nicht gleich groß -> wir croppen NICHT, wir skalieren auf Button-Größe
+        key = (w, h)
+        surf = self._ui_cross_cache.get(key)
+        if surf is None:
+            surf = atlas_image("ui", cross_item_name((w, h)))
+            if surf is None:
+                cross = get_assets().image(os.path.join(self.ui_dir, "crossed.png"), owner=self)
+                surf = pygame.transform.smoothscale(cross, (w, h))
+            self._ui_cross_cache[key] = surf
+        return surf
+
+    def _ui_button_blits(self, rect: pygame.Rect, text: str, variant: str = "normal") -> tuple[tuple, list]:
+        """(Button-Sprite, Text-Blits) für Surface.blits; Preise kommen aus dem Glyph-Atlas."""
+        btn = (self._ui_button_surface(rect.w, rect.h, variant), rect.topleft)
 
         # Text (bei not ggf. etwas heller/dunkler – du wolltest keine Extra-Spielereien)
         color = (0, 0, 0) if variant != "not" else (80, 80, 80)
-        t = self.font_small.render(text, True, color)
+        return btn, number_blits(self.font_small, text, color, rect.center, "center")
 
-        screen.blit(t, (rect.centerx - t.get_width() // 2, rect.centery - t.get_height() // 2))
+    def _draw_ui_button(self, screen: pygame.Surface, rect: pygame.Rect, text: str, variant: str = "normal") -> None:
+        """
+        variant: "normal" | "hi" | "not"
+        """
+        btn, labels = self._ui_button_blits(rect, text, variant)
+        screen.blits([btn] + labels, doreturn=False)
 
 
 
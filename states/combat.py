@@ -10,62 +10,17 @@ from settings import TIME_SCALE_1X, TIME_SCALE_2X, TIME_SCALE_4X
 from enum import Enum
 from typing import Optional, Dict, Callable, Tuple
 from collections import deque
+from core.frame_profiler import profile_section
+from core.assets import get_assets
+from core.atlas import GOOD_ICON_SIZE, atlas_image, good_icon_name
+from core.ui_text import text_surface
+from combat.engine import (
+    AbilitySpec, CombatEngine, CombatStance, CombatantRuntime, PlayerStats,
+)
 
 
 
 
-# -----------------------------
-# Data / Definitions (v1)
-# -----------------------------
-class CombatStance(Enum):
-    OFFENSIVE = "offensive"
-    BALANCED = "balanced"
-    DEFENSIVE = "defensive"
-
-@dataclass
-class PlayerStats:
-    cannon_damage_mult: float = 1.0
-    reload_mult: float = 1.0
-    boarding_damage_mult: float = 1.0
-    repair_mult: float = 1.0
-    evade_mult: float = 1.0
-    flee_mult: float = 1.0
-
-
-@dataclass
-class CombatantRuntime:
-    name: str
-
-    # Defensive
-    hp: int
-    hp_max: int
-    armor_physical: float  # percent
-    armor_abyssal: float   # percent
-
-    # Offensive
-    damage_min: int
-    damage_max: int
-    damage_type: str       # "physical" | "abyssal"
-    penetration: float     # percent, can exceed 100
-    crit_chance: float     # 0..1
-    crit_multiplier: float # e.g. 1.5, 2.0
-
-    # Tempo
-    initiative_base: float
-
-    # Meta
-    difficulty_tier: int
-    threat_level: int
-
-    # Status effects
-    status: dict = field(default_factory=dict)
-
-    # Morale
-    morale: int = 100  # 0..100
-
-    #Additional stats for abilities/statuses
-    quick_repair_vuln_rounds: int = 0  # erhöht eingehenden Schaden für N Runden
-
 @dataclass
 class _FloatText:
     text: str
@@ -87,983 +42,6 @@ class _Particle:
     size: int
     color: tuple[int, int, int]
 
-@dataclass
-class AbilitySpec:
-    id: str
-    name: str
-    cooldown_rounds: int = 0
-
-    # morale handling
-    morale_cost: int = 0          # subtract on use
-    morale_delta: int = 0         # add (or subtract) on use
-
-    # conditions + execution
-    # can_use returns (ok, reason)
-    can_use: Optional[Callable[["CombatEngine", str], Tuple[bool, str]]] = None
-
-    # execute returns a result dict; ctx can be used for params like {"mult": 0.35}
-    execute: Optional[Callable[["CombatEngine", str, dict], dict]] = None
-
-
-class CombatEngine:
-    """
-    MVP-Engine:
-    - distance in [0..1], 0 = Boarding-Reichweite, 1 = weit weg
-    - Aktionen via trigger_* Methoden
-    - update(sim_dt) tickt cooldowns und simple enemy AI
-    """
-
-    def __init__(self, player: CombatantRuntime, enemy: CombatantRuntime, pstats: PlayerStats):
-        self.p = player
-        self.e = enemy
-        self.pstats = pstats
-
-        self.log = deque(maxlen=10)
-        self.finished: bool = False
-        self.outcome: Optional[str] = None  # "win" | "lose" | "flee"
-
-        #Reward
-        self.rewards = {"gold": 0, "xp": 0, "cargo": []}  # cargo: list[tuple[good_id, tons]]
-
-        # --- AI state ---
-        self._events = deque()
-
-
-        # Runden-Tracking (future-proof)
-        self.round_index: int = 0
-        self.turn_owner: str = "player"   # "player" | "enemy"
-        self._turn_queue: list[str] = []
-        self.last_initiative: dict = {"player": 0.0, "enemy": 0.0}
-
-        # --- Combat Stance ---
-        self.stance: CombatStance = CombatStance.BALANCED
-        self._stance_changed_this_round: bool = False
-        # track morale tier changes (for feedback)
-        self._last_morale_tier = {
-            "player": self._morale_tier(self.p.morale),
-            "enemy": self._morale_tier(self.e.morale),
-        }
-
-        # --- Abilities / cooldowns (C1) ---
-        self._abilities: dict[str, AbilitySpec] = {}
-        self._cd: dict[str, dict[str, int]] = {"player": {}, "enemy": {}}
-
-        self._register_base_abilities()
-
-
-
-    def pop_event(self) -> Optional[dict]:
-        if not self._events:
-            return None
-        return self._events.popleft()
-
-    def add_event(self, ev: dict) -> None:
-        if not hasattr(self, "_events") or self._events is None:
-            self._events = deque()
-        self._events.append(ev)
-
-
-    def _register_base_abilities(self) -> None:
-        self.register_ability(AbilitySpec(
-            id="fire",
-            name="Fire",
-            cooldown_rounds=0,
-            can_use=None,
-            execute=lambda eng, side, ctx: eng._ability_fire(side, ctx),
-        ))
-
-        self.register_ability(AbilitySpec(
-            id="repair",
-            name="Repair",
-            cooldown_rounds=1,
-            can_use=lambda eng, side: (eng.p.hp < eng.p.hp_max, "full_hp"),
-            execute=lambda eng, side, ctx: eng._ability_repair(side, ctx),
-        ))
-
-        self.register_ability(AbilitySpec(
-            id="flee",
-            name="Flee",
-            cooldown_rounds=2,
-            can_use=None,
-            execute=lambda eng, side, ctx: eng._ability_flee(side, ctx),
-        ))
-
-        self.register_ability(AbilitySpec(
-            id="quick_repair",
-            name="Quick Repair",
-            cooldown_rounds=3,
-            can_use=None,
-            execute=lambda eng, side, ctx: eng._ability_quick_repair(side, ctx),
-        ))
-
-
-    def register_ability(self, spec: AbilitySpec) -> None:
-        self._abilities[spec.id] = spec
-        for s in ("player", "enemy"):
-            self._cd[s].setdefault(spec.id, 0)
-
-    def can_use_ability(self, ability_id: str, side: str) -> tuple[bool, str]:
-        if self.finished:
-            return False, "finished"
-        if side not in ("player", "enemy"):
-            return False, "bad_side"
-        if ability_id not in self._abilities:
-            return False, "unknown"
-        if self.turn_owner != side:
-            return False, "not_your_turn"
-
-        spec = self._abilities[ability_id]
-
-        if self._cd[side].get(ability_id, 0) > 0:
-            return False, "cooldown"
-
-        actor = self.p if side == "player" else self.e
-        if spec.morale_cost > 0 and actor.morale < spec.morale_cost:
-            return False, "low_morale"
-
-        if spec.can_use:
-            ok, reason = spec.can_use(self, side)
-            if not ok:
-                return False, reason
-
-        return True, ""
-
-    def use_ability(self, ability_id: str, side: str, ctx: Optional[dict] = None) -> Optional[dict]:
-        ok, reason = self.can_use_ability(ability_id, side)
-        if not ok:
-            if side == "player":
-                self.add_log(f"{ability_id.upper()} not available ({reason}).")
-            return None
-
-        spec = self._abilities.get(ability_id)
-        if not spec:
-            return None
-
-        if ctx is None:
-            ctx = {}
-
-        actor = self.p if side == "player" else self.e
-
-        # morale cost/effect
-        if spec.morale_cost:
-            actor.morale = max(0, actor.morale - int(spec.morale_cost))
-        if spec.morale_delta:
-            actor.morale = max(0, min(100, actor.morale + int(spec.morale_delta)))
-
-        # 🔧 SICHERER EXECUTE
-        if spec.execute:
-            res = spec.execute(self, side, ctx)
-        else:
-            res = {"result": "noop"}
-
-        # cooldown
-        if spec.cooldown_rounds > 0:
-            self._cd[side][ability_id] = int(spec.cooldown_rounds)
-
-        return res
-
-    def _morale_tier(self, morale: int) -> str:
-        if morale >= 80:
-            return "bonus"
-        if morale >= 40:
-            return "neutral"
-        if morale >= 20:
-            return "malus"
-        return "panic"
-
-    def _morale_modifiers(self, morale: int) -> dict:
-        tier = self._morale_tier(morale)
-
-        if tier == "bonus":
-            return {
-                "hit": 1.10,
-                "repair": 1.15,
-                "flee": 0.85,
-                "panic_fail": 0.0,
-            }
-
-        if tier == "malus":
-            return {
-                "hit": 0.85,
-                "repair": 0.75,
-                "flee": 1.15,
-                "panic_fail": 0.0,
-            }
-
-        if tier == "panic":
-            return {
-                "hit": 0.65,
-                "repair": 0.50,
-                "flee": 1.35,
-                "panic_fail": 0.25,  # 25% Aktion scheitert
-            }
-
-        # neutral
-        return {
-            "hit": 1.0,
-            "repair": 1.0,
-            "flee": 1.0,
-            "panic_fail": 0.0,
-        }
-
-    def get_live_combat_multipliers(self, unit):
-        """
-        SINGLE SOURCE OF TRUTH.
-        All combat systems must use this.
-        """
-
-        # --- STANCE ---
-        stance_damage = 1.0
-        stance_repair = 1.0
-        stance_hit = 1.0
-        stance_flee = 1.0
-
-        if self.stance.name == "OFFENSIVE":
-            stance_damage = 1.20
-            stance_hit = 1.10
-            stance_repair = 0.85
-            stance_flee = 0.85
-
-        elif self.stance.name == "DEFENSIVE":
-            stance_damage = 0.90
-            stance_hit = 0.90
-            stance_repair = 1.20
-            stance_flee = 1.25
-
-        # --- MORALE ---
-        morale = unit.morale / 100.0
-
-        morale_damage = 0.75 + morale * 0.5
-        morale_hit = 0.5 + morale * 0.75
-        morale_repair = 0.7 + morale * 0.6
-        morale_flee = 1.3 - morale * 0.6
-        # --- PANIC FAIL (used by player_repair) ---
-        panic_fail = 0.0
-        if unit.morale < 20:
-            # 20 morale -> 0%, 0 morale -> 50%
-            panic_fail = (20 - unit.morale) / 20.0 * 0.50
-
-        return {
-            "damage": stance_damage * morale_damage,
-            "hit": stance_hit * morale_hit,
-            "repair": stance_repair * morale_repair,
-            "flee": stance_flee * morale_flee,
-            "panic_fail": panic_fail,
-        }
-
-    def _compute_enemy_pressure(self) -> float:
-        """
-        0.00 .. 0.35 typical.
-        Higher = harder to flee.
-        """
-        hp_frac = 0.0
-        if self.e.hp_max > 0:
-            hp_frac = max(0.0, min(1.0, self.e.hp / self.e.hp_max))
-
-        morale_frac = max(0.0, min(1.0, self.e.morale / 100.0))
-
-        # weighted pressure
-        return 0.20 * hp_frac + 0.15 * morale_frac
-
-    def _compute_flee_chance(self) -> float:
-        base = 0.20  # not a panic exit
-
-        # morale contribution: -0.10 .. +0.20
-        m = max(0.0, min(1.0, self.p.morale / 100.0))
-        morale_term = -0.10 + 0.30 * m
-
-        # stance contribution
-        if self.stance.name == "DEFENSIVE":
-            stance_term = +0.10
-        elif self.stance.name == "OFFENSIVE":
-            stance_term = -0.08
-        else:
-            stance_term = 0.0
-
-        pressure = self._compute_enemy_pressure()
-
-        chance = base + morale_term + stance_term - pressure
-        return max(0.05, min(0.85, chance))
-
-    def _apply_low_morale_flee_penalty(self) -> dict:
-        """
-        Returns penalty dict (for UI/log). Does not assume economy model.
-        """
-        if self.p.morale >= 20:
-            return {"penalty": None}
-
-        # chance grows as morale drops: 20 -> 0.25, 0 -> 0.60
-        t = (20 - self.p.morale) / 20.0
-        chance = 0.25 + 0.35 * t
-
-        if random.random() >= chance:
-            return {"penalty": None}
-
-        # penalty is abstract (hook)
-        return {"penalty": "crew_scatter", "chance": chance}
-
-    def player_fire(self) -> bool:
-        res = self.use_ability("fire", "player")
-        if not res:
-            return False
-
-        # if combat ended inside executor, don't advance turn
-        if not self.finished:
-            self._advance_turn()
-        return True
-
-    def player_attack(self) -> bool:
-        # Backward compatibility: route to player_fire()
-        return self.player_fire()
-
-    def player_repair(self) -> bool:
-        res = self.use_ability("repair", "player")
-        if not res:
-            return False
-
-        # action consumed unless combat ended (repair doesn't end combat)
-        if not self.finished:
-            self._advance_turn()
-        return True
-
-    def player_flee(self) -> bool:
-        res = self.use_ability("flee", "player")
-        if not res:
-            return False
-
-        # If flee succeeded, combat already ended inside executor.
-        if res.get("result") != "success" and not self.finished:
-            self._advance_turn()
-
-        return True
-    
-    def player_quick_repair(self) -> bool:
-        res = self.use_ability("quick_repair", "player")
-        if not res:
-            return False
-
-        if not self.finished:
-            self._advance_turn()
-        return True
-
-    def _ability_fire(self, side: str, ctx: dict) -> dict:
-        if self.finished:
-            return {"result": "finished"}
-
-        if side not in ("player", "enemy"):
-            return {"result": "bad_side"}
-
-        # turn ownership check: only enforce for player; enemy auto-actions can bypass if you want
-        if side == "player" and self.turn_owner != "player":
-            return {"result": "no_turn"}
-
-        attacker = self.p if side == "player" else self.e
-        defender = self.e if side == "player" else self.p
-
-        mult = float(ctx.get("mult", 1.0))
-        res = self._fire(attacker=attacker, defender=defender, mult=mult)
-
-        # emit event for both sides
-        self.add_event({
-            "type": "fire",
-            "side": side,
-            "result": res.get("result"),
-            "hull": int(res.get("hull", 0)),
-            "applied": list(res.get("applied", [])),
-        })
-
-        if side == "player":
-            self.add_log(f"You fire: -{int(res.get('hull', 0))} hull.")
-        else:
-            self.add_log(f"Enemy fires: -{int(res.get('hull', 0))} hull.")
-
-        if self._check_finish():
-            self._stop_turns()
-            return {"result": "finished", **res}
-
-        return {"result": "ok", **res}
-
-    def _ability_repair(self, side: str, ctx: dict) -> dict:
-        if side != "player":
-            return {"result": "blocked"}
-
-        if self.finished or self.turn_owner != "player":
-            return {"result": "no_turn"}
-
-        mods = self.get_live_combat_multipliers(self.p)
-
-        # panic check
-        panic = float(mods.get("panic_fail", 0.0))
-        if panic > 0.0 and random.random() < panic:
-            self.add_log("Repair failed due to panic!")
-            self.p.morale = max(0, self.p.morale - 4)
-            return {"result": "panic_fail", "heal": 0}
-
-        # success roll
-        success_chance = self._compute_repair_success(self.p)
-        roll = random.random()
-        success = roll < success_chance
-
-        base_heal = int(round(self.p.hp_max * 0.10))
-        base_heal = max(3, base_heal)
-
-        heal = int(round(base_heal * float(mods.get("repair", 1.0))))
-
-        stress_loss = 5
-        if self.stance.name == "OFFENSIVE":
-            stress_loss += 3
-        elif self.stance.name == "DEFENSIVE":
-            stress_loss -= 1
-        stress_loss = max(2, stress_loss)
-
-        applied_heal = 0
-        if success:
-            old_hp = self.p.hp
-            self.p.hp = min(self.p.hp_max, self.p.hp + heal)
-            applied_heal = self.p.hp - old_hp
-            self.add_log(f"Repair succeeded (+{applied_heal} HP) (p={success_chance:.2f}, r={roll:.2f})")
-            self.p.morale = min(100, self.p.morale + 1)
-        else:
-            self.add_log(f"Repair failed (p={success_chance:.2f}, r={roll:.2f})")
-            self.p.morale = max(0, self.p.morale - 4)
-
-        self.p.morale = max(0, self.p.morale - stress_loss)
-
-        # chip shot
-        chip_res = self.use_ability("fire", "enemy", {"mult": 0.35})
-
-        self.add_event({
-            "type": "repair",
-            "side": "player",
-            "amount": applied_heal,
-        })
-
-        return {
-            "result": "success" if success else "fail",
-            "heal": applied_heal,
-            "p": success_chance,
-            "r": roll,
-            "chip": {
-                "result": chip_res.get("result") if chip_res else None,
-                "hull": int(chip_res.get("hull", 0)) if chip_res else 0
-            }
-
-        }
-
-    def _ability_flee(self, side: str, ctx: dict) -> dict:
-        if side != "player":
-            return {"result": "blocked"}
-
-        if self.finished or self.turn_owner != "player":
-            return {"result": "no_turn"}
-
-        chance = self._compute_flee_chance()
-        roll = random.random()
-        success = roll < chance
-
-        if success:
-            penalty = self._apply_low_morale_flee_penalty()
-
-            self.add_event({
-                "type": "flee",
-                "side": "player",
-                "success": True
-            })
-
-            if penalty.get("penalty"):
-                self.add_log(f"Flee succeeded, but chaos ensued ({penalty['penalty']})!")
-                self.add_event({"type": "flee_penalty", **penalty})
-            else:
-                self.add_log("Flee succeeded!")
-
-            self.add_log(f"(p={chance:.2f}, r={roll:.2f})")
-
-            self.finished = True
-            self.outcome = "flee"
-            self._stop_turns()
-
-            return {"result": "success", "p": chance, "r": roll, "penalty": penalty}
-
-        # failure
-        self.add_log(f"Flee failed! (p={chance:.2f}, r={roll:.2f})")
-        self.p.morale = max(0, self.p.morale - 8)
-
-        chip_res = self.use_ability("fire", "enemy", {"mult": 0.60})
-        self.add_event({
-            "type": "flee",
-            "side": "player",
-            "success": False
-        })
-
-        return {
-            "result": "fail",
-            "p": chance,
-            "r": roll,
-            "chip": {
-                "result": chip_res.get("result") if chip_res else None,
-                "hull": int(chip_res.get("hull", 0)) if chip_res else 0
-            }
-        }
-
-    def _ability_quick_repair(self, side: str, ctx: dict) -> dict:
-        if side != "player":
-            return {"result": "blocked"}
-
-        if self.finished or self.turn_owner != "player":
-            return {"result": "no_turn"}
-
-        mods = self.get_live_combat_multipliers(self.p)
-
-        # großer Heal: 30% max HP (mit repair-mult)
-        base_heal = int(round(self.p.hp_max * 0.30))
-        base_heal = max(8, base_heal)
-        heal = int(round(base_heal * float(mods.get("repair", 1.0))))
-
-        old_hp = self.p.hp
-        self.p.hp = min(self.p.hp_max, self.p.hp + heal)
-        applied = self.p.hp - old_hp
-
-        # starker Moralverlust
-        morale_loss = 18
-        self.p.morale = max(0, self.p.morale - morale_loss)
-
-        # Verwundbarkeit nächste Runde
-        self.p.quick_repair_vuln_rounds = max(self.p.quick_repair_vuln_rounds, 1)
-
-        self.add_event({
-            "type": "quick_repair",
-            "side": "player",
-            "heal": int(applied),
-        })
-
-        self.add_log(f"Quick Repair! +{applied} HP, -{morale_loss} morale. Vulnerable next round.")
-
-        return {"result": "ok", "heal": int(applied)}
-
-    def _compute_rewards(self) -> dict:
-        # sauber am neuen Modell orientiert
-        dmg_avg = (self.e.damage_min + self.e.damage_max) * 0.5
-        armor_avg = (self.e.armor_physical + self.e.armor_abyssal) * 0.5
-
-        danger = (
-            self.e.hp_max * 0.35 +
-            dmg_avg * 6.0 +
-            armor_avg * 1.2 +
-            self.e.threat_level * 35.0 +
-            self.e.difficulty_tier * 25.0
-        )
-        gold = int(8 + danger * 0.12)
-        xp = int(4 + danger * 0.09)
-
-        # cargo-drops machen wir später datengetrieben (EnemyDef.loot.cargo)
-        return {"gold": gold, "xp": xp, "cargo": []}
-    
-    def add_log(self, msg: str) -> None:
-        self.log.append(msg)
-
-    def update(self, dt: float) -> None:
-        if self.finished:
-            return
-
-        # check for death after DOT
-        if self._check_finish():
-            self._stop_turns()
-            return
-
-        # Turn-based round init
-        if self.round_index == 0 or not self._turn_queue:
-            self._start_new_round()
-
-        # enemy auto-turn (max 1 action per frame)
-        if self.turn_owner == "enemy":
-            self._enemy_take_turn()
-            return
-        
-    def set_stance(self, stance: CombatStance) -> bool:
-        """
-        Returns True if stance was changed.
-        Can be called only once per round.
-        """
-        if self.finished:
-            return False
-
-        if self._stance_changed_this_round:
-            return False
-
-        if stance == self.stance:
-            return False
-
-        self.stance = stance
-        self._stance_changed_this_round = True
-        self.add_log(f"Stance set to {stance.name.title()}")
-
-        return True
-
-    def _stance_modifiers(self) -> dict:
-        """
-        Central stance balance table.
-        """
-        if self.stance == CombatStance.OFFENSIVE:
-            return {
-                "damage": 1.20,
-                "morale": -1.0,
-                "flee": 0.75,
-            }
-        if self.stance == CombatStance.DEFENSIVE:
-            return {
-                "damage": 0.85,
-                "morale": +1.0,
-                "flee": 1.25,
-            }
-        # BALANCED
-        return {
-            "damage": 1.0,
-            "morale": 0.0,
-            "flee": 1.0,
-        }
-
-    def _stop_turns(self) -> None:
-        self._turn_queue = []
-        self.turn_owner = "none"
-
-    def _apply_status(self, target: CombatantRuntime, key: str, payload: dict) -> bool:
-        """
-        Returns True if status was newly applied, False if refreshed/updated.
-        """
-        if key not in target.status:
-            target.status[key] = dict(payload)
-            return True
-
-        # refresh duration (keep strongest values if needed)
-        target.status[key]["dur"] = max(target.status[key].get("dur", 0.0), payload.get("dur", 0.0))
-        # merge known numeric fields (simple: max)
-        for k, v in payload.items():
-            if k == "dur":
-                continue
-            try:
-                target.status[key][k] = max(float(target.status[key].get(k, 0.0)), float(v))
-            except Exception:
-                target.status[key][k] = v
-        return False
-
-
-    def _remove_status(self, target: CombatantRuntime, key: str) -> None:
-        if key in target.status:
-            del target.status[key]
-
-    def _tick_statuses(self, target: CombatantRuntime, sim_dt: float) -> None:
-        if not target.status:
-            return
-
-        to_remove = []
-
-        # Leak: hull DOT
-        leak = target.status.get("leak")
-        if leak:
-            dps = float(leak.get("dps", self.LEAK_DPS))
-            dmg = max(0, int(dps * sim_dt))
-            # ensure DOT does something even on small dt
-            if dmg == 0 and sim_dt > 0:
-                # probabilistic 1 hp tick
-                if random.random() < (dps * sim_dt):
-                    dmg = 1
-            if dmg > 0 and target.hp > 0:
-                target.hp = max(0, target.hp - dmg)
-
-
-            leak["dur"] = float(leak.get("dur", 0.0)) - sim_dt
-            if leak["dur"] <= 0.0:
-                to_remove.append("leak")
-
-        # Shaken: just duration (effect applied via reload multiplier)
-        shaken = target.status.get("shaken")
-        if shaken:
-            shaken["dur"] = float(shaken.get("dur", 0.0)) - sim_dt
-            if shaken["dur"] <= 0.0:
-                to_remove.append("shaken")
-
-        for k in to_remove:
-            self._remove_status(target, k)
-
-
-    def _compute_hit_chance(self, attacker):
-        base = 0.75
-        mods = self.get_live_combat_multipliers(attacker)
-
-        chance = base * mods["hit"]
-        return max(0.05, min(0.95, chance))
-
-    def _compute_repair_success(self, unit: CombatantRuntime) -> float:
-        """
-        Repair success chance based on morale.
-        0..100 morale -> 0.35..0.90
-        """
-        m = max(0, min(100, int(unit.morale))) / 100.0
-        chance = 0.35 + 0.55 * m
-        return max(0.10, min(0.95, chance))
-
-    def get_debug_combat_modifiers(self, unit):
-        """
-        Returns live combat multipliers affected by stance & morale.
-        """
-        mods = {}
-
-        # --- BASE ---
-        cannon = 1.0
-        reload = 1.0
-        boarding = 1.0
-        repair = 1.0
-        evade = 1.0
-        flee = 1.0
-
-        # --- STANCE ---
-        if self.stance.name == "OFFENSIVE":
-            cannon *= 1.20
-            boarding *= 1.15
-            repair *= 0.85
-            evade *= 0.90
-            flee *= 0.85
-
-        elif self.stance.name == "DEFENSIVE":
-            cannon *= 0.90
-            boarding *= 0.85
-            repair *= 1.20
-            evade *= 1.15
-            flee *= 1.25
-
-        # BALANCED = no change
-
-        # --- MORALE ---
-        morale = unit.morale / 100.0
-
-        cannon *= 0.75 + morale * 0.5
-        reload *= 1.25 - morale * 0.5
-        boarding *= 0.8 + morale * 0.4
-        repair *= 0.7 + morale * 0.6
-        evade *= 0.8 + morale * 0.4
-        flee *= 1.3 - morale * 0.6
-
-        mods["Cannon Damage"] = cannon
-        mods["Reload Speed"] = reload
-        mods["Boarding Damage"] = boarding
-        mods["Repair Power"] = repair
-        mods["Evade"] = evade
-        mods["Flee"] = flee
-
-        return mods
-
-
-    # ---- Player actions ----
-
-    def _roll_initiative(self, base: float) -> float:
-        # kleine, faire Varianz pro Runde (±8%)
-        jitter = random.uniform(-0.08, 0.08)
-        return max(0.05, base * (1.0 + jitter))
-
-    def _start_new_round(self) -> None:
-        self.round_index += 1
-        # decay one-round vulnerability flags
-        if getattr(self.p, "quick_repair_vuln_rounds", 0) > 0:
-            self.p.quick_repair_vuln_rounds -= 1
-        if getattr(self.e, "quick_repair_vuln_rounds", 0) > 0:
-            self.e.quick_repair_vuln_rounds -= 1
-
-        # reset stance-change lock per round
-        self._stance_changed_this_round = False
-
-        ip = self._roll_initiative(self.p.initiative_base)
-        ie = self._roll_initiative(self.e.initiative_base)
-        self.last_initiative = {"player": ip, "enemy": ie}
-
-        if ip >= ie:
-            self._turn_queue = ["player", "enemy"]
-        else:
-            self._turn_queue = ["enemy", "player"]
-
-        self.turn_owner = self._turn_queue[0]
-        self.add_log(f"Round {self.round_index}: init P={ip:.2f} vs E={ie:.2f} → {self.turn_owner} first")
-
-        # --- tick ability cooldowns (C1.1) ---
-        for side in ("player", "enemy"):
-            for aid, cd in list(self._cd[side].items()):
-                if cd > 0:
-                    self._cd[side][aid] = cd - 1
-
-    def _fire(self, attacker: CombatantRuntime, defender: CombatantRuntime, mult: float) -> dict:
-        mods = self.get_live_combat_multipliers(attacker)
-
-        # --- HIT CHECK ---
-        hit_chance = self._compute_hit_chance(attacker)
-        hit_roll = random.random()
-        hit = hit_roll < hit_chance
-
-        if not hit:
-            # morale loss on miss
-            morale_loss = 6
-
-            # offensive stance -> more morale punishment
-            if self.stance.name == "OFFENSIVE":
-                morale_loss += 4
-
-            attacker.morale = max(0, attacker.morale - morale_loss)
-
-            self.add_log(
-                f"{attacker.name} missed! "
-                f"(hit {hit_chance:.2f}, roll {hit_roll:.2f})"
-            )
-
-            return {
-                "result": "miss",
-                "hull": 0,
-                "applied": [],
-                "hit_chance": hit_chance,
-                "roll": hit_roll,
-            }
-
-
-
-        """
-        Feste Damage-Auflösung (verbindliche Reihenfolge, keine Sonderfälle):
-        1) Damage-Roll [min..max]
-        2) Crit-Check -> damage *= crit_multiplier
-        3) Damage-Typ bestimmen
-        4) Ziel-Armor bestimmen
-        5) Penetration abziehen (Armor kann negativ werden)
-        6) Final Damage = HP-Verlust
-        """
-        # 1) Damage roll
-        dmin = int(attacker.damage_min)
-        dmax = int(attacker.damage_max)
-        if dmax < dmin:
-            dmax = dmin
-        base = random.randint(dmin, dmax)
-
-        # 2) Crit check
-        cc = float(attacker.crit_chance)
-        cc *= mods["hit"]
-        cc = max(0.0, min(1.0, cc))
-        cm = float(attacker.crit_multiplier)
-        is_crit = (random.random() < max(0.0, min(1.0, cc)))
-        if is_crit:
-            base = int(round(base * max(1.0, cm)))
-
-        # 3) Damage type
-        dtype = str(attacker.damage_type)
-
-        # 4) Target armor by type
-        armor = float(defender.armor_physical) if dtype == "physical" else float(defender.armor_abyssal)
-
-        # 5) Penetration subtract (armor may become negative)
-        pen = float(attacker.penetration)
-        effective_armor = armor - pen
-
-        # 6) Convert armor% into multiplier (positive reduces, negative amplifies)
-        # Beispiel: 30 armor -> 0.70 dmg, -20 armor -> 1.20 dmg
-        dmg_mult_from_armor = max(0.1, 1.0 - (effective_armor / 100.0))
-
-        # final damage (mult bleibt als hook, aber keine Sonderfälle)
-        dmg = int(round(base * float(mult) * dmg_mult_from_armor * mods["damage"]))
-        # quick repair vulnerability: incoming damage increased for 1 round
-        if getattr(defender, "quick_repair_vuln_rounds", 0) > 0:
-            dmg = int(round(dmg * 1.35))
-
-        if dmg < 1:
-            dmg = 1
-
-        defender.hp = max(0, int(defender.hp) - dmg)
-        # morale impact
-        if is_crit:
-            defender.morale -= 8
-            attacker.morale += 4
-        else:
-            defender.morale -= 4
-            attacker.morale += 2
-
-
-        defender.morale = max(0, min(100, defender.morale))
-        attacker.morale = max(0, min(100, attacker.morale))
-
-
-        # morale tier change feedback
-        for key, unit in (("player", attacker), ("enemy", defender)):
-            old = self._last_morale_tier.get(key)
-            new = self._morale_tier(unit.morale)
-            if old != new:
-                self._last_morale_tier[key] = new
-                self.add_event({
-                    "type": "morale_shift",
-                    "side": key,
-                    "tier": new,
-                })
-
-        return {
-            "result": "crit" if is_crit else "hit",
-            "hull": dmg,  # UI-Key beibehalten
-            "applied": [],
-            "damage_type": dtype,
-            "armor": armor,
-            "penetration": pen,
-            "effective_armor": effective_armor,
-        }
-
-
-    def _repair(self, target: CombatantRuntime, amount_base: int) -> None:
-        if target.hp <= 0:
-            return
-        target.hp = min(target.hp_max, target.hp + max(1, amount_base))
-
-    def _enemy_take_turn(self) -> None:
-        if self.finished:
-            return
-
-        res = self._fire(attacker=self.e, defender=self.p, mult=1.0)
-        self.add_event({
-            "type": "fire",
-            "side": "enemy",
-            "result": res.get("result"),
-            "hull": int(res.get("hull", 0)),
-            "applied": list(res.get("applied", [])),
-        })
-
-
-        if self._check_finish():
-            self._stop_turns()
-            return
-
-        self._advance_turn()
-
-    def _advance_turn(self) -> None:
-        if not self._turn_queue:
-            self._start_new_round()
-            return
-
-        # entferne aktuellen Spieler aus Queue
-        cur = self._turn_queue.pop(0) if self._turn_queue else None
-
-        if not self._turn_queue:
-            # Runde vorbei → neue Runde
-            self._start_new_round()
-        else:
-            self.turn_owner = self._turn_queue[0]
-
-    def _check_finish(self) -> bool:
-        if self.e.hp <= 0:
-            self.finished = True
-            self.outcome = "win"
-            self.rewards = self._compute_rewards()
-            self.add_log("Enemy defeated!")
-            self._stop_turns()
-            return True
-
-        if self.p.hp <= 0:
-            self.finished = True
-            self.outcome = "lose"
-            self.rewards = {}
-            self.add_log("You were defeated!")
-            self._stop_turns()
-            return True
-
-        return False
 
 # -----------------------------
 # State
@@ -1081,6 +59,10 @@ UI_STANCE_ICON_SIZE = 72
 UI_STANCE_GAP = 10
 UI_STANCE_PAD = 12
 
+# Sofort-Auflösung [R]: Rechenzeit pro Frame, Gegner-KI mit dem Knotenbudget ihres Presets
+RESOLVE_FRAME_MS = 6.0
+RESOLVE_MAX_ROUNDS = 200
+
 class CombatState:
     def __init__(self, enemy_id: str = "") -> None:
         self.enemy_id = enemy_id
@@ -1092,25 +74,27 @@ class CombatState:
     
 
     def on_enter(self) -> None:
-        from core.ui_text import FontBank, TextStyle, render_text
-        from settings import UI_FONT_PATH, UI_FONT_FALLBACK
+        from core.ui_text import get_fonts, TextStyle, render_text
 
-        self._fonts = FontBank(UI_FONT_PATH, UI_FONT_FALLBACK)
+        self._fonts = get_fonts()
         self.font = self._fonts.get(18)
         self.small = self._fonts.get(16)
         
         # --- Damage number fonts (big & bold) ---
-        self._dmg_font = self._fonts.get(32)
-        self._dmg_font.set_bold(True)
+        # (Fonts der FontBank sind prozessweit geteilt -> bold über den Key, nicht per set_bold)
+        self._dmg_font = self._fonts.get(32, bold=True)
 
         # optional: noch stärker für Crits (später)
-        self._dmg_font_big = self._fonts.get(40)
-        self._dmg_font_big.set_bold(True)
+        self._dmg_font_big = self._fonts.get(40, bold=True)
 
         self.engine = None
 
         self._pending_rewards = {"gold": 0, "xp": 0, "cargo": []}
 
+        # abgefangener NPC-Konvoi (Weltkarte) -> Ladung wird bei Sieg zur Beute
+        from world.convoys import take_convoy_intercept
+        self._convoy = take_convoy_intercept(self.ctx)
+
         # UI state
         self._floating_texts = []  # [(text, x, y, timer)]
 
@@ -1137,62 +121,23 @@ class CombatState:
         # (Falls du dein Ship-Runtime Feld schon umbenannt hast, ist 'hp' korrekt;
         #  wir lassen hull_hp als Fallback, damit du nicht sofort abstürzt, falls irgendwo noch Altstände sind.)
         hp_cur = int(getattr(ship, "hp", getattr(ship, "hull_hp", 0)) or 0)
-        hp_max = int(getattr(c, "hp_max", 1) or 1)
-        if hp_cur <= 0:
-            hp_cur = hp_max
-        hp_max = max(hp_max, hp_cur)
-
-        self._player = CombatantRuntime(
-            name="You",
-
-            hp=hp_cur,
-            hp_max=hp_max,
-
-            armor_physical=float(getattr(c, "armor_physical", 0.0)),
-            armor_abyssal=float(getattr(c, "armor_abyssal", 0.0)),
-
-            damage_min=int(getattr(c, "damage_min", 1)),
-            damage_max=int(getattr(c, "damage_max", 1)),
-            damage_type=str(getattr(c, "damage_type", "physical")),
-            penetration=float(getattr(c, "penetration", 0.0)),
-            crit_chance=float(getattr(c, "crit_chance", 0.0)),
-            crit_multiplier=float(getattr(c, "crit_multiplier", 1.5)),
-
-            initiative_base=float(getattr(c, "initiative_base", 1.0)),
-
-            difficulty_tier=int(getattr(c, "difficulty_tier", 1)),
-            threat_level=int(getattr(c, "threat_level", 1)),
-        )
-        # Morale initialisieren (kann später durch Aktionen beeinflusst werden)
-        self._player.morale = random.randint(65, 80)
 
         ed = self.ctx.content.enemies.get(self.enemy_id)
         # kein fallback mehr: enemy_id muss existieren
-        self._enemy = CombatantRuntime(
-            name=ed.name,
-
-            hp=int(ed.combat.hp_max),
-            hp_max=int(ed.combat.hp_max),
-            armor_physical=float(ed.combat.armor_physical),
-            armor_abyssal=float(ed.combat.armor_abyssal),
 
-            damage_min=int(ed.combat.damage_min),
-            damage_max=int(ed.combat.damage_max),
-            damage_type=str(ed.combat.damage_type),
-            penetration=float(ed.combat.penetration),
-            crit_chance=float(ed.combat.crit_chance),
-            crit_multiplier=float(ed.combat.crit_multiplier),
-
-            initiative_base=float(ed.combat.initiative_base),
-
-            difficulty_tier=int(ed.combat.difficulty_tier),
-            threat_level=int(ed.combat.threat_level),
+        # Engine mit eigenem Seed + Mitschnitt (combat/replay.py), Morale wird dort gewürfelt.
+        # Gegner-KI nach Schwierigkeitsgrad (Suchtiefe + Zeitbudget pro Frame)
+        from combat.enemy_ai import DEFAULT_AI_PRESET
+        from combat.replay import start_fight
+        rc = getattr(self.ctx, "run_config", None)
+        self.engine, self._recorder = start_fight(
+            shipdef, ed, hp_cur, self.ctx.player_stats,
+            ai=getattr(rc, "difficulty_id", None) or DEFAULT_AI_PRESET,
         )
-
-        #morale initialisieren (kann später durch Aktionen beeinflusst werden)
-        self._enemy.morale = random.randint(55, 75)
-
-        self.engine = CombatEngine(self._player, self._enemy, self.ctx.player_stats)
+        self._player = self.engine.p
+        self._enemy = self.engine.e
+        self._auto_resolve = False
+        self._resolving = False
 
 
         # UI rects (werden per _layout_ui() dynamisch gesetzt)
@@ -1210,7 +155,7 @@ class CombatState:
 
         # --- Icon cache (goods) ---
         self._good_icon_cache = {}
-        self._icon_size = 32  # passt gut zu deiner Zeilenhöhe
+        self._icon_size = GOOD_ICON_SIZE  # passt gut zu deiner Zeilenhöhe
 
 
         # --- UI metrics (fixes _line_height crash + consistent spacing) ---
@@ -1228,11 +173,8 @@ class CombatState:
         self._bg = self._load_combat_background()
 
         # --- UI: empty sign for unit names ---
-        try:
-            sign_path = os.path.join("assets", "ui", "sign_empty.png")
-            self._sign_empty = pygame.image.load(sign_path).convert_alpha()
-        except Exception:
-            self._sign_empty = None
+        assets = get_assets()
+        self._sign_empty = assets.image(os.path.join("assets", "ui", "sign_empty.png"), owner=self)
         # use same sign as ability button shield
         self._name_shield = self._sign_empty
 
@@ -1257,9 +199,8 @@ class CombatState:
         self._ability_icons = {}
 
         for ability_id in ("fire", "repair", "flee", "quick_repair"):
-            path = os.path.join(abilities_dir, f"{ability_id}.png")
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
+            img = assets.image(os.path.join(abilities_dir, f"{ability_id}.png"), owner=self)
+            if img is not None:
                 self._ability_icons[ability_id] = img
 
 
@@ -1296,22 +237,8 @@ class CombatState:
             except Exception:
                 self._reveal = None
 
-        # --- Name sign (empty wooden sign) ---
-        try:
-            ui_dir = os.path.join("assets", "ui")  # falls du ui_dir bereits irgendwo setzt: diesen try-Block behalten
-            sign_path = os.path.join(ui_dir, "sign_empty.png")
-            self._sign_empty = pygame.image.load(sign_path).convert_alpha()
-        except Exception:
-            self._sign_empty = None
-
-
         from settings import MASTER_LIFE_ICON
-        self._ml_icon = None
-        try:
-            if os.path.exists(MASTER_LIFE_ICON):
-                self._ml_icon = pygame.image.load(MASTER_LIFE_ICON).convert_alpha()
-        except Exception:
-            self._ml_icon = None
+        self._ml_icon = assets.image(MASTER_LIFE_ICON, owner=self)
 
         # --- Turn delay (visual spacing between actions) ---
         self._turn_delay = 0.0  # seconds remaining
@@ -1325,19 +252,14 @@ class CombatState:
 
         base = os.path.join("assets", "ui", "stance")
         for key in ("offensive", "balanced", "defensive"):
-            path = os.path.join(base, f"{key}.png")
-            try:
-                self._stance_icons[key] = pygame.image.load(path).convert_alpha()
-            except Exception:
-                self._stance_icons[key] = None
+            self._stance_icons[key] = assets.image(os.path.join(base, f"{key}.png"), owner=self)
 
         # --- Morale UI assets (3-layer) ---
-        try:
-            base = os.path.join("assets", "ui", "moral")
-            self._morale_frame = pygame.image.load(os.path.join(base, "moral.png")).convert_alpha()
-            self._morale_fill = pygame.image.load(os.path.join(base, "moral_fill.png")).convert_alpha()
-            self._morale_bg = pygame.image.load(os.path.join(base, "moral_bg.png")).convert_alpha()
-        except Exception:
+        base = os.path.join("assets", "ui", "moral")
+        self._morale_frame = assets.image(os.path.join(base, "moral.png"), owner=self)
+        self._morale_fill = assets.image(os.path.join(base, "moral_fill.png"), owner=self)
+        self._morale_bg = assets.image(os.path.join(base, "moral_bg.png"), owner=self)
+        if self._morale_frame is None or self._morale_fill is None or self._morale_bg is None:
             self._morale_frame = None
             self._morale_fill = None
             self._morale_bg = None
@@ -1397,7 +319,7 @@ class CombatState:
         spec schema:
         { "sprite": str|None, "size": (w,h), "scale": float, "offset": (x,y), "flip_x": bool }
         Loads and scales with aspect ratio to fit into size, then applies optional scale multiplier.
-        Uses a small cache to avoid repeated disk hits.
+        Bilder kommen aus dem AssetManager, der lokale Cache spart nur die Aspect-Fit-Rechnung.
         """
         path = spec.get("sprite")
         if not path:
@@ -1422,9 +344,9 @@ class CombatState:
         if base_key in self._sprite_cache:
             return self._sprite_cache[base_key]
 
-        try:
-            img = pygame.image.load(path).convert_alpha()
-        except Exception:
+        assets = get_assets()
+        img = assets.image(path)
+        if img is None:
             self._sprite_cache[base_key] = None
             return None
 
@@ -1446,19 +368,13 @@ class CombatState:
             self._sprite_cache[base_key] = cached
             return cached
 
-        surf = pygame.transform.smoothscale(img, (out_w, out_h))
+        surf = assets.image(path, (out_w, out_h), owner=self)
         self._sprite_cache[key] = surf
         self._sprite_cache[base_key] = surf
         return surf
 
     def _try_load_sprite(self, path: str, size: tuple[int, int]) -> Optional[pygame.Surface]:
-        try:
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                return pygame.transform.smoothscale(img, size)
-        except Exception:
-            pass
-        return None
+        return get_assets().image(path, size, owner=self)
 
 
     def _load_combat_background(self) -> Optional[pygame.Surface]:
@@ -1481,12 +397,11 @@ class CombatState:
                 os.path.join("assets", "maps", f"{map_id}_combat.png"),         # optional convention
             ]
 
-            p = next((c for c in candidates if os.path.exists(c)), None)
+            assets = get_assets()
+            p = next((c for c in candidates if assets.exists(c)), None)
             if not p:
                 return None
 
-            img = pygame.image.load(p).convert()
-
             # scale to current screen once
             surf = pygame.display.get_surface()
             if surf:
@@ -1494,7 +409,7 @@ class CombatState:
             else:
                 w, h = 960, 720
 
-            return pygame.transform.smoothscale(img, (w, h))
+            return assets.image(p, (w, h), alpha=False, owner=self)
         except Exception:
             return None
 
@@ -1507,22 +422,19 @@ class CombatState:
         if good_id in self._good_icon_cache:
             return self._good_icon_cache[good_id]
 
-        # Standard: assets/icons/<good_id>.png
-        base = os.path.join("assets", "icons")
-        candidates = [
-            os.path.join(base, f"{good_id}.png"),
-            os.path.join(base, good_id, "icon.png"),  # optionaler Fallback
-        ]
-
-        surf = None
-        for path in candidates:
-            if os.path.exists(path):
-                try:
-                    img = pygame.image.load(path).convert_alpha()
-                    surf = pygame.transform.smoothscale(img, (self._icon_size, self._icon_size))
+        # Standard: Goods-Atlas (assets/icons/<good_id>.png in GOOD_ICON_SIZE), geglättete Variante wie der Fallback
+        surf = atlas_image("goods", good_icon_name(good_id, smooth=True)) if self._icon_size == GOOD_ICON_SIZE else None
+        if surf is None:
+            base = os.path.join("assets", "icons")
+            candidates = [
+                os.path.join(base, f"{good_id}.png"),
+                os.path.join(base, good_id, "icon.png"),  # optionaler Fallback
+            ]
+            assets = get_assets()
+            for path in candidates:
+                surf = assets.image(path, (self._icon_size, self._icon_size), owner=self)
+                if surf is not None:
                     break
-                except Exception:
-                    surf = None
 
         self._good_icon_cache[good_id] = surf
         return surf
@@ -1540,6 +452,7 @@ class CombatState:
             ship.hp = int(value)
 
     def on_exit(self) -> None:
+        get_assets().release(self)
         # --- Music: restore previous (world) playlist ---
         try:
             self.ctx.audio.pop_music(fade_ms=800)
@@ -1821,6 +734,15 @@ class CombatState:
                 self._leave_combat()
             return
 
+        # Auflösung läuft über mehrere Frames -> solange kein Kampf-Input
+        if getattr(self, "_resolving", False):
+            return
+
+        # Sofort-Auflösung (auch während des Gegnerzugs), wird im nächsten update() ausgeführt
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+            self._auto_resolve = True
+            return
+
         # Block input wenn nicht Player-Turn
         if getattr(self, "engine", None) and getattr(self.engine, "turn_owner", None) != "player":
             # optional: trotzdem Pause erlauben
@@ -1899,6 +821,14 @@ class CombatState:
         #bobbing
         self._t = float(getattr(self, "_t", 0.0)) + float(dt)
 
+        # Vorab-Prognose für die gewählte Haltung (memoisiert); im Kampf nur bis sie anzeigbar ist,
+        # feiner rechnet der Übergangsscreen bzw. der nächste Haltungswechsel
+        odds = getattr(self, "_odds", None)
+        if odds is None or not odds.ready or getattr(self, "_odds_stance", None) != self.engine.stance:
+            from combat.odds import estimate_encounter_odds
+            self._odds = estimate_encounter_odds(self.ctx, self.enemy_id, self.engine.stance, budget_ms=1.0)
+            self._odds_stance = self.engine.stance
+
         # Wenn Ergebnis schon angezeigt wird, keine weiteren Turns/Enemy-Aktionen ausführen
         if getattr(self, "_result_showing", False):
             # Reveal weiter ticken lassen, damit es nicht schwarz bleibt
@@ -1909,10 +839,25 @@ class CombatState:
                     self._reveal = None
             return
 
+        # Rest des Kampfes headless durchrechnen -> unten direkt zum Ergebnis-Overlay
+        if getattr(self, "_auto_resolve", False):
+            self._auto_resolve = False
+            self._start_resolve()
+        if getattr(self, "_resolving", False):
+            self._resolve_step()
+            if self._resolving:
+                return
+
         # --- Turn delay gate: wait before allowing next action/turn to execute ---
         if float(getattr(self, "_turn_delay", 0.0)) > 0.0:
             self._turn_delay = max(0.0, float(self._turn_delay) - float(dt))
 
+            # Gegner-KI rechnet zeitgeschnitten im Delay-Fenster am nächsten Zug
+            ai = getattr(self.engine, "enemy_ai", None)
+            if ai is not None and self.engine.turn_owner == "enemy":
+                with profile_section(self.game, "combat.ai"):
+                    ai.think(self.engine)
+
             # Reveal weiter ticken lassen (sonst kann es wieder "kleben")
             if getattr(self, "_reveal", None):
                 self._reveal["t"] = float(self._reveal.get("t", 0.0)) + float(dt)
@@ -1955,18 +900,20 @@ class CombatState:
             return
 
 
-        self.engine.update(dt)
+        with profile_section(self.game, "combat.engine"):
+            self.engine.update(dt)
 
         acted = False
-        while True:
-            ev = self.engine.pop_event()
-            if not ev:
-                break
-            self._handle_vfx_event(ev)
+        with profile_section(self.game, "combat.events"):
+            while True:
+                ev = self.engine.pop_event()
+                if not ev:
+                    break
+                self._handle_vfx_event(ev)
 
-            # Any of these events represent an action we want to space out
-            if ev.get("type") in ("fire", "repair", "board", "flee"):
-                acted = True
+                # Any of these events represent an action we want to space out
+                if ev.get("type") in ("fire", "repair", "board", "flee"):
+                    acted = True
 
         # After an action (usually enemy auto-turn), start delay before next turn
         if acted and not getattr(self.engine, "finished", False):
@@ -1978,6 +925,10 @@ class CombatState:
             if getattr(self.engine, "outcome", None) == "win":
                 ed = self.ctx.content.enemies[self.enemy_id]
                 self._pending_rewards = self._build_rewards_from_enemydef(ed)
+                if getattr(self, "_convoy", None) is not None:
+                    from world.convoys import claim_convoy_cargo
+                    self._pending_rewards["cargo"] = list(self._pending_rewards.get("cargo", []) or []) + claim_convoy_cargo(self.ctx, self._convoy)
+                    self._convoy = None
 
                 lines = []
                 gold = int(self._pending_rewards.get("gold", 0))
@@ -1995,12 +946,15 @@ class CombatState:
 
             elif getattr(self.engine, "outcome", None) == "lose":
                 self._result_payload = {"title": "DEFEAT", "lines": [("cargo", "You lost the battle.")]}
+            elif getattr(self.engine, "outcome", None) == "enemy_fled":
+                self._result_payload = {"title": "ENEMY ESCAPED", "lines": [("cargo", "The enemy got away.")]}
             else:
                 self._result_payload = {"title": "ESCAPED", "lines": [("cargo", "You fled successfully.")]}  # fallback
 
             self._result_showing = True
             self._result_timer = 0.0
             self._result_applied = False
+            self._save_replay()
 
         # 2) Reveal-Overlay Timer (sonst bleibt der Screen schwarz)
         if getattr(self, "_reveal", None):
@@ -2009,6 +963,58 @@ class CombatState:
             if self._reveal["t"] >= dur:
                 self._reveal = None
 
+    def _start_resolve(self) -> None:
+        self._pending_action = None
+        self._turn_delay = 0.0
+        self._resolving = True
+
+        # KI headless (budget_ms None): deterministisch bis zum node_budget ihres Presets statt Zeitscheiben
+        ai = getattr(self.engine, "enemy_ai", None)
+        self._resolve_ai_budget = getattr(ai, "budget_ms", None)
+        if ai is not None:
+            ai.budget_ms = None
+
+    def _resolve_step(self) -> None:
+        """Rechnet den Kampf headless weiter, ~RESOLVE_FRAME_MS pro Frame."""
+        from time import perf_counter
+        from combat.batch_sim import POLICIES, play_step
+        from combat.odds import ODDS_POLICY
+
+        # gleiches Spieler-Modell wie die Odds-Anzeige
+        policy = POLICIES[ODDS_POLICY]
+        engine = self.engine
+        ai = getattr(engine, "enemy_ai", None)
+        deadline = perf_counter() + RESOLVE_FRAME_MS / 1000.0
+        with profile_section(self.game, "combat.resolve"):
+            while not engine.finished and engine.round_index <= RESOLVE_MAX_ROUNDS:
+                # Gegnerzug vorrechnen (bis zum Knotenbudget), decide() nimmt dann das fertige Ergebnis
+                if ai is not None and engine.turn_owner == "enemy":
+                    left_ms = (deadline - perf_counter()) * 1000.0
+                    if left_ms <= 0.0 or not ai.think(engine, left_ms):
+                        return
+                play_step(engine, policy)
+                if perf_counter() >= deadline:
+                    return
+
+        # fertig (oder Rundenlimit: dann geht der Kampf normal weiter)
+        self._resolving = False
+        ai = getattr(engine, "enemy_ai", None)
+        if ai is not None:
+            ai.budget_ms = self._resolve_ai_budget
+        engine.add_log("Battle auto-resolved")
+
+    def _save_replay(self) -> None:
+        rec = getattr(self, "_recorder", None)
+        if rec is None:
+            return
+        self._recorder = None
+        self.engine.recorder = None
+        try:
+            from combat.replay import save_record
+            save_record(rec.finish(self.engine))
+        except OSError:
+            pass  # Mitschnitt ist optional, Kampf nicht blockieren
+
     def _handle_vfx_event(self, ev: dict) -> None:
         et = ev.get("type")
         side = ev.get("side")  # "player" | "enemy"
@@ -2132,11 +1138,15 @@ class CombatState:
             if hull > 0:
                 add_float(f"-{hull}", dst[0], dst[1] - 48, (255, 150, 110))
 
-        elif et == "repair":
-            amt = int(ev.get("amount", 0))
+        elif et in ("repair", "quick_repair"):
+            amt = int(ev.get("amount", ev.get("heal", 0)))
             add_burst(src[0], src[1] - 10, (120, 220, 150))
             add_float(f"+{amt}", src[0], src[1] - 40, (140, 240, 170))
 
+        elif et == "stance":
+            # Haltungswechsel der Gegner-KI
+            add_float(str(ev.get("stance", "")).upper(), src[0], src[1] - 70, (240, 220, 140))
+
         elif et == "flee":
             ok = bool(ev.get("success", ev.get("ok", False)))
             add_float("ESCAPE!" if ok else "FAILED!", src[0], src[1] - 40, (200, 200, 240) if ok else (240, 140, 140))
@@ -2191,7 +1201,8 @@ class CombatState:
             oy = int(random.uniform(-self._shake_amp, self._shake_amp))
 
         # Scene direkt rendern (robust, kein "black overlay")
-        self._render_scene(screen)
+        with profile_section(self.game, "combat.scene"):
+            self._render_scene(screen)
 
 
         p = self.ctx.player
@@ -2232,6 +1243,14 @@ class CombatState:
         speed_label = "PAUSE" if self.ctx.clock.paused else f"{ts:.0f}x"
         title = self.font.render(f"COMBAT vs {self._enemy.name}   Speed: {speed_label}", True, (220, 220, 220))
         screen.blit(title, (40, 30))
+        if getattr(self, "_odds", None) is not None:
+            from combat.odds import format_odds
+            # oben mittig: links liegt das Haltungs-Panel über dem Header
+            odds_txt = self.font.render(format_odds(self._odds), True, (235, 225, 200))
+            screen.blit(odds_txt, odds_txt.get_rect(midtop=(W // 2, 30)))
+        if not getattr(self, "_result_showing", False):
+            hint = self.small.render("[R] Auto-resolve", True, (190, 190, 190))
+            screen.blit(hint, hint.get_rect(midtop=(W // 2, 54)))
 
         # Bars
         # Bars (centered above player/enemy units, half length)
@@ -2374,7 +1393,8 @@ class CombatState:
                 pygame.draw.rect(screen, (10, 10, 10), rect, 2, border_radius=10)
 
         # Combat log bottom-right
-        self._draw_combat_log_panel(screen)
+        with profile_section(self.game, "combat.log"):
+            self._draw_combat_log_panel(screen)
 
         if getattr(self, "_result_showing", False):
             self._draw_result_overlay(screen)
@@ -2440,7 +1460,7 @@ class CombatState:
 
         mods = self.engine.get_live_combat_multipliers(self.engine.p)
         #mods = self.engine.get_debug_combat_modifiers(self.engine.e)  TITEL ÄNDERN
-        hit_chance = self.engine._compute_hit_chance(self.engine.p)
+        hit_chance = self.engine._compute_hit_chance(self.engine.p, mods)
         rep_p = self.engine._compute_repair_success(self.engine.p)
 
         line_h = 18
@@ -2455,7 +1475,7 @@ class CombatState:
 
         title = self.font.render("PLAYER MODIFIERS", True, (230, 230, 230))
         base_hit = 0.75
-        hit_mult = float(mods.get("hit", 1.0))
+        hit_mult = float(mods.hit)
         hc_txt = f"Hit Chance: {hit_chance*100:5.1f}%   (base {base_hit*100:.0f}% × x{hit_mult:.2f})"
 
         surf = self.font.render(hc_txt, True, (240, 220, 180))
@@ -2468,7 +1488,7 @@ class CombatState:
         draw_line("PLAYER MODIFIERS")
 
         for name in ("damage", "hit", "repair", "flee", "panic_fail"):
-            value = float(mods.get(name, 0.0))
+            value = float(getattr(mods, name, 0.0))
 
             if name == "panic_fail":
                 txt = f"{name:<12}: {value*100:5.1f}%"
@@ -2497,12 +1517,7 @@ class CombatState:
 
         # draw wave edges (same asset path if available)
         wave_path = self._reveal.get("wave_path")
-        wave = None
-        try:
-            if wave_path and os.path.exists(wave_path):
-                wave = pygame.image.load(wave_path).convert_alpha()
-        except Exception:
-            wave = None
+        wave = get_assets().image(wave_path) if wave_path else None
 
         if intrude > 0:
             if wave is None:
@@ -2728,14 +1743,14 @@ class CombatState:
             font = self._dmg_font_big if getattr(ft, "crit", False) else self._dmg_font
 
             # render main + outline for readability
-            main = font.render(ft.text, True, ft.color)
+            main = text_surface(font, ft.text, ft.color)
 
             # optional scaling (crit punch)
             scale = float(getattr(ft, "scale", 1.0))
             if abs(scale - 1.0) > 0.01:
                 main = pygame.transform.smoothscale(main, (int(main.get_width() * scale), int(main.get_height() * scale)))
 
-            outline = font.render(ft.text, True, (0, 0, 0))
+            outline = text_surface(font, ft.text, (0, 0, 0))
             if abs(scale - 1.0) > 0.01:
                 outline = pygame.transform.smoothscale(outline, (int(outline.get_width() * scale), int(outline.get_height() * scale)))
 
@@ -2877,7 +1892,7 @@ class CombatState:
         pygame.draw.rect(screen, (80, 180, 120), pygame.Rect(x, y, int(w * frac), h), border_radius=4)
         pygame.draw.rect(screen, (25, 28, 38), pygame.Rect(x, y, w, h), 2, border_radius=4)
 
-        txt = self.font.render(f"{label}: {val}/{vmax}", True, (230, 230, 230))
+        txt = text_surface(self.font, f"{label}: {val}/{vmax}", (230, 230, 230))
         screen.blit(txt, (x, y - 30))
 
     def _draw_morale_bar(self, screen, x, y, morale: int, label: str):
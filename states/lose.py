@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from typing import Optional
 import os
 import pygame
+from core.assets import get_assets
 from ui.video_background import VideoBackground
 
 @dataclass
@@ -39,21 +40,12 @@ class LoseState:
             self.ctx.lose_bg = self.bg
 
         # Sign laden
-        self._sign = None
+        assets = get_assets()
         self._sign_path = os.path.join("assets", "ui", "sign_lose.png")
-        if os.path.exists(self._sign_path):
-            try:
-                self._sign = pygame.image.load(self._sign_path).convert_alpha()
-            except Exception:
-                self._sign = None
+        self._sign = assets.image(self._sign_path, owner=self)
         # Menü-Schild laden
-        self._menu_sign = None
         self._menu_sign_path = os.path.join("assets", "ui", "sign_menu.png")
-        if os.path.exists(self._menu_sign_path):
-            try:
-                self._menu_sign = pygame.image.load(self._menu_sign_path).convert_alpha()
-            except Exception:
-                self._menu_sign = None
+        self._menu_sign = assets.image(self._menu_sign_path, owner=self)
 
         # --- Lose Musik (robust) ---
         lose_candidates = [
@@ -89,7 +81,7 @@ class LoseState:
     def on_exit(self) -> None:
         # Optional: wenn du beim Rückweg ins Menü wieder Menü-Musik willst,
         # übernimmt das Menü-State meist selbst. Ansonsten könntest du hier pop_music() machen.
-        pass
+        get_assets().release(self)
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -111,6 +103,14 @@ class LoseState:
         if getattr(self, "bg", None) is not None:
             self.bg.update(dt)
 
+    def is_idle(self) -> bool:
+        # erst wenn alle Einblendungen durch sind und kein Video läuft
+        if getattr(self, "bg", None) is not None and self.bg.has_frames():
+            return False
+        intro = max(0.90 + 0.25 + 0.85, 0.90 + 0.25 + 0.15 + self.sign_fade_in)
+        menu = float(getattr(self, "_menu_delay", 5.0)) + float(getattr(self, "_menu_fade", 0.35))
+        return self._t >= max(intro, menu)
+
 
     def render(self, screen: pygame.Surface) -> None:
         alpha = 0  # immer initialisieren, damit der Overlay-Block nicht crasht
@@ -6,6 +6,8 @@ from typing import Optional, Any, Dict, List, Tuple
 
 import pygame
 
+from core.assets import get_assets
+from core.ui_text import text_surface
 from ui.video_background import VideoBackground
 
 
@@ -24,11 +26,10 @@ class MainMenuState:
         self.selected_index: int = 0
         self.item_hitboxes: List[Tuple[int, pygame.Rect]] = []
 
-        from core.ui_text import FontBank
-        from settings import UI_FONT_PATH, UI_FONT_FALLBACK
+        from core.ui_text import get_fonts
 
         if self.fonts is None:
-            self.fonts = FontBank(UI_FONT_PATH, UI_FONT_FALLBACK)
+            self.fonts = get_fonts()
 
         self.font = self.fonts.get(40)
         self.small = self.fonts.get(14)
@@ -62,30 +63,26 @@ class MainMenuState:
             "Optionen": os.path.join("assets", "ui", "sign_options.png"),
             "Spiel beenden": os.path.join("assets", "ui", "sign_quit.png"),
         }
-        self.title_sign = pygame.image.load(
-            os.path.join("assets", "ui", "pirate.png")
-        ).convert_alpha()
-
-        try:
-            self._raw_signs = {}
-            for label, path in self.sign_paths.items():
-                s = pygame.image.load(path).convert_alpha()
-                s = self._crop_to_alpha(s, min_alpha=10)  # <- WICHTIG
-                self._raw_signs[label] = s
-
-        except Exception:
-            # Falls Assets fehlen => Text-Fallback
-            self._use_image_buttons = False
-            self._raw_signs = {}
+        assets = get_assets()
+        self.title_sign = assets.image(os.path.join("assets", "ui", "pirate.png"), owner=self)
+
+        self._raw_signs = {}
+        for label, path in self.sign_paths.items():
+            s = assets.image(path, owner=self)
+            if s is None:
+                # Falls Assets fehlen => Text-Fallback
+                self._use_image_buttons = False
+                self._raw_signs = {}
+                break
+            self._raw_signs[label] = self._crop_to_alpha(s, min_alpha=10)  # <- WICHTIG
 
         # --- Stats background for panels (options/load preview etc.) ---
-        self._bg_stats = None
-        try:
-            self._bg_stats = pygame.image.load(
-                os.path.join("assets", "ui", "bg_stats.png")
-            ).convert_alpha()
-        except Exception:
-            self._bg_stats = None
+        self._bg_stats = assets.image(os.path.join("assets", "ui", "bg_stats.png"), owner=self)
+
+        # World/City/Kampf-Module + Assets im Hintergrund vorladen, solange das Menü steht
+        start_warmup = getattr(self.game, "start_warmup", None)
+        if start_warmup is not None:
+            start_warmup()
 
         # Musik
         tracks = [
@@ -113,29 +110,25 @@ class MainMenuState:
         self._load_preview_meta = None
         self._load_preview_mtime = None
 
+        # Saves ändern sich nicht, solange das Hauptmenü offen ist -> einmal über die Slot-Header prüfen
+        from core.save_slots import save_exists
+        self._load_available = save_exists()
+
     def _refresh_load_preview_cache(self) -> None:
-        from core.save_system import DEFAULT_SAVE_PATH, PREVIEW_PATH, load_save_metadata
-        import os, pygame
+        from core.save_slots import latest_slot, load_slot_thumbnail
 
-        # cache invalidation via mtime
-        mtime_json = os.path.getmtime(DEFAULT_SAVE_PATH) if os.path.exists(DEFAULT_SAVE_PATH) else None
-        mtime_png = os.path.getmtime(PREVIEW_PATH) if os.path.exists(PREVIEW_PATH) else None
-        mtime = (mtime_json, mtime_png)
+        # neuester Slot; Header kommen aus dem Slot-Cache, Thumbnail nur bei neuem Slot/mtime
+        info = latest_slot()
+        key = (info.path, info.mtime) if info is not None else None
 
-        if self._load_preview_mtime == mtime:
+        if self._load_preview_mtime == key:
             return
 
-        self._load_preview_mtime = mtime
-        self._load_preview_meta = load_save_metadata(DEFAULT_SAVE_PATH)
+        self._load_preview_mtime = key
+        self._load_preview_meta = info.meta if info is not None else None
 
-        if os.path.exists(PREVIEW_PATH):
-            try:
-                img = pygame.image.load(PREVIEW_PATH).convert_alpha()
-                self._load_preview_img = img
-            except Exception:
-                self._load_preview_img = None
-        else:
-            self._load_preview_img = None
+        img = load_slot_thumbnail(info) if info is not None else None
+        self._load_preview_img = img.convert_alpha() if img is not None else None
 
 
     def _draw_load_preview(self, screen: pygame.Surface, anchor_rect: pygame.Rect) -> None:
@@ -228,12 +221,12 @@ class MainMenuState:
             lines = ["Save vorhanden, aber Metadaten fehlen."]
 
         for line in lines:
-            surf = f.render(line, True, (240, 240, 240))
+            surf = text_surface(f, line, (240, 240, 240))
             screen.blit(surf, (x + pad, cur_y))
             cur_y += surf.get_height() + 6
 
     def on_exit(self) -> None:
-        pass
+        get_assets().release(self)
 
 
 
@@ -342,7 +335,7 @@ class MainMenuState:
 
         self.item_hitboxes = []
         for i, item in enumerate(self.items):
-            txt = self.font.render(item, True, (240, 240, 240))
+            txt = text_surface(self.font, item, (240, 240, 240))
             tx = screen_w // 2 - txt.get_width() // 2
             ty = start_y + i * spacing
             rect = pygame.Rect(tx - 20, ty - 8, txt.get_width() + 40, txt.get_height() + 16)
@@ -368,23 +361,25 @@ class MainMenuState:
             self.game.push(st)
             return
 
-        from core.save_system import save_exists
-        if not save_exists():
+        if not self._load_available:
             self._toast = ("Kein Savegame gefunden.", pygame.time.get_ticks())
             return
 
         if selected == "Spiel laden":
-            from core.save_system import load_game
-            ok = load_game(self.ctx)
-            if ok:
-                from states.world import WorldMapState
-                self.game.replace(WorldMapState())
-            else:
-                self._toast = ("Kein Savegame gefunden.", pygame.time.get_ticks())
+            from states.save_slots import SaveSlotsState
+            self.game.push(SaveSlotsState(mode="load", bg_mode="menu", on_pick=self._load_from))
             return
 
         return
 
+    def _load_from(self, path: str) -> None:
+        from core.save_system import load_game
+        if load_game(self.ctx, path):
+            from states.world import WorldMapState
+            self.game.replace(WorldMapState())
+        else:
+            self._toast = ("Kein Savegame gefunden.", pygame.time.get_ticks())
+
 
     # -------------------------
     # Loop
@@ -462,8 +457,7 @@ class MainMenuState:
             # -------------------------
             # Schilder (über den Seilen)
             # -------------------------
-            from core.save_system import save_exists
-            load_available = save_exists()  # <-- DIES muss außerhalb der Schleife stehen! (siehe Schritt 1)
+            load_available = self._load_available
 
             for i, label in enumerate(self.items):
                 rect = self._button_rects.get(label)
@@ -494,7 +488,7 @@ class MainMenuState:
                 # Tooltip
                 if disabled and rect.collidepoint(mx, my):
                     tip_font = self.fonts.get(20)
-                    tip = tip_font.render("Kein Savegame gefunden", True, (240, 240, 240))
+                    tip = text_surface(tip_font, "Kein Savegame gefunden", (240, 240, 240))
                     tip_bg = pygame.Surface((tip.get_width() + 16, tip.get_height() + 10), pygame.SRCALPHA)
                     tip_bg.fill((0, 0, 0, 170))
                     tx = rect.centerx - tip_bg.get_width() // 2
@@ -528,7 +522,7 @@ class MainMenuState:
                 if hover or is_selected:
                     pygame.draw.rect(screen, (45, 60, 85), rect, border_radius=8)
 
-                txt = self.font.render(item, True, (240, 240, 240))
+                txt = text_surface(self.font, item, (240, 240, 240))
                 tx = rect.centerx - txt.get_width() // 2
                 ty = rect.centery - txt.get_height() // 2
                 screen.blit(txt, (tx, ty))
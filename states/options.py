@@ -6,6 +6,8 @@ from typing import Any, Optional, Tuple
 
 import pygame
 
+from core.assets import get_assets
+
 
 @dataclass
 class OptionsState:
@@ -25,11 +27,10 @@ class OptionsState:
     dragging: bool = False
 
     def on_enter(self) -> None:
-        from core.ui_text import FontBank
-        from settings import UI_FONT_PATH, UI_FONT_FALLBACK
+        from core.ui_text import get_fonts
 
         if self.fonts is None:
-            self.fonts = FontBank(UI_FONT_PATH, UI_FONT_FALLBACK)
+            self.fonts = get_fonts()
 
         self.title_font = self.fonts.get(44)
         self.body_font = self.fonts.get(22)
@@ -42,23 +43,14 @@ class OptionsState:
         self._click_sfx = os.path.join("assets", "sfx", "ui_click.mp3")
 
         # --- use same background as Stats menu (assets/ui/bg_stats.png) ---
-        self._bg_stats = None
-        try:
-            self._bg_stats = pygame.image.load(os.path.join("assets", "ui", "bg_stats.png")).convert_alpha()
-        except Exception:
-            self._bg_stats = None
+        assets = get_assets()
+        self._bg_stats = assets.image(os.path.join("assets", "ui", "bg_stats.png"), owner=self)
 
         # --- back button wood sign ---
-        self._back_img = None
-        try:
-            self._back_img = pygame.image.load(
-                os.path.join("assets", "ui", "back.png")
-            ).convert_alpha()
-        except Exception:
-            self._back_img = None
+        self._back_img = assets.image(os.path.join("assets", "ui", "back.png"), owner=self)
 
     def on_exit(self) -> None:
-        pass
+        get_assets().release(self)
 
     # ----------------------------
     # Input
@@ -138,6 +130,10 @@ class OptionsState:
                 except Exception:
                     pass
 
+    def is_idle(self) -> bool:
+        # Snapshot-Hintergrund ist statisch, das Menü-Video nicht
+        return self.bg_mode != "menu"
+
     def render(self, screen: pygame.Surface) -> None:
         sw, sh = screen.get_size()
 
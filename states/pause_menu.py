@@ -8,6 +8,9 @@ from typing import Optional, List, Tuple, Any
 
 import pygame
 
+from core.assets import get_assets
+from core.ui_text import text_surface
+
 
 @dataclass
 class PauseMenuState:
@@ -22,15 +25,13 @@ class PauseMenuState:
 
     def on_enter(self) -> None:
         if self.font is None:
-            from core.ui_text import FontBank, TextStyle, render_text
-            from settings import UI_FONT_PATH, UI_FONT_FALLBACK
+            from core.ui_text import get_fonts, TextStyle, render_text
 
-            self._fonts = FontBank(UI_FONT_PATH, UI_FONT_FALLBACK)
+            self._fonts = get_fonts()
             self.font = self._fonts.get(44)
 
         if self.small is None:
-            from core.ui_text import FontBank, TextStyle, render_text
-            from settings import UI_FONT_PATH, UI_FONT_FALLBACK
+            from core.ui_text import get_fonts, TextStyle, render_text
             self.small = self._fonts.get(30)
 
         # Spielzeit pausieren (merken + setzen)
@@ -49,15 +50,14 @@ class PauseMenuState:
         ]
 
         # Bild-Schilder laden (falls vorhanden)
+        assets = get_assets()
         self._raw_signs = {}
         ui_dir = os.path.join("assets", "ui")
         for label in self.labels:
             fn = self._slug(label) + ".png"
-            path = os.path.join(ui_dir, fn)
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                img = self._crop_to_alpha(img, min_alpha=10)
-                self._raw_signs[label] = img
+            img = assets.image(os.path.join(ui_dir, fn), owner=self)
+            if img is not None:
+                self._raw_signs[label] = self._crop_to_alpha(img, min_alpha=10)
 
         self._scaled_signs = {}
         self._button_rects = {}
@@ -72,13 +72,10 @@ class PauseMenuState:
         self._input_mode = "mouse"  # or "keyboard"
 
         # --- Stats menu background image (assets/ui/bg_stats.png) ---
-        self._bg_stats = None
-        try:
-            self._bg_stats = pygame.image.load(os.path.join("assets", "ui", "bg_stats.png")).convert_alpha()
-        except Exception:
-            self._bg_stats = None
+        self._bg_stats = assets.image(os.path.join("assets", "ui", "bg_stats.png"), owner=self)
 
     def on_exit(self) -> None:
+        get_assets().release(self)
         # Pause-Zustand wiederherstellen
         clock = getattr(self.ctx, "clock", None)
         if clock is not None:
@@ -169,29 +166,40 @@ class PauseMenuState:
                     return
 
     def update(self, dt: float) -> None:
-        pass
+        job = getattr(self, "_save_job", None)
+        if job is None:
+            return
+        now = pygame.time.get_ticks()
+        if not job.done():
+            self._toast = ("Speichere ...", now)  # bleibt stehen, bis der Save-Thread fertig ist
+            return
+        self._save_job = None
+        err = job.exception()
+        if err is not None:
+            print(f"[Save] failed: {err}")
+            self._toast = ("Speichern fehlgeschlagen.", now)
+        else:
+            self._toast = ("Spiel gespeichert.", now)
+
+    def is_idle(self) -> bool:
+        # Hover/Auswahl kommen über Events; nur der Toast (und ein laufender Save) läuft ab
+        return not getattr(self, "_toast", None) and getattr(self, "_save_job", None) is None
 
     def _refresh_load_preview_cache(self) -> None:
-        import os, pygame
-        from core.save_system import DEFAULT_SAVE_PATH, PREVIEW_PATH, load_save_metadata
+        from core.save_slots import latest_slot, load_slot_thumbnail
 
-        mtime_json = os.path.getmtime(DEFAULT_SAVE_PATH) if os.path.exists(DEFAULT_SAVE_PATH) else None
-        mtime_png = os.path.getmtime(PREVIEW_PATH) if os.path.exists(PREVIEW_PATH) else None
-        mtime = (mtime_json, mtime_png)
+        # neuester Slot (nur Header); Thumbnail nur neu laden, wenn sich Slot/mtime ändert
+        info = latest_slot()
+        key = (info.path, info.mtime) if info is not None else None
 
-        if self._load_preview_mtime == mtime:
+        if self._load_preview_mtime == key:
             return
 
-        self._load_preview_mtime = mtime
-        self._load_preview_meta = load_save_metadata(DEFAULT_SAVE_PATH)
+        self._load_preview_mtime = key
+        self._load_preview_meta = info.meta if info is not None else None
 
-        if os.path.exists(PREVIEW_PATH):
-            try:
-                self._load_preview_img = pygame.image.load(PREVIEW_PATH).convert_alpha()
-            except Exception:
-                self._load_preview_img = None
-        else:
-            self._load_preview_img = None
+        img = load_slot_thumbnail(info) if info is not None else None
+        self._load_preview_img = img.convert_alpha() if img is not None else None
 
 
     def _draw_load_preview(self, screen: pygame.Surface, anchor_rect: pygame.Rect) -> None:
@@ -277,7 +285,7 @@ class PauseMenuState:
             lines = ["Save vorhanden, aber Metadaten fehlen."]
 
         for line in lines:
-            surf = f.render(line, True, (240, 240, 240))
+            surf = text_surface(f, line, (240, 240, 240))
             screen.blit(surf, (x + pad, cur_y))
             cur_y += surf.get_height() + 6
 
@@ -324,13 +332,13 @@ class PauseMenuState:
                 # Fallback: Textbutton
                 bg = (38, 48, 62) if (hover or selected) else (26, 32, 40)
                 pygame.draw.rect(screen, bg, rect, border_radius=12)
-                txt = self.small.render(label, True, (240, 240, 240))
+                txt = text_surface(self.small, label, (240, 240, 240))
                 screen.blit(txt, txt.get_rect(center=rect.center))
 
         if getattr(self, "_toast", None):
             msg, t0 = self._toast
             if pygame.time.get_ticks() - t0 < 1400:
-                surf = self.small.render(msg, True, (240, 240, 240))
+                surf = text_surface(self.small, msg, (240, 240, 240))
                 r = surf.get_rect(center=(sw // 2, int(sh * 0.86)))
                 screen.blit(surf, r)
             else:
@@ -385,6 +393,22 @@ class PauseMenuState:
         return snap
 
 
+    def _save_to(self, path: str) -> None:
+        # Snapshot jetzt, Schreiben (Save + Thumbnail) im Save-Thread; die Preview-Surface gehört ab hier dem Thread
+        from core.save_system import save_game_async
+        preview, self._save_preview = getattr(self, "_save_preview", None), None
+        self._save_job = save_game_async(self.ctx, path, preview=preview)
+        self._toast = ("Speichere ...", pygame.time.get_ticks())
+
+    def _load_from(self, path: str) -> None:
+        from core.save_system import load_game
+        if load_game(self.ctx, path):
+            self.game.pop()
+            from states.world import WorldMapState
+            self.game.replace(WorldMapState())
+        else:
+            self._toast = ("Kein Savegame gefunden.", pygame.time.get_ticks())
+
     def _activate(self, label: str) -> None:
         # Click SFX
         audio = getattr(self.ctx, "audio", None)
@@ -401,30 +425,32 @@ class PauseMenuState:
             if hasattr(self.game, "state_stack") and len(self.game.state_stack) >= 2:
                 below = self.game.state_stack[-2]
 
+            sw, sh = self.game.screen.get_size()
+            tmp = pygame.Surface((sw, sh), pygame.SRCALPHA)
             if below is not None:
-                sw, sh = self.game.screen.get_size()
-                tmp = pygame.Surface((sw, sh), pygame.SRCALPHA)
                 below.render(tmp)
-
-                from core.save_system import save_preview, save_game
-                save_preview(tmp)     # saves/preview.png
-                save_game(self.ctx)   # saves/savegame.json
             else:
-                from core.save_system import save_game
-                save_game(self.ctx)
+                tmp.fill((12, 14, 18))
+            self._save_preview = tmp
+
+            # 2) Slot wählen; Hintergrund = derselbe Screenshot mit Pause-Abdunklung
+            snap = tmp.copy()
+            overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 140))
+            snap.blit(overlay, (0, 0))
 
-            self._toast = ("Spiel gespeichert.", pygame.time.get_ticks())
+            from states.save_slots import SaveSlotsState
+            self.game.push(SaveSlotsState(mode="save", bg_mode="snapshot", bg_snapshot=snap, on_pick=self._save_to))
             return
 
         if label == "sign_load":
-            from core.save_system import load_game
-            ok = load_game(self.ctx)
-            if ok:
-                self.game.pop()
-                from states.world import WorldMapState
-                self.game.replace(WorldMapState())
-            else:
+            from core.save_slots import save_exists
+            if not save_exists():
                 self._toast = ("Kein Savegame gefunden.", pygame.time.get_ticks())
+                return
+            from states.save_slots import SaveSlotsState
+            snap = self._make_pause_background_snapshot()
+            self.game.push(SaveSlotsState(mode="load", bg_mode="snapshot", bg_snapshot=snap, on_pick=self._load_from))
             return
 
         if label == "sign_options":
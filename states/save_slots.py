@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pygame
+
+from core.assets import get_assets
+from core.ui_text import text_surface
+
+
+@dataclass
+class SaveSlotsState:
+    """
+    Slot-Auswahl zum Laden/Speichern. Liest nur die Save-Header (list_slots),
+    Thumbnails erst, wenn ein Slot ausgewählt ist.
+    on_pick(path) wird nach dem Schließen aufgerufen (der Aufrufer lädt/speichert).
+    """
+    game: Any = None
+    ctx: Any = None
+    fonts: Any = None
+
+    mode: str = "load"  # "load" | "save"
+    on_pick: Optional[Callable[[str], None]] = None
+
+    # background wie OptionsState: "menu" = ctx.menu_bg live, "snapshot" = eingefroren
+    bg_mode: str = "menu"
+    bg_snapshot: Optional[pygame.Surface] = None
+
+    selected: int = 0
+    scroll: int = 0
+
+    ROW_H = 38
+
+    def on_enter(self) -> None:
+        from core.ui_text import get_fonts
+        from core.save_slots import list_slots
+
+        if self.fonts is None:
+            self.fonts = get_fonts()
+        self.title_font = self.fonts.get(44)
+        self.body_font = self.fonts.get(22)
+        self.small_font = self.fonts.get(16)
+
+        self._click_sfx = os.path.join("assets", "sfx", "ui_click.mp3")
+        self._bg_path = os.path.join("assets", "ui", "bg_stats.png")
+        self._back_img = get_assets().image(os.path.join("assets", "ui", "back.png"), owner=self)
+
+        # altes Einzel-Savegame nur beim Laden anbieten
+        self.slots = list_slots(include_legacy=(self.mode == "load"))
+        self._thumbs: Dict[Tuple[str, float], Optional[pygame.Surface]] = {}
+
+        used = [i for i, s in enumerate(self.slots) if not s.empty]
+        if self.mode == "load":
+            # zuletzt gespeicherter Slot vorausgewählt
+            self.selected = max(used, key=lambda i: self.slots[i].mtime) if used else 0
+        else:
+            empty = [i for i, s in enumerate(self.slots) if s.empty]
+            self.selected = empty[0] if empty else 0
+        self.scroll = 0
+
+    def on_exit(self) -> None:
+        get_assets().release(self)
+
+    # ----------------------------
+    # Input
+    # ----------------------------
+    def handle_event(self, event) -> None:
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.game.pop()
+                return
+            if event.key in (pygame.K_UP, pygame.K_w):
+                self.selected = (self.selected - 1) % len(self.slots)
+                return
+            if event.key in (pygame.K_DOWN, pygame.K_s):
+                self.selected = (self.selected + 1) % len(self.slots)
+                return
+            if event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                self._pick(self.selected)
+                return
+
+        if event.type == pygame.MOUSEWHEEL:
+            self.selected = max(0, min(len(self.slots) - 1, self.selected - event.y))
+            return
+
+        if event.type == pygame.MOUSEMOTION:
+            i = self._row_at(event.pos)
+            if i is not None:
+                self.selected = i
+            return
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            panel = self._panel_rect(self.game.screen.get_size())
+            if self._back_button_rect(panel).collidepoint(event.pos):
+                self._play_click()
+                self.game.pop()
+                return
+            i = self._row_at(event.pos)
+            if i is not None:
+                self.selected = i
+                self._pick(i)
+
+    def _pick(self, i: int) -> None:
+        info = self.slots[i]
+        if self.mode == "load" and info.empty:
+            return
+        self._play_click()
+        self.game.pop()
+        if self.on_pick is not None:
+            self.on_pick(info.path)
+
+    # ----------------------------
+    # Update / Render
+    # ----------------------------
+    def update(self, dt: float) -> None:
+        if self.bg_mode == "menu":
+            bg = getattr(self.ctx, "menu_bg", None)
+            if bg is not None:
+                bg.update(dt)
+
+    def is_idle(self) -> bool:
+        # Snapshot-Hintergrund ist statisch, das Menü-Video nicht
+        return self.bg_mode != "menu"
+
+    def render(self, screen: pygame.Surface) -> None:
+        sw, sh = screen.get_size()
+
+        # --- background ---
+        bg = getattr(self.ctx, "menu_bg", None) if self.bg_mode == "menu" else None
+        if bg is not None:
+            bg.draw(screen)
+        elif self.bg_snapshot is not None:
+            screen.blit(self.bg_snapshot, (0, 0))
+        else:
+            screen.fill((12, 14, 18))
+
+        dim = pygame.Surface((sw, sh), pygame.SRCALPHA)
+        dim.fill((0, 0, 0, 140))
+        screen.blit(dim, (0, 0))
+
+        # --- panel (bg_stats auf Panelgröße, über den AssetManager gecacht) ---
+        panel = self._panel_rect((sw, sh))
+        panel_bg = get_assets().image(self._bg_path, size=panel.size, owner=self)
+        if panel_bg is not None:
+            screen.blit(panel_bg, panel.topleft)
+            overlay = pygame.Surface(panel.size, pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 80))
+            screen.blit(overlay, panel.topleft)
+        else:
+            fallback = pygame.Surface(panel.size, pygame.SRCALPHA)
+            fallback.fill((20, 20, 24, 235))
+            screen.blit(fallback, panel.topleft)
+
+        title = "SPIEL LADEN" if self.mode == "load" else "SPIEL SPEICHERN"
+        screen.blit(text_surface(self.title_font, title, (240, 240, 240)), (panel.x + 22, panel.y + 16))
+
+        # --- Slot-Liste ---
+        list_rect = self._list_rect(panel)
+        visible = self._visible_rows(list_rect)
+        self._clamp_scroll(visible)
+        for row in range(visible):
+            i = self.scroll + row
+            if i >= len(self.slots):
+                break
+            self._draw_row(screen, pygame.Rect(list_rect.x, list_rect.y + row * self.ROW_H, list_rect.w, self.ROW_H - 4), i)
+
+        # --- Details zum gewählten Slot ---
+        self._draw_details(screen, panel, list_rect)
+
+        self._draw_button(screen, self._back_button_rect(panel))
+
+    def _draw_row(self, screen: pygame.Surface, rect: pygame.Rect, i: int) -> None:
+        info = self.slots[i]
+        disabled = self.mode == "load" and info.empty
+
+        if i == self.selected:
+            bg = pygame.Surface(rect.size, pygame.SRCALPHA)
+            bg.fill((255, 255, 255, 30 if not disabled else 12))
+            screen.blit(bg, rect.topleft)
+
+        name = "Altes Savegame" if info.slot == 0 else f"Slot {info.slot:02d}"
+        col = (150, 150, 160) if disabled else (240, 240, 240)
+        surf = text_surface(self.body_font, name, col)
+        screen.blit(surf, (rect.x + 10, rect.centery - surf.get_height() // 2))
+
+        if info.empty:
+            desc = "leer"
+        else:
+            m = info.meta or {}
+            desc = f"Tag {m.get('day', '?')}  {m.get('time_str', '')}  |  Level {m.get('level', '?')}"
+        surf = text_surface(self.small_font, desc, (200, 200, 210) if not disabled else (130, 130, 140))
+        screen.blit(surf, (rect.x + 150, rect.centery - surf.get_height() // 2))
+
+    def _draw_details(self, screen: pygame.Surface, panel: pygame.Rect, list_rect: pygame.Rect) -> None:
+        info = self.slots[self.selected]
+        x = list_rect.right + 24
+        w = panel.right - 28 - x
+        y = list_rect.y
+
+        img = self._thumb(info, w)
+        if img is not None:
+            screen.blit(img, (x, y))
+            y += img.get_height() + 12
+
+        if info.empty:
+            lines = ["Leerer Slot"] if self.mode == "save" else ["Kein Savegame"]
+        else:
+            m = info.meta or {}
+            enc_pct = int(max(0.0, min(1.0, float(m.get("enc_meter", 0.0)))) * 100)
+            lines = [
+                f"Tag {m.get('day', '?')}  |  {m.get('time_str', '')}",
+                f"Level {m.get('level', '?')}  |  XP {m.get('xp', 0)}",
+                f"Gold {m.get('money', 0)}  |  Gefahr {enc_pct}%",
+                time.strftime("Gespeichert %d.%m.%Y %H:%M", time.localtime(info.mtime)),
+            ]
+            if self.mode == "save":
+                lines.append("Wird überschrieben.")
+
+        for line in lines:
+            surf = text_surface(self.small_font, line, (240, 240, 240))
+            screen.blit(surf, (x, y))
+            y += surf.get_height() + 6
+
+    def _thumb(self, info, width: int) -> Optional[pygame.Surface]:
+        # erst bei Auswahl laden (liest nur den Thumbnail-Bereich der Datei), dann pro Slot+mtime cachen
+        if info.empty:
+            return None
+        key = (info.path, info.mtime)
+        if key not in self._thumbs:
+            from core.save_slots import load_slot_thumbnail
+            img = load_slot_thumbnail(info)
+            if img is not None:
+                h = int(width * img.get_height() / max(1, img.get_width()))
+                img = pygame.transform.smoothscale(img.convert_alpha(), (width, h))
+            self._thumbs[key] = img
+        return self._thumbs[key]
+
+    # ----------------------------
+    # Layout helpers
+    # ----------------------------
+    def _panel_rect(self, size: Tuple[int, int]) -> pygame.Rect:
+        sw, sh = size
+        panel = pygame.Rect(0, 0, int(min(960, sw * 0.80)), int(min(600, sh * 0.80)))
+        panel.center = (sw // 2, sh // 2)
+        return panel
+
+    def _list_rect(self, panel: pygame.Rect) -> pygame.Rect:
+        top = panel.y + 84
+        return pygame.Rect(panel.x + 22, top, int(panel.w * 0.50), panel.bottom - 110 - top)
+
+    def _visible_rows(self, list_rect: pygame.Rect) -> int:
+        return max(1, list_rect.h // self.ROW_H)
+
+    def _clamp_scroll(self, visible: int) -> None:
+        # Liste scrollt mit der Auswahl (Tastatur/Mausrad)
+        if self.selected < self.scroll:
+            self.scroll = self.selected
+        elif self.selected >= self.scroll + visible:
+            self.scroll = self.selected - visible + 1
+        self.scroll = max(0, min(self.scroll, len(self.slots) - visible))
+
+    def _row_at(self, pos: Tuple[int, int]) -> Optional[int]:
+        list_rect = self._list_rect(self._panel_rect(self.game.screen.get_size()))
+        if not list_rect.collidepoint(pos):
+            return None
+        i = self.scroll + (pos[1] - list_rect.y) // self.ROW_H
+        if i >= min(len(self.slots), self.scroll + self._visible_rows(list_rect)):
+            return None
+        return i
+
+    def _back_button_rect(self, panel: pygame.Rect) -> pygame.Rect:
+        r = pygame.Rect(0, 0, 220, 72)
+        r.bottomright = (panel.right - 28, panel.bottom - 20)
+        return r
+
+    def _draw_button(self, screen: pygame.Surface, rect: pygame.Rect) -> None:
+        hover = rect.collidepoint(pygame.mouse.get_pos())
+        img = get_assets().image(os.path.join("assets", "ui", "back.png"), size=rect.size, owner=self) \
+            if self._back_img is not None else None
+        if img is not None:
+            screen.blit(img, rect.topleft)
+        else:
+            bg = pygame.Surface(rect.size, pygame.SRCALPHA)
+            bg.fill((40, 40, 48, 220))
+            screen.blit(bg, rect.topleft)
+            pygame.draw.rect(screen, (255, 255, 255), rect, 1, border_radius=12)
+            surf = text_surface(self.body_font, "Zurück", (240, 240, 240))
+            screen.blit(surf, surf.get_rect(center=rect.center))
+        if hover:
+            glow = pygame.Surface(rect.size, pygame.SRCALPHA)
+            glow.fill((255, 255, 255, 35))
+            screen.blit(glow, rect.topleft)
+
+    def _play_click(self) -> None:
+        audio = getattr(self.ctx, "audio", None)
+        if audio is not None:
+            audio.play_sfx(self._click_sfx)
@@ -16,10 +16,9 @@ class NewGameSetupState:
     font: Optional[pygame.font.Font] = None
 
     def on_enter(self) -> None:
-        from core.ui_text import FontBank, TextStyle, render_text
-        from settings import UI_FONT_PATH, UI_FONT_FALLBACK
+        from core.ui_text import get_fonts, TextStyle, render_text
 
-        self._fonts = FontBank(UI_FONT_PATH, UI_FONT_FALLBACK)
+        self._fonts = get_fonts()
         self.font = self._fonts.get(28)
         self.small = self._fonts.get(14)
 
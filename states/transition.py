@@ -6,6 +6,7 @@ import math
 import pygame
 
 from settings import SCREEN_W, SCREEN_H
+from core.assets import get_assets
 
 
 def _ease_in_out(t: float) -> float:
@@ -46,30 +47,18 @@ class TransitionState:
             self.snapshot.fill((10, 12, 18))
 
         # load wave texture (optional)
-        self._wave = None
-        try:
-            # Debug: absolute existence check
-            if os.path.exists(self.wave_path):
-                img = pygame.image.load(self.wave_path).convert_alpha()
-
-                # Normalize thickness (so intrude math is deterministic)
-                # Target thickness in pixels (edge "depth")
-                self._wave_thickness = 160
-
-                # scale so height == thickness (top/bottom usage)
-                w = img.get_width()
-                h = img.get_height()
-                if h != self._wave_thickness:
-                    new_w = max(1, int(w * (self._wave_thickness / float(h))))
-                    img = pygame.transform.smoothscale(img, (new_w, self._wave_thickness))
-
-                self._wave = img
-            else:
-                self._wave_thickness = 160
-                self._wave = None
-        except Exception:
-            self._wave_thickness = 160
-            self._wave = None
+        # Normalize thickness (so intrude math is deterministic)
+        # Target thickness in pixels (edge "depth")
+        self._wave_thickness = 160
+        assets = get_assets()
+        img = assets.image(self.wave_path)
+        if img is not None:
+            # scale so height == thickness (top/bottom usage)
+            w = img.get_width()
+            h = img.get_height()
+            new_w = max(1, int(w * (self._wave_thickness / float(h))))
+            img = assets.image(self.wave_path, (new_w, self._wave_thickness), owner=self)
+        self._wave = img
 
         # Time-Scale sichern und während Transition einfrieren
         self._prev_time_scale = getattr(self.ctx.clock, "time_scale", None)
@@ -78,6 +67,13 @@ class TransitionState:
         except Exception:
             pass
 
+        # Kampfprognose: wird während des Übergangs pro Frame verfeinert
+        self._odds = None
+        self._odds_font = None
+        if self.kind == "to_combat" and self.enemy_id:
+            from combat.odds import estimate_encounter_odds
+            self._odds = estimate_encounter_odds(self.ctx, self.enemy_id)
+
                 # Sicherheitsmaßnahme: Encounter-Wellenloop im Übergang ausblenden
         try:
             self.ctx.audio.stop_loop_sfx("enc_waves_level", fade_ms=250)
@@ -85,6 +81,7 @@ class TransitionState:
             pass
 
     def on_exit(self) -> None:
+        get_assets().release(self)
         try:
             # Clip sicher zurücksetzen, damit der nächste State normal rendert
             if hasattr(self.ctx, "screen") and self.ctx.screen:
@@ -107,6 +104,10 @@ class TransitionState:
 
     def update(self, dt: float) -> None:
         self._t += dt
+        odds = getattr(self, "_odds", None)
+        if odds is not None and not odds.final:
+            from combat.odds import estimate_encounter_odds
+            self._odds = estimate_encounter_odds(self.ctx, self.enemy_id)
         if self._t >= self.duration:
             self._finish()
 
@@ -178,11 +179,27 @@ class TransitionState:
             veil.fill((0, 0, 0, black_alpha))
             screen.blit(veil, (0, 0))
 
+        # Kampfprognose über der Verdunkelung (bleibt bis zum Kampf lesbar)
+        if getattr(self, "_odds", None) is not None:
+            self._draw_odds(screen)
+
         # Debug hint (remove later)
         if getattr(self, "_wave", None) is None:
             txt = pygame.font.SysFont("arial", 18).render("wave_edge.png NOT loaded", True, (255, 120, 120))
             screen.blit(txt, (12, 12))
 
+    def _draw_odds(self, screen: pygame.Surface) -> None:
+        from combat.odds import format_odds
+        W, H = screen.get_size()
+        if self._odds_font is None:
+            from core.ui_text import get_fonts
+            self._odds_font = get_fonts().get(28)
+
+        a = max(0.0, min(1.0, self._t / 0.35))
+        txt = self._odds_font.render(format_odds(self._odds), True, (235, 225, 200))
+        txt.set_alpha(int(255 * a))
+        screen.blit(txt, txt.get_rect(center=(W // 2, int(H * 0.86))))
+
     def _draw_wave_edges(self, screen: pygame.Surface, pe: float) -> None:
         W, H = screen.get_size()
         t_global = float(getattr(self, "_t", 0.0))
@@ -314,3 +331,65 @@ class TransitionState:
                         screen.blit(wave_r, (x, y0 + i * gap))
                 finally:
                     screen.set_clip(prev_clip)
+
+
+@dataclass
+class MapLoadingState:
+    """
+    Kurzer Lade-Übergang für Map-Wechsel, falls die Zielmap noch nicht fertig
+    im Hintergrund geladen ist. Liegt auf dem WorldMapState (push) und
+    schaltet die Map um, sobald der AssetStreamer fertig ist.
+    """
+    game = None
+    ctx = None
+
+    world: object = None
+    target_map: str = ""
+    spawn: Tuple[float, float] = (0.0, 0.0)
+
+    min_duration: float = 0.25  # kein hartes Flackern bei sehr schnellen Loads
+    fade_time: float = 0.20
+
+    def on_enter(self) -> None:
+        self._t = 0.0
+        self._font = None
+
+        # Spielzeit anhalten, solange geladen wird
+        self._prev_paused = bool(getattr(self.ctx.clock, "paused", False))
+        self.ctx.clock.paused = True
+
+    def on_exit(self) -> None:
+        self.ctx.clock.paused = self._prev_paused
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        # block input während des Ladens
+        pass
+
+    def update(self, dt: float) -> None:
+        self._t += dt
+        if self._t < self.min_duration:
+            return
+        if not self.world._is_map_ready(self.target_map):
+            return
+
+        world = self.world
+        self.game.pop()
+        world._switch_map(self.target_map, self.spawn)
+
+    def render(self, screen: pygame.Surface) -> None:
+        W, H = screen.get_size()
+        if self.world is not None:
+            self.world.render(screen)
+
+        a = max(0.0, min(1.0, self._t / max(0.001, self.fade_time)))
+        veil = pygame.Surface((W, H), pygame.SRCALPHA)
+        veil.fill((0, 0, 0, int(200 * _ease_in_out(a))))
+        screen.blit(veil, (0, 0))
+
+        if self._font is None:
+            from core.ui_text import get_fonts
+            self._font = get_fonts().get(32)
+
+        dots = "." * (1 + int(self._t * 3.0) % 3)
+        txt = self._font.render(f"Karte wird geladen{dots}", True, (230, 230, 230))
+        screen.blit(txt, txt.get_rect(center=(W // 2, H // 2)))
@@ -3,8 +3,7 @@ import pygame
 from dataclasses import dataclass
 from typing import Any
 
-from core.ui_text import FontBank, TextStyle, render_text
-from settings import UI_FONT_PATH, UI_FONT_FALLBACK
+from core.ui_text import get_fonts, TextStyle, render_text
 
 
 @dataclass
@@ -17,7 +16,7 @@ class VictoryState:
         if getattr(self.ctx, "clock", None) is not None:
             self.ctx.clock.time_scale = 0.0
 
-        self.fonts = FontBank(UI_FONT_PATH, UI_FONT_FALLBACK)
+        self.fonts = get_fonts()
         self.title_font = self.fonts.get(64, bold=True)
         self.text_font = self.fonts.get(28, bold=True)
         self.small_font = self.fonts.get(20)
@@ -46,6 +45,10 @@ class VictoryState:
     def update(self, dt: float) -> None:
         pass
 
+    def is_idle(self) -> bool:
+        # statischer Screen: ohne Input ändert sich nichts
+        return True
+
     def render(self, screen: pygame.Surface) -> None:
         w, h = screen.get_size()
 
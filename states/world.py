@@ -6,14 +6,78 @@ import os
 from settings import SCREEN_W, SCREEN_H
 import math
 from settings import TIME_SCALE_PAUSE, TIME_SCALE_1X, TIME_SCALE_2X, TIME_SCALE_4X
+from settings import TIME_SCALE_16X, TIME_SCALE_64X, WORLD_SIM_HZ, WORLD_SIM_MAX_STEPS, FAST_FORWARD_RENDER_FPS
+from settings import CONVOY_SPRITE_SIZE, CONVOY_INTERCEPT_RADIUS
 from core.water_fx import WakeSystem   
 from core.progression import xp_to_level
+from core.asset_stream import get_asset_streamer
+from core.dirty_render import DirtyRectRenderer
+from core.sprite_rotation import get_rotation_atlas
+from core.assets import NEAREST, get_assets
+from world.convoys import ConvoyField, SeaLane, build_sea_lane, shipment_schedule
+
+
+def _load_map_visual(path: str) -> pygame.Surface:
+    # kein convert() hier: läuft ggf. im Worker-Thread, convert macht der Main-Thread
+    img = pygame.image.load(path)
+    if img.get_bitsize() < 24:
+        tmp = pygame.Surface(img.get_size(), pygame.SRCALPHA)
+        tmp.blit(img, (0, 0))
+        img = tmp
+    if img.get_size() != (SCREEN_W, SCREEN_H):
+        img = pygame.transform.smoothscale(img, (SCREEN_W, SCREEN_H))
+    return img
+
+
+def _load_map_mask(path: str) -> pygame.Surface:
+    # WICHTIG: Nav-Maske ohne smoothscale, damit Farben exakt bleiben
+    img = pygame.image.load(path)
+    if img.get_size() != (SCREEN_W, SCREEN_H):
+        img = pygame.transform.scale(img, (SCREEN_W, SCREEN_H))  # nearest neighbor
+    return img
+
+
+def _build_nav_grid(nav: pygame.Surface) -> list[bytes]:
+    """
+    Befahrbarkeits-Grid aus der Navmap: grid[x][y] -> 1 (Wasser) / 0 (Land).
+    Gleiche Regel wie _is_sailable, aber kanalweise über Lookup-Tabellen statt get_at pro Pixel.
+    """
+    w, h = nav.get_size()
+    raw = pygame.image.tobytes(nav, "RGB")
+    r, g, b = raw[0::3], raw[1::3], raw[2::3]
+
+    def mask(chan: bytes, pred) -> int:
+        table = bytes(1 if pred(v) else 0 for v in range(256))
+        return int.from_bytes(chan.translate(table), "big")
+
+    blue_water = mask(b, lambda v: v >= 200) & mask(r, lambda v: v <= 60) & mask(g, lambda v: v <= 60)
+    white = mask(r, lambda v: v >= 230) & mask(g, lambda v: v >= 230) & mask(b, lambda v: v >= 230)
+    flat = (blue_water | white).to_bytes(w * h, "big")
+
+    # Spalten-Layout wie bisher (grid[x][y])
+    return [flat[x::w] for x in range(w)]
+
+
+def _load_map_bundle(cfg: dict) -> dict:
+    """
+    Lädt alle Layer einer Map + Nav-Grid. Thread-sicher (kein convert),
+    damit es im AssetStreamer im Hintergrund laufen kann.
+    """
+    nav = _load_map_mask(cfg["nav"])
+    return {
+        "visual": _load_map_visual(cfg["visual"]),
+        "nav": nav,
+        "nav_grid": _build_nav_grid(nav),
+        "trg": _load_map_mask(cfg["trg"]),
+        "enc": _load_map_mask(cfg["enc"]),
+    }
 
 
 @dataclass
 class WorldMapState:
     game = None
     ctx = None
+    owns_clear = True  # render() deckt den ganzen Screen selbst ab (Game.fill überspringen)
     font: Optional[pygame.font.Font] = None
     
     MAPS = {
@@ -42,30 +106,16 @@ class WorldMapState:
 
     def on_enter(self) -> None:
         # Masterlife icon (immer initialisieren)
-        self._ml_icon = None
-        try:
-            from settings import MASTER_LIFE_ICON
-            import os, pygame
-            if os.path.exists(MASTER_LIFE_ICON):
-                self._ml_icon = pygame.image.load(MASTER_LIFE_ICON).convert_alpha()
-                self._ml_icon_scaled_cache = {}
-
-        except Exception:
-            self._ml_icon = None
+        from settings import MASTER_LIFE_ICON, GOLD_ICON
+        assets = get_assets()
+        self._ml_icon = assets.image(MASTER_LIFE_ICON, owner=self)
+        self._ml_icon_scaled_cache = {}
 
         # --- Gold UI ---
-        self._gold_icon = None
-        self._gold_icon_scaled = None
-        try:
-            from settings import GOLD_ICON
-            if os.path.exists(GOLD_ICON):
-                self._gold_icon = pygame.image.load(GOLD_ICON).convert_alpha()
-                # Standardgröße (kannst du später easy ändern)
-                gold_size = 78
-                self._gold_icon_scaled = pygame.transform.smoothscale(self._gold_icon, (gold_size, gold_size))
-        except Exception:
-            self._gold_icon = None
-            self._gold_icon_scaled = None
+        self._gold_icon = assets.image(GOLD_ICON, owner=self)
+        # Standardgröße (kannst du später easy ändern)
+        gold_size = 78
+        self._gold_icon_scaled = assets.image(GOLD_ICON, (gold_size, gold_size), owner=self)
 
         # --- Player Stats Button / Menu ---
         self._stats_open = False
@@ -82,7 +132,7 @@ class WorldMapState:
         # ensure player_stats exists (created in combat otherwise)
         if not hasattr(self.ctx, "player_stats") or self.ctx.player_stats is None:
             try:
-                from states.combat import PlayerStats  # local import avoids global dependency
+                from combat.engine import PlayerStats  # local import avoids global dependency
                 self.ctx.player_stats = PlayerStats()
             except Exception:
                 # hard fallback: simple object with expected attrs
@@ -99,32 +149,18 @@ class WorldMapState:
         self._stats_btn = None
         self._stats_btn_hover_img = None
 
-        try:
-            surf = pygame.image.load(os.path.join("assets", "ui", "stats.png")).convert_alpha()
-            self._stats_btn = pygame.transform.smoothscale(surf, (120, 180))
-        except Exception:
-            self._stats_btn = None
-
-        try:
-            surf_h = pygame.image.load(os.path.join("assets", "ui", "stats_klick.png")).convert_alpha()
-            self._stats_btn_hover_img = pygame.transform.smoothscale(surf_h, (120, 180))
-        except Exception:
-            self._stats_btn_hover_img = None
+        self._stats_btn = assets.image(os.path.join("assets", "ui", "stats.png"), (120, 180), owner=self)
+        self._stats_btn_hover_img = assets.image(os.path.join("assets", "ui", "stats_klick.png"), (120, 180), owner=self)
         # --- Stats menu background image (assets/ui/bg_stats.png) ---
-        self._bg_stats = None
-        try:
-            self._bg_stats = pygame.image.load(os.path.join("assets", "ui", "bg_stats.png")).convert_alpha()
-        except Exception:
-            self._bg_stats = None
+        self._bg_stats = assets.image(os.path.join("assets", "ui", "bg_stats.png"), owner=self)
 
         # aktuelle Map (default)
         if not hasattr(self.ctx, "current_map_id") or not self.ctx.current_map_id:
             self.ctx.current_map_id = "world_01"
 
-        from core.ui_text import FontBank, TextStyle, render_text
-        from settings import UI_FONT_PATH, UI_FONT_FALLBACK
+        from core.ui_text import get_fonts, TextStyle, render_text
 
-        self._fonts = FontBank(UI_FONT_PATH, UI_FONT_FALLBACK)
+        self._fonts = get_fonts()
         self.font = self._fonts.get(22)
         self.small = self._fonts.get(14)
 
@@ -143,6 +179,12 @@ class WorldMapState:
         self._ship_sprite_cache = {}
         self._ship_sprite_size = (42, 42)
 
+        # Rotationen des eigenen Schiffs einmalig beim Laden vorrendern
+        try:
+            self._get_ship_rotations(self.ctx.content.ships[self.ctx.player.ship.id].name)
+        except Exception:
+            pass
+
         # in on_enter()
         self._ship_time = 0.0
 
@@ -158,8 +200,32 @@ class WorldMapState:
         self._ensure_ship_on_water()
         self._wake = WakeSystem()
 
+        # --- NPC-Konvois: Positionen aus (Abfahrt, Seeweg, Fortschritt), nicht simuliert ---
+        self._convoys = ConvoyField()
+        self._convoy_pose = ([], [], [])
+        self._convoy_types = []
+        self._convoy_lanes_pending = set()
+        if getattr(self.ctx, "convoy_ignore", None) is None:
+            self.ctx.convoy_ignore = set()
+
+        # --- Fixed-Timestep Sim (entkoppelt von der Render-FPS) ---
+        self._sim_step_dt = 1.0 / float(WORLD_SIM_HZ)
+        self._sim_acc = 0.0
+        self._ff_prev_scale = None
+        self._ff_render_acc = 0.0
+        self.skip_render = False
+        self._reset_ship_interpolation()
+
+        # --- Layered Rendering: statischer Layer + Dirty-Rects ---
+        self._static_layer = None
+        self._static_key = None
+        self._text_cache = {}
+        self._compositor = DirtyRectRenderer()
+        self._last_live_frame = -2
+        self.dirty_rects = None
+
         self._ship_loop_key = "ship_ambience"
-        self._ship_loop_path = os.path.join("assets", "sfx", "ship_waves_loop.wav")  # dein Pfad
+        self._ship_loop_path = self._resolve_sfx_path("ship_waves_loop")
         self._ship_loop_started = False
         self._ship_loop_vol = 0.0
 
@@ -179,8 +245,8 @@ class WorldMapState:
 
         xp_path = os.path.join("assets", "ui", "xp.png")
         try:
-            if os.path.exists(xp_path):
-                self._xp_panel_raw = pygame.image.load(xp_path).convert_alpha()
+            self._xp_panel_raw = assets.image(xp_path, owner=self)
+            if self._xp_panel_raw is not None:
 
                 # KOMPAKTER: weniger breit, etwas höher
                 panel_w = 220
@@ -193,8 +259,8 @@ class WorldMapState:
                 self._xp_fill = None
 
                 fill_path = os.path.join("assets", "ui", "xp_fill.png")
-                if os.path.exists(fill_path):
-                    self._xp_fill_raw = pygame.image.load(fill_path).convert_alpha()
+                self._xp_fill_raw = assets.image(fill_path, owner=self)
+                if self._xp_fill_raw is not None:
                     self._xp_fill = pygame.transform.smoothscale(self._xp_fill_raw, (panel_w, panel_h))
 
                 # Platzierung: unten links (screen-size nicht aus ctx nehmen)
@@ -245,13 +311,8 @@ class WorldMapState:
         BARO_SCALE_FRAME = 0.22   # kleineres Gehäuse
         BARO_SCALE_MARKER = 0.12  # Marker deutlich kleiner (wird zusätzlich auf Säulenbreite gefittet)
 
-        self._barometer_frame_raw = pygame.image.load(
-            os.path.join("assets", "ui", "barometer.png")
-        ).convert_alpha()
-
-        self._barometer_marker_raw = pygame.image.load(
-            os.path.join("assets", "ui", "level.png")
-        ).convert_alpha()
+        self._barometer_frame_raw = assets.image(os.path.join("assets", "ui", "barometer.png"), owner=self)
+        self._barometer_marker_raw = assets.image(os.path.join("assets", "ui", "level.png"), owner=self)
 
         # Frame scale
         fw, fh = self._barometer_frame_raw.get_size()
@@ -322,6 +383,7 @@ class WorldMapState:
 
     def on_exit(self) -> None:
         self.ctx.audio.stop_loop_sfx(self._ship_loop_key, fade_ms=800)
+        get_assets().release(self)
 
     def handle_event(self, event) -> None:
         # --- Stats menu input has priority ---
@@ -380,6 +442,9 @@ class WorldMapState:
             elif event.key == pygame.K_TAB:
                 self._cycle_time_speed()
                 self.ctx.audio.play_sfx(os.path.join("assets", "sfx", "ui_click.mp3"))
+            elif event.key == pygame.K_f:
+                self._cycle_fast_forward()
+                self.ctx.audio.play_sfx(os.path.join("assets", "sfx", "ui_click.mp3"))
 
 
             elif event.key == pygame.K_e:
@@ -451,12 +516,12 @@ class WorldMapState:
         else:
             sim_dt = dt * float(getattr(self.ctx.clock, "time_scale", 1.0))
 
-        self._ship_time += sim_dt
-
         if not hasattr(self, "_enc_meter"):
             self._enc_meter = 0.0
 
-        self._ui_t = float(getattr(self, "_ui_t", 0.0)) + float(dt)
+        # UI-Animationen (Barometer-Marker, Dock-Glow) stehen in der Pause -> Karte kann in den Leerlauf
+        if not self.ctx.clock.paused:
+            self._ui_t = float(getattr(self, "_ui_t", 0.0)) + float(dt)
         
 
         ship = self.ctx.player.ship
@@ -471,6 +536,96 @@ class WorldMapState:
         if has_input:
             desired = desired.normalize()
 
+        # --- Fixed-Timestep: Physik/Wake/Barometer laufen in festen Sim-Schritten ---
+        # Input wird einmal pro Frame gelesen und gilt für alle Schritte dieses Frames.
+        step_dt = self._sim_step_dt
+        self._sim_acc += sim_dt
+        steps = int(self._sim_acc / step_dt)
+        if steps > WORLD_SIM_MAX_STEPS:
+            # Hänger / extremer Schnellvorlauf: Rest verwerfen statt ewig aufzuholen
+            steps = WORLD_SIM_MAX_STEPS
+            self._sim_acc = steps * step_dt
+
+        for _ in range(steps):
+            self._sim_acc -= step_dt
+            self._prev_ship_pos = ship.pos
+            self._prev_ship_heading = ship.heading
+            if self._sim_step(step_dt, desired, has_input):
+                return  # Encounter -> State wurde ersetzt
+
+        # Render-Interpolation zwischen letztem und aktuellem Sim-Zustand (0..1)
+        self._sim_alpha = max(0.0, min(1.0, self._sim_acc / step_dt))
+
+        # Konvois einmal pro Frame (nicht pro Sim-Schritt) positionieren
+        self._update_convoys()
+        if self._check_convoy_intercept():
+            return
+
+        self._update_fast_forward_render(dt)
+
+        # --- Barometer -> waves_level Loop Volume (0..100 -> 0.40..0.80) ---
+        meter = float(getattr(self, "_enc_meter", 0.0))
+        meter = max(0.0, min(1.0, meter))
+        # Persist back to ctx (wichtig für Save)
+        self.ctx.enc_meter = float(getattr(self, "_enc_meter", 0.0))
+
+        if self._enc_waves_path and meter > 0.001:
+            # linear mapping 0..1 -> 0.40..0.80
+            vol = 0.40 + (0.80 - 0.40) * meter
+
+            # start loop once, then update volume
+            self.ctx.audio.play_loop_sfx(self._enc_sfx_loop_key, self._enc_waves_path, volume=vol)
+            self._enc_sfx_loop_started = True
+        else:
+            # if meter is basically 0: fade out loop
+            if self._enc_sfx_loop_started:
+                self.ctx.audio.stop_loop_sfx(self._enc_sfx_loop_key, fade_ms=300)
+                self._enc_sfx_loop_started = False
+
+
+        vx, vy = ship.vel
+        speed = math.hypot(vx, vy)
+
+        # Ziel: erst ab kleiner Bewegung hörbar, dann bis max aufziehen
+        min_speed = 18.0
+        max_speed = 260.0
+
+        # Test-Logik: Sobald Input aktiv ist, soll man es hören (unabhängig von min_speed)
+        if has_input:
+            target = 0.990  # fix zum Test
+        else:
+            # wenn kein Input: nach Speed ausblenden
+            if speed <= min_speed:
+                target = 0.0
+            else:
+                t = (speed - min_speed) / max(1.0, (max_speed - min_speed))
+                t = max(0.0, min(1.0, t))
+                target = 0.30 * t
+
+
+        # weiches Fade
+        fade_in = 1.2
+        fade_out = 0.9
+        if target > self._ship_loop_vol:
+            self._ship_loop_vol = min(target, self._ship_loop_vol + sim_dt / max(0.001, fade_in))
+        else:
+            self._ship_loop_vol = max(target, self._ship_loop_vol - sim_dt / max(0.001, fade_out))
+
+        # Loop einmal starten (mit 0 Volume), danach nur noch set_loop_volume
+        if not self._ship_loop_started:
+            self.ctx.audio.play_loop_sfx(self._ship_loop_key, self._ship_loop_path, volume=0.0)
+            self._ship_loop_started = True
+
+        self.ctx.audio.set_loop_volume(self._ship_loop_key, self._ship_loop_vol)
+
+    def _sim_step(self, step_dt: float, desired: pygame.Vector2, has_input: bool) -> bool:
+        """
+        Ein fester Sim-Schritt: Schiffsphysik, Wake, Map-Übergang, Encounter-Meter.
+        Gibt True zurück, wenn ein Encounter ausgelöst wurde (State ist dann ersetzt).
+        """
+        self._ship_time += step_dt
+        ship = self.ctx.player.ship
+
         # --- Zustand laden ---
         pos = pygame.Vector2(ship.pos[0], ship.pos[1])
         vel = pygame.Vector2(ship.vel[0], ship.vel[1])
@@ -494,7 +649,7 @@ class WorldMapState:
             acc -= vel * speed * self._ship_quad_drag
 
         # --- Integration ---
-        vel += acc * sim_dt
+        vel += acc * step_dt
         
         if has_input and vel.length_squared() > 1.0:
             # begrenzt, wie stark man die aktuelle Bewegungsrichtung pro Sekunde drehen kann
@@ -502,7 +657,7 @@ class WorldMapState:
             cur = vel.normalize()
             target = desired
             # blend towards target direction
-            blended = (cur.lerp(target, min(1.0, max_turn_per_sec * sim_dt))).normalize()
+            blended = (cur.lerp(target, min(1.0, max_turn_per_sec * step_dt))).normalize()
             vel = blended * vel.length()
 
         # Clamp speed
@@ -515,8 +670,8 @@ class WorldMapState:
             vel.update(0.0, 0.0)
 
         # --- Move + Collision/Slide über Navmap ---
-        nx = pos.x + vel.x * sim_dt
-        ny = pos.y + vel.y * sim_dt
+        nx = pos.x + vel.x * step_dt
+        ny = pos.y + vel.y * step_dt
 
         if self._is_sailable(nx, ny):
             pos.update(nx, ny)
@@ -533,7 +688,7 @@ class WorldMapState:
         # Persist back
         ship.pos = (pos.x, pos.y)
         ship.vel = (vel.x, vel.y)
-        self._wake.update(sim_dt, ship.pos, ship.vel)
+        self._wake.update(step_dt, ship.pos, ship.vel)
         # Optional: Heading für Sprite-Rotation aus Velocity ableiten
         if vel.length_squared() > 1.0:
             # Wir wollen: Down = 0°, Right = -90°, Left = +90°, Up = 180°
@@ -542,95 +697,83 @@ class WorldMapState:
             ship.heading = math.radians(heading_deg)
             
 
-        self._check_map_transition()
+        if self._check_map_transition():
+            return True
 
         # --- Encounter meter update (global, no reset on color change) ---
-        if sim_dt > 0.0:
-            enc_color = self._get_enc_color_at_ship()
-            self._enc_last_color = enc_color  # nur UI/Debug
-
-            cfg_map = self._encounter_cfg.get(self.ctx.current_map_id, {})
-            entry = cfg_map.get(enc_color) if enc_color is not None else None
-
-            if entry is None:
-                # Kein Treffer (außerhalb ODER Farbe nicht konfiguriert): immer decayn
-                self._enc_meter = max(0.0, self._enc_meter - self._enc_decay_per_sec * sim_dt)
-            else:
-                # Treffer: gainen
-                rate = float(entry.get("meter_per_sec", 0.10))
-                self._enc_meter = min(1.0, self._enc_meter + rate * sim_dt)
-
-                if self._enc_meter >= 1.0:
-                    # Guaranteed encounter
-                    if self._enc_meter >= 1.0:
-                        # Crash-SFX einmal abspielen, wenn 100% erreicht
-                        if self._enc_crash_path:
-                            self.ctx.audio.play_sfx(self._enc_crash_path)
-
-                        # Loop kurz ausblenden (wir gehen gleich in Transition/Combat)
-                        self.ctx.audio.stop_loop_sfx(self._enc_sfx_loop_key, fade_ms=250)
-                        self._enc_sfx_loop_started = False
-
-                        self._enc_meter = 0.0
-                        self.ctx.enc_meter = 0.0
-                        self._trigger_encounter_from_color(enc_color, entry)
-                        return
+        enc_color = self._get_enc_color_at_ship()
+        self._enc_last_color = enc_color  # nur UI/Debug
 
+        cfg_map = self._encounter_cfg.get(self.ctx.current_map_id, {})
+        entry = cfg_map.get(enc_color) if enc_color is not None else None
 
-        # --- Barometer -> waves_level Loop Volume (0..100 -> 0.40..0.80) ---
-        meter = float(getattr(self, "_enc_meter", 0.0))
-        meter = max(0.0, min(1.0, meter))
-        # Persist back to ctx (wichtig für Save)
-        self.ctx.enc_meter = float(getattr(self, "_enc_meter", 0.0))
-
-        if self._enc_waves_path and meter > 0.001:
-            # linear mapping 0..1 -> 0.40..0.80
-            vol = 0.40 + (0.80 - 0.40) * meter
-
-            # start loop once, then update volume
-            self.ctx.audio.play_loop_sfx(self._enc_sfx_loop_key, self._enc_waves_path, volume=vol)
-            self._enc_sfx_loop_started = True
+        if entry is None:
+            # Kein Treffer (außerhalb ODER Farbe nicht konfiguriert): immer decayn
+            self._enc_meter = max(0.0, self._enc_meter - self._enc_decay_per_sec * step_dt)
         else:
-            # if meter is basically 0: fade out loop
-            if self._enc_sfx_loop_started:
-                self.ctx.audio.stop_loop_sfx(self._enc_sfx_loop_key, fade_ms=300)
+            # Treffer: gainen
+            rate = float(entry.get("meter_per_sec", 0.10))
+            self._enc_meter = min(1.0, self._enc_meter + rate * step_dt)
+
+            if self._enc_meter >= 1.0:
+                # Guaranteed encounter
+                # Crash-SFX einmal abspielen, wenn 100% erreicht
+                if self._enc_crash_path:
+                    self.ctx.audio.play_sfx(self._enc_crash_path)
+
+                # Loop kurz ausblenden (wir gehen gleich in Transition/Combat)
+                self.ctx.audio.stop_loop_sfx(self._enc_sfx_loop_key, fade_ms=250)
                 self._enc_sfx_loop_started = False
 
+                self._enc_meter = 0.0
+                self.ctx.enc_meter = 0.0
+                self._reset_ship_interpolation()
+                self._trigger_encounter_from_color(enc_color, entry)
+                return True
 
-        vx, vy = ship.vel
-        speed = math.hypot(vx, vy)
-
-        # Ziel: erst ab kleiner Bewegung hörbar, dann bis max aufziehen
-        min_speed = 18.0
-        max_speed = 260.0
+        return False
 
-        # Test-Logik: Sobald Input aktiv ist, soll man es hören (unabhängig von min_speed)
-        if has_input:
-            target = 0.990  # fix zum Test
-        else:
-            # wenn kein Input: nach Speed ausblenden
-            if speed <= min_speed:
-                target = 0.0
-            else:
-                t = (speed - min_speed) / max(1.0, (max_speed - min_speed))
-                t = max(0.0, min(1.0, t))
-                target = 0.30 * t
+    def _reset_ship_interpolation(self) -> None:
+        # Nach Teleport/Spawn nicht über den Bildschirm interpolieren
+        ship = self.ctx.player.ship
+        self._prev_ship_pos = ship.pos
+        self._prev_ship_heading = ship.heading
+        self._sim_alpha = 1.0
 
+    def _get_interpolated_ship_pose(self) -> tuple[tuple[float, float], float]:
+        """
+        Render-Pose des Schiffs: zwischen vorletztem und letztem Sim-Schritt interpoliert.
+        """
+        ship = self.ctx.player.ship
+        prev = getattr(self, "_prev_ship_pos", None)
+        if prev is None:
+            return ship.pos, ship.heading
+
+        a = float(getattr(self, "_sim_alpha", 1.0))
+        x = prev[0] + (ship.pos[0] - prev[0]) * a
+        y = prev[1] + (ship.pos[1] - prev[1]) * a
+
+        # Heading über den kürzeren Winkel interpolieren
+        h0 = float(getattr(self, "_prev_ship_heading", ship.heading))
+        dh = (float(ship.heading) - h0 + math.pi) % math.tau - math.pi
+        return (x, y), h0 + dh * a
+
+    def _update_fast_forward_render(self, dt: float) -> None:
+        # Schnellvorlauf: Sim läuft voll, Rendering wird auf FAST_FORWARD_RENDER_FPS gedrosselt
+        clock = self.ctx.clock
+        ts = float(getattr(clock, "time_scale", TIME_SCALE_1X))
+        if clock.paused or ts < TIME_SCALE_16X or self._stats_open:
+            self._ff_render_acc = 0.0
+            self.skip_render = False
+            return
 
-        # weiches Fade
-        fade_in = 1.2
-        fade_out = 0.9
-        if target > self._ship_loop_vol:
-            self._ship_loop_vol = min(target, self._ship_loop_vol + sim_dt / max(0.001, fade_in))
+        self._ff_render_acc += float(dt)
+        interval = 1.0 / max(1.0, float(FAST_FORWARD_RENDER_FPS))
+        if self._ff_render_acc >= interval:
+            self._ff_render_acc %= interval
+            self.skip_render = False
         else:
-            self._ship_loop_vol = max(target, self._ship_loop_vol - sim_dt / max(0.001, fade_out))
-
-        # Loop einmal starten (mit 0 Volume), danach nur noch set_loop_volume
-        if not self._ship_loop_started:
-            self.ctx.audio.play_loop_sfx(self._ship_loop_key, self._ship_loop_path, volume=0.0)
-            self._ship_loop_started = True
-
-        self.ctx.audio.set_loop_volume(self._ship_loop_key, self._ship_loop_vol)
+            self.skip_render = True
 
     def _trigger_encounter_from_color(self, enc_color, entry: dict) -> None:
         import random
@@ -660,11 +803,15 @@ class WorldMapState:
         # Meter-Reset ist oben; hier nur Spam-Schutz:
         self._encounter_cooldown = 6.0
 
-    def _check_map_transition(self) -> None:
+    def _check_map_transition(self) -> bool:
+        """
+        Prüft den Trigger-Layer. Gibt True zurück, wenn ein Lade-Übergang gepusht wurde
+        (Sim-Schritte für diesen Frame dann abbrechen).
+        """
         ship = self.ctx.player.ship
         x, y = int(ship.pos[0]), int(ship.pos[1])
         if x < 0 or y < 0 or x >= SCREEN_W or y >= SCREEN_H:
-            return
+            return False
 
         r, g, b, *_ = self._map_trg.get_at((x, y))
         color = (r, g, b)
@@ -675,17 +822,53 @@ class WorldMapState:
         if color in transitions:
             target_map, target_spawn = transitions[color]
 
-            # 1) Map wechseln
-            self.ctx.current_map_id = target_map
+            # Assets noch nicht fertig gestreamt -> kurzer Lade-Übergang, Wechsel danach
+            if not self._is_map_ready(target_map):
+                from states.transition import MapLoadingState
+                self._prefetch_map(target_map)
+                st = MapLoadingState(world=self, target_map=target_map, spawn=target_spawn)
+                st.game = self.game
+                st.ctx = self.ctx
+                self.game.push(st)
+                return True
+
+            self._switch_map(target_map, target_spawn)
 
-            # 2) Zielspawn setzen
-            ship.pos = target_spawn
+        return False
 
-            # 3) Map-Assets/Cache laden, aber ohne Respawn-Logik
-            self._load_current_map_assets()
+    def _switch_map(self, target_map: str, target_spawn: tuple[float, float]) -> None:
+        ship = self.ctx.player.ship
+
+        # 1) Map wechseln
+        self.ctx.current_map_id = target_map
 
-            # 4) Nur sicherstellen, dass Spawn auf Wasser landet
-            self._ensure_ship_on_water()
+        # 2) Zielspawn setzen
+        ship.pos = target_spawn
+
+        # 3) Map-Assets/Cache laden, aber ohne Respawn-Logik
+        self._load_current_map_assets()
+
+        # 4) Nur sicherstellen, dass Spawn auf Wasser landet
+        self._ensure_ship_on_water()
+        self._reset_ship_interpolation()
+
+    def _is_map_ready(self, map_id: str) -> bool:
+        cache = getattr(self.ctx, "map_cache", None) or {}
+        if map_id in cache:
+            return True
+        return get_asset_streamer(self.ctx).is_ready(map_id)
+
+    def _prefetch_map(self, map_id: str) -> None:
+        cache = getattr(self.ctx, "map_cache", None) or {}
+        if map_id in cache or map_id not in self.MAPS:
+            return
+        get_asset_streamer(self.ctx).submit(map_id, _load_map_bundle, self.MAPS[map_id])
+
+    def _prefetch_neighbor_maps(self) -> None:
+        # Nachbar-Maps (laut transitions) schon beim Betreten im Hintergrund dekodieren
+        cfg = self.MAPS.get(self.ctx.current_map_id, {})
+        for target_map, _spawn in cfg.get("transitions", {}).values():
+            self._prefetch_map(target_map)
 
     def _load_current_map_assets(self) -> None:
         map_id = self.ctx.current_map_id
@@ -695,205 +878,276 @@ class WorldMapState:
             self.ctx.map_cache = {}
             cache = self.ctx.map_cache
 
-        if map_id in cache:
-            cached = cache[map_id]
-            self._map_visual = cached["visual"]
-            self._map_nav = cached["nav"]
-            self._nav_grid = cached["nav_grid"]
+        if map_id not in cache:
+            # Fertiges (oder laufendes) Hintergrund-Laden übernehmen, sonst synchron laden
+            bundle = None
+            streamer = get_asset_streamer(self.ctx)
+            if streamer.is_pending(map_id):
+                bundle = streamer.take(map_id, timeout=None)
+            if bundle is None:
+                bundle = _load_map_bundle(self.MAPS[map_id])
+
+            # convert() nur im Main-Thread
+            cache[map_id] = {
+                "visual": bundle["visual"].convert_alpha(),
+                "nav": bundle["nav"].convert(),
+                "nav_grid": bundle["nav_grid"],
+                "city_harbors": None,
+                "trg": bundle["trg"].convert(),
+                "enc": bundle["enc"].convert(),
+            }
+
+        cached = cache[map_id]
+        self._map_visual = cached["visual"]
+        self._map_nav = cached["nav"]
+        self._nav_grid = cached["nav_grid"]
+        self._map_trg = cached["trg"]
+        self._map_enc = cached["enc"]
+
+        # Häfen hängen an den Cities der aktuellen Map -> erst beim Betreten bauen
+        if cached.get("city_harbors") is None:
+            self._city_harbors = {}
+            self._build_city_harbors()
+            cached["city_harbors"] = self._city_harbors
+        else:
             self._city_harbors = cached["city_harbors"]
-            self._map_trg = cached["trg"]
-            self._map_enc = cached["enc"]
 
-            return
+        self._prefetch_neighbor_maps()
 
-        cfg = self.MAPS[map_id]
-        self._map_visual = self._load_and_scale_visual(cfg["visual"])
-        self._map_nav = self._load_and_scale_nav(cfg["nav"])
-        self._map_trg = self._load_and_scale_nav(cfg["trg"])
-        self._map_enc = self._load_and_scale_nav(cfg["enc"])
+    def render(self, screen) -> None:
+        # Bildschirmgröße merken für UI-Layout
+        self._last_screen_w = screen.get_width()
+        self._last_screen_h = screen.get_height()
 
+        # "live" = direkt auf den Game-Screen und wir sind oberster State.
+        # Nur dann stimmt Dirty-Rect-Rendering; Snapshots / Overlays (Pause, Laden) zeichnen voll.
+        game = self.game
+        live = game is not None and screen is getattr(game, "screen", None) and game.state is self
+        frame = int(getattr(game, "frame_index", 0))
 
-        self._nav_grid = [[False for _ in range(SCREEN_H)] for _ in range(SCREEN_W)]
-        for x in range(SCREEN_W):
-            for y in range(SCREEN_H):
-                r, g, b, *_ = self._map_nav.get_at((x, y))
-                is_blue_water = (b >= 200 and r <= 60 and g <= 60)
-                is_white = (r >= 230 and g >= 230 and b >= 230)
-                self._nav_grid[x][y] = (is_blue_water or is_white)
+        static = self._get_static_layer(screen.get_size())
 
-        self._city_harbors = {}
-        self._build_city_harbors()
+        comp = self._compositor if live else DirtyRectRenderer()
+        comp.begin()
+        self._queue_dynamic_layers(comp, screen)
 
-        cache[map_id] = {
-            "visual": self._map_visual,
-            "nav": self._map_nav,
-            "nav_grid": self._nav_grid,
-            "city_harbors": self._city_harbors,
-            "trg": self._map_trg,
-            "enc": self._map_enc,
+        partial = (
+            live and not self._stats_open and self._last_live_frame == frame - 1
+            and not getattr(game, "force_full_redraw", False)
+        )
+        rects = comp.present(screen, static, full=not partial)
 
-        }
+        if self._stats_open:
+            self._render_stats_menu(screen)
+            # Overlay liegt über allem -> nach dem Schließen wieder voll zeichnen
+            comp.reset()
+            rects = None
+
+        if live:
+            self._last_live_frame = frame
+            self.dirty_rects = rects
+
+    def _get_static_layer(self, size: tuple[int, int]) -> pygame.Surface:
+        """
+        Statischer Hintergrund: Map + City-Schilder + feste HUD-Rahmen.
+        Wird nur bei Map- oder Größenwechsel neu gebaut.
+        """
+        key = (self.ctx.current_map_id, tuple(size), id(self._map_visual))
+        if self._static_layer is not None and self._static_key == key:
+            return self._static_layer
+
+        sw, sh = size
+        layer = pygame.Surface((sw, sh)).convert()
+        layer.fill((12, 14, 18))
 
-    def render(self, screen) -> None:
-        world = self.ctx.world
-        player = self.ctx.player
         # Map background (fixed)
-        screen.blit(self._map_visual, (0, 0))
+        layer.blit(self._map_visual, (0, 0))
 
-        p = self.ctx.player
-        ml = int(getattr(p, "master_lives", 0))
-        ml_max = int(getattr(p, "master_lives_max", 3))
+        # City-Schilder (nur aktuelle Map)
+        for c in self.ctx.world.cities:
+            if getattr(c, "map_id", "world_01") != self.ctx.current_map_id:
+                continue
+            sign = self._get_city_sign(c.name)
+            if sign is not None:
+                sx = c.pos[0] - (sign.get_width() // 2)
+                sy = c.pos[1] - (sign.get_height() // 2)
+                layer.blit(sign, (sx, sy))
 
-        # Bildschirmgröße merken für UI-Layout
-        self._last_screen_w = screen.get_width()
-        self._last_screen_h = screen.get_height()
+        # Hinweiszeile ändert sich nie
+        hint = self.font.render("WASD: Steuern | E: Anlegen | SPACE: Pause | TAB: Zeit x4 | F: Schnellvorlauf", True, (150,150,150))
+        layer.blit(hint, (20, 50))
+
+        # --- UI background box for XP + Gold (bottom-left) ---
+        box_x = -4          # etwas vom Rand weg
+        box_w = 220        # Breite der UI-Spalte
+        box_h = 180        # Höhe für XP + Gold
+        box_y = sh - box_h - 4
+
+        ui_bg = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
+        pygame.draw.rect(
+            ui_bg,
+            (0, 0, 0, 130),   # Schwarz, transparent
+            ui_bg.get_rect(),
+            border_radius=16
+        )
+        layer.blit(ui_bg, (box_x, box_y))
+
+        # Barometer-Gehäuse (Marker kommt dynamisch)
+        baro = self._get_baro_rect(sw, sh)
+        layer.blit(self._barometer_frame, baro.topleft)
+
+        # XP-Panel (Fill kommt dynamisch)
+        if getattr(self, "_xp_panel", None) is not None:
+            layer.blit(self._xp_panel, self._get_xp_panel_rect(sh).topleft)
+
+        self._static_layer = layer
+        self._static_key = key
+        return layer
+
+    def _cached_text(self, slot: str, text: str, font: pygame.font.Font, color) -> pygame.Surface:
+        # Text-Surface pro Slot; nur neu rendern, wenn sich Text/Font/Farbe ändert
+        cache = getattr(self, "_text_cache", None)
+        if cache is None:
+            self._text_cache = {}
+            cache = self._text_cache
+
+        k = (text, id(font), tuple(color))
+        hit = cache.get(slot)
+        if hit is not None and hit[0] == k:
+            return hit[1]
+
+        surf = font.render(text, True, color)
+        cache[slot] = (k, surf)
+        return surf
+
+    def _queue_dynamic_layers(self, comp: DirtyRectRenderer, screen: pygame.Surface) -> None:
+        """
+        Meldet alle dynamischen Elemente (in Zeichenreihenfolge) beim Compositor an:
+        (name, key, rect, draw). Ändert sich key/rect nicht, wird das Element nicht neu gezeichnet.
+        """
+        world = self.ctx.world
+        player = self.ctx.player
+        sw, sh = screen.get_size()
+        baro = self._get_baro_rect(sw, sh)
+
+        ship_render_pos, ship_render_heading = self._get_interpolated_ship_pose()
 
         # -----------------------------
         # Master-Lives Anzeige (über Barometer)
         # -----------------------------
-        p = self.ctx.player
-        ml = int(getattr(p, "master_lives", 0))
-        ml_max = int(getattr(p, "master_lives_max", 3))
+        ml = int(getattr(player, "master_lives", 0))
+        ml_max = int(getattr(player, "master_lives_max", 3))
 
         size = 48
         gap = 10
-        sw, sh = screen.get_size()
-        baro = getattr(self, "_baro_rect", None)
-
-        # --------------- Dockable Cities + Signs + Prompts -----------------
-        dockable_any = False
-        ship_pos = self.ctx.player.ship.pos
+        total_h = ml_max * size + (ml_max - 1) * gap
+        start_y = baro.centery - total_h // 2
+
+        # negative Werte = Herzen rücken näher an die sichtbare Barometer-Kante (überlappen in den Baro-Rect)
+        pad = -60  # <- bei Bedarf -10 / -24 feinjustieren
+        start_x = max(8, baro.left - size - pad)
+        start_y = max(8, min(sh - total_h - 8, start_y))
+
+        if ml_max > 0:
+            if self._ml_icon is not None:
+                icon, icon_dim = self._get_master_life_icons(size)
+                lives_rect = pygame.Rect(start_x, start_y, size, total_h)
+
+                def draw_lives(surf, icon=icon, icon_dim=icon_dim, ml=ml, ml_max=ml_max, x=start_x, y=start_y, size=size, gap=gap):
+                    for i in range(ml_max):
+                        surf.blit(icon if i < ml else icon_dim, (x, y + i * (size + gap)))
+            else:
+                # Fallback ohne Icon
+                lives_rect = pygame.Rect(start_x, start_y, ml_max * (size + gap), size)
 
-        # Fallback, falls barometer rect nicht gesetzt
-        if baro is not None:
-            total_h = ml_max * size + (ml_max - 1) * gap
-            start_y = baro.centery - total_h // 2
+                def draw_lives(surf, ml=ml, ml_max=ml_max, x=start_x, y=start_y, size=size, gap=gap):
+                    for i in range(ml_max):
+                        col = (230, 230, 230) if i < ml else (120, 120, 120)
+                        pygame.draw.circle(
+                            surf,
+                            col,
+                            (x + i * (size + gap) + size // 2,
+                            y + size // 2),
+                            size // 2 - 4,
+                        )
 
-            # negative Werte = Herzen rücken näher an die sichtbare Barometer-Kante (überlappen in den Baro-Rect)
-            pad = -60  # <- bei Bedarf -10 / -24 feinjustieren
-            start_x = max(8, baro.left - size - pad)
+            comp.add("master_lives", (ml, ml_max), lives_rect, draw_lives)
 
-            sh = screen.get_height()
-            start_y = max(8, min(sh - total_h - 8, start_y))
-        else:
-            start_x = 24
-            start_y = 24
-
-        if self._ml_icon is not None:
-            icon = getattr(self, "_ml_icon_scaled_cache", {}).get(size)
-            if icon is None:
-                if not hasattr(self, "_ml_icon_scaled_cache"):
-                    self._ml_icon_scaled_cache = {}
-                icon = pygame.transform.smoothscale(self._ml_icon, (size, size))
-                self._ml_icon_scaled_cache[size] = icon
-
-            for i in range(ml_max):
-                ic = icon.copy()
-                if i >= ml:
-                    ic.set_alpha(70)
-                screen.blit(ic, (start_x, start_y + i * (size + gap)))
+        from settings import DOCK_RADIUS_MULT, DOCK_RADIUS_BONUS
 
-        else:
-            # Fallback ohne Icon
-            for i in range(ml_max):
-                col = (230, 230, 230) if i < ml else (120, 120, 120)
-                pygame.draw.circle(
-                    screen,
-                    col,
-                    (start_x + i * (size + gap) + size // 2,
-                    start_y + size // 2),
-                    size // 2 - 4,
-                )
-
-        from settings import DOCK_RADIUS_MULT, DOCK_RADIUS_BONUS  # <-- EINMAL oben bei den Imports platzieren
-
-        # Draw cities
+        # --------------- Dockable Cities (Glow) -----------------
+        dockable_any = False
+        ship_pos = player.ship.pos
+        glow_r = 28
         for c in world.cities:
             # ✅ WICHTIG: zuerst Map filtern, dann erst dock/hover/glow!
             if getattr(c, "map_id", "world_01") != self.ctx.current_map_id:
                 continue
 
             # --- Dock-Check: ist diese Stadt aktuell in Reichweite? ---
-            ship_pos = self.ctx.player.ship.pos
             hx, hy = self._city_harbors.get(c.id, c.pos)
             dx = hx - ship_pos[0]
             dy = hy - ship_pos[1]
 
             dist = (dx*dx + dy*dy) ** 0.5
             dock_r = c.harbor_radius * DOCK_RADIUS_MULT + DOCK_RADIUS_BONUS
-            dockable = dist <= dock_r
-
-            if dockable and not dockable_any:
-                dockable_any = True
-                dock_city = c
-
-            # --- Glow (nur auf aktueller Map) ---
-            if dockable:
-                self._draw_city_glow(screen, c.pos, base_r=28)
+            if dist > dock_r:
+                continue
+            dockable_any = True
 
-            # --- Schild ---
+            # Glow pulsiert -> jedes Frame neu; Schild liegt im statischen Layer,
+            # wird aber über dem Glow erneut gezeichnet (wie vorher: Glow unter Schild)
+            half = glow_r + 14
+            rect = pygame.Rect(0, 0, half * 2, half * 2)
+            rect.center = (int(c.pos[0]), int(c.pos[1]))
             sign = self._get_city_sign(c.name)
+            sign_pos = None
             if sign is not None:
-                sx = c.pos[0] - (sign.get_width() // 2)
-                sy = c.pos[1] - (sign.get_height() // 2)
-                screen.blit(sign, (sx, sy))
+                sign_pos = (c.pos[0] - (sign.get_width() // 2), c.pos[1] - (sign.get_height() // 2))
+                rect.union_ip(sign.get_rect(topleft=sign_pos))
+
+            pulse_key = int(float(getattr(self, "_ui_t", 0.0)) * 60.0)
+
+            def draw_glow(surf, c=c, sign=sign, sign_pos=sign_pos):
+                self._draw_city_glow(surf, c.pos, base_r=glow_r)
+                if sign is not None:
+                    surf.blit(sign, sign_pos)
+
+            comp.add(f"glow:{c.id}", pulse_key, rect, draw_glow)
 
         # --- Dock-Prompt beim Schiff ---
         if dockable_any:
-            ship_x, ship_y = ship_pos
-
             prompt_text = "E = Andocken"
 
             # größere & dickere Schrift
             prompt_font = self._fonts.get(24, bold=True)
 
             # Position leicht rechts oberhalb vom Schiff
-            px = ship_x + 18
-            py = ship_y - 28
-
-            self._draw_prompt_box(
-                screen,
-                prompt_text,
-                (px, py),
-                prompt_font,
-                padding=6,
-                bg_alpha=150
+            px = int(ship_render_pos[0] + 18)
+            py = int(ship_render_pos[1] - 28)
+
+            txt = self._cached_text(f"prompt:{prompt_text}", prompt_text, prompt_font, (245, 245, 245))
+            pw, ph = txt.get_size()
+            comp.add(
+                "dock_prompt", (px, py), pygame.Rect(px, py, pw + 12, ph + 12),
+                lambda surf: self._draw_prompt_box(surf, prompt_text, (px, py), prompt_font, padding=6, bg_alpha=150),
             )
 
         # HUD
         day = self.ctx.clock.day
         paused = "PAUSE" if self.ctx.clock.paused else ""
-        hud = self.font.render(f"Tag {day}  ZeitScale: {self.ctx.clock.time_scale:.2f}  {paused}", True, (200,200,200))
-        screen.blit(hud, (20, 20))
-        hint = self.font.render("WASD: Steuern | E: Anlegen | SPACE: Pause | TAB: Zeit x4", True, (150,150,150))
-        screen.blit(hint, (20, 50))
-
-        # --- UI background box for XP + Gold (bottom-left) ---
-        sw, sh = screen.get_size()
-
-        box_x = -4          # etwas vom Rand weg
-        box_w = 220        # Breite der UI-Spalte
-        box_h = 180        # Höhe für XP + Gold
-        box_y = sh - box_h - 4
-
-        ui_bg = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
-        pygame.draw.rect(
-            ui_bg,
-            (0, 0, 0, 130),   # Schwarz, transparent
-            ui_bg.get_rect(),
-            border_radius=16
-        )
-
-        screen.blit(ui_bg, (box_x, box_y))
+        hud_text = f"Tag {day}  ZeitScale: {self.ctx.clock.time_scale:.2f}  {paused}"
+        hud = self._cached_text("hud", hud_text, self.font, (200, 200, 200))
+        comp.add("hud", hud_text, hud.get_rect(topleft=(20, 20)), lambda surf: surf.blit(hud, (20, 20)))
 
         # --- Gold Anzeige (Icon + Text, ohne Hintergrundbox) ---
-        money = int(getattr(self.ctx.player, "money", 0))
+        money = int(getattr(player, "money", 0))
         money_txt = f"{money:,}".replace(",", ".")
 
         gx, gy = 10, 540  # feste Position
 
         icon = getattr(self, "_gold_icon_scaled", None)
-        txt_surf = self.font.render(money_txt, True, (235, 235, 200))
+        txt_surf = self._cached_text("gold", money_txt, self.font, (235, 235, 200))
         txt_w, txt_h = txt_surf.get_size()
 
         gap = 10  # Abstand Icon → Text
@@ -904,26 +1158,36 @@ class WorldMapState:
             # Text vertikal mittig zum Icon ausrichten
             ty = gy + (ih - txt_h) // 2
             tx = gx + iw + gap
+            gold_rect = pygame.Rect(gx, gy, iw, ih).union(pygame.Rect(tx, ty, txt_w, txt_h))
 
-            screen.blit(icon, (gx, gy))
-            screen.blit(txt_surf, (tx, ty))
+            def draw_gold(surf):
+                surf.blit(icon, (gx, gy))
+                surf.blit(txt_surf, (tx, ty))
         else:
             # Fallback ohne Icon
-            screen.blit(txt_surf, (gx, gy))
+            gold_rect = pygame.Rect(gx, gy, txt_w, txt_h)
 
+            def draw_gold(surf):
+                surf.blit(txt_surf, (gx, gy))
 
+        comp.add("gold", money_txt, gold_rect, draw_gold)
 
+        # NPC-Konvois: nur sichtbare materialisieren, alle in einem Compositor-Element
+        convoy_item = self._get_convoy_item(screen.get_rect())
+        if convoy_item is not None:
+            comp.add("convoys", *convoy_item)
 
-        # Draw wake (Particles)
-        self._wake.render(screen)
+        # Draw wake (Particles) – ändert sich nur, solange die Sim läuft
+        wake_rect = self._wake.bounds()
+        if wake_rect is not None:
+            comp.add("wake", self._ship_time, wake_rect, self._wake.render)
 
-        # Draw ship (Sprite)
+        # Draw ship (vorrotierte Frames statt rotozoom pro Frame)
         ship_name = self.ctx.content.ships[player.ship.id].name  # "Schaluppe"
-        sprite = self._get_ship_sprite(ship_name)
-
+        rotations = self._get_ship_rotations(ship_name)
 
-        if sprite is not None:
-            x, y = player.ship.pos
+        if rotations is not None:
+            x, y = ship_render_pos
 
             # Idle-Bobbing nur visuell
             vel = pygame.Vector2(player.ship.vel[0], player.ship.vel[1])
@@ -935,49 +1199,70 @@ class WorldMapState:
                 bob = math.sin(self._ship_time * 2.0) * 2.0
                 roll_deg = math.sin(self._ship_time * 1.4) * 3.0
 
-
             # Heading -> Grad (pygame rotozoom nutzt Grad)
             # Achtung: Sprite-Ausrichtung: falls dein PNG "nach oben" zeigt, musst du -90° offset geben.
-            heading_deg = -player.ship.heading * 57.29577951308232  # rad->deg
+            heading_deg = -ship_render_heading * 57.29577951308232  # rad->deg
+            frame_idx = rotations.index_for(heading_deg + roll_deg)
 
-            rotated = pygame.transform.rotozoom(sprite, heading_deg + roll_deg, 1.0)
+            rotated = rotations.frames[frame_idx]
             rect = rotated.get_rect(center=(int(x), int(y + bob)))
-            screen.blit(rotated, rect)
-            
-
+            comp.add("ship", (rect.topleft, frame_idx), rect, lambda surf: surf.blit(rotated, rect))
         else:
-            pygame.draw.circle(screen, (240, 240, 120), player.ship.pos, 6)
-
-        ship = self.ctx.player.ship
-        x, y = int(ship.pos[0]), int(ship.pos[1])
-
-        self._render_barometer(screen)
-
+            cx, cy = int(ship_render_pos[0]), int(ship_render_pos[1])
+            comp.add(
+                "ship", (cx, cy), pygame.Rect(cx - 7, cy - 7, 15, 15),
+                lambda surf: pygame.draw.circle(surf, (240, 240, 120), (cx, cy), 6),
+            )
 
+        # Barometer-Marker
+        marker_surf, (mx, my) = self._get_baro_marker(baro)
+        comp.add(
+            "baro_marker", (mx, my, marker_surf.get_size()), marker_surf.get_rect(topleft=(mx, my)),
+            lambda surf: surf.blit(marker_surf, (mx, my)),
+        )
 
-        self._draw_xp_bar(screen)
+        # XP-Fill
+        xp_item = self._get_xp_fill_item(sh)
+        if xp_item is not None:
+            comp.add("xp_fill", *xp_item)
 
-        self._render_stats_button(screen)
-        if self._stats_open:
-            self._render_stats_menu(screen)
+        # Stats-Button
+        btn_item = self._get_stats_button_item(baro)
+        if btn_item is not None:
+            comp.add("stats_btn", *btn_item)
 
-    def _render_barometer(self, screen: pygame.Surface) -> None:
-        """
-        Renders the barometer frame and moves the skull marker
-        vertically based on _enc_meter (0..1).
-        """
-        meter = max(0.0, min(1.0, float(getattr(self, "_enc_meter", 0.0))))
-
-        # Position: rechts, leicht eingerückt
+    def _get_master_life_icons(self, size: int) -> tuple[pygame.Surface, pygame.Surface]:
+        # (voll, abgedunkelt) – statt icon.copy() pro Leben und Frame
+        cache = getattr(self, "_ml_icon_scaled_cache", None)
+        if cache is None:
+            self._ml_icon_scaled_cache = {}
+            cache = self._ml_icon_scaled_cache
+
+        icons = cache.get(size)
+        if icons is None:
+            icon = pygame.transform.smoothscale(self._ml_icon, (size, size))
+            dim = icon.copy()
+            dim.set_alpha(70)
+            icons = (icon, dim)
+            cache[size] = icons
+        return icons
+
+    def _get_baro_rect(self, sw: int, sh: int) -> pygame.Rect:
         # Position: unten rechts
         margin_x = -65
         margin_y = -50
-        x = screen.get_width() - self._baro_w - margin_x
-        y = screen.get_height() - self._baro_h - margin_y
+        x = sw - self._baro_w - margin_x
+        y = sh - self._baro_h - margin_y
         self._baro_rect = pygame.Rect(x, y, self._baro_w, self._baro_h)
+        return self._baro_rect
 
-        # --- Frame ---
-        screen.blit(self._barometer_frame, (x, y))
+    def _get_baro_marker(self, baro: pygame.Rect) -> tuple[pygame.Surface, tuple[int, int]]:
+        """
+        Skull-Marker des Barometers: bewegt sich vertikal nach _enc_meter (0..1).
+        Gibt (Surface, Position) zurück; das Gehäuse liegt im statischen Layer.
+        """
+        meter = max(0.0, min(1.0, float(getattr(self, "_enc_meter", 0.0))))
+        x, y = baro.topleft
 
         # --- Marker movement ---
         # Marker bewegt sich innerhalb des Frames (oben/unten etwas Padding)
@@ -990,8 +1275,6 @@ class WorldMapState:
 
         # 0.0 = unten (SAFE), 1.0 = oben (DANGER)
         marker_y = track_bottom - int(track_height * meter)
-        marker_x = track_top + (track_height - self._marker_w) // 2
-
 
         t = float(getattr(self, "_ui_t", 0.0))
 
@@ -999,46 +1282,33 @@ class WorldMapState:
         float_px = int(math.sin(t * 2.2) * 2)
         marker_y += float_px
 
-        # --- Shake nur bei hoher Gefahr ---
-        if meter > 0.80:
-            strength = (meter - 0.80) / 0.20  # 0..1
-            shake = int(math.sin(t * 28.0) * (1 + 2 * strength))
-            marker_x += shake
-
-
-
         # Marker in der Säule zentrieren (nicht über das gesamte Gehäuse)
         pillar_left = x + (self._baro_w - self._baro_pillar_w) // 2
         marker_x = pillar_left + (self._baro_pillar_w - self._marker_w) // 2
 
-
         marker_surf = self._get_animated_marker_surface(meter, t)
         mx = marker_x + (self._marker_w - marker_surf.get_width()) // 2
         my = marker_y + (self._marker_h - marker_surf.get_height()) // 2
-        screen.blit(marker_surf, (mx, my))
+        return marker_surf, (mx, my)
 
-    def _render_stats_button(self, screen: pygame.Surface) -> None:
+    def _get_stats_button_item(self, baro: pygame.Rect):
         if getattr(self, "_stats_btn", None) is None:
-            return
-        if not hasattr(self, "_baro_rect"):
-            return
+            return None
 
         base = self._stats_btn
         hover_img = getattr(self, "_stats_btn_hover_img", None)
 
         bw, bh = base.get_width(), base.get_height()
-        x = self._baro_rect.centerx - bw // 2
-        y = self._baro_rect.top - bh - 10
+        x = baro.centerx - bw // 2
+        y = baro.top - bh - 10
         self._stats_btn_rect = pygame.Rect(x, y, bw, bh)
 
         mx, my = pygame.mouse.get_pos()
         hover = self._stats_btn_rect.collidepoint(mx, my)
 
         # Use hover flame image if available, else fall back to base
-        if hover and hover_img is not None:
-            screen.blit(hover_img, (x, y))
-        else:
-            screen.blit(base, (x, y))
+        img = hover_img if (hover and hover_img is not None) else base
+        return bool(hover), self._stats_btn_rect.copy(), lambda surf: surf.blit(img, (x, y))
 
     def _render_stats_menu(self, screen: pygame.Surface) -> None:
         # dim background
@@ -1277,7 +1547,20 @@ class WorldMapState:
 
         return surf
 
-    def _draw_xp_bar(self, screen) -> None:
+    def _get_xp_panel_rect(self, sh: int) -> pygame.Rect:
+        margin = -10
+        r = self._xp_panel.get_rect(bottomleft=(margin, sh - margin))
+        self._xp_panel_rect = r
+        return r
+
+    def _get_xp_fill_item(self, sh: int):
+        """
+        XP-Fill als dynamisches Element (Panel liegt im statischen Layer).
+        Key = sichtbare Breite -> nur bei XP-Änderung neu zeichnen.
+        """
+        if getattr(self, "_xp_panel", None) is None or getattr(self, "_xp_fill", None) is None:
+            return None
+
         xp = int(getattr(self.ctx.player, "xp", 0))
         lvl, cur, need = xp_to_level(xp)
         frac = 0.0 if need <= 0 else max(0.0, min(1.0, cur / need))
@@ -1286,39 +1569,30 @@ class WorldMapState:
         if lvl >= 10:
             frac = 1.0
 
-        # Panel-Variante (wenn xp.png vorhanden)
-        if getattr(self, "_xp_panel", None) is not None:
-            sw, sh = screen.get_size()
-            margin = -10
-
-            r = self._xp_panel.get_rect(bottomleft=(margin, sh - margin))
-            self._xp_panel_rect = r
-
-            # 1) Panel zuerst (Frame/Background)
-            screen.blit(self._xp_panel, r.topleft)
-
-            # 2) Fill (sichtbarer Anteil) – vertikal gestreckt
-            if getattr(self, "_xp_fill", None) is not None:
-                fill_pad_left = 22
-                fill_pad_right = 22
-                fill_y = 26
-                fill_h = 64  # <- DAS ist deine neue sichtbare Höhe (hier einstellen)
-
-                fill_rect = pygame.Rect(
-                    r.x + fill_pad_left,
-                    r.y + fill_y,
-                    r.width - fill_pad_left - fill_pad_right,
-                    fill_h
-                )
+        r = self._get_xp_panel_rect(sh)
 
-                visible = 0.10 + 0.90 * frac
-                vis_w = max(1, min(fill_rect.width, int(fill_rect.width * visible)))
+        # Fill (sichtbarer Anteil) – vertikal gestreckt
+        fill_pad_left = 22
+        fill_pad_right = 22
+        fill_y = 26
+        fill_h = 64  # <- DAS ist deine neue sichtbare Höhe (hier einstellen)
 
-                # Source slice: gleiche Koordinaten wie Panel, aber IMMER innerhalb des Fill-Bilds
-                src_x = fill_pad_left
-                src_y = fill_y
-                src_area = pygame.Rect(src_x, src_y, vis_w, fill_h)
-                screen.blit(self._xp_fill, fill_rect.topleft, src_area)
+        fill_rect = pygame.Rect(
+            r.x + fill_pad_left,
+            r.y + fill_y,
+            r.width - fill_pad_left - fill_pad_right,
+            fill_h
+        )
+
+        visible = 0.10 + 0.90 * frac
+        vis_w = max(1, min(fill_rect.width, int(fill_rect.width * visible)))
+
+        # Source slice: gleiche Koordinaten wie Panel, aber IMMER innerhalb des Fill-Bilds
+        src_area = pygame.Rect(fill_pad_left, fill_y, vis_w, fill_h)
+        fill = self._xp_fill
+
+        # Rect = ganzer Fill-Bereich, damit beim Schrumpfen (Level-Up) der alte Rest verschwindet
+        return vis_w, fill_rect, lambda surf: surf.blit(fill, fill_rect.topleft, src_area)
 
     def _get_ship_sprite(self, ship_type: str) -> pygame.Surface | None:
         # Robust: falls on_enter() nicht gelaufen ist
@@ -1332,19 +1606,35 @@ class WorldMapState:
             return self._ship_sprite_cache[key]
 
         p = os.path.join("assets", "ships", f"{ship_type}.png")
-        if not os.path.exists(p):
-            self._ship_sprite_cache[key] = None
-            return None
-
-        img = pygame.image.load(p).convert_alpha()
-        img = pygame.transform.scale(img, self._ship_sprite_size)
+        img = get_assets().image(p, self._ship_sprite_size, transform=NEAREST, owner=self)
         self._ship_sprite_cache[key] = img
         return img
 
+    def _get_ship_rotations(self, ship_type: str):
+        """
+        Rotations-Atlas für den Schiffstyp (prozessweit geteilt, z.B. auch für NPC-Schiffe).
+        Winkelauflösung richtet sich nach der Sprite-Größe.
+        """
+        sprite = self._get_ship_sprite(ship_type)
+        if sprite is None:
+            return None
+        return get_rotation_atlas((ship_type, sprite.get_size()), sprite)
+
+    def _get_convoy_rotations(self, ship_type: str):
+        # kleinere Sprites als das Spielerschiff, Atlas prozessweit geteilt
+        key = ("convoy", ship_type)
+        if key not in self._ship_sprite_cache:
+            p = os.path.join("assets", "ships", f"{ship_type}.png")
+            self._ship_sprite_cache[key] = get_assets().image(p, CONVOY_SPRITE_SIZE, owner=self)
+        sprite = self._ship_sprite_cache[key]
+        if sprite is None:
+            return None
+        return get_rotation_atlas((ship_type, sprite.get_size()), sprite)
+
     def _get_city_sign(self, city_name: str) -> pygame.Surface | None:
         """
-        Lädt ein City-Schild aus assets/ui/cities/<city_name>.png und cached es.
-        Fallback: None, wenn Datei fehlt oder Fehler.
+        Lädt ein City-Schild aus assets/ui/cities/<city_name>.png (bzw. kleingeschrieben) und cached es.
+        Fallback: None, wenn Datei fehlt oder Fehler (wird ebenfalls gecacht).
         """
         cache = getattr(self, "_city_sign_cache", None)
         if cache is None:
@@ -1354,41 +1644,26 @@ class WorldMapState:
         if city_name in cache:
             return cache[city_name]
 
+        assets = get_assets()
         safe = city_name.strip().lower()
-        path = os.path.join("assets", "ui", "cities", f"{city_name}.png")
-        if not os.path.exists(path):
-            safe = city_name.strip().lower()
-            path = os.path.join("assets", "ui", "cities", f"{safe}.png")
-            return None
-
-        try:
-            img = pygame.image.load(path).convert_alpha()
-
-            # --- Auto-Scale auf feste Höhe ---
-            target_h = int(getattr(self, "_city_sign_target_h", 32))
-            if target_h > 0 and img.get_height() != target_h:
-                scale = target_h / img.get_height()
-                new_w = max(1, int(img.get_width() * scale))
-                img = pygame.transform.smoothscale(img, (new_w, target_h))
-
-            cache[city_name] = img
-            return img
-        except Exception:
+        img = None
+        for name in (city_name, safe):
+            path = os.path.join("assets", "ui", "cities", f"{name}.png")
+            img = assets.image(path)
+            if img is not None:
+                break
+        if img is None:
             cache[city_name] = None
             return None
 
+        # --- Auto-Scale auf feste Höhe ---
+        target_h = int(getattr(self, "_city_sign_target_h", 32))
+        if target_h > 0 and img.get_height() != target_h:
+            scale = target_h / img.get_height()
+            new_w = max(1, int(img.get_width() * scale))
+            img = assets.image(path, (new_w, target_h), owner=self)
 
-    def _load_and_scale_visual(self, path: str) -> pygame.Surface:
-        img = pygame.image.load(path).convert_alpha()
-        if img.get_size() != (SCREEN_W, SCREEN_H):
-            img = pygame.transform.smoothscale(img, (SCREEN_W, SCREEN_H))
-        return img
-
-    def _load_and_scale_nav(self, path: str) -> pygame.Surface:
-        # WICHTIG: Nav-Maske ohne smoothscale, damit Farben exakt bleiben
-        img = pygame.image.load(path).convert()  # keine Alpha nötig
-        if img.get_size() != (SCREEN_W, SCREEN_H):
-            img = pygame.transform.scale(img, (SCREEN_W, SCREEN_H))  # nearest neighbor
+        cache[city_name] = img
         return img
 
 
@@ -1535,8 +1810,8 @@ class WorldMapState:
         """
         x, y = int(pos[0]), int(pos[1])
 
-        # Puls (0..1)
-        t = pygame.time.get_ticks() / 1000.0
+        # Puls (0..1), läuft mit der UI-Zeit (steht in der Pause)
+        t = float(getattr(self, "_ui_t", 0.0))
         pulse = 0.5 + 0.5 * math.sin(t * 3.0)  # Frequenz: 3.0 -> angenehmes Pulsieren
 
         r = int(base_r + pulse * 8)  # Radius pulsiert leicht
@@ -1574,13 +1849,17 @@ class WorldMapState:
         Zeichnet Text mit schwarzem, halbtransparentem Hintergrund.
         pos = (x, y) ist die linke obere Ecke der Box.
         """
-        # Text
-        txt = font.render(text, True, (245, 245, 245))
-        shadow = font.render(text, True, (0, 0, 0))
+        # Text (gecached, der Prompt steht meist viele Frames gleich da)
+        txt = self._cached_text(f"prompt:{text}", text, font, (245, 245, 245))
+        shadow = self._cached_text(f"prompt_shadow:{text}", text, font, (0, 0, 0))
 
         w, h = txt.get_size()
-        box = pygame.Surface((w + padding * 2, h + padding * 2), pygame.SRCALPHA)
-        box.fill((0, 0, 0, bg_alpha))
+        box_key = ("prompt_box", w + padding * 2, h + padding * 2, bg_alpha)
+        box = self._text_cache.get(box_key)
+        if box is None:
+            box = pygame.Surface((w + padding * 2, h + padding * 2), pygame.SRCALPHA)
+            box.fill((0, 0, 0, bg_alpha))
+            self._text_cache[box_key] = box
 
         x, y = int(pos[0]), int(pos[1])
 
@@ -1629,6 +1908,182 @@ class WorldMapState:
         # 3) Fallback: Startstadt (falls gesetzt), sonst erste City
         self._spawn_ship_at_start_harbor()
 
+    # --- NPC-Konvois ---------------------------------------------------------
+
+    CONVOY_SHIP_TYPES = ("Fleute", "Holk", "Karake")
+
+    def _get_sea_lane(self, src_id: str, dst_id: str) -> SeaLane | None:
+        """
+        Seeweg zwischen zwei Häfen der aktuellen Map. A* läuft einmal pro Route im
+        Hintergrund; Ergebnis (auch None = keine Route) liegt danach im map_cache.
+        """
+        map_id = self.ctx.current_map_id
+        lanes = self.ctx.map_cache[map_id].setdefault("sea_lanes", {})
+        key = (src_id, dst_id)
+        if key in lanes:
+            return lanes[key]
+
+        # Route wird nur in einer Richtung gesucht, Gegenrichtung = umgedreht
+        a_id, b_id = sorted(key)
+        job = f"lane:{map_id}:{a_id}:{b_id}"
+        streamer = get_asset_streamer(self.ctx)
+        if streamer.is_ready(job):
+            self._convoy_lanes_pending.discard(job)
+            lane = streamer.take(job)
+            lanes[(a_id, b_id)] = lane
+            lanes[(b_id, a_id)] = SeaLane(list(reversed(lane.points))) if lane is not None else None
+            return lanes[key]
+
+        a = self._city_harbors.get(a_id)
+        b = self._city_harbors.get(b_id)
+        if a is None or b is None:
+            return None
+        streamer.submit(job, build_sea_lane, self._nav_grid, a, b)
+        self._convoy_lanes_pending.add(job)
+        return None
+
+    def _sync_convoys(self) -> None:
+        """
+        Baut das ConvoyField nur neu, wenn sich die Shipment-Liste, der Tag oder die
+        Map geändert hat (oder ein Seeweg fertig gesucht wurde).
+        """
+        shipments = getattr(self.ctx, "npc_shipments", None) or []
+        map_id = self.ctx.current_map_id
+        day = int(self.ctx.clock.day)
+        sig = (map_id, day, id(shipments), len(shipments))
+
+        if sig == self._convoys.signature:
+            pending = self._convoy_lanes_pending
+            streamer = get_asset_streamer(self.ctx)
+            if not pending or not any(streamer.is_ready(job) for job in pending):
+                return
+
+        on_map = {c.id for c in self.ctx.content.cities_by_map.get(map_id, ())}
+        entries = []
+        for s in shipments:
+            # nur Routen innerhalb der aktuellen Map (kartenübergreifend gibt es keine Seewege)
+            if s.src_city_id == s.dst_city_id:
+                continue
+            if s.src_city_id not in on_map or s.dst_city_id not in on_map:
+                continue
+            lane = self._get_sea_lane(s.src_city_id, s.dst_city_id)
+            if lane is None:
+                continue
+            depart, duration = shipment_schedule(s, day)
+            entries.append((s, lane, depart, duration))
+
+        self._convoys.rebuild(entries, sig)
+        types = self.CONVOY_SHIP_TYPES
+        self._convoy_types = [types[sum(e[0].good_id.encode()) % len(types)] for e in entries]
+
+        # Abgefangene Konvois, die es nicht mehr gibt, vergessen
+        alive = {id(s) for s in shipments}
+        self.ctx.convoy_ignore &= alive
+
+    def _update_convoys(self) -> None:
+        self._sync_convoys()
+        clock = self.ctx.clock
+        now = float(clock.day) + float(clock.seconds_in_day) / max(1e-6, float(clock.day_length_seconds))
+        self._convoy_pose = self._convoys.positions(now)
+
+    def _check_convoy_intercept(self) -> bool:
+        """
+        Spieler fährt in einen Konvoi -> Gefecht gegen dessen Eskorte.
+        Im Hafenbereich wird nicht abgefangen. Gibt True zurück, wenn der State ersetzt wurde.
+        """
+        if not len(self._convoys):
+            return False
+
+        ship = self.ctx.player.ship
+        px, py = ship.pos
+        xs, ys, _angs = self._convoy_pose
+        hits = ConvoyField.within(xs, ys, px, py, CONVOY_INTERCEPT_RADIUS)
+        if not hits:
+            return False
+        if self._find_city_by_harbor_range(ship.pos) is not None:
+            return False
+
+        ignore = self.ctx.convoy_ignore
+        shipment = None
+        for i in hits:
+            s = self._convoys.shipments[i]
+            if id(s) not in ignore:
+                shipment = s
+                break
+        if shipment is None:
+            return False
+
+        # derselbe Konvoi löst (auch nach Flucht/Niederlage) nicht erneut aus
+        ignore.add(id(shipment))
+        self.ctx.convoy_intercept = shipment
+
+        from states.transition import TransitionState
+
+        snap = pygame.Surface((SCREEN_W, SCREEN_H))
+        self.render(snap)
+        self._reset_ship_interpolation()
+        self.game.replace(TransitionState(
+            kind="to_combat",
+            snapshot=snap,
+            focus=(px, py),
+            enemy_id=self._convoy_escort_for(shipment),
+        ))
+        return True
+
+    @staticmethod
+    def _convoy_escort_for(shipment) -> str:
+        # Eskorte skaliert mit der Ladung
+        qty = float(getattr(shipment, "qty", 0.0))
+        if qty >= 60.0:
+            return "pirate_frigate"
+        if qty >= 20.0:
+            return "pirate_brig"
+        return "pirate_sloop"
+
+    def _get_convoy_item(self, bounds: pygame.Rect):
+        """
+        (key, rect, draw) für alle Konvois im Bild oder None.
+        Sprites kommen aus den geteilten Rotations-Atlanten; deckungsgleiche Konvois
+        (gleiches Pixel, gleicher Frame) werden nur einmal geblittet.
+        """
+        if not len(self._convoys):
+            return None
+        pose = self._convoy_pose
+        visible = ConvoyField.visible_indices(pose[0], pose[1], (bounds.x, bounds.y, bounds.w, bounds.h))
+        if not visible:
+            return None
+
+        ship_types = self._convoy_types
+        atlases = {t: self._get_convoy_rotations(t) for t in self.CONVOY_SHIP_TYPES}
+        xs, ys, angs = ConvoyField.gather(pose, visible)
+
+        seen = set()
+        blits = []
+        x0 = y0 = 1 << 30
+        x1 = y1 = -(1 << 30)
+        for i, x, y, ang in zip(visible, xs, ys, angs):
+            ship_type = ship_types[i]
+            atlas = atlases[ship_type]
+            if atlas is None:
+                continue
+            fi = atlas.index_for(ang)
+            k = (int(x), int(y), fi, ship_type)
+            if k in seen:
+                continue
+            seen.add(k)
+
+            img = atlas.frames[fi]
+            w, h = img.get_size()
+            px, py = k[0] - w // 2, k[1] - h // 2
+            blits.append((img, (px, py)))
+            x0, y0 = min(x0, px), min(y0, py)
+            x1, y1 = max(x1, px + w), max(y1, py + h)
+
+        if not blits:
+            return None
+        key = frozenset(seen)
+        return key, pygame.Rect(x0, y0, x1 - x0, y1 - y0), lambda surf: surf.blits(blits, doreturn=False)
+
     def _cycle_time_speed(self) -> None:
         # Reihenfolge: Pause -> 1x -> 2x -> 4x
         # Wir verwenden paused als echten Pause-Schalter, time_scale bleibt 1/2/4.
@@ -1644,3 +2099,18 @@ class WorldMapState:
             self.ctx.clock.time_scale = TIME_SCALE_4X
         else:
             self.ctx.clock.paused = True
+
+    def _cycle_fast_forward(self) -> None:
+        # Reihenfolge: normal -> x16 -> x64 -> zurück zur vorherigen Geschwindigkeit
+        clock = self.ctx.clock
+        clock.paused = False
+
+        ts = float(getattr(clock, "time_scale", TIME_SCALE_1X))
+        if ts < TIME_SCALE_16X:
+            self._ff_prev_scale = ts
+            clock.time_scale = TIME_SCALE_16X
+        elif ts < TIME_SCALE_64X:
+            clock.time_scale = TIME_SCALE_64X
+        else:
+            clock.time_scale = getattr(self, "_ff_prev_scale", None) or TIME_SCALE_1X
+            self._ff_prev_scale = None
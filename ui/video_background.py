@@ -3,6 +3,10 @@ from __future__ import annotations
 
 import os
 import glob
+import hashlib
+import json
+import mmap
+import threading
 from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
@@ -10,32 +14,265 @@ from typing import Optional
 import pygame
 
 
+PACK_DIR = os.path.join("cache", "video")
+PACK_VERSION = 1
+
+
+def _fit_size(src_size: tuple[int, int], target: tuple[int, int], cover: bool) -> tuple[int, int]:
+    iw, ih = src_size
+    sw, sh = target
+    sx = sw / float(iw)
+    sy = sh / float(ih)
+    s = max(sx, sy) if cover else min(sx, sy)
+    return max(1, int(iw * s)), max(1, int(ih * s))
+
+
+def _decode_fitted(path: str, target: tuple[int, int], cover: bool) -> Optional[pygame.Surface]:
+    """PNG/JPG dekodieren und auf Zielgröße bringen (ohne convert -> geht im Hintergrund-Thread)."""
+    try:
+        img = pygame.image.load(path)
+    except Exception:
+        return None
+    iw, ih = img.get_size()
+    if iw <= 0 or ih <= 0:
+        return None
+    size = _fit_size((iw, ih), target, cover)
+    if size == (iw, ih):
+        return img
+    if img.get_bitsize() not in (24, 32):
+        img = img.convert(32, img.get_flags() & pygame.SRCALPHA)
+    return pygame.transform.smoothscale(img, size)
+
+
+# -----------------------------
+# Raw-Frame-Pack (optional, offline gebaut)
+# -----------------------------
+def _sources_signature(paths: list[str]) -> str:
+    # Name + Größe + mtime reicht (Frames werden nur komplett neu exportiert)
+    h = hashlib.sha1()
+    for p in paths:
+        st = os.stat(p)
+        h.update(f"{os.path.basename(p)}:{st.st_size}:{int(st.st_mtime)};".encode("utf-8"))
+    return h.hexdigest()
+
+
+def pack_paths(frames_dir: str, target: tuple[int, int]) -> tuple[str, str]:
+    name = os.path.basename(os.path.normpath(frames_dir))
+    base = os.path.join(PACK_DIR, f"{name}_{target[0]}x{target[1]}")
+    return base + ".raw", base + ".json"
+
+
+class FramePack:
+    """
+    Vorkonvertierte Frames (RGB, schon auf Zielgröße) in einer Datei, per mmap gelesen:
+    kein PNG-Decode und kein Skalieren zur Laufzeit.
+    """
+
+    def __init__(self, raw_path: str, frame_size: tuple[int, int], count: int):
+        self.frame_size = frame_size
+        self.count = count
+        self.frame_bytes = frame_size[0] * frame_size[1] * 3
+        self._file = open(raw_path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @classmethod
+    def open(cls, frames_dir: str, paths: list[str], target: tuple[int, int], cover: bool) -> Optional["FramePack"]:
+        raw_path, manifest = pack_paths(frames_dir, target)
+        try:
+            with open(manifest, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            meta.get("version") != PACK_VERSION
+            or meta.get("count") != len(paths)
+            or bool(meta.get("cover")) != bool(cover)
+            or meta.get("sources") != _sources_signature(paths)
+        ):
+            print(f"[Video] {manifest} is stale, run 'python -m ui.video_background {frames_dir}'")
+            return None
+        try:
+            pack = cls(raw_path, tuple(meta["frame_size"]), int(meta["count"]))
+        except (OSError, ValueError, KeyError):
+            return None
+        if len(pack._mm) < pack.frame_bytes * pack.count:
+            pack.close()
+            return None
+        return pack
+
+    def frame(self, idx: int) -> pygame.Surface:
+        off = idx * self.frame_bytes
+        # Kopie aus dem Mapping (memcpy), damit die Surface nicht am mmap hängt
+        return pygame.image.frombuffer(self._mm[off:off + self.frame_bytes], self.frame_size, "RGB")
+
+    def close(self) -> None:
+        try:
+            self._mm.close()
+        finally:
+            self._file.close()
+
+
+def build_pack(frames_dir: str, target: tuple[int, int], cover: bool = True) -> tuple[str, int]:
+    """Frames dekodieren, auf target bringen und als Raw-Pack (cache/video/) schreiben."""
+    paths = VideoBackground._scan_frames(frames_dir)
+    if not paths:
+        raise FileNotFoundError(f"no frames in {frames_dir}")
+    raw_path, manifest = pack_paths(frames_dir, target)
+    os.makedirs(os.path.dirname(raw_path), exist_ok=True)
+
+    frame_size = None
+    tmp = raw_path + ".tmp"
+    with open(tmp, "wb") as f:
+        for p in paths:
+            surf = _decode_fitted(p, target, cover)
+            if surf is None:
+                raise ValueError(f"cannot decode {p}")
+            if frame_size is None:
+                frame_size = surf.get_size()
+            elif surf.get_size() != frame_size:
+                surf = pygame.transform.smoothscale(surf, frame_size)
+            f.write(pygame.image.tobytes(surf, "RGB"))
+    os.replace(tmp, raw_path)
+
+    meta = {
+        "version": PACK_VERSION,
+        "count": len(paths),
+        "frame_size": list(frame_size),
+        "cover": bool(cover),
+        "sources": _sources_signature(paths),
+    }
+    with open(manifest, "w", encoding="utf-8") as f:
+        json.dump(meta, f, sort_keys=True)
+    return raw_path, len(paths)
+
+
+# -----------------------------
+# Decode-Thread
+# -----------------------------
+class _FrameDecoder:
+    """
+    Hintergrund-Thread, der die nächsten `lookahead` Frames ab dem aktuellen Index
+    dekodiert und auf Zielgröße skaliert (Ringpuffer). convert passiert im Main-Thread.
+    """
+
+    def __init__(self, paths: list[str], target: tuple[int, int], cover: bool, loop: bool,
+                 lookahead: int, pack: Optional[FramePack] = None):
+        self.paths = paths
+        self.target = target
+        self.cover = cover
+        self.loop = loop
+        self.lookahead = max(1, int(lookahead))
+        self.pack = pack
+
+        self._cond = threading.Condition()
+        self._ready: dict[int, Optional[pygame.Surface]] = {}
+        self._current = 0
+        self._busy: Optional[int] = None  # Frame, der gerade im Thread dekodiert wird
+        self._taken: set[int] = set()     # schon abgeholt (liegt im Cache des Main-Threads)
+        self._stop = False
+        self._thread = threading.Thread(target=self._run, name="video-decode", daemon=True)
+        self._thread.start()
+
+    def decode(self, idx: int) -> Optional[pygame.Surface]:
+        if self.pack is not None:
+            return self.pack.frame(idx)
+        return _decode_fitted(self.paths[idx], self.target, self.cover)
+
+    def _window(self) -> list[int]:
+        n = len(self.paths)
+        out = []
+        for k in range(min(self.lookahead, n)):
+            i = self._current + k
+            if i >= n:
+                if not self.loop:
+                    break
+                i %= n
+            out.append(i)
+        return out
+
+    def want(self, idx: int) -> None:
+        with self._cond:
+            if idx != self._current:
+                self._current = idx
+                window = set(self._window())
+                for i in [i for i in self._ready if i not in window]:
+                    del self._ready[i]
+                self._taken &= window
+                self._cond.notify()
+
+    def take(self, idx: int) -> tuple[bool, Optional[pygame.Surface]]:
+        """(fertig?, Surface) – Surface ist None, wenn der Frame nicht dekodiert werden konnte."""
+        with self._cond:
+            if idx in self._ready:
+                self._taken.add(idx)
+                return True, self._ready.pop(idx)
+        return False, None
+
+    def _next_missing(self) -> Optional[int]:
+        for i in self._window():
+            if i not in self._ready and i not in self._taken and i != self._busy:
+                return i
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                idx = self._next_missing()
+                while not self._stop and idx is None:
+                    self._cond.wait()
+                    idx = self._next_missing()
+                if self._stop:
+                    return
+                self._busy = idx
+
+            surf = self.decode(idx)
+
+            with self._cond:
+                self._busy = None
+                if idx in self._window():
+                    self._ready[idx] = surf
+
+    def close(self) -> None:
+        with self._cond:
+            self._stop = True
+            self._cond.notify()
+        self._thread.join(timeout=1.0)
+        if self.pack is not None:
+            self.pack.close()
+
+
 @dataclass
 class VideoBackground:
     """
     Spielt eine Frame-Sequenz (PNG/JPG/WebP) als 'Video' ab.
     - Kein echtes mp4 decoding zur Runtime
     - Sehr robust für PyGame/PyInstaller
+    - Ein Hintergrund-Thread dekodiert/skaliert die nächsten Frames vor; ist ein Frame noch
+      nicht fertig, bleibt der vorige stehen (statt den Render-Thread zu blockieren)
+    - Liegt ein Raw-Pack in cache/video/ (python -m ui.video_background <dir>), wird daraus gelesen
     """
     frames_dir: str
     fps: int = 30
     loop: bool = True
     cover: bool = True                # True = cover (füllt Screen), False = contain
-    cache_size: int = 24              # wie viele Frames als Surface im RAM gehalten werden
+    cache_size: int = 24              # wie viele fertige (skalierte) Frames als Surface im RAM gehalten werden
+    lookahead: int = 8                # so viele Frames dekodiert der Thread im Voraus
+    use_pack: bool = True             # Raw-Pack benutzen, falls vorhanden
 
     _frame_paths: list[str] = None
     _t: float = 0.0
     _index: int = 0
 
-    _cache: OrderedDict[int, pygame.Surface] = None
-    _last_scaled_key: Optional[tuple[int, int, int]] = None
-    _last_scaled_surf: Optional[pygame.Surface] = None
+    _cache: OrderedDict[tuple[int, int, int], pygame.Surface] = None
+    _decoder: Optional[_FrameDecoder] = None
+    _shown: Optional[pygame.Surface] = None
 
     def __post_init__(self) -> None:
         self._frame_paths = self._scan_frames(self.frames_dir)
         self._cache = OrderedDict()
 
-    def _scan_frames(self, frames_dir: str) -> list[str]:
+    @staticmethod
+    def _scan_frames(frames_dir: str) -> list[str]:
         exts = ("*.png", "*.jpg", "*.jpeg", "*.webp")
         paths: list[str] = []
         for pat in exts:
@@ -49,8 +286,8 @@ class VideoBackground:
     def reset(self) -> None:
         self._t = 0.0
         self._index = 0
-        self._last_scaled_key = None
-        self._last_scaled_surf = None
+        if self._decoder is not None:
+            self._decoder.want(0)
 
     def update(self, dt: float) -> None:
         if not self._frame_paths:
@@ -69,69 +306,88 @@ class VideoBackground:
                 else:
                     self._index = len(self._frame_paths) - 1
 
-        # invalidate scaled cache (neuer frame)
-        self._last_scaled_key = None
-        self._last_scaled_surf = None
+        if self._decoder is not None:
+            self._decoder.want(self._index)
 
-    def _load_frame(self, idx: int) -> Optional[pygame.Surface]:
-        if not self._frame_paths:
-            return None
+    def _ensure_decoder(self, target: tuple[int, int]) -> _FrameDecoder:
+        dec = self._decoder
+        if dec is not None and dec.target == target:
+            return dec
+        if dec is not None:
+            dec.close()
+            self._cache.clear()
+        pack = FramePack.open(self.frames_dir, self._frame_paths, target, self.cover) if self.use_pack else None
+        dec = _FrameDecoder(self._frame_paths, target, self.cover, self.loop, self.lookahead, pack)
+        dec.want(self._index)
+        self._decoder = dec
+        return dec
 
-        # clamp
-        idx = max(0, min(idx, len(self._frame_paths) - 1))
-
-        if idx in self._cache:
-            surf = self._cache.pop(idx)
-            self._cache[idx] = surf
+    def _frame(self, target: tuple[int, int]) -> Optional[pygame.Surface]:
+        key = (self._index, target[0], target[1])
+        surf = self._cache.get(key)
+        if surf is not None:
+            self._cache.move_to_end(key)
             return surf
 
-        path = self._frame_paths[idx]
-        try:
-            surf = pygame.image.load(path).convert_alpha()
-        except Exception:
-            return None
+        dec = self._ensure_decoder(target)
+        ready, raw = dec.take(self._index)
+        if not ready:
+            if self._shown is not None:
+                # Frame noch im Thread -> vorigen stehen lassen (kein Stocken)
+                return self._shown
+            # kalter Start: ersten Frame einmal synchron holen
+            raw = dec.decode(self._index)
+        if raw is None:
+            return self._shown
 
-        self._cache[idx] = surf
+        surf = raw.convert_alpha() if raw.get_flags() & pygame.SRCALPHA else raw.convert()
+        self._cache[key] = surf
         while len(self._cache) > max(1, int(self.cache_size)):
             self._cache.popitem(last=False)
-
         return surf
 
     def draw(self, screen: pygame.Surface) -> None:
         if not self._frame_paths:
             return
 
-        src = self._load_frame(self._index)
-        if src is None:
+        sw, sh = screen.get_size()
+        scaled = self._frame((sw, sh))
+        if scaled is None:
             return
+        self._shown = scaled
 
-        sw, sh = screen.get_size()
-        iw, ih = src.get_size()
+        # center blit
+        x = (sw - scaled.get_width()) // 2
+        y = (sh - scaled.get_height()) // 2
+        screen.blit(scaled, (x, y))
 
-        if iw <= 0 or ih <= 0:
-            return
+    def close(self) -> None:
+        """Decode-Thread beenden und Frames freigeben."""
+        if self._decoder is not None:
+            self._decoder.close()
+            self._decoder = None
+        self._cache.clear()
+        self._shown = None
 
-        # scaled cache (pro frame + screen size)
-        key = (self._index, sw, sh)
-        if self._last_scaled_key == key and self._last_scaled_surf is not None:
-            scaled = self._last_scaled_surf
-        else:
-            sx = sw / float(iw)
-            sy = sh / float(ih)
 
-            if self.cover:
-                s = max(sx, sy)  # cover
-            else:
-                s = min(sx, sy)  # contain
+def main(argv: Optional[list[str]] = None) -> None:
+    import argparse
 
-            tw = max(1, int(iw * s))
-            th = max(1, int(ih * s))
-            scaled = pygame.transform.smoothscale(src, (tw, th)).convert_alpha()
+    ap = argparse.ArgumentParser(description="Frame-Sequenz als Raw-Pack (cache/video/) vorkonvertieren")
+    ap.add_argument("frames_dir")
+    ap.add_argument("--size", default=None, help="Zielgröße WxH (Default: SCREEN_W x SCREEN_H)")
+    ap.add_argument("--contain", action="store_true", help="contain statt cover skalieren")
+    args = ap.parse_args(argv)
 
-            self._last_scaled_key = key
-            self._last_scaled_surf = scaled
+    if args.size:
+        w, h = (int(v) for v in args.size.lower().split("x"))
+    else:
+        from settings import SCREEN_W, SCREEN_H
+        w, h = SCREEN_W, SCREEN_H
 
-        # center blit
-        x = (sw - scaled.get_width()) // 2
-        y = (sh - scaled.get_height()) // 2
-        screen.blit(scaled, (x, y))
+    path, n = build_pack(args.frames_dir, (w, h), cover=not args.contain)
+    print(f"{args.frames_dir}: {n} frames -> {path} ({os.path.getsize(path) / 1048576.0:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
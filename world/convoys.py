@@ -0,0 +1,353 @@
+from __future__ import annotations
+import heapq
+import math
+from bisect import bisect_right
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # optional: ohne NumPy werden Positionen pro Konvoi berechnet
+    np = None
+
+
+LANE_CELL = 8          # Rastergröße (px) für die Seeweg-Suche
+LANE_LOS_STEP = 4.0    # Abtastschritt (px) für Sichtlinien beim Glätten
+
+
+class SeaLane:
+    """
+    Gecachter Seeweg zwischen zwei Häfen als Polyline mit kumulierten Längen.
+    """
+    __slots__ = ("points", "cum", "length")
+
+    def __init__(self, points: list[tuple[float, float]]):
+        if len(points) < 2:
+            points = [points[0], points[0]]
+        self.points = points
+        cum = [0.0]
+        for (ax, ay), (bx, by) in zip(points, points[1:]):
+            cum.append(cum[-1] + math.hypot(bx - ax, by - ay))
+        self.cum = cum
+        self.length = cum[-1]
+
+    def point_at(self, s: float) -> tuple[float, float, float]:
+        """(x, y, angle_deg) bei Bogenlänge s. angle wie beim Spieler-Sprite (Down = 0°)."""
+        s = max(0.0, min(self.length, s))
+        i = min(len(self.points) - 2, max(0, bisect_right(self.cum, s) - 1))
+        (ax, ay), (bx, by) = self.points[i], self.points[i + 1]
+        seg = self.cum[i + 1] - self.cum[i]
+        f = 0.0 if seg <= 1e-6 else (s - self.cum[i]) / seg
+        return ax + (bx - ax) * f, ay + (by - ay) * f, math.degrees(math.atan2(bx - ax, by - ay))
+
+
+def build_sea_lane(nav_grid, start: tuple[float, float], goal: tuple[float, float], cell: int = LANE_CELL) -> Optional[SeaLane]:
+    """
+    A* auf einem groben Wasser-Raster (cell px) zwischen zwei Hafenpositionen,
+    danach per Sichtlinie geglättet. Bevorzugt Wege mit Abstand zur Küste und fällt
+    für enge Durchfahrten auf das nackte Raster zurück.
+    Läuft ohne pygame -> kann im AssetStreamer laufen.
+    """
+    w = len(nav_grid)
+    h = len(nav_grid[0]) if w else 0
+    gw, gh = w // cell, h // cell
+    if gw <= 0 or gh <= 0:
+        return None
+
+    half = cell // 2
+    water = bytearray(gw * gh)
+    for cx in range(gw):
+        col = nav_grid[cx * cell + half]
+        for cy in range(gh):
+            water[cx * gh + cy] = 1 if col[cy * cell + half] else 0
+
+    for clearance in (1, 0):
+        open_cells = water if clearance == 0 else _erode(water, gw, gh, clearance)
+        lane = _search_lane(open_cells, gw, gh, cell, start, goal)
+        if lane is not None:
+            return lane
+    return None
+
+
+def _erode(water: bytearray, gw: int, gh: int, r: int) -> bytearray:
+    # Zelle ist nur offen, wenn alle Nachbarn im Radius r Wasser sind
+    out = bytearray(gw * gh)
+    for cx in range(r, gw - r):
+        for cy in range(r, gh - r):
+            ok = 1
+            for dx in range(-r, r + 1):
+                base = (cx + dx) * gh
+                for dy in range(-r, r + 1):
+                    if not water[base + cy + dy]:
+                        ok = 0
+                        break
+                if not ok:
+                    break
+            out[cx * gh + cy] = ok
+    return out
+
+
+def _search_lane(open_cells: bytearray, gw: int, gh: int, cell: int,
+                 start: tuple[float, float], goal: tuple[float, float]) -> Optional[SeaLane]:
+    half = cell // 2
+
+    def is_open(cx: int, cy: int) -> bool:
+        return 0 <= cx < gw and 0 <= cy < gh and bool(open_cells[cx * gh + cy])
+
+    def nearest_open_cell(p: tuple[float, float]) -> Optional[tuple[int, int]]:
+        cx0 = min(gw - 1, max(0, int(p[0]) // cell))
+        cy0 = min(gh - 1, max(0, int(p[1]) // cell))
+        for r in range(0, 12):
+            for dx in range(-r, r + 1):
+                for dy in range(-r, r + 1):
+                    if max(abs(dx), abs(dy)) == r and is_open(cx0 + dx, cy0 + dy):
+                        return cx0 + dx, cy0 + dy
+        return None
+
+    s = nearest_open_cell(start)
+    g = nearest_open_cell(goal)
+    if s is None or g is None:
+        return None
+
+    # A* (8 Nachbarn, Oktil-Heuristik)
+    sqrt2 = math.sqrt(2.0)
+
+    def heur(c: tuple[int, int]) -> float:
+        dx, dy = abs(c[0] - g[0]), abs(c[1] - g[1])
+        return (dx + dy) + (sqrt2 - 2.0) * min(dx, dy)
+
+    open_heap = [(heur(s), 0.0, s)]
+    came: dict[tuple[int, int], tuple[int, int]] = {}
+    cost = {s: 0.0}
+    steps = ((1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+             (1, 1, sqrt2), (1, -1, sqrt2), (-1, 1, sqrt2), (-1, -1, sqrt2))
+
+    found = False
+    while open_heap:
+        _f, c_cost, cur = heapq.heappop(open_heap)
+        if cur == g:
+            found = True
+            break
+        if c_cost > cost.get(cur, math.inf):
+            continue
+        cx, cy = cur
+        for dx, dy, sc in steps:
+            nxt = (cx + dx, cy + dy)
+            if not is_open(*nxt):
+                continue
+            # keine Diagonale durch Landecken
+            if dx and dy and not (is_open(cx + dx, cy) and is_open(cx, cy + dy)):
+                continue
+            nc = c_cost + sc
+            if nc < cost.get(nxt, math.inf):
+                cost[nxt] = nc
+                came[nxt] = cur
+                heapq.heappush(open_heap, (nc + heur(nxt), nc, nxt))
+
+    if not found:
+        return None
+
+    cells = [g]
+    while cells[-1] != s:
+        cells.append(came[cells[-1]])
+    cells.reverse()
+
+    def line_of_sight(a: tuple[float, float], b: tuple[float, float]) -> bool:
+        # Sichtlinie nur durch offene Zellen -> Glätten hält den Küstenabstand
+        dist = math.hypot(b[0] - a[0], b[1] - a[1])
+        n = max(1, int(dist / LANE_LOS_STEP))
+        for k in range(n + 1):
+            t = k / n
+            x = a[0] + (b[0] - a[0]) * t
+            y = a[1] + (b[1] - a[1]) * t
+            if not is_open(int(x) // cell, int(y) // cell):
+                return False
+        return True
+
+    raw = [(cx * cell + half + 0.5, cy * cell + half + 0.5) for cx, cy in cells]
+
+    # Glätten: vom aktuellen Punkt aus den weitesten sichtbaren Punkt nehmen
+    pts = [raw[0]]
+    i = 0
+    while i < len(raw) - 1:
+        j = len(raw) - 1
+        while j > i + 1 and not line_of_sight(raw[i], raw[j]):
+            j -= 1
+        pts.append(raw[j])
+        i = j
+
+    # Hafen -> erste/letzte offene Zelle
+    pts.insert(0, (float(start[0]), float(start[1])))
+    pts.append((float(goal[0]), float(goal[1])))
+    return SeaLane(pts)
+
+
+class ConvoyField:
+    """
+    Alle NPC-Konvois einer Map als Arrays (Structure-of-Arrays).
+    Positionen werden nicht simuliert, sondern aus (Abfahrt, Dauer, Seeweg)
+    zum aktuellen Zeitpunkt abgeleitet – tausende Konvois kosten nur ein paar Array-Ops.
+    """
+
+    def __init__(self) -> None:
+        self.signature = None
+        self.shipments: list = []
+        self._lanes: list[SeaLane] = []
+        self._depart = []
+        self._duration = []
+        self._lane_idx = []
+
+        # alle Lanes hintereinander (global monoton steigende Bogenlänge)
+        self._gx = self._gy = self._gcum = None
+        self._lane_base = []
+        self._lane_first = []
+        self._lane_last = []
+
+    def __len__(self) -> int:
+        return len(self.shipments)
+
+    def rebuild(self, entries: list[tuple[object, SeaLane, float, float]], signature) -> None:
+        """entries: (shipment, lane, depart_day, duration_days)"""
+        self.signature = signature
+        self.shipments = [e[0] for e in entries]
+
+        lane_ids: dict[int, int] = {}
+        self._lanes = []
+        lane_idx = []
+        for _s, lane, _d, _t in entries:
+            k = id(lane)
+            if k not in lane_ids:
+                lane_ids[k] = len(self._lanes)
+                self._lanes.append(lane)
+            lane_idx.append(lane_ids[k])
+
+        depart = [float(e[2]) for e in entries]
+        duration = [max(1e-6, float(e[3])) for e in entries]
+
+        gx, gy, gcum = [], [], []
+        self._lane_base, self._lane_first, self._lane_last = [], [], []
+        base = 0.0
+        for lane in self._lanes:
+            self._lane_first.append(len(gx))
+            self._lane_base.append(base)
+            for (x, y), c in zip(lane.points, lane.cum):
+                gx.append(x)
+                gy.append(y)
+                gcum.append(base + c)
+            self._lane_last.append(len(gx) - 1)
+            base += lane.length + 1.0  # Lücke, damit gcum streng steigt
+
+        if np is not None:
+            self._depart = np.asarray(depart, dtype=np.float64)
+            self._duration = np.asarray(duration, dtype=np.float64)
+            self._lane_idx = np.asarray(lane_idx, dtype=np.int64)
+            self._gx = np.asarray(gx, dtype=np.float64)
+            self._gy = np.asarray(gy, dtype=np.float64)
+            self._gcum = np.asarray(gcum, dtype=np.float64)
+            self._lane_base = np.asarray(self._lane_base, dtype=np.float64)
+            self._lane_first = np.asarray(self._lane_first, dtype=np.int64)
+            self._lane_last = np.asarray(self._lane_last, dtype=np.int64)
+            self._lane_len = np.asarray([l.length for l in self._lanes], dtype=np.float64)
+        else:
+            self._depart, self._duration, self._lane_idx = depart, duration, lane_idx
+
+    def positions(self, now_days: float):
+        """
+        Liefert (xs, ys, angles_deg) für alle Konvois zum Zeitpunkt now_days (Tag + Tagesanteil).
+        Mit NumPy als Arrays, sonst als Listen.
+        """
+        if not self.shipments:
+            return [], [], []
+
+        if np is None:
+            xs, ys, angs = [], [], []
+            for dep, dur, li in zip(self._depart, self._duration, self._lane_idx):
+                lane = self._lanes[li]
+                p = min(1.0, max(0.0, (now_days - dep) / dur))
+                x, y, a = lane.point_at(p * lane.length)
+                xs.append(x)
+                ys.append(y)
+                angs.append(a)
+            return xs, ys, angs
+
+        p = np.clip((now_days - self._depart) / self._duration, 0.0, 1.0)
+        li = self._lane_idx
+        s = self._lane_base[li] + p * self._lane_len[li]
+
+        # Segment-Index global per searchsorted, dann auf die eigene Lane klemmen
+        idx = np.searchsorted(self._gcum, s, side="right") - 1
+        idx = np.clip(idx, self._lane_first[li], np.maximum(self._lane_first[li], self._lane_last[li] - 1))
+
+        x0, y0 = self._gx[idx], self._gy[idx]
+        x1, y1 = self._gx[idx + 1], self._gy[idx + 1]
+        seg = self._gcum[idx + 1] - self._gcum[idx]
+        f = np.where(seg > 1e-6, (s - self._gcum[idx]) / np.maximum(seg, 1e-6), 0.0)
+        f = np.clip(f, 0.0, 1.0)
+
+        xs = x0 + (x1 - x0) * f
+        ys = y0 + (y1 - y0) * f
+        angs = np.degrees(np.arctan2(x1 - x0, y1 - y0))
+        return xs, ys, angs
+
+    @staticmethod
+    def visible_indices(xs, ys, rect: tuple[int, int, int, int], margin: float = 24.0) -> list[int]:
+        x0, y0, w, h = rect
+        if np is not None and not isinstance(xs, list):
+            m = (xs >= x0 - margin) & (xs < x0 + w + margin) & (ys >= y0 - margin) & (ys < y0 + h + margin)
+            return np.nonzero(m)[0].tolist()
+        return [
+            i for i, (x, y) in enumerate(zip(xs, ys))
+            if x0 - margin <= x < x0 + w + margin and y0 - margin <= y < y0 + h + margin
+        ]
+
+    @staticmethod
+    def gather(pose, indices: list[int]) -> tuple[list, list, list]:
+        """Teilmenge (xs, ys, angles) als Python-Listen, z.B. nur die sichtbaren Konvois."""
+        xs, ys, angs = pose
+        if np is not None and not isinstance(xs, list):
+            return xs[indices].tolist(), ys[indices].tolist(), angs[indices].tolist()
+        return [xs[i] for i in indices], [ys[i] for i in indices], [angs[i] for i in indices]
+
+    @staticmethod
+    def within(xs, ys, px: float, py: float, radius: float) -> list[int]:
+        """Indizes aller Konvois im Umkreis radius um (px, py), nächster zuerst."""
+        r2 = radius * radius
+        if np is not None and not isinstance(xs, list):
+            d2 = (xs - px) ** 2 + (ys - py) ** 2
+            idx = np.nonzero(d2 <= r2)[0]
+            return idx[np.argsort(d2[idx])].tolist()
+        hits = []
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            d2 = (x - px) ** 2 + (y - py) ** 2
+            if d2 <= r2:
+                hits.append((d2, i))
+        return [i for _d2, i in sorted(hits)]
+
+
+def shipment_schedule(shipment, day: int) -> tuple[float, float]:
+    """
+    (Abfahrt, Gesamtdauer) in Tagen. eta_days zählt täglich runter,
+    daher Gesamtdauer = Rest-ETA + bereits gefahrene Tage.
+    """
+    depart = float(getattr(shipment, "created_day", day))
+    duration = float(shipment.eta_days) + max(0.0, float(day) - depart)
+    return depart, max(1.0, duration)
+
+
+def take_convoy_intercept(ctx):
+    """Holt (und löscht) den aktuell abgefangenen Konvoi aus dem ctx."""
+    s = getattr(ctx, "convoy_intercept", None)
+    ctx.convoy_intercept = None
+    return s
+
+
+def claim_convoy_cargo(ctx, shipment) -> list[tuple[str, float]]:
+    """
+    Konvoi nach gewonnenem Gefecht auflösen: Shipment kommt nie an,
+    die Ladung wird zur Beute (Kapazität prüft der Aufrufer).
+    """
+    shipments = getattr(ctx, "npc_shipments", None) or []
+    if shipment not in shipments:
+        return []
+    shipments.remove(shipment)
+    qty = max(0.0, float(getattr(shipment, "qty", 0.0)))
+    return [(shipment.good_id, round(qty, 2))] if qty > 0.0 else []